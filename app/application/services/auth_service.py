@@ -1,12 +1,17 @@
+import hashlib
 import secrets
 from datetime import datetime, timedelta, timezone
-from typing import Optional, Tuple, Dict, Any
-from uuid import UUID
+from typing import Optional, Tuple, Dict, Any, List
+from uuid import UUID, uuid4
 
 from jose import jwt
-from passlib.context import CryptContext
-
 from app.domain.entities.user import User, UserRole
+from app.infrastructure.utils.bounded_executor import BoundedExecutor, get_password_hash_executor
+from app.infrastructure.utils.password_hashing import (
+    create_password_context,
+    get_password_hash_process_pool,
+    hash_password,
+)
 
 
 class AuthService:
@@ -16,12 +21,14 @@ class AuthService:
         algorithm: str = "HS256",
         access_token_expire_minutes: int = 30,
         refresh_token_expire_days: int = 7,
+        hash_executor: Optional[BoundedExecutor] = None,
     ):
         self.secret_key = secret_key
         self.algorithm = algorithm
         self.access_token_expire_minutes = access_token_expire_minutes
         self.refresh_token_expire_days = refresh_token_expire_days
-        self.pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
+        self.pwd_context = create_password_context()
+        self.hash_executor = hash_executor or get_password_hash_executor()
 
     def verify_password(self, plain_password: str, hashed_password: str) -> bool:
         return self.pwd_context.verify(plain_password, hashed_password)
@@ -29,14 +36,54 @@ class AuthService:
     def get_password_hash(self, password: str) -> str:
         return self.pwd_context.hash(password)
 
+    async def verify_password_async(self, plain_password: str, hashed_password: str) -> bool:
+        """
+        Verifica a senha em uma thread do executor de hashing, sem bloquear o event loop.
+
+        Raises:
+            ExecutorQueueFullError: Se a fila de hashing estiver cheia
+        """
+        return await self.hash_executor.run(self.pwd_context.verify, plain_password, hashed_password)
+
+    async def get_password_hash_async(self, password: str) -> str:
+        """
+        Gera o hash da senha em uma thread do executor de hashing, sem bloquear o event loop.
+
+        Raises:
+            ExecutorQueueFullError: Se a fila de hashing estiver cheia
+        """
+        return await self.hash_executor.run(self.pwd_context.hash, password)
+
+    async def get_password_hashes_parallel(self, passwords: List[str]) -> List[str]:
+        """
+        Gera os hashes de várias senhas em paralelo, usando um pool de processos
+        que ocupa todos os núcleos. Usado em importações em lote.
+
+        As senhas são enviadas em lotes de uma por processo, pela fila limitada
+        do pool.
+
+        Raises:
+            ExecutorQueueFullError: Se a fila do pool de processos estiver cheia
+        """
+        return await get_password_hash_process_pool().map(hash_password, passwords)
+
     def create_access_token(
         self, user_id: UUID, role: UserRole, expires_delta: Optional[timedelta] = None
     ) -> Tuple[str, datetime]:
-        to_encode = {"sub": str(user_id), "role": role, "type": "access"}
+        now = datetime.now(timezone.utc)
+        to_encode = {
+            "sub": str(user_id),
+            "role": role,
+            "type": "access",
+            # jti identifica o token para revogação; iat com milissegundos permite
+            # comparar com a época de revogação do usuário sem ambiguidade
+            "jti": uuid4().hex,
+            "iat": int(now.timestamp() * 1000) / 1000,
+        }
         if expires_delta:
-            expire = datetime.now(timezone.utc) + expires_delta
+            expire = now + expires_delta
         else:
-            expire = datetime.now(timezone.utc) + timedelta(
+            expire = now + timedelta(
                 minutes=self.access_token_expire_minutes
             )
         to_encode.update({"exp": expire})
@@ -49,6 +96,11 @@ class AuthService:
         expires = datetime.now(timezone.utc) + timedelta(days=self.refresh_token_expire_days)
         return token, expires
 
+    @staticmethod
+    def hash_refresh_token(token: str) -> str:
+        """Retorna o digest SHA-256 usado como chave de busca do refresh token."""
+        return hashlib.sha256(token.encode("utf-8")).hexdigest()
+
     def decode_token(self, token: str) -> Dict[str, Any]:
         """Decodifica um token JWT e retorna seu payload."""
         return jwt.decode(token, self.secret_key, algorithms=[self.algorithm])
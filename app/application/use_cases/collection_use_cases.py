@@ -1,7 +1,8 @@
-from typing import List, Optional
+from datetime import datetime
+from typing import List, Optional, Tuple
 from uuid import UUID
 
-from app.domain.entities.collection import Collection, CollectionStatus
+from app.domain.entities.collection import Collection, CollectionStatus, CollectionVersion
 from app.domain.repositories.collection_repository import CollectionRepository
 from app.domain.repositories.company_repository import CompanyRepository
 from app.domain.repositories.user_repository import UserRepository
@@ -112,9 +113,20 @@ class CollectionUseCases:
 
         return await self.collection_repository.update(collection)
 
+    async def get_all_collections(self) -> List[Collection]:
+        return await self.collection_repository.get_all()
+
     async def get_collection_by_id(self, collection_id: UUID) -> Optional[Collection]:
         return await self.collection_repository.get_by_id(collection_id)
 
+    async def get_collection_version(self, collection_id: UUID) -> Optional[CollectionVersion]:
+        return await self.collection_repository.get_version(collection_id)
+
+    async def get_collections_version(
+        self, user_id: Optional[UUID] = None, collector_id: Optional[UUID] = None
+    ) -> Tuple[int, Optional[datetime]]:
+        return await self.collection_repository.get_list_version(user_id=user_id, collector_id=collector_id)
+
     async def get_collections_by_user(self, user_id: UUID) -> List[Collection]:
         return await self.collection_repository.get_by_user_id(user_id)
 
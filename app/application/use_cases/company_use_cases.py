@@ -1,4 +1,5 @@
-from typing import List, Optional
+from datetime import datetime
+from typing import List, Optional, Tuple
 from uuid import UUID
 
 from app.domain.entities.company import Company
@@ -31,6 +32,12 @@ class CompanyUseCases:
     async def get_company_by_id(self, company_id: UUID) -> Optional[Company]:
         return await self.company_repository.get_by_id(company_id)
 
+    async def get_company_updated_at(self, company_id: UUID) -> Optional[datetime]:
+        return await self.company_repository.get_updated_at(company_id)
+
+    async def get_companies_version(self) -> Tuple[int, Optional[datetime]]:
+        return await self.company_repository.get_list_version()
+
     async def get_company_by_zip_code(self, zip_code: str) -> Optional[Company]:
         return await self.company_repository.get_by_zip_code(zip_code)
 
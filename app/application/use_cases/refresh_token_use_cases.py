@@ -0,0 +1,86 @@
+from datetime import datetime, timezone
+from typing import Optional, Tuple
+from uuid import UUID, uuid4
+
+from app.application.services.auth_service import AuthService
+from app.domain.entities.refresh_token import RefreshToken
+from app.domain.repositories.refresh_token_repository import RefreshTokenRepository
+
+
+class InvalidRefreshTokenError(ValueError):
+    pass
+
+
+class RefreshTokenReuseError(InvalidRefreshTokenError):
+    """Um refresh token já rotacionado foi apresentado novamente."""
+
+    def __init__(self, refresh_token: RefreshToken):
+        super().__init__("Refresh token reutilizado")
+        self.refresh_token = refresh_token
+
+
+class RefreshTokenUseCases:
+    def __init__(self, refresh_token_repository: RefreshTokenRepository, auth_service: AuthService):
+        self.refresh_token_repository = refresh_token_repository
+        self.auth_service = auth_service
+
+    async def issue_refresh_token(
+        self, user_id: UUID, family_id: Optional[UUID] = None
+    ) -> Tuple[str, RefreshToken]:
+        token, expires = self.auth_service.create_refresh_token(user_id=user_id)
+        refresh_token = RefreshToken(
+            id=uuid4(),
+            token_hash=self.auth_service.hash_refresh_token(token),
+            user_id=user_id,
+            # Entidades usam datetime UTC sem timezone, como o restante do banco
+            expires_at=expires.astimezone(timezone.utc).replace(tzinfo=None),
+            family_id=family_id,
+        )
+        return token, await self.refresh_token_repository.create(refresh_token)
+
+    async def rotate_refresh_token(self, token: str) -> Tuple[str, RefreshToken]:
+        """
+        Troca um refresh token válido por um novo da mesma família.
+
+        Se o token apresentado já tiver sido revogado, toda a família é revogada,
+        pois isso indica que o token vazou e está sendo reutilizado.
+        """
+        current = await self.refresh_token_repository.get_by_token_hash(
+            self.auth_service.hash_refresh_token(token)
+        )
+        if current is None or current.is_expired():
+            raise InvalidRefreshTokenError("Refresh token inválido ou expirado")
+
+        if current.revoked:
+            await self.refresh_token_repository.revoke_family(current.family_id)
+            raise RefreshTokenReuseError(current)
+
+        new_token, expires = self.auth_service.create_refresh_token(user_id=current.user_id)
+        # Revogação do atual e gravação do substituto na mesma transação: se a
+        # gravação falhar, o token atual continua válido
+        replacement = await self.refresh_token_repository.rotate(
+            current.id,
+            RefreshToken(
+                id=uuid4(),
+                token_hash=self.auth_service.hash_refresh_token(new_token),
+                user_id=current.user_id,
+                expires_at=expires.astimezone(timezone.utc).replace(tzinfo=None),
+                family_id=current.family_id,
+            ),
+        )
+        if replacement is None:
+            # Outra requisição rotacionou o mesmo token ao mesmo tempo
+            await self.refresh_token_repository.revoke_family(current.family_id)
+            raise RefreshTokenReuseError(current)
+        return new_token, replacement
+
+    async def revoke_refresh_token_family(self, token: str) -> int:
+        current = await self.refresh_token_repository.get_by_token_hash(
+            self.auth_service.hash_refresh_token(token)
+        )
+        if current is None:
+            return 0
+        return await self.refresh_token_repository.revoke_family(current.family_id)
+
+    async def purge_expired_refresh_tokens(self, chunk_size: int = 1000) -> int:
+        return await self.refresh_token_repository.purge_expired(datetime.utcnow(), chunk_size)
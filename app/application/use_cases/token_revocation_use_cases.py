@@ -0,0 +1,37 @@
+from datetime import datetime, timedelta, timezone
+from uuid import UUID
+
+from app.application.services.auth_service import AuthService
+from app.domain.entities.token_revocation import RevocationKind, TokenRevocation
+from app.domain.repositories.token_revocation_repository import TokenRevocationRepository
+
+
+class TokenRevocationUseCases:
+    def __init__(
+        self,
+        token_revocation_repository: TokenRevocationRepository,
+        auth_service: AuthService,
+    ):
+        self.token_revocation_repository = token_revocation_repository
+        self.auth_service = auth_service
+
+    async def revoke_access_token(self, jti: str, expires_at: float) -> TokenRevocation:
+        """Revoga um único access token até o seu `exp` (timestamp)."""
+        revocation = TokenRevocation(
+            kind=RevocationKind.TOKEN,
+            subject=jti,
+            expires_at=datetime.fromtimestamp(expires_at, tz=timezone.utc).replace(tzinfo=None),
+        )
+        return await self.token_revocation_repository.create(revocation)
+
+    async def revoke_user_tokens(self, user_id: UUID) -> TokenRevocation:
+        """Invalida todos os access tokens do usuário emitidos até agora."""
+        now = datetime.utcnow()
+        revocation = TokenRevocation(
+            kind=RevocationKind.USER,
+            subject=str(user_id),
+            issued_before=now,
+            # Depois disso, qualquer token emitido antes de `now` já expirou
+            expires_at=now + timedelta(minutes=self.auth_service.access_token_expire_minutes),
+        )
+        return await self.token_revocation_repository.create(revocation)
@@ -1,4 +1,4 @@
-from typing import List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 from uuid import UUID
 
 from app.domain.entities.user import User, UserRole
@@ -24,7 +24,7 @@ class UserUseCases:
             raise ValueError("User with this username already exists")
 
         # Hash password
-        hashed_password = self.auth_service.get_password_hash(password)
+        hashed_password = await self.auth_service.get_password_hash_async(password)
 
         # Create user
         user = User(
@@ -38,11 +38,71 @@ class UserUseCases:
         # Save user
         return await self.user_repository.create(user)
 
+    async def import_users(
+        self, users: List[Dict[str, Any]], chunk_size: int = 200
+    ) -> Tuple[List[User], List[Tuple[int, str]]]:
+        """
+        Cria vários usuários de uma vez.
+
+        A unicidade de email e username é verificada para o lote inteiro em uma
+        única consulta, os hashes são gerados em paralelo e a inserção é feita
+        em blocos. Retorna os usuários criados e a lista de (índice, erro) das
+        linhas rejeitadas.
+        """
+        failures: List[Tuple[int, str]] = []
+
+        # Duplicados dentro do próprio lote
+        accepted: List[Tuple[int, Dict[str, Any]]] = []
+        seen_emails, seen_usernames = set(), set()
+        for index, data in enumerate(users):
+            if data["email"] in seen_emails:
+                failures.append((index, "Duplicate email in import"))
+            elif data["username"] in seen_usernames:
+                failures.append((index, "Duplicate username in import"))
+            else:
+                seen_emails.add(data["email"])
+                seen_usernames.add(data["username"])
+                accepted.append((index, data))
+
+        # Duplicados já existentes no banco, em uma única consulta
+        existing_emails, existing_usernames = await self.user_repository.get_existing_identifiers(
+            [data["email"] for _, data in accepted],
+            [data["username"] for _, data in accepted],
+        )
+        pending: List[Tuple[int, Dict[str, Any]]] = []
+        for index, data in accepted:
+            if data["email"] in existing_emails:
+                failures.append((index, "User with this email already exists"))
+            elif data["username"] in existing_usernames:
+                failures.append((index, "User with this username already exists"))
+            else:
+                pending.append((index, data))
+
+        # Hash apenas das linhas que serão inseridas
+        hashed_passwords = await self.auth_service.get_password_hashes_parallel(
+            [data["password"] for _, data in pending]
+        )
+        new_users = [
+            User(
+                username=data["username"],
+                email=data["email"],
+                hashed_password=hashed_password,
+                role=data["role"],
+                company_id=data.get("company_id"),
+            )
+            for (_, data), hashed_password in zip(pending, hashed_passwords)
+        ]
+
+        created, insert_failures = await self.user_repository.create_many(new_users, chunk_size)
+        failures.extend((pending[position][0], error) for position, error in insert_failures)
+        failures.sort()
+        return created, failures
+
     async def authenticate_user(self, email: str, password: str) -> Optional[User]:
         user = await self.user_repository.get_by_email(email)
         if not user:
             return None
-        if not self.auth_service.verify_password(password, user.hashed_password):
+        if not await self.auth_service.verify_password_async(password, user.hashed_password):
             return None
         return user
 
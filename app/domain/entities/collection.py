@@ -1,5 +1,5 @@
 from enum import Enum
-from typing import Optional, List
+from typing import NamedTuple, Optional, List
 from datetime import datetime
 from uuid import UUID, uuid4
 
@@ -40,3 +40,13 @@ class Collection:
         self.updated_at = updated_at or datetime.utcnow()
         self.collector_id = collector_id
         self.company_id = company_id
+
+
+class CollectionVersion(NamedTuple):
+    """Colunas leves de uma coleta: bastam para checar permissões e gerar o ETag."""
+
+    id: UUID
+    user_id: UUID
+    collector_id: Optional[UUID]
+    company_id: Optional[UUID]
+    updated_at: datetime
@@ -0,0 +1,29 @@
+from typing import Optional
+from datetime import datetime
+from uuid import UUID, uuid4
+
+
+class RefreshToken:
+    def __init__(
+        self,
+        token_hash: str,
+        user_id: UUID,
+        expires_at: datetime,
+        family_id: Optional[UUID] = None,
+        id: Optional[UUID] = None,
+        revoked: bool = False,
+        replaced_by: Optional[UUID] = None,
+        created_at: Optional[datetime] = None,
+    ):
+        self.id = id or uuid4()
+        self.token_hash = token_hash
+        self.user_id = user_id
+        self.expires_at = expires_at
+        # Todos os tokens gerados a partir do mesmo login compartilham a família
+        self.family_id = family_id or uuid4()
+        self.revoked = revoked
+        self.replaced_by = replaced_by
+        self.created_at = created_at or datetime.utcnow()
+
+    def is_expired(self, now: Optional[datetime] = None) -> bool:
+        return self.expires_at <= (now or datetime.utcnow())
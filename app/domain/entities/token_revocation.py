@@ -0,0 +1,29 @@
+from enum import Enum
+from typing import Optional
+from datetime import datetime
+
+
+class RevocationKind(str, Enum):
+    # Revoga um único access token pelo seu jti
+    TOKEN = "token"
+    # Revoga todos os access tokens do usuário emitidos antes de issued_before
+    USER = "user"
+
+
+class TokenRevocation:
+    def __init__(
+        self,
+        kind: RevocationKind,
+        subject: str,
+        expires_at: datetime,
+        issued_before: Optional[datetime] = None,
+        id: Optional[int] = None,
+        created_at: Optional[datetime] = None,
+    ):
+        self.id = id
+        self.kind = kind
+        self.subject = subject
+        # Depois de expires_at nenhum token afetado pode ser válido e o registro pode ser apagado
+        self.expires_at = expires_at
+        self.issued_before = issued_before
+        self.created_at = created_at or datetime.utcnow()
@@ -1,8 +1,9 @@
 from abc import ABC, abstractmethod
-from typing import List, Optional
+from datetime import datetime
+from typing import List, Optional, Tuple
 from uuid import UUID
 
-from app.domain.entities.collection import Collection, CollectionStatus
+from app.domain.entities.collection import Collection, CollectionStatus, CollectionVersion
 
 
 class CollectionRepository(ABC):
@@ -14,6 +15,16 @@ class CollectionRepository(ABC):
     async def get_by_id(self, collection_id: UUID) -> Optional[Collection]:
         pass
 
+    @abstractmethod
+    async def get_version(self, collection_id: UUID) -> Optional[CollectionVersion]:
+        pass
+
+    @abstractmethod
+    async def get_list_version(
+        self, user_id: Optional[UUID] = None, collector_id: Optional[UUID] = None
+    ) -> Tuple[int, Optional[datetime]]:
+        pass
+
     @abstractmethod
     async def get_by_user_id(self, user_id: UUID) -> List[Collection]:
         pass
@@ -1,5 +1,6 @@
 from abc import ABC, abstractmethod
-from typing import List, Optional
+from datetime import datetime
+from typing import List, Optional, Tuple
 from uuid import UUID
 
 from app.domain.entities.company import Company
@@ -14,6 +15,14 @@ class CompanyRepository(ABC):
     async def get_by_id(self, company_id: UUID) -> Optional[Company]:
         pass
 
+    @abstractmethod
+    async def get_updated_at(self, company_id: UUID) -> Optional[datetime]:
+        pass
+
+    @abstractmethod
+    async def get_list_version(self) -> Tuple[int, Optional[datetime]]:
+        pass
+
     @abstractmethod
     async def get_by_zip_code(self, zip_code: str) -> Optional[Company]:
         pass
@@ -0,0 +1,41 @@
+from abc import ABC, abstractmethod
+from datetime import datetime
+from typing import Optional
+from uuid import UUID
+
+from app.domain.entities.refresh_token import RefreshToken
+
+
+class RefreshTokenRepository(ABC):
+    @abstractmethod
+    async def create(self, refresh_token: RefreshToken) -> RefreshToken:
+        pass
+
+    @abstractmethod
+    async def get_by_token_hash(self, token_hash: str) -> Optional[RefreshToken]:
+        pass
+
+    @abstractmethod
+    async def revoke(self, token_id: UUID, replaced_by: Optional[UUID] = None) -> bool:
+        pass
+
+    @abstractmethod
+    async def rotate(self, token_id: UUID, replacement: RefreshToken) -> Optional[RefreshToken]:
+        """
+        Revoga o token e grava o substituto em uma única transação.
+
+        Retorna None, sem gravar nada, se o token já estava revogado.
+        """
+        pass
+
+    @abstractmethod
+    async def revoke_family(self, family_id: UUID) -> int:
+        pass
+
+    @abstractmethod
+    async def revoke_all_for_user(self, user_id: UUID) -> int:
+        pass
+
+    @abstractmethod
+    async def purge_expired(self, before: Optional[datetime] = None, chunk_size: int = 1000) -> int:
+        pass
@@ -0,0 +1,19 @@
+from abc import ABC, abstractmethod
+from datetime import datetime
+from typing import List, Optional
+
+from app.domain.entities.token_revocation import TokenRevocation
+
+
+class TokenRevocationRepository(ABC):
+    @abstractmethod
+    async def create(self, revocation: TokenRevocation) -> TokenRevocation:
+        pass
+
+    @abstractmethod
+    async def get_created_since(self, since: Optional[datetime] = None) -> List[TokenRevocation]:
+        pass
+
+    @abstractmethod
+    async def purge_expired(self, before: Optional[datetime] = None) -> int:
+        pass
@@ -1,5 +1,5 @@
 from abc import ABC, abstractmethod
-from typing import List, Optional
+from typing import List, Optional, Set, Tuple
 from uuid import UUID
 
 from app.domain.entities.user import User
@@ -37,3 +37,15 @@ class UserRepository(ABC):
     @abstractmethod
     async def get_collectors_by_company_id(self, company_id: UUID) -> List[User]:
         pass
+
+    @abstractmethod
+    async def get_existing_identifiers(
+        self, emails: List[str], usernames: List[str]
+    ) -> Tuple[Set[str], Set[str]]:
+        pass
+
+    @abstractmethod
+    async def create_many(
+        self, users: List[User], chunk_size: int = 200
+    ) -> Tuple[List[User], List[Tuple[int, str]]]:
+        pass
@@ -1,13 +1,14 @@
 from datetime import datetime, timedelta
 from typing import Optional, Dict, Any
 
-from fastapi import Depends, HTTPException, status
+from fastapi import Depends, HTTPException, Request, status
 from fastapi.security import OAuth2PasswordBearer
-from jose import JWTError, jwt
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.domain.entities.user import User, UserRole
 from app.domain.repositories.user_repository import UserRepository
+from app.infrastructure.auth.revocation import get_revocation_registry
+from app.infrastructure.auth.token_verifier import get_request_claims
 from app.infrastructure.config import get_settings
 from app.infrastructure.database.database import get_db
 from app.infrastructure.repositories.user_repository_impl import UserRepositoryImpl
@@ -18,24 +19,25 @@ oauth2_scheme = OAuth2PasswordBearer(tokenUrl="token")
 
 
 async def get_current_user(
-    token: str = Depends(oauth2_scheme), db: AsyncSession = Depends(get_db)
+    request: Request, token: str = Depends(oauth2_scheme), db: AsyncSession = Depends(get_db)
 ) -> User:
     credentials_exception = HTTPException(
         status_code=status.HTTP_401_UNAUTHORIZED,
         detail="Could not validate credentials",
         headers={"WWW-Authenticate": "Bearer"},
     )
-    try:
-        payload = jwt.decode(
-            token, settings.secret_key, algorithms=[settings.algorithm]
-        )
-        user_id: str = payload.get("sub")
-        if user_id is None:
-            raise credentials_exception
-        role: str = payload.get("role")
-        if role is None:
-            raise credentials_exception
-    except JWTError:
+    # Reutiliza as claims já verificadas pelo middleware nesta requisição
+    payload = get_request_claims(request)
+    if payload is None:
+        raise credentials_exception
+    user_id: str = payload.get("sub")
+    if user_id is None:
+        raise credentials_exception
+    role: str = payload.get("role")
+    if role is None:
+        raise credentials_exception
+    # Verificação em memória, sem acesso ao banco
+    if get_revocation_registry().is_revoked(payload):
         raise credentials_exception
 
     user_repository: UserRepository = UserRepositoryImpl(db)
@@ -0,0 +1,91 @@
+import time
+from datetime import datetime, timedelta, timezone
+from functools import lru_cache
+from typing import Any, Dict, Optional
+
+from app.domain.entities.token_revocation import RevocationKind, TokenRevocation
+from app.domain.repositories.token_revocation_repository import TokenRevocationRepository
+
+
+def _to_timestamp(value: datetime) -> float:
+    """Converte um datetime UTC sem timezone (padrão do banco) em timestamp."""
+    return value.replace(tzinfo=timezone.utc).timestamp()
+
+
+class RevocationRegistry:
+    """
+    Estado de revogação de access tokens mantido em memória em cada worker.
+
+    Guarda duas estruturas pequenas:
+    - épocas por usuário: tokens do usuário com `iat` anterior à época são inválidos
+    - conjunto de jti negados, cada um até o `exp` do próprio token
+
+    A verificação é feita só com buscas em dicionários, sem acesso ao banco. A
+    tabela `token_revocations` é a fonte da verdade e é lida periodicamente por
+    `sync` para propagar revogações feitas em outros workers.
+    """
+
+    # Margem para ler de novo registros recentes, cobrindo commits fora de ordem
+    SYNC_LOOKBACK = timedelta(seconds=30)
+
+    def __init__(self):
+        self._user_epochs: Dict[str, float] = {}
+        self._epoch_expirations: Dict[str, float] = {}
+        self._denied_jtis: Dict[str, float] = {}
+        self._synced_until: Optional[datetime] = None
+
+    def is_revoked(self, claims: Dict[str, Any]) -> bool:
+        """Verifica se as claims de um access token foram revogadas."""
+        if self._denied_jtis:
+            jti = claims.get("jti")
+            if jti is not None and jti in self._denied_jtis:
+                return True
+        if self._user_epochs:
+            epoch = self._user_epochs.get(claims.get("sub"))
+            if epoch is not None and claims.get("iat", 0) < epoch:
+                return True
+        return False
+
+    def apply(self, revocation: TokenRevocation) -> None:
+        """Aplica uma revogação ao estado local (operação idempotente)."""
+        expires_at = _to_timestamp(revocation.expires_at)
+        if revocation.kind == RevocationKind.TOKEN:
+            self._denied_jtis[revocation.subject] = expires_at
+        elif revocation.issued_before is not None:
+            epoch = _to_timestamp(revocation.issued_before)
+            if epoch > self._user_epochs.get(revocation.subject, 0):
+                self._user_epochs[revocation.subject] = epoch
+                self._epoch_expirations[revocation.subject] = expires_at
+
+    def prune(self, now: Optional[float] = None) -> None:
+        """Remove entradas que não podem mais afetar nenhum token válido."""
+        now = now or time.time()
+        for jti in [jti for jti, expires_at in self._denied_jtis.items() if expires_at <= now]:
+            del self._denied_jtis[jti]
+        for user_id in [
+            user_id for user_id, expires_at in self._epoch_expirations.items() if expires_at <= now
+        ]:
+            del self._epoch_expirations[user_id]
+            del self._user_epochs[user_id]
+
+    async def sync(self, repository: TokenRevocationRepository) -> int:
+        """Carrega do banco as revogações criadas desde a última sincronização."""
+        started_at = datetime.utcnow()
+        since = self._synced_until - self.SYNC_LOOKBACK if self._synced_until else None
+        revocations = await repository.get_created_since(since)
+        for revocation in revocations:
+            self.apply(revocation)
+        self._synced_until = started_at
+        self.prune()
+        return len(revocations)
+
+    def stats(self) -> Dict[str, int]:
+        return {
+            "denied_tokens": len(self._denied_jtis),
+            "user_epochs": len(self._user_epochs),
+        }
+
+
+@lru_cache()
+def get_revocation_registry() -> RevocationRegistry:
+    return RevocationRegistry()
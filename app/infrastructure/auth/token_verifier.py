@@ -0,0 +1,99 @@
+import time
+from collections import OrderedDict
+from functools import lru_cache
+from typing import Any, Dict, Optional, Tuple
+
+from fastapi import Request
+from fastapi.security.utils import get_authorization_scheme_param
+from jose import JWTError, jwt
+
+from app.infrastructure.config import get_settings
+
+# Marca "ainda não verificado" em request.state (None significa "sem token válido")
+_UNVERIFIED = object()
+
+
+class TokenVerifier:
+    """
+    Verifica tokens JWT mantendo um LRU dos tokens verificados recentemente.
+
+    Clientes móveis reenviam o mesmo access token em todas as requisições; com o
+    cache, a verificação HMAC e o parsing do JSON acontecem uma única vez por
+    token. Cada entrada só é válida até o `exp` do próprio token.
+    """
+
+    def __init__(self, secret_key: str, algorithm: str = "HS256", max_entries: int = 1024):
+        self.secret_key = secret_key
+        self.algorithm = algorithm
+        self.max_entries = max_entries
+        self._cache: "OrderedDict[str, Tuple[Dict[str, Any], float]]" = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def verify(self, token: str) -> Dict[str, Any]:
+        """
+        Retorna as claims do token.
+
+        Raises:
+            JWTError: Se o token for inválido ou estiver expirado
+        """
+        entry = self._cache.get(token)
+        if entry is not None:
+            claims, expires_at = entry
+            if expires_at > time.time():
+                self._cache.move_to_end(token)
+                self.hits += 1
+                return claims
+            del self._cache[token]
+
+        self.misses += 1
+        claims = jwt.decode(token, self.secret_key, algorithms=[self.algorithm])
+
+        # Tokens sem "exp" não são cacheados, pois não há como limitar sua validade
+        expires_at = claims.get("exp")
+        if isinstance(expires_at, (int, float)) and self.max_entries > 0:
+            self._cache[token] = (claims, float(expires_at))
+            if len(self._cache) > self.max_entries:
+                self._cache.popitem(last=False)
+        return claims
+
+    def clear(self) -> None:
+        self._cache.clear()
+
+
+@lru_cache()
+def get_token_verifier() -> TokenVerifier:
+    settings = get_settings()
+    return TokenVerifier(
+        secret_key=settings.secret_key,
+        algorithm=settings.algorithm,
+        max_entries=settings.token_cache_size,
+    )
+
+
+def get_bearer_token(authorization: Optional[str]) -> Optional[str]:
+    """Extrai o token de um cabeçalho `Authorization: Bearer <token>`."""
+    scheme, token = get_authorization_scheme_param(authorization)
+    if scheme.lower() != "bearer" or not token:
+        return None
+    return token
+
+
+def get_request_claims(request: Request) -> Optional[Dict[str, Any]]:
+    """
+    Retorna as claims do token da requisição, verificando-o no máximo uma vez.
+
+    O resultado fica em `request.state.token_claims`, compartilhado entre os
+    middlewares e as dependências da mesma requisição.
+    """
+    claims = getattr(request.state, "token_claims", _UNVERIFIED)
+    if claims is _UNVERIFIED:
+        claims = None
+        token = get_bearer_token(request.headers.get("Authorization"))
+        if token:
+            try:
+                claims = get_token_verifier().verify(token)
+            except JWTError:
+                claims = None
+        request.state.token_claims = claims
+    return claims
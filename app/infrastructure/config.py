@@ -1,7 +1,7 @@
 import os
 import secrets
 from functools import lru_cache
-from typing import Optional
+from typing import Dict, List, Optional
 
 from pydantic import BaseModel, Field
 
@@ -10,16 +10,124 @@ from pydantic import BaseModel, Field
 DEFAULT_SECRET_KEY = secrets.token_hex(32)
 
 
+def _parse_int_mapping(value: str) -> Dict[str, int]:
+    """Converte "chave=valor,chave=valor" em dicionário (ex.: limites por papel)."""
+    mapping = {}
+    for item in value.split(","):
+        if "=" in item:
+            key, number = item.split("=", 1)
+            mapping[key.strip()] = int(number)
+    return mapping
+
+
 class Settings(BaseModel):
     app_name: str = "Waste Collection API"
     admin_email: str = "admin"
     database_url: str = Field(
         default="sqlite+aiosqlite:///./waste_collection.db"
     )
+    # Pool de conexões do PostgreSQL (asyncpg); o SQLite usa só o pool instrumentado
+    db_pool_size: int = Field(default=10)
+    db_max_overflow: int = Field(default=5)
+    db_pool_timeout_seconds: float = Field(default=5.0)
+    db_pool_recycle_seconds: int = Field(default=1800)
+    db_pool_pre_ping: bool = Field(default=True)
+    db_pool_warmup_connections: int = Field(default=5)
+    # Cache de prepared statements do asyncpg por conexão (0 com PgBouncer em modo transação)
+    db_statement_cache_size: int = Field(default=256)
+    # statement_timeout do servidor, em milissegundos (0 desliga)
+    db_statement_timeout_ms: int = Field(default=15000)
+    # Perfil SQLite (SQLite em arquivo): conexões de leitura por worker, além da única
+    # conexão de escrita, e pragmas aplicados a todas as conexões
+    sqlite_read_pool_size: int = Field(default=8)
+    sqlite_busy_timeout_ms: int = Field(default=5000)
+    sqlite_mmap_size_bytes: int = Field(default=256 * 1024 * 1024)
+    sqlite_cache_size_kib: int = Field(default=16 * 1024)
+    sqlite_optimize_interval_seconds: int = Field(default=3600)
     secret_key: str = Field(default=DEFAULT_SECRET_KEY)
     algorithm: str = Field(default="HS256")
     access_token_expire_minutes: int = Field(default=30)
     refresh_token_expire_days: int = Field(default=7)
+    token_cache_size: int = Field(default=1024)
+    revocation_sync_interval_seconds: float = Field(default=5.0)
+    password_hash_workers: int = Field(default=2)
+    password_hash_queue_size: int = Field(default=32)
+    password_hash_processes: int = Field(default=0)  # 0 = um processo por núcleo
+    password_hash_process_queue_size: int = Field(default=0)  # 0 = um lote (uma senha por processo)
+    user_import_max_rows: int = Field(default=5000)
+    user_import_chunk_size: int = Field(default=200)
+    rate_limit_backend: str = Field(default="memory")  # memory ou sqlite
+    rate_limit_sqlite_path: str = Field(default="./rate_limit.db")
+    rate_limit_max_clients: int = Field(default=100_000)
+    # Limites por minuto de usuários autenticados, por papel (anônimos usam o limite geral)
+    rate_limit_role_limits: Dict[str, int] = Field(
+        default_factory=lambda: {"admin": 600, "collector": 300, "regular": 120}
+    )
+    # Custo por minuto de requisições pesadas (uploads), por papel
+    rate_limit_heavy_per_minute: int = Field(default=30)
+    rate_limit_role_heavy_limits: Dict[str, int] = Field(
+        default_factory=lambda: {"admin": 200, "collector": 60, "regular": 60}
+    )
+    trusted_proxies: List[str] = Field(default_factory=list)
+    refresh_token_purge_interval_seconds: int = Field(default=3600)
+    refresh_token_purge_chunk_size: int = Field(default=1000)
+    # Limites da cópia do corpo das requisições para o log
+    request_log_max_body_bytes: int = Field(default=64 * 1024)
+    request_log_max_field_chars: int = Field(default=256)
+    # Amostragem de leituras rotineiras no log de requisições (0 desliga)
+    request_log_sample_target_per_minute: int = Field(default=60)
+    request_log_slow_ms: float = Field(default=1000.0)
+    request_log_summary_interval_seconds: float = Field(default=60.0)
+    # Escrita assíncrona dos logs de segurança
+    security_log_path: str = Field(default="./logs/security.log")
+    security_log_queue_size: int = Field(default=10_000)
+    security_log_batch_size: int = Field(default=256)
+    security_log_flush_interval_seconds: float = Field(default=0.5)
+    security_log_drop_policy: str = Field(default="drop_newest")  # drop_newest ou drop_oldest
+    # Rotação, compressão e retenção de logs/security.log
+    security_log_max_bytes: int = Field(default=100 * 1024 * 1024)
+    security_log_rotate_daily: bool = Field(default=True)
+    security_log_retention_days: int = Field(default=30)
+    security_log_max_segments: int = Field(default=100)
+    security_log_compress: bool = Field(default=True)
+    # Cópia indexada dos eventos de segurança para consultas (SQLite em modo WAL)
+    security_audit_enabled: bool = Field(default=True)
+    security_audit_db_path: str = Field(default="./logs/security_audit.db")
+    security_audit_retention_days: int = Field(default=90)
+    # Compressão das respostas
+    compression_minimum_size: int = Field(default=1024)
+    compression_thread_threshold_bytes: int = Field(default=256 * 1024)
+    compression_gzip_level: int = Field(default=6)
+    # Controle de admissão por classe de prioridade: requisições simultâneas,
+    # tamanho da fila de espera e prazo na fila (0 desliga a classe)
+    admission_limits: Dict[str, int] = Field(
+        default_factory=lambda: {"auth": 16, "collector": 32, "resident": 64, "admin": 8}
+    )
+    admission_queue_sizes: Dict[str, int] = Field(
+        default_factory=lambda: {"auth": 64, "collector": 64, "resident": 128, "admin": 16}
+    )
+    admission_queue_timeouts_ms: Dict[str, int] = Field(
+        default_factory=lambda: {"auth": 1000, "collector": 500, "resident": 1000, "admin": 5000}
+    )
+    # Limite adaptativo de operações simultâneas no banco, por tipo (read/write):
+    # limite inicial, teto (0 desliga), fila de espera e prazo na fila
+    db_concurrency_initial_limits: Dict[str, int] = Field(default_factory=lambda: {"read": 8, "write": 2})
+    db_concurrency_max_limits: Dict[str, int] = Field(default_factory=lambda: {"read": 32, "write": 8})
+    db_concurrency_queue_sizes: Dict[str, int] = Field(default_factory=lambda: {"read": 256, "write": 128})
+    db_concurrency_queue_timeouts_ms: Dict[str, int] = Field(
+        default_factory=lambda: {"read": 1000, "write": 2000}
+    )
+    # Razão máxima entre a latência recente e a de referência antes de reduzir o limite
+    db_concurrency_latency_tolerance: float = Field(default=1.5)
+    # Cache de respostas serializadas: bytes de payload por entidade (0 desliga)
+    payload_cache_limits: Dict[str, int] = Field(
+        default_factory=lambda: {
+            "company": 4 * 1024 * 1024,
+            "companies": 4 * 1024 * 1024,
+            "collection": 32 * 1024 * 1024,
+            "collections": 32 * 1024 * 1024,
+        }
+    )
 
 
 @lru_cache()
@@ -32,8 +140,91 @@ def get_settings() -> Settings:
 
     return Settings(
         database_url=os.getenv("DATABASE_URL", "sqlite+aiosqlite:///./waste_collection.db"),
+        db_pool_size=int(os.getenv("DB_POOL_SIZE", "10")),
+        db_max_overflow=int(os.getenv("DB_MAX_OVERFLOW", "5")),
+        db_pool_timeout_seconds=float(os.getenv("DB_POOL_TIMEOUT_SECONDS", "5")),
+        db_pool_recycle_seconds=int(os.getenv("DB_POOL_RECYCLE_SECONDS", "1800")),
+        db_pool_pre_ping=os.getenv("DB_POOL_PRE_PING", "true").lower() == "true",
+        db_pool_warmup_connections=int(os.getenv("DB_POOL_WARMUP_CONNECTIONS", "5")),
+        db_statement_cache_size=int(os.getenv("DB_STATEMENT_CACHE_SIZE", "256")),
+        db_statement_timeout_ms=int(os.getenv("DB_STATEMENT_TIMEOUT_MS", "15000")),
+        sqlite_read_pool_size=int(os.getenv("SQLITE_READ_POOL_SIZE", "8")),
+        sqlite_busy_timeout_ms=int(os.getenv("SQLITE_BUSY_TIMEOUT_MS", "5000")),
+        sqlite_mmap_size_bytes=int(os.getenv("SQLITE_MMAP_SIZE_BYTES", str(256 * 1024 * 1024))),
+        sqlite_cache_size_kib=int(os.getenv("SQLITE_CACHE_SIZE_KIB", "16384")),
+        sqlite_optimize_interval_seconds=int(os.getenv("SQLITE_OPTIMIZE_INTERVAL_SECONDS", "3600")),
         secret_key=os.getenv("SECRET_KEY", DEFAULT_SECRET_KEY),
         algorithm=os.getenv("ALGORITHM", "HS256"),
         access_token_expire_minutes=int(os.getenv("ACCESS_TOKEN_EXPIRE_MINUTES", "30")),
         refresh_token_expire_days=int(os.getenv("REFRESH_TOKEN_EXPIRE_DAYS", "7")),
+        token_cache_size=int(os.getenv("TOKEN_CACHE_SIZE", "1024")),
+        revocation_sync_interval_seconds=float(os.getenv("REVOCATION_SYNC_INTERVAL_SECONDS", "5")),
+        password_hash_workers=int(os.getenv("PASSWORD_HASH_WORKERS", "2")),
+        password_hash_queue_size=int(os.getenv("PASSWORD_HASH_QUEUE_SIZE", "32")),
+        password_hash_processes=int(os.getenv("PASSWORD_HASH_PROCESSES", "0")),
+        password_hash_process_queue_size=int(os.getenv("PASSWORD_HASH_PROCESS_QUEUE_SIZE", "0")),
+        user_import_max_rows=int(os.getenv("USER_IMPORT_MAX_ROWS", "5000")),
+        user_import_chunk_size=int(os.getenv("USER_IMPORT_CHUNK_SIZE", "200")),
+        rate_limit_backend=os.getenv("RATE_LIMIT_BACKEND", "memory"),
+        rate_limit_sqlite_path=os.getenv("RATE_LIMIT_SQLITE_PATH", "./rate_limit.db"),
+        rate_limit_max_clients=int(os.getenv("RATE_LIMIT_MAX_CLIENTS", "100000")),
+        rate_limit_role_limits=_parse_int_mapping(
+            os.getenv("RATE_LIMIT_ROLE_LIMITS", "admin=600,collector=300,regular=120")
+        ),
+        rate_limit_heavy_per_minute=int(os.getenv("RATE_LIMIT_HEAVY_PER_MINUTE", "30")),
+        rate_limit_role_heavy_limits=_parse_int_mapping(
+            os.getenv("RATE_LIMIT_ROLE_HEAVY_LIMITS", "admin=200,collector=60,regular=60")
+        ),
+        trusted_proxies=[proxy for proxy in os.getenv("TRUSTED_PROXIES", "").split(",") if proxy.strip()],
+        refresh_token_purge_interval_seconds=int(os.getenv("REFRESH_TOKEN_PURGE_INTERVAL_SECONDS", "3600")),
+        refresh_token_purge_chunk_size=int(os.getenv("REFRESH_TOKEN_PURGE_CHUNK_SIZE", "1000")),
+        request_log_max_body_bytes=int(os.getenv("REQUEST_LOG_MAX_BODY_BYTES", "65536")),
+        request_log_max_field_chars=int(os.getenv("REQUEST_LOG_MAX_FIELD_CHARS", "256")),
+        request_log_sample_target_per_minute=int(os.getenv("REQUEST_LOG_SAMPLE_TARGET_PER_MINUTE", "60")),
+        request_log_slow_ms=float(os.getenv("REQUEST_LOG_SLOW_MS", "1000")),
+        request_log_summary_interval_seconds=float(os.getenv("REQUEST_LOG_SUMMARY_INTERVAL_SECONDS", "60")),
+        security_log_path=os.getenv("SECURITY_LOG_PATH", os.path.join(os.getcwd(), "logs", "security.log")),
+        security_log_queue_size=int(os.getenv("SECURITY_LOG_QUEUE_SIZE", "10000")),
+        security_log_batch_size=int(os.getenv("SECURITY_LOG_BATCH_SIZE", "256")),
+        security_log_flush_interval_seconds=float(os.getenv("SECURITY_LOG_FLUSH_INTERVAL_SECONDS", "0.5")),
+        security_log_drop_policy=os.getenv("SECURITY_LOG_DROP_POLICY", "drop_newest"),
+        security_log_max_bytes=int(os.getenv("SECURITY_LOG_MAX_BYTES", str(100 * 1024 * 1024))),
+        security_log_rotate_daily=os.getenv("SECURITY_LOG_ROTATE_DAILY", "true").lower() == "true",
+        security_log_retention_days=int(os.getenv("SECURITY_LOG_RETENTION_DAYS", "30")),
+        security_log_max_segments=int(os.getenv("SECURITY_LOG_MAX_SEGMENTS", "100")),
+        security_log_compress=os.getenv("SECURITY_LOG_COMPRESS", "true").lower() == "true",
+        security_audit_enabled=os.getenv("SECURITY_AUDIT_ENABLED", "true").lower() == "true",
+        security_audit_db_path=os.getenv(
+            "SECURITY_AUDIT_DB_PATH", os.path.join(os.getcwd(), "logs", "security_audit.db")
+        ),
+        security_audit_retention_days=int(os.getenv("SECURITY_AUDIT_RETENTION_DAYS", "90")),
+        compression_minimum_size=int(os.getenv("COMPRESSION_MINIMUM_SIZE", "1024")),
+        compression_thread_threshold_bytes=int(os.getenv("COMPRESSION_THREAD_THRESHOLD_BYTES", "262144")),
+        compression_gzip_level=int(os.getenv("COMPRESSION_GZIP_LEVEL", "6")),
+        admission_limits=_parse_int_mapping(
+            os.getenv("ADMISSION_LIMITS", "auth=16,collector=32,resident=64,admin=8")
+        ),
+        admission_queue_sizes=_parse_int_mapping(
+            os.getenv("ADMISSION_QUEUE_SIZES", "auth=64,collector=64,resident=128,admin=16")
+        ),
+        admission_queue_timeouts_ms=_parse_int_mapping(
+            os.getenv("ADMISSION_QUEUE_TIMEOUTS_MS", "auth=1000,collector=500,resident=1000,admin=5000")
+        ),
+        db_concurrency_initial_limits=_parse_int_mapping(
+            os.getenv("DB_CONCURRENCY_INITIAL_LIMITS", "read=8,write=2")
+        ),
+        db_concurrency_max_limits=_parse_int_mapping(os.getenv("DB_CONCURRENCY_MAX_LIMITS", "read=32,write=8")),
+        db_concurrency_queue_sizes=_parse_int_mapping(
+            os.getenv("DB_CONCURRENCY_QUEUE_SIZES", "read=256,write=128")
+        ),
+        db_concurrency_queue_timeouts_ms=_parse_int_mapping(
+            os.getenv("DB_CONCURRENCY_QUEUE_TIMEOUTS_MS", "read=1000,write=2000")
+        ),
+        db_concurrency_latency_tolerance=float(os.getenv("DB_CONCURRENCY_LATENCY_TOLERANCE", "1.5")),
+        payload_cache_limits=_parse_int_mapping(
+            os.getenv(
+                "PAYLOAD_CACHE_LIMITS",
+                "company=4194304,companies=4194304,collection=33554432,collections=33554432",
+            )
+        ),
     )
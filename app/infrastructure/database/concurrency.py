@@ -0,0 +1,329 @@
+import asyncio
+import math
+import time
+from collections import deque
+from functools import lru_cache
+from typing import Any, Awaitable, Callable, Deque, Dict, Optional, Tuple, TypeVar
+
+from sqlalchemy.exc import OperationalError, TimeoutError as PoolTimeoutError
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.sql.dml import UpdateBase
+
+from app.infrastructure.config import get_settings
+
+T = TypeVar("T")
+
+
+class DatabaseBusyError(RuntimeError):
+    """Lançada quando não há vaga para acessar o banco dentro do prazo da fila."""
+
+
+class AdaptiveConcurrencyLimiter:
+    """
+    Limite adaptativo de operações simultâneas no banco (estilo gradiente).
+
+    Cada operação ocupa uma vaga enquanto trabalha no banco (ver
+    LimitedAsyncSession), e a duração é a amostra de latência. A cada janela de amostras, o limiter
+    compara a latência média da janela com a de referência (a menor média de
+    janela, que sobe devagar com o tempo): enquanto ela não passa de
+    `latency_tolerance` vezes a referência, o limite cresce (uma vaga por
+    janela, suavizado); quando passa, o limite cai na proporção do gradiente
+    (no máximo pela metade). Erros operacionais do banco (timeout do pool,
+    banco travado) cortam o limite pela metade. O limite só é ajustado quando
+    está em uso, para não disparar com a carga baixa.
+
+    Operações além do limite esperam em uma fila limitada, com prazo; com a
+    fila cheia ou o prazo vencido, DatabaseBusyError é lançada na hora, em
+    vez de mais corrotinas se acumularem no pool ou no lock de escrita do
+    SQLite e a vazão cair junto com a latência de todas.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        initial_limit: int,
+        max_limit: int,
+        min_limit: int = 1,
+        queue_size: int = 0,
+        queue_timeout: float = 1.0,
+        latency_tolerance: float = 1.5,
+        smoothing: float = 0.2,
+        window_size: int = 10,
+        baseline_drift_seconds: float = 60.0,
+    ):
+        self.name = name
+        self.min_limit = min_limit
+        self.max_limit = max(max_limit, min_limit)
+        self.queue_size = queue_size
+        self.queue_timeout = queue_timeout
+        self.latency_tolerance = latency_tolerance
+        self.smoothing = smoothing
+        self.window_size = window_size
+        self.baseline_drift_seconds = baseline_drift_seconds
+        self._last_update = time.monotonic()
+        self._limit = float(min(max(initial_limit, min_limit), self.max_limit))
+        # Latência média da última janela e a de referência (menor média de janela)
+        self._latency: Optional[float] = None
+        self._baseline: Optional[float] = None
+        self._window_sum = 0.0
+        self._window_count = 0
+        self._window_in_flight = 0
+        self._window_error = False
+
+        # Estado acessado apenas a partir do event loop
+        self.in_flight = 0
+        self.waiters: Deque[asyncio.Future] = deque()
+        self.admitted = 0
+        self.rejected = 0
+        self.timed_out = 0
+        self.errors = 0
+
+    @property
+    def limit(self) -> int:
+        return int(self._limit)
+
+    async def acquire(self) -> None:
+        """
+        Ocupa uma vaga; espera na fila até `queue_timeout` segundos.
+
+        Raises:
+            DatabaseBusyError: Se a fila estiver cheia ou o prazo vencer
+        """
+        if self.in_flight < self.limit and not self.waiters:
+            self.in_flight += 1
+            self.admitted += 1
+            return
+        if len(self.waiters) >= self.queue_size:
+            self.rejected += 1
+            raise DatabaseBusyError(f"Limite de acesso ao banco '{self.name}' atingido")
+
+        waiter = asyncio.get_running_loop().create_future()
+        self.waiters.append(waiter)
+        try:
+            await asyncio.wait({waiter}, timeout=self.queue_timeout)
+        except BaseException:
+            # Cancelada enquanto esperava: devolver a vaga se ela já foi concedida
+            if waiter.done() and not waiter.cancelled():
+                self._release_slot()
+            else:
+                waiter.cancel()
+                self._discard(waiter)
+            raise
+        if waiter.done():
+            # A vaga foi concedida por _wake(); in_flight já a conta
+            self.admitted += 1
+            return
+        waiter.cancel()
+        self._discard(waiter)
+        self.timed_out += 1
+        raise DatabaseBusyError(f"Prazo da fila de acesso ao banco '{self.name}' vencido")
+
+    def release(self, latency: float, error: bool = False) -> None:
+        """Devolve a vaga e registra a latência observada (segundos)."""
+        self._record(latency, error)
+        self._release_slot()
+
+    def _record(self, latency: float, error: bool) -> None:
+        if error:
+            self.errors += 1
+            # Erro do banco: corta o limite pela metade, uma vez por janela
+            if not self._window_error:
+                self._window_error = True
+                self._limit = max(self.min_limit, self._limit / 2)
+        self._window_sum += latency
+        self._window_count += 1
+        self._window_in_flight = max(self._window_in_flight, self.in_flight)
+        # Uma janela tem ao menos `window_size` amostras e, com limites altos, uma por vaga
+        if self._window_count >= max(self.window_size, self.limit):
+            self._update_limit()
+
+    def _update_limit(self) -> None:
+        latency = self._window_sum / self._window_count
+        used = self._window_in_flight
+        error = self._window_error
+        self._window_sum = 0.0
+        self._window_count = 0
+        self._window_in_flight = 0
+        self._window_error = False
+        self._latency = latency
+        now = time.monotonic()
+        elapsed = now - self._last_update
+        self._last_update = now
+        if self._baseline is None:
+            self._baseline = latency
+            return
+
+        if latency < self._baseline:
+            self._baseline = latency
+        else:
+            # A referência é a menor latência vista e só sobe devagar (constante de tempo
+            # `baseline_drift_seconds`): a sobrecarga não vira o novo normal, mas
+            # consultas que ficaram mais pesadas acabam acompanhadas
+            drift = 1 - math.exp(-elapsed / self.baseline_drift_seconds)
+            self._baseline += (latency - self._baseline) * drift
+
+        # Com menos da metade das vagas em uso, a latência não diz nada sobre o limite
+        if error or used < self._limit / 2:
+            return
+        gradient = max(0.5, min(1.0, self.latency_tolerance * self._baseline / latency))
+        new_limit = self._limit * gradient + 1
+        self._limit = self._limit * (1 - self.smoothing) + new_limit * self.smoothing
+        self._limit = max(self.min_limit, min(self.max_limit, self._limit))
+
+    def _release_slot(self) -> None:
+        self.in_flight -= 1
+        self._wake()
+
+    def _wake(self) -> None:
+        # Concede as vagas livres, na ordem de chegada, a quem está na fila
+        while self.waiters and self.in_flight < self.limit:
+            waiter = self.waiters.popleft()
+            if not waiter.done():
+                self.in_flight += 1
+                waiter.set_result(None)
+
+    def _discard(self, waiter: asyncio.Future) -> None:
+        try:
+            self.waiters.remove(waiter)
+        except ValueError:
+            pass
+
+    def stats(self) -> Dict[str, Any]:
+        """Retorna o limite atual, a ocupação, a fila e as recusas."""
+        return {
+            "limit": self.limit,
+            "max_limit": self.max_limit,
+            "in_flight": self.in_flight,
+            "queued": len(self.waiters),
+            "queue_size": self.queue_size,
+            "admitted": self.admitted,
+            "rejected": self.rejected,
+            "timed_out": self.timed_out,
+            "errors": self.errors,
+            "latency_ms": round((self._latency or 0.0) * 1000, 3),
+            "baseline_latency_ms": round((self._baseline or 0.0) * 1000, 3),
+        }
+
+
+class LimitedAsyncSession(AsyncSession):
+    """
+    AsyncSession que ocupa uma vaga dos limiters só durante o trabalho no banco.
+
+    Cada leitura (execute, get, refresh, ...) ocupa uma vaga de `read` enquanto
+    o comando roda. A primeira escrita (INSERT/UPDATE/DELETE, ou qualquer
+    comando com alterações pendentes, que serão enviadas pelo autoflush) ocupa
+    uma vaga de `write` até o fim da transação, enquanto a conexão de escrita
+    está em uso. O processamento da requisição entre um comando e outro (ex.: o
+    bcrypt do login) não ocupa vaga nem entra na latência. Sem `limiters`
+    (scripts), nada é limitado.
+
+    Raises:
+        DatabaseBusyError: Nos comandos, se não houver vaga dentro do prazo da fila
+    """
+
+    def __init__(self, *args: Any, limiters: Optional[Dict[str, AdaptiveConcurrencyLimiter]] = None, **kwargs: Any):
+        super().__init__(*args, **kwargs)
+        self.limiters = limiters or {}
+        # Vaga de escrita ocupada até o fim da transação: (limiter, início)
+        self._write_slot: Optional[Tuple[AdaptiveConcurrencyLimiter, float]] = None
+        self._write_error = False
+
+    def _has_pending_writes(self) -> bool:
+        sync_session = self.sync_session
+        return bool(sync_session.new or sync_session.dirty or sync_session.deleted)
+
+    async def _run(self, write: Optional[bool], method: Callable[..., Awaitable[T]], *args: Any, **kwargs: Any) -> T:
+        # write=None: o comando não precisa de vaga própria (commit sem alterações)
+        limiter = None
+        if self._write_slot is None and self.limiters and write is not None:
+            write = write or self._has_pending_writes()
+            limiter = self.limiters.get("write" if write else "read")
+        if limiter is not None:
+            await limiter.acquire()
+        start = time.perf_counter()
+        if limiter is not None and write:
+            self._write_slot = (limiter, start)
+
+        error = False
+        try:
+            return await method(*args, **kwargs)
+        except (OperationalError, PoolTimeoutError):
+            error = True
+            if self._write_slot is not None:
+                self._write_error = True
+            raise
+        finally:
+            if limiter is not None and not write:
+                limiter.release(time.perf_counter() - start, error)
+
+    def _end_write(self) -> None:
+        if self._write_slot is not None:
+            limiter, start = self._write_slot
+            self._write_slot = None
+            limiter.release(time.perf_counter() - start, self._write_error)
+            self._write_error = False
+
+    async def execute(self, statement: Any, *args: Any, **kwargs: Any) -> Any:
+        return await self._run(isinstance(statement, UpdateBase), super().execute, statement, *args, **kwargs)
+
+    async def scalar(self, statement: Any, *args: Any, **kwargs: Any) -> Any:
+        return await self._run(isinstance(statement, UpdateBase), super().scalar, statement, *args, **kwargs)
+
+    async def stream(self, statement: Any, *args: Any, **kwargs: Any) -> Any:
+        return await self._run(isinstance(statement, UpdateBase), super().stream, statement, *args, **kwargs)
+
+    async def get(self, *args: Any, **kwargs: Any) -> Any:
+        return await self._run(False, super().get, *args, **kwargs)
+
+    async def get_one(self, *args: Any, **kwargs: Any) -> Any:
+        return await self._run(False, super().get_one, *args, **kwargs)
+
+    async def refresh(self, *args: Any, **kwargs: Any) -> None:
+        await self._run(False, super().refresh, *args, **kwargs)
+
+    async def merge(self, *args: Any, **kwargs: Any) -> Any:
+        return await self._run(False, super().merge, *args, **kwargs)
+
+    async def delete(self, *args: Any, **kwargs: Any) -> None:
+        await self._run(False, super().delete, *args, **kwargs)
+
+    async def flush(self, *args: Any, **kwargs: Any) -> None:
+        await self._run(self._has_pending_writes() or None, super().flush, *args, **kwargs)
+
+    async def commit(self) -> None:
+        try:
+            await self._run(self._has_pending_writes() or None, super().commit)
+        finally:
+            self._end_write()
+
+    async def rollback(self) -> None:
+        try:
+            await super().rollback()
+        finally:
+            self._end_write()
+
+    async def close(self) -> None:
+        try:
+            await super().close()
+        finally:
+            self._end_write()
+
+
+@lru_cache()
+def get_db_limiters() -> Dict[str, AdaptiveConcurrencyLimiter]:
+    """Limiters de leitura e escrita; uma classe com limite máximo 0 não é limitada."""
+    settings = get_settings()
+    limiters = {}
+    for kind in ("read", "write"):
+        max_limit = settings.db_concurrency_max_limits.get(kind, 0)
+        if max_limit <= 0:
+            continue
+        limiters[kind] = AdaptiveConcurrencyLimiter(
+            name=kind,
+            initial_limit=settings.db_concurrency_initial_limits.get(kind, 1),
+            max_limit=max_limit,
+            queue_size=settings.db_concurrency_queue_sizes.get(kind, 0),
+            queue_timeout=settings.db_concurrency_queue_timeouts_ms.get(kind, 1000) / 1000,
+            latency_tolerance=settings.db_concurrency_latency_tolerance,
+        )
+    return limiters
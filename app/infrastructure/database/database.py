@@ -1,23 +1,41 @@
+from fastapi import Request
 from sqlalchemy import create_engine
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import sessionmaker
-from sqlalchemy.ext.asyncio import create_async_engine, AsyncSession
+from sqlalchemy.ext.asyncio import create_async_engine
 from sqlalchemy.orm import sessionmaker
 
 from app.infrastructure.config import get_settings
+from app.infrastructure.database.concurrency import LimitedAsyncSession, get_db_limiters
+from app.infrastructure.database.pool import engine_options
+from app.infrastructure.database.sqlite import RoutingSession, create_sqlite_engines, is_sqlite_file
 
 settings = get_settings()
 
 SQLALCHEMY_DATABASE_URL = settings.database_url
 
-engine = create_async_engine(SQLALCHEMY_DATABASE_URL)
-SessionLocal = sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
+if is_sqlite_file(SQLALCHEMY_DATABASE_URL):
+    # Perfil SQLite: uma conexão de escrita serializada e um pool de leitura
+    engine, read_engine = create_sqlite_engines(settings)
+    SessionLocal = sessionmaker(
+        class_=LimitedAsyncSession,
+        sync_session_class=RoutingSession,
+        writer=engine,
+        reader=read_engine,
+        expire_on_commit=False,
+    )
+    engines = {"write": engine, "read": read_engine}
+else:
+    engine = create_async_engine(SQLALCHEMY_DATABASE_URL, **engine_options(settings))
+    SessionLocal = sessionmaker(engine, class_=LimitedAsyncSession, expire_on_commit=False)
+    engines = {"primary": engine}
 
 Base = declarative_base()
 
 
-async def get_db():
-    db = SessionLocal()
+async def get_db(request: Request = None):
+    # Fora de requisições (scripts), a sessão não passa pelos limiters
+    db = SessionLocal(limiters=get_db_limiters() if request is not None else None)
     try:
         yield db
     finally:
@@ -0,0 +1,72 @@
+import asyncio
+import logging
+import random
+
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+from app.infrastructure.auth.revocation import RevocationRegistry
+from app.infrastructure.database.database import SessionLocal
+from app.infrastructure.database.sqlite import optimize
+from app.infrastructure.repositories.refresh_token_repository_impl import RefreshTokenRepositoryImpl
+from app.infrastructure.repositories.token_revocation_repository_impl import TokenRevocationRepositoryImpl
+
+logger = logging.getLogger(__name__)
+
+
+async def purge_expired_refresh_tokens(chunk_size: int = 1000) -> int:
+    """Remove refresh tokens expirados em lotes e retorna quantos foram apagados."""
+    async with SessionLocal() as db:
+        return await RefreshTokenRepositoryImpl(db).purge_expired(chunk_size=chunk_size)
+
+
+async def purge_expired_token_revocations() -> int:
+    """Remove revogações que não afetam mais nenhum access token válido."""
+    async with SessionLocal() as db:
+        return await TokenRevocationRepositoryImpl(db).purge_expired()
+
+
+async def sync_token_revocations(registry: RevocationRegistry) -> int:
+    """Atualiza o estado de revogação em memória a partir do banco."""
+    async with SessionLocal() as db:
+        return await registry.sync(TokenRevocationRepositoryImpl(db))
+
+
+async def run_token_purge(interval_seconds: int, chunk_size: int = 1000) -> None:
+    """
+    Executa a limpeza de refresh tokens e revogações expirados periodicamente.
+
+    Um pequeno atraso aleatório inicial evita que todos os workers executem a
+    limpeza ao mesmo tempo.
+    """
+    await asyncio.sleep(random.uniform(0, min(interval_seconds, 60)))
+    while True:
+        try:
+            purged = await purge_expired_refresh_tokens(chunk_size)
+            if purged:
+                logger.info("Refresh tokens expirados removidos: %d", purged)
+            purged = await purge_expired_token_revocations()
+            if purged:
+                logger.info("Revogações expiradas removidas: %d", purged)
+        except Exception:
+            logger.exception("Falha ao remover tokens expirados")
+        await asyncio.sleep(interval_seconds)
+
+
+async def run_revocation_sync(registry: RevocationRegistry, interval_seconds: float) -> None:
+    """Propaga periodicamente para este worker as revogações feitas em outros workers."""
+    while True:
+        await asyncio.sleep(interval_seconds)
+        try:
+            await sync_token_revocations(registry)
+        except Exception:
+            logger.exception("Falha ao sincronizar revogações de tokens")
+
+
+async def run_sqlite_optimize(engine: AsyncEngine, interval_seconds: int) -> None:
+    """Executa `PRAGMA optimize` periodicamente no perfil SQLite."""
+    while True:
+        await asyncio.sleep(interval_seconds)
+        try:
+            await optimize(engine)
+        except Exception:
+            logger.exception("Falha ao executar PRAGMA optimize")
@@ -1,18 +1,36 @@
 from datetime import datetime
 import uuid
-from typing import List
+from typing import Any, List, Optional
 
-from sqlalchemy import Column, String, DateTime, ForeignKey, Float, Table, JSON, Boolean
+from sqlalchemy import Column, String, DateTime, ForeignKey, Float, Integer, Index, Table, JSON, Boolean
 from sqlalchemy.orm import relationship
+from sqlalchemy.types import TypeDecorator
 
 from app.infrastructure.database.database import Base
 
 
+class UUIDString(TypeDecorator):
+    """
+    Identificador armazenado como texto.
+
+    Aceita UUID nos parâmetros (ex.: `Model.id == collection_id` com o UUID do
+    path), convertendo para a mesma representação textual gravada no banco.
+    """
+
+    impl = String
+    cache_ok = True
+
+    def process_bind_param(self, value: Any, dialect: Any) -> Optional[str]:
+        if value is None:
+            return None
+        return str(value)
+
+
 # Association table for company zip codes
 company_zip_codes = Table(
     "company_zip_codes",
     Base.metadata,
-    Column("company_id", String, ForeignKey("companies.id"), primary_key=True),
+    Column("company_id", UUIDString, ForeignKey("companies.id"), primary_key=True),
     Column("zip_code", String, primary_key=True),
 )
 
@@ -20,14 +38,14 @@ company_zip_codes = Table(
 class UserModel(Base):
     __tablename__ = "users"
 
-    id = Column(String, primary_key=True, index=True, default=lambda: str(uuid.uuid4()))
+    id = Column(UUIDString, primary_key=True, index=True, default=lambda: str(uuid.uuid4()))
     username = Column(String, unique=True, index=True)
     email = Column(String, unique=True, index=True)
     hashed_password = Column(String)
     role = Column(String)
     created_at = Column(DateTime, default=datetime.utcnow)
     updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
-    company_id = Column(String, ForeignKey("companies.id"), nullable=True)
+    company_id = Column(UUIDString, ForeignKey("companies.id"), nullable=True, index=True)
     profile_type = Column(String, nullable=True)  # ADMIN, COMPANY_OWNER, COLLECTOR, REGULAR_USER
 
     # Relationships
@@ -39,7 +57,7 @@ class UserModel(Base):
 class CompanyModel(Base):
     __tablename__ = "companies"
 
-    id = Column(String, primary_key=True, index=True, default=lambda: str(uuid.uuid4()))
+    id = Column(UUIDString, primary_key=True, index=True, default=lambda: str(uuid.uuid4()))
     name = Column(String, index=True)
     description = Column(String)
     created_at = Column(DateTime, default=datetime.utcnow)
@@ -55,7 +73,8 @@ class ZipCodeModel(Base):
     __tablename__ = "zip_codes"
 
     zip_code = Column(String, primary_key=True, index=True)
-    company_id = Column(String, ForeignKey("companies.id"), primary_key=True)
+    # A chave primária começa por zip_code; as consultas por empresa precisam de índice próprio
+    company_id = Column(UUIDString, ForeignKey("companies.id"), primary_key=True, index=True)
 
     # Relationships
     company = relationship("CompanyModel", back_populates="zip_codes")
@@ -63,19 +82,24 @@ class ZipCodeModel(Base):
 
 class CollectionModel(Base):
     __tablename__ = "collections"
-
-    id = Column(String, primary_key=True, index=True, default=lambda: str(uuid.uuid4()))
-    user_id = Column(String, ForeignKey("users.id"))
+    __table_args__ = (
+        # Listas por solicitante e por coletor, e a versão delas (count + max(updated_at))
+        Index("ix_collections_user_id_updated_at", "user_id", "updated_at"),
+        Index("ix_collections_collector_id_updated_at", "collector_id", "updated_at"),
+    )
+
+    id = Column(UUIDString, primary_key=True, index=True, default=lambda: str(uuid.uuid4()))
+    user_id = Column(UUIDString, ForeignKey("users.id"))
     description = Column(String)
     location_latitude = Column(Float)
     location_longitude = Column(Float)
-    zip_code = Column(String)
+    zip_code = Column(String, index=True)
     images = Column(JSON)  # Store as JSON array in SQLite
-    status = Column(String)
+    status = Column(String, index=True)
     created_at = Column(DateTime, default=datetime.utcnow)
     updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
-    collector_id = Column(String, ForeignKey("users.id"), nullable=True)
-    company_id = Column(String, ForeignKey("companies.id"), nullable=True)
+    collector_id = Column(UUIDString, ForeignKey("users.id"), nullable=True)
+    company_id = Column(UUIDString, ForeignKey("companies.id"), nullable=True, index=True)
 
     # Relationships
     user = relationship("UserModel", back_populates="collections_requested", foreign_keys=[user_id])
@@ -86,12 +110,26 @@ class CollectionModel(Base):
 class RefreshTokenModel(Base):
     __tablename__ = "refresh_tokens"
 
-    id = Column(String, primary_key=True, index=True, default=lambda: str(uuid.uuid4()))
-    token = Column(String, unique=True, index=True)
-    expires_at = Column(DateTime)
-    user_id = Column(String, ForeignKey("users.id"))
+    id = Column(UUIDString, primary_key=True, index=True, default=lambda: str(uuid.uuid4()))
+    # Apenas o digest SHA-256 do token é armazenado; o valor original nunca é persistido
+    token_hash = Column(String(64), unique=True, index=True, nullable=False)
+    family_id = Column(UUIDString, index=True, nullable=False)
+    expires_at = Column(DateTime, index=True)
+    user_id = Column(UUIDString, ForeignKey("users.id"), index=True)
     revoked = Column(Boolean, default=False)
+    replaced_by = Column(UUIDString, nullable=True)
     created_at = Column(DateTime, default=datetime.utcnow)
 
     # Relationships
     user = relationship("UserModel", backref="refresh_tokens")
+
+
+class TokenRevocationModel(Base):
+    __tablename__ = "token_revocations"
+
+    id = Column(Integer, primary_key=True, autoincrement=True)
+    kind = Column(String, nullable=False)  # token (jti) ou user (época de revogação)
+    subject = Column(String, nullable=False)
+    issued_before = Column(DateTime, nullable=True)
+    expires_at = Column(DateTime, index=True, nullable=False)
+    created_at = Column(DateTime, default=datetime.utcnow, index=True)
@@ -0,0 +1,114 @@
+import asyncio
+import time
+from contextlib import AsyncExitStack
+from typing import Any, Dict
+
+from sqlalchemy import exc, text
+from sqlalchemy.engine import make_url
+from sqlalchemy.ext.asyncio import AsyncEngine
+from sqlalchemy.pool import AsyncAdaptedQueuePool, Pool
+
+from app.infrastructure.config import Settings
+
+
+class InstrumentedAsyncQueuePool(AsyncAdaptedQueuePool):
+    """
+    AsyncAdaptedQueuePool que mede o tempo de obtenção das conexões.
+
+    O tempo de `_do_get` inclui a espera por uma conexão livre e, no overflow,
+    a abertura da conexão; esgotado `pool_timeout`, a obtenção conta como
+    timeout. Os contadores são lidos por `pool_stats`.
+    """
+
+    def __init__(self, *args: Any, **kwargs: Any):
+        super().__init__(*args, **kwargs)
+        self.checkouts = 0
+        self.timeouts = 0
+        self.wait_total = 0.0
+        self.wait_max = 0.0
+
+    def _do_get(self):
+        start = time.perf_counter()
+        try:
+            return super()._do_get()
+        except exc.TimeoutError:
+            self.timeouts += 1
+            raise
+        finally:
+            waited = time.perf_counter() - start
+            self.checkouts += 1
+            self.wait_total += waited
+            self.wait_max = max(self.wait_max, waited)
+
+
+def engine_options(settings: Settings) -> Dict[str, Any]:
+    """
+    Argumentos de `create_async_engine` conforme o banco de DATABASE_URL.
+
+    No PostgreSQL (asyncpg): tamanho e overflow do pool, prazo de obtenção,
+    reciclagem e pre-ping das conexões, cache de prepared statements do
+    asyncpg e `statement_timeout` no servidor. O SQLite em arquivo tem seus
+    próprios engines (`sqlite.create_sqlite_engines`); o SQLite em memória
+    mantém o pool padrão do dialeto.
+    """
+    url = make_url(settings.database_url)
+    if url.get_backend_name() == "postgresql":
+        server_settings = {"application_name": settings.app_name}
+        if settings.db_statement_timeout_ms > 0:
+            server_settings["statement_timeout"] = str(settings.db_statement_timeout_ms)
+        return {
+            "poolclass": InstrumentedAsyncQueuePool,
+            "pool_size": settings.db_pool_size,
+            "max_overflow": settings.db_max_overflow,
+            "pool_timeout": settings.db_pool_timeout_seconds,
+            "pool_recycle": settings.db_pool_recycle_seconds,
+            "pool_pre_ping": settings.db_pool_pre_ping,
+            "connect_args": {
+                "prepared_statement_cache_size": settings.db_statement_cache_size,
+                "server_settings": server_settings,
+            },
+        }
+    return {}
+
+
+async def warm_up_pool(engine: AsyncEngine, connections: int) -> int:
+    """
+    Abre `connections` conexões simultâneas e as devolve ao pool.
+
+    Evita que as primeiras requisições paguem a abertura das conexões (TCP,
+    TLS, autenticação). Returns: quantidade de conexões abertas.
+    """
+    connections = min(connections, engine.pool.size()) if isinstance(engine.pool, AsyncAdaptedQueuePool) else 0
+    if connections <= 0:
+        return 0
+    async with AsyncExitStack() as stack:
+        opened = await asyncio.gather(
+            *(stack.enter_async_context(engine.connect()) for _ in range(connections))
+        )
+        for connection in opened:
+            await connection.execute(text("SELECT 1"))
+    return connections
+
+
+def pool_stats(pool: Pool) -> Dict[str, Any]:
+    """Ocupação do pool e, no pool instrumentado, as esperas por conexão."""
+    if not isinstance(pool, AsyncAdaptedQueuePool):
+        return {"pool": type(pool).__name__}
+    stats = {
+        "pool": type(pool).__name__,
+        "size": pool.size(),
+        "checked_in": pool.checkedin(),
+        "checked_out": pool.checkedout(),
+        "overflow": max(pool.overflow(), 0),
+        "max_overflow": pool._max_overflow,
+    }
+    if isinstance(pool, InstrumentedAsyncQueuePool):
+        stats.update(
+            {
+                "checkouts": pool.checkouts,
+                "timeouts": pool.timeouts,
+                "wait_avg_ms": round(pool.wait_total / pool.checkouts * 1000, 3) if pool.checkouts else 0.0,
+                "wait_max_ms": round(pool.wait_max * 1000, 3),
+            }
+        )
+    return stats
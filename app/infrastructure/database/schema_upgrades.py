@@ -0,0 +1,108 @@
+import hashlib
+import logging
+from pathlib import Path
+from typing import Optional
+
+from alembic import command
+from alembic.config import Config
+from sqlalchemy import Boolean, Column, DateTime, MetaData, String, Table, inspect, select
+from sqlalchemy.engine import Connection
+
+from app.infrastructure.database.models import Base, RefreshTokenModel
+
+logger = logging.getLogger(__name__)
+
+MIGRATIONS_DIR = Path(__file__).resolve().parents[3] / "migrations"
+# Revisão equivalente ao schema criado pelo create_all antes das migrações versionadas
+BASELINE_REVISION = "0001"
+
+# Colunas lidas do formato antigo, com os tipos para que as datas voltem como datetime
+_legacy_refresh_tokens = Table(
+    "refresh_tokens",
+    MetaData(),
+    Column("id", String, primary_key=True),
+    Column("token", String),
+    Column("expires_at", DateTime),
+    Column("user_id", String),
+    Column("revoked", Boolean),
+    Column("created_at", DateTime),
+)
+
+
+def upgrade_refresh_tokens(connection: Connection) -> int:
+    """
+    Migra a tabela refresh_tokens do formato antigo (token em texto puro).
+
+    O formato atual guarda apenas o SHA-256 do token (`token_hash`), a família
+    de rotação (`family_id`) e o substituto (`replaced_by`). As linhas antigas
+    são copiadas com o digest do token e cada token vira uma família própria,
+    de modo que as sessões existentes continuam válidas. Chamada por
+    `upgrade_schema` ao adotar um banco sem versionamento; não faz nada se a
+    tabela já estiver no formato atual ou ainda não existir.
+
+    Returns:
+        int: Quantidade de refresh tokens migrados
+    """
+    inspector = inspect(connection)
+    if not inspector.has_table("refresh_tokens"):
+        return 0
+    columns = {column["name"] for column in inspector.get_columns("refresh_tokens")}
+    if "token_hash" in columns or "token" not in columns:
+        return 0
+
+    rows = connection.execute(select(_legacy_refresh_tokens)).mappings().all()
+    # Remover a tabela antiga também remove seus índices, cujos nomes seriam
+    # recriados pela tabela nova
+    RefreshTokenModel.__table__.drop(connection)
+    RefreshTokenModel.__table__.create(connection)
+    migrated = [
+        {
+            "id": row["id"],
+            "token_hash": hashlib.sha256(row["token"].encode("utf-8")).hexdigest(),
+            "family_id": row["id"],
+            "expires_at": row["expires_at"],
+            "user_id": row["user_id"],
+            "revoked": bool(row["revoked"]),
+            "replaced_by": None,
+            "created_at": row["created_at"],
+        }
+        for row in rows
+        if row["token"]
+    ]
+    if migrated:
+        connection.execute(RefreshTokenModel.__table__.insert(), migrated)
+    logger.info("refresh_tokens migrada para token_hash: %d tokens", len(migrated))
+    return len(migrated)
+
+
+def alembic_config(connection: Optional[Connection] = None) -> Config:
+    """Configuração do Alembic para `migrations/`, opcionalmente sobre uma conexão aberta."""
+    config = Config()
+    config.set_main_option("script_location", str(MIGRATIONS_DIR))
+    if connection is not None:
+        config.attributes["connection"] = connection
+    return config
+
+
+def upgrade_schema(connection: Connection) -> int:
+    """
+    Leva o banco até a última revisão de `migrations/versions`.
+
+    Um banco sem `alembic_version` mas com tabelas foi criado pelo
+    `create_all`: a tabela refresh_tokens antiga é migrada, as tabelas que
+    faltarem são criadas e o banco é marcado na revisão inicial antes do
+    upgrade, que então só aplica as revisões seguintes (ex.: os índices).
+
+    Returns:
+        int: Quantidade de refresh tokens migrados do formato antigo
+    """
+    config = alembic_config(connection)
+    inspector = inspect(connection)
+    migrated = 0
+    if inspector.has_table("users") and not inspector.has_table("alembic_version"):
+        migrated = upgrade_refresh_tokens(connection)
+        Base.metadata.create_all(connection)
+        command.stamp(config, BASELINE_REVISION)
+        logger.info("Banco sem versionamento marcado na revisão %s", BASELINE_REVISION)
+    command.upgrade(config, "head")
+    return migrated
@@ -0,0 +1,102 @@
+from typing import Any, Optional, Tuple
+
+from sqlalchemy import event, text
+from sqlalchemy.engine import make_url
+from sqlalchemy.ext.asyncio import AsyncEngine, create_async_engine
+from sqlalchemy.orm import Session
+from sqlalchemy.sql.dml import UpdateBase
+
+from app.infrastructure.config import Settings
+from app.infrastructure.database.pool import InstrumentedAsyncQueuePool
+
+
+def is_sqlite_file(database_url: str) -> bool:
+    """True para SQLite em arquivo; o SQLite em memória não usa o perfil."""
+    url = make_url(database_url)
+    return url.get_backend_name() == "sqlite" and url.database not in (None, "", ":memory:")
+
+
+def _apply_pragmas(dbapi_connection: Any, settings: Settings, read_only: bool) -> None:
+    cursor = dbapi_connection.cursor()
+    # busy_timeout primeiro: a troca para WAL espera por outros processos em vez de falhar
+    cursor.execute(f"PRAGMA busy_timeout = {int(settings.sqlite_busy_timeout_ms)}")
+    cursor.execute("PRAGMA journal_mode = WAL")
+    cursor.execute("PRAGMA synchronous = NORMAL")
+    cursor.execute(f"PRAGMA mmap_size = {int(settings.sqlite_mmap_size_bytes)}")
+    # Valor negativo: tamanho em KiB, e não em páginas
+    cursor.execute(f"PRAGMA cache_size = -{int(settings.sqlite_cache_size_kib)}")
+    cursor.execute("PRAGMA temp_store = MEMORY")
+    if read_only:
+        cursor.execute("PRAGMA query_only = ON")
+    cursor.close()
+
+
+def create_sqlite_engines(settings: Settings) -> Tuple[AsyncEngine, AsyncEngine]:
+    """
+    Cria o engine de escrita e o de leitura do perfil SQLite.
+
+    Toda conexão sai com WAL, `synchronous=NORMAL`, `busy_timeout`, mmap e
+    cache configurados. O engine de escrita tem uma única conexão por worker,
+    de modo que as escritas do processo são serializadas no pool em vez de
+    disputarem o lock do arquivo; o de leitura tem um pool de conexões
+    `query_only`, que no WAL leem em paralelo sem bloquear nem ser
+    bloqueadas pelo escritor.
+
+    Returns:
+        Tuple[AsyncEngine, AsyncEngine]: (engine de escrita, engine de leitura)
+    """
+
+    def build(pool_size: int, read_only: bool) -> AsyncEngine:
+        engine = create_async_engine(
+            settings.database_url,
+            poolclass=InstrumentedAsyncQueuePool,
+            pool_size=pool_size,
+            max_overflow=0,
+            pool_timeout=settings.db_pool_timeout_seconds,
+        )
+
+        @event.listens_for(engine.sync_engine, "connect")
+        def set_pragmas(dbapi_connection: Any, connection_record: Any) -> None:
+            _apply_pragmas(dbapi_connection, settings, read_only)
+
+        return engine
+
+    return build(1, read_only=False), build(max(settings.sqlite_read_pool_size, 1), read_only=True)
+
+
+class RoutingSession(Session):
+    """
+    Sessão que escolhe o engine por operação.
+
+    Consultas vão para o pool de leitura; flush, INSERT, UPDATE e DELETE vão
+    para o escritor. Depois da primeira escrita, o restante da transação
+    também usa o escritor, para enxergar o que ainda não foi confirmado. Assim,
+    a conexão de escrita só é ocupada do primeiro comando de escrita até o
+    commit, e não durante as leituras e o processamento da requisição
+    (ex.: o bcrypt do login).
+    """
+
+    def __init__(self, writer: AsyncEngine, reader: AsyncEngine, **kwargs: Any):
+        super().__init__(**kwargs)
+        self._writer = writer.sync_engine
+        self._reader = reader.sync_engine
+        self._writing = False
+
+    def get_bind(self, mapper: Optional[Any] = None, clause: Optional[Any] = None, **kwargs: Any):
+        if self._writing or self._flushing or isinstance(clause, UpdateBase):
+            self._writing = True
+            return self._writer
+        return self._reader
+
+
+@event.listens_for(RoutingSession, "after_transaction_end")
+def _reset_routing(session: RoutingSession, transaction: Any) -> None:
+    # Uma nova transação volta a ler do pool de leitura
+    if transaction.parent is None:
+        session._writing = False
+
+
+async def optimize(engine: AsyncEngine) -> None:
+    """Executa `PRAGMA optimize`, que atualiza as estatísticas usadas pelo planejador."""
+    async with engine.connect() as connection:
+        await connection.execute(text("PRAGMA optimize"))
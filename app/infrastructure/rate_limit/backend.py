@@ -0,0 +1,105 @@
+import math
+from abc import ABC, abstractmethod
+from typing import NamedTuple, Optional
+
+
+class RateLimitResult(NamedTuple):
+    """Resultado de uma verificação do rate limiter."""
+
+    allowed: bool
+    limit: int
+    # Custo ainda disponível na janela deslizante
+    remaining: int
+    # Segundos até o fim da janela atual
+    reset_after: float
+    # Segundos até a requisição caber no limite (0 se permitida)
+    retry_after: float
+
+
+def sliding_window_result(
+    allowed: bool,
+    previous: int,
+    current: int,
+    offset: float,
+    window_size: float,
+    limit: int,
+    cost: int,
+) -> RateLimitResult:
+    """
+    Monta o RateLimitResult a partir dos contadores do "sliding window counter".
+
+    `previous` e `current` são os contadores da janela anterior e da atual já
+    após o incremento (se houve). A requisição cabe quando
+    floor(previous * peso + current) + cost <= limit, em que o peso é a fração
+    da janela anterior que ainda se sobrepõe ao intervalo deslizante.
+    """
+    weight = 1 - offset / window_size
+    used = int(previous * weight + current)
+    remaining = max(0, limit - used)
+    reset_after = window_size - offset
+    if allowed:
+        return RateLimitResult(True, limit, remaining, reset_after, 0.0)
+
+    budget = limit - cost + 1  # contagem estimada máxima (exclusiva) que ainda permite a requisição
+    if cost > limit:
+        # Nunca cabe no limite; sugerir uma janela inteira
+        retry_after = window_size
+    elif current < budget:
+        # Basta a janela anterior "escorrer" até caber: previous * peso(t) + current < budget
+        target_weight = (budget - current) / previous if previous else 1.0
+        retry_after = max(0.0, (1 - target_weight) * window_size - offset)
+    else:
+        # Só na próxima janela, quando a atual vira a anterior e passa a escorrer
+        retry_after = reset_after + max(0.0, 1 - budget / current) * window_size
+    # A condição é estrita: arredondar para o segundo seguinte, mesmo se exato
+    return RateLimitResult(False, limit, 0, reset_after, float(math.floor(retry_after) + 1))
+
+
+class RateLimitBackend(ABC):
+    """
+    Armazenamento dos contadores do rate limiter.
+
+    Os contadores são separados por `bucket` (ex.: "general", "auth") e, dentro
+    dele, por chave do cliente. Implementações compartilhadas entre processos
+    permitem que o limite configurado valha para o servidor inteiro, e não para
+    cada worker do uvicorn isoladamente.
+    """
+
+    @abstractmethod
+    async def hit(
+        self,
+        bucket: str,
+        key: str,
+        limit: int,
+        window_size: float,
+        cost: int = 1,
+        now: Optional[float] = None,
+    ) -> RateLimitResult:
+        """
+        Registra uma requisição de custo `cost` se ela couber no limite do cliente.
+
+        Requisições rejeitadas não são contabilizadas.
+        """
+        pass
+
+    def close(self) -> None:
+        """Libera recursos do backend (conexões, arquivos)."""
+
+
+class CounterStore(ABC):
+    """
+    Interface mínima de um armazenamento externo de contadores (ex.: Redis).
+
+    Usada pelo ExternalStoreRateLimitBackend; `incr` precisa ser atômico no
+    armazenamento, pois vários workers incrementam a mesma chave.
+    """
+
+    @abstractmethod
+    async def get(self, key: str) -> int:
+        """Retorna o valor do contador (0 se a chave não existir)."""
+        pass
+
+    @abstractmethod
+    async def incr(self, key: str, amount: int, ttl_seconds: float) -> int:
+        """Soma `amount` ao contador e retorna o novo valor; a chave expira após `ttl_seconds`."""
+        pass
@@ -0,0 +1,58 @@
+import logging
+import time
+from typing import Optional
+
+from app.infrastructure.rate_limit.backend import (
+    CounterStore,
+    RateLimitBackend,
+    RateLimitResult,
+    sliding_window_result,
+)
+
+logger = logging.getLogger(__name__)
+
+
+class ExternalStoreRateLimitBackend(RateLimitBackend):
+    """
+    Contadores em um armazenamento externo (ex.: Redis), compartilhados entre hosts.
+
+    Cada janela é uma chave própria que expira sozinha após duas janelas. O
+    incremento atômico do armazenamento decide a requisição; se o limite já foi
+    atingido, o incremento é desfeito para que requisições rejeitadas não contem.
+    Falhas do armazenamento liberam a requisição (fail open).
+    """
+
+    def __init__(self, store: CounterStore, prefix: str = "rate_limit"):
+        self.store = store
+        self.prefix = prefix
+        self.errors = 0
+
+    async def hit(
+        self,
+        bucket: str,
+        key: str,
+        limit: int,
+        window_size: float,
+        cost: int = 1,
+        now: Optional[float] = None,
+    ) -> RateLimitResult:
+        if now is None:
+            now = time.time()
+        window, offset = divmod(now, window_size)
+        window = int(window)
+        base_key = f"{self.prefix}:{bucket}:{key}"
+        current_key = f"{base_key}:{window}"
+        ttl = 2 * window_size
+
+        try:
+            previous = await self.store.get(f"{base_key}:{window - 1}")
+            current = await self.store.incr(current_key, cost, ttl)
+            estimated = int(previous * (1 - offset / window_size) + current - cost)
+            allowed = estimated + cost <= limit
+            if not allowed:
+                current = await self.store.incr(current_key, -cost, ttl)
+        except Exception:
+            self.errors += 1
+            logger.warning("Falha no armazenamento do rate limiter; requisição permitida", exc_info=True)
+            return RateLimitResult(True, limit, limit, window_size - offset, 0.0)
+        return sliding_window_result(allowed, previous, current, offset, window_size, limit, cost)
@@ -0,0 +1,103 @@
+import time
+from collections import OrderedDict
+from typing import Dict, Optional
+
+from app.infrastructure.rate_limit.backend import RateLimitBackend, RateLimitResult, sliding_window_result
+
+
+class _WindowSlot:
+    """Contadores de um cliente: janela atual e janela anterior."""
+
+    __slots__ = ("window", "current", "previous")
+
+    def __init__(self, window: int):
+        self.window = window
+        self.current = 0
+        self.previous = 0
+
+
+class SlidingWindowCounter:
+    """
+    Limitador de taxa por "sliding window counter" com memória limitada.
+
+    Cada cliente ocupa um slot fixo (contador da janela atual e da anterior);
+    a contagem na janela deslizante é estimada ponderando a janela anterior pela
+    fração que ainda se sobrepõe ao intervalo. O custo por requisição é
+    constante e o número de clientes rastreados é limitado por um LRU: ao
+    atingir `max_clients`, o cliente usado há mais tempo é descartado.
+    """
+
+    def __init__(self, window_size: float = 60, max_clients: int = 100_000):
+        self.window_size = window_size
+        self.max_clients = max_clients
+        self._slots: "OrderedDict[str, _WindowSlot]" = OrderedDict()
+        self.evictions = 0
+
+    def hit(self, key: str, limit: int, now: Optional[float] = None, cost: int = 1) -> RateLimitResult:
+        """Registra uma requisição de custo `cost` se ela couber no limite do cliente."""
+        if now is None:
+            now = time.time()
+        window, offset = divmod(now, self.window_size)
+        window = int(window)
+
+        slot = self._slots.get(key)
+        if slot is None:
+            slot = _WindowSlot(window)
+            self._slots[key] = slot
+            if len(self._slots) > self.max_clients:
+                self._slots.popitem(last=False)
+                self.evictions += 1
+        else:
+            self._slots.move_to_end(key)
+            if slot.window != window:
+                # Janela avançou: a atual vira a anterior (ou ambas zeram se houve um intervalo maior)
+                slot.previous = slot.current if slot.window == window - 1 else 0
+                slot.current = 0
+                slot.window = window
+
+        estimated = int(slot.previous * (1 - offset / self.window_size) + slot.current)
+        allowed = estimated + cost <= limit
+        if allowed:
+            slot.current += cost
+        return sliding_window_result(
+            allowed, slot.previous, slot.current, offset, self.window_size, limit, cost
+        )
+
+    def __len__(self) -> int:
+        return len(self._slots)
+
+    def stats(self) -> Dict[str, int]:
+        """Retorna estatísticas do limitador."""
+        return {
+            "clients": len(self._slots),
+            "max_clients": self.max_clients,
+            "evictions": self.evictions,
+        }
+
+
+class MemoryRateLimitBackend(RateLimitBackend):
+    """
+    Contadores em memória, um SlidingWindowCounter por bucket.
+
+    Mais rápido, porém cada processo tem os seus próprios contadores: com
+    vários workers o limite efetivo é multiplicado pelo número de workers.
+    """
+
+    def __init__(self, max_clients: int = 100_000):
+        self.max_clients = max_clients
+        self.counters: Dict[str, SlidingWindowCounter] = {}
+
+    async def hit(
+        self,
+        bucket: str,
+        key: str,
+        limit: int,
+        window_size: float,
+        cost: int = 1,
+        now: Optional[float] = None,
+    ) -> RateLimitResult:
+        counter = self.counters.get(bucket)
+        if counter is None:
+            counter = SlidingWindowCounter(window_size, self.max_clients)
+            self.counters[bucket] = counter
+        return counter.hit(key, limit, now, cost)
@@ -0,0 +1,225 @@
+import asyncio
+import logging
+import sqlite3
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, Optional, Tuple
+
+from app.infrastructure.rate_limit.backend import RateLimitBackend, RateLimitResult, sliding_window_result
+
+logger = logging.getLogger(__name__)
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS rate_limit_counters (
+    counter_key TEXT PRIMARY KEY,
+    window_index INTEGER NOT NULL,
+    current INTEGER NOT NULL,
+    previous INTEGER NOT NULL,
+    updated_at REAL NOT NULL
+)
+"""
+
+# Um único UPSERT faz a virada de janela, a verificação e o incremento. O SQLite
+# executa a instrução inteira sob o lock de escrita, então o incremento é atômico
+# entre processos. Se a requisição não cabe no limite, os WHEREs impedem o
+# INSERT/UPDATE e o RETURNING não devolve linhas. Nas expressões do SET as
+# colunas têm os valores antigos da linha.
+_HIT = """
+INSERT INTO rate_limit_counters (counter_key, window_index, current, previous, updated_at)
+SELECT :key, :window, :cost, 0, :now WHERE :cost <= :limit
+ON CONFLICT (counter_key) DO UPDATE SET
+    previous = CASE
+        WHEN window_index = :window THEN previous
+        WHEN window_index = :window - 1 THEN current
+        ELSE 0
+    END,
+    current = (CASE WHEN window_index = :window THEN current ELSE 0 END) + :cost,
+    window_index = :window,
+    updated_at = :now
+WHERE
+    CAST(
+        (CASE
+            WHEN window_index = :window THEN previous
+            WHEN window_index = :window - 1 THEN current
+            ELSE 0
+        END) * :weight
+        + (CASE WHEN window_index = :window THEN current ELSE 0 END)
+    AS INTEGER) + :cost <= :limit
+RETURNING current, previous
+"""
+
+_SELECT = "SELECT window_index, current, previous FROM rate_limit_counters WHERE counter_key = ?"
+
+
+class SQLiteRateLimitBackend(RateLimitBackend):
+    """
+    Contadores em um arquivo SQLite (modo WAL) compartilhado pelos workers locais.
+
+    Cada verificação é um único UPSERT em autocommit (uma transação curta); com
+    WAL e synchronous=NORMAL não há fsync por requisição. Se o banco falhar, a
+    requisição é permitida (fail open) para que o rate limiter nunca derrube a API.
+
+    O UPSERT roda direto no event loop, em uma conexão dedicada com
+    busy_timeout=0: ela nunca espera. Se outro worker estiver com o lock de
+    escrita, a verificação é refeita em uma thread dedicada, por uma segunda
+    conexão que espera até `busy_timeout_ms`; só esse caminho raro paga a troca
+    de thread. O checkpoint automático do WAL fica desligado na conexão do loop:
+    o checkpoint (que faz fsync) e a limpeza dos contadores antigos rodam na
+    mesma thread, em segundo plano.
+    """
+
+    def __init__(
+        self,
+        path: str,
+        busy_timeout_ms: int = 50,
+        prune_interval: float = 60,
+        checkpoint_writes: int = 1000,
+    ):
+        self.path = path
+        self.busy_timeout_ms = busy_timeout_ms
+        self.prune_interval = prune_interval
+        self.checkpoint_writes = checkpoint_writes
+        self._connection: Optional[sqlite3.Connection] = None  # event loop, sem espera
+        self._blocking_connection: Optional[sqlite3.Connection] = None  # thread, espera o lock
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._maintenance: Optional["asyncio.Future[None]"] = None
+        self._max_window_size = 0.0
+        self._last_prune = 0.0
+        self._writes = 0
+        self.contended = 0
+        self.errors = 0
+
+    def _connect(self, busy_timeout_ms: int, autocheckpoint: bool) -> sqlite3.Connection:
+        # Conexões abertas sob demanda, já dentro do processo do worker;
+        # `close` pode vir de outra thread no encerramento
+        connection = sqlite3.connect(
+            self.path, isolation_level=None, timeout=busy_timeout_ms / 1000, check_same_thread=False
+        )
+        try:
+            connection.execute("PRAGMA journal_mode=WAL")
+            connection.execute("PRAGMA synchronous=NORMAL")
+            connection.execute(f"PRAGMA busy_timeout={int(busy_timeout_ms)}")
+            if not autocheckpoint:
+                connection.execute("PRAGMA wal_autocheckpoint=0")
+            connection.execute(_SCHEMA)
+        except sqlite3.Error:
+            connection.close()
+            raise
+        return connection
+
+    def _get_executor(self) -> ThreadPoolExecutor:
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="rate-limit-sqlite")
+        return self._executor
+
+    async def hit(
+        self,
+        bucket: str,
+        key: str,
+        limit: int,
+        window_size: float,
+        cost: int = 1,
+        now: Optional[float] = None,
+    ) -> RateLimitResult:
+        if now is None:
+            now = time.time()
+        window, offset = divmod(now, window_size)
+        window = int(window)
+        counter_key = f"{bucket}:{key}"
+        self._max_window_size = max(self._max_window_size, window_size)
+        params = {
+            "key": counter_key,
+            "window": window,
+            "weight": 1 - offset / window_size,
+            "cost": cost,
+            "limit": limit,
+            "now": now,
+        }
+
+        try:
+            try:
+                if self._connection is None:
+                    self._connection = self._connect(0, autocheckpoint=False)
+                allowed, current, previous = self._check(self._connection, params)
+            except sqlite3.OperationalError:
+                # Lock de escrita com outro worker: espera fora do event loop
+                self.contended += 1
+                allowed, current, previous = await asyncio.get_running_loop().run_in_executor(
+                    self._get_executor(), self._check_blocking, params
+                )
+        except sqlite3.Error:
+            self.errors += 1
+            logger.warning("Falha no backend SQLite do rate limiter; requisição permitida", exc_info=True)
+            return RateLimitResult(True, limit, limit, window_size - offset, 0.0)
+
+        if allowed:
+            self._writes += 1
+        self._schedule_maintenance(now)
+        return sliding_window_result(allowed, previous, current, offset, window_size, limit, cost)
+
+    def _check(self, connection: sqlite3.Connection, params: Dict[str, Any]) -> Tuple[bool, int, int]:
+        row = connection.execute(_HIT, params).fetchone()
+        if row is not None:
+            current, previous = row
+            return True, current, previous
+        # Rejeitada: ler os contadores (só neste caminho) para calcular o Retry-After
+        current, previous = self._read_counters(connection, params["key"], params["window"])
+        return False, current, previous
+
+    def _check_blocking(self, params: Dict[str, Any]) -> Tuple[bool, int, int]:
+        if self._blocking_connection is None:
+            self._blocking_connection = self._connect(self.busy_timeout_ms, autocheckpoint=False)
+        return self._check(self._blocking_connection, params)
+
+    @staticmethod
+    def _read_counters(connection: sqlite3.Connection, counter_key: str, window: int) -> Tuple[int, int]:
+        row = connection.execute(_SELECT, (counter_key,)).fetchone()
+        if row is None:
+            return 0, 0
+        window_index, current, previous = row
+        if window_index == window:
+            return current, previous
+        return 0, current if window_index == window - 1 else 0
+
+    def _schedule_maintenance(self, now: float) -> None:
+        if self._maintenance is not None and not self._maintenance.done():
+            return
+        prune = now - self._last_prune > self.prune_interval
+        checkpoint = self._writes >= self.checkpoint_writes
+        if not (prune or checkpoint):
+            return
+        if prune:
+            self._last_prune = now
+        if checkpoint:
+            self._writes = 0
+        self._maintenance = asyncio.get_running_loop().run_in_executor(
+            self._get_executor(), self._maintain, now, prune, checkpoint
+        )
+
+    def _maintain(self, now: float, prune: bool, checkpoint: bool) -> None:
+        """Remove contadores sem uso há mais de duas janelas e faz o checkpoint do WAL."""
+        try:
+            if self._blocking_connection is None:
+                self._blocking_connection = self._connect(self.busy_timeout_ms, autocheckpoint=False)
+            if prune:
+                self._blocking_connection.execute(
+                    "DELETE FROM rate_limit_counters WHERE updated_at < ?",
+                    (now - 2 * self._max_window_size,),
+                )
+            if checkpoint:
+                # PASSIVE não bloqueia os outros workers
+                self._blocking_connection.execute("PRAGMA wal_checkpoint(PASSIVE)")
+        except sqlite3.Error:
+            self.errors += 1
+            logger.warning("Falha na manutenção do backend SQLite do rate limiter", exc_info=True)
+
+    def close(self) -> None:
+        if self._executor is not None:
+            self._executor.shutdown(wait=True)
+            self._executor = None
+            self._maintenance = None
+        for connection in (self._connection, self._blocking_connection):
+            if connection is not None:
+                connection.close()
+        self._connection = None
+        self._blocking_connection = None
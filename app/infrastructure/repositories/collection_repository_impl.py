@@ -1,12 +1,14 @@
-from typing import List, Optional
+from datetime import datetime
+from typing import List, Optional, Tuple
 from uuid import UUID
 
-from sqlalchemy import select
+from sqlalchemy import func, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.domain.entities.collection import Collection, CollectionStatus
+from app.domain.entities.collection import Collection, CollectionStatus, CollectionVersion
 from app.domain.repositories.collection_repository import CollectionRepository
 from app.infrastructure.database.models import CollectionModel
+from app.infrastructure.utils.payload_cache import get_payload_cache
 
 
 class CollectionRepositoryImpl(CollectionRepository):
@@ -30,6 +32,7 @@ class CollectionRepositoryImpl(CollectionRepository):
         )
         self.db.add(db_collection)
         await self.db.commit()
+        self._invalidate_cache(collection.id)
         await self.db.refresh(db_collection)
         return self._map_to_entity(db_collection)
 
@@ -40,6 +43,39 @@ class CollectionRepositoryImpl(CollectionRepository):
             return None
         return self._map_to_entity(db_collection)
 
+    async def get_version(self, collection_id: UUID) -> Optional[CollectionVersion]:
+        # Sem description/images: consulta pela chave primária, sem as colunas pesadas
+        result = await self.db.execute(
+            select(
+                CollectionModel.id,
+                CollectionModel.user_id,
+                CollectionModel.collector_id,
+                CollectionModel.company_id,
+                CollectionModel.updated_at,
+            ).where(CollectionModel.id == collection_id)
+        )
+        row = result.first()
+        if row is None:
+            return None
+        return CollectionVersion(
+            id=row.id,
+            user_id=row.user_id,
+            collector_id=row.collector_id,
+            company_id=row.company_id,
+            updated_at=row.updated_at,
+        )
+
+    async def get_list_version(
+        self, user_id: Optional[UUID] = None, collector_id: Optional[UUID] = None
+    ) -> Tuple[int, Optional[datetime]]:
+        query = select(func.count(CollectionModel.id), func.max(CollectionModel.updated_at))
+        if user_id is not None:
+            query = query.where(CollectionModel.user_id == user_id)
+        if collector_id is not None:
+            query = query.where(CollectionModel.collector_id == collector_id)
+        count, last_updated_at = (await self.db.execute(query)).one()
+        return count, last_updated_at
+
     async def get_by_user_id(self, user_id: UUID) -> List[Collection]:
         result = await self.db.execute(select(CollectionModel).where(CollectionModel.user_id == user_id))
         db_collections = result.scalars().all()
@@ -82,11 +118,12 @@ class CollectionRepositoryImpl(CollectionRepository):
         db_collection.zip_code = collection.zip_code
         db_collection.images = collection.images
         db_collection.status = collection.status
-        db_collection.updated_at = collection.updated_at
+        db_collection.updated_at = datetime.utcnow()
         db_collection.collector_id = collection.collector_id
         db_collection.company_id = collection.company_id
         
         await self.db.commit()
+        self._invalidate_cache(collection.id)
         await self.db.refresh(db_collection)
         return self._map_to_entity(db_collection)
 
@@ -98,8 +135,15 @@ class CollectionRepositoryImpl(CollectionRepository):
         
         await self.db.delete(db_collection)
         await self.db.commit()
+        self._invalidate_cache(collection_id)
         return True
 
+    def _invalidate_cache(self, collection_id: UUID) -> None:
+        # Respostas serializadas da coleta e das listagens de coletas
+        cache = get_payload_cache()
+        cache.invalidate("collection", collection_id)
+        cache.clear("collections")
+
     def _map_to_entity(self, db_collection: CollectionModel) -> Collection:
         return Collection(
             id=db_collection.id,
@@ -1,12 +1,14 @@
-from typing import List, Optional
+from datetime import datetime
+from typing import List, Optional, Tuple
 from uuid import UUID
 
-from sqlalchemy import select, delete
+from sqlalchemy import delete, func, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.domain.entities.company import Company
 from app.domain.repositories.company_repository import CompanyRepository
 from app.infrastructure.database.models import CompanyModel, ZipCodeModel
+from app.infrastructure.utils.payload_cache import get_payload_cache
 
 
 class CompanyRepositoryImpl(CompanyRepository):
@@ -32,6 +34,7 @@ class CompanyRepositoryImpl(CompanyRepository):
             self.db.add(db_zip_code)
             
         await self.db.commit()
+        self._invalidate_cache(company.id)
         await self.db.refresh(db_company)
         
         # Get zip codes for the company
@@ -70,6 +73,15 @@ class CompanyRepositoryImpl(CompanyRepository):
             updated_at=db_company.updated_at,
         )
 
+    async def get_updated_at(self, company_id: UUID) -> Optional[datetime]:
+        result = await self.db.execute(select(CompanyModel.updated_at).where(CompanyModel.id == company_id))
+        return result.scalar_one_or_none()
+
+    async def get_list_version(self) -> Tuple[int, Optional[datetime]]:
+        result = await self.db.execute(select(func.count(CompanyModel.id), func.max(CompanyModel.updated_at)))
+        count, last_updated_at = result.one()
+        return count, last_updated_at
+
     async def get_by_zip_code(self, zip_code: str) -> Optional[Company]:
         result = await self.db.execute(
             select(ZipCodeModel).where(ZipCodeModel.zip_code == zip_code)
@@ -113,7 +125,9 @@ class CompanyRepositoryImpl(CompanyRepository):
         
         db_company.name = company.name
         db_company.description = company.description
-        db_company.updated_at = company.updated_at
+        # Explícito: mudanças só nos CEPs não alteram a linha da empresa, e o
+        # ETag da empresa depende do updated_at
+        db_company.updated_at = datetime.utcnow()
         
         # Delete existing zip codes
         await self.db.execute(
@@ -129,6 +143,7 @@ class CompanyRepositoryImpl(CompanyRepository):
             self.db.add(db_zip_code)
             
         await self.db.commit()
+        self._invalidate_cache(company.id)
         await self.db.refresh(db_company)
         
         # Get zip codes for the company
@@ -160,4 +175,11 @@ class CompanyRepositoryImpl(CompanyRepository):
         # Delete company
         await self.db.delete(db_company)
         await self.db.commit()
+        self._invalidate_cache(company_id)
         return True
+
+    def _invalidate_cache(self, company_id: UUID) -> None:
+        # Respostas serializadas da empresa e da listagem de empresas
+        cache = get_payload_cache()
+        cache.invalidate("company", company_id)
+        cache.clear("companies")
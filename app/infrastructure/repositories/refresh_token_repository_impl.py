@@ -0,0 +1,125 @@
+from datetime import datetime
+from typing import Optional
+from uuid import UUID
+
+from sqlalchemy import select, update, delete
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.domain.entities.refresh_token import RefreshToken
+from app.domain.repositories.refresh_token_repository import RefreshTokenRepository
+from app.infrastructure.database.models import RefreshTokenModel
+
+
+class RefreshTokenRepositoryImpl(RefreshTokenRepository):
+    def __init__(self, db: AsyncSession):
+        self.db = db
+
+    async def create(self, refresh_token: RefreshToken) -> RefreshToken:
+        db_refresh_token = self._map_to_model(refresh_token)
+        self.db.add(db_refresh_token)
+        await self.db.commit()
+        return self._map_to_entity(db_refresh_token)
+
+    async def get_by_token_hash(self, token_hash: str) -> Optional[RefreshToken]:
+        result = await self.db.execute(
+            select(RefreshTokenModel).where(RefreshTokenModel.token_hash == token_hash)
+        )
+        db_refresh_token = result.scalars().first()
+        if db_refresh_token is None:
+            return None
+        return self._map_to_entity(db_refresh_token)
+
+    async def revoke(self, token_id: UUID, replaced_by: Optional[UUID] = None) -> bool:
+        # Condicional em revoked = false: só uma rotação concorrente pode vencer
+        result = await self.db.execute(
+            update(RefreshTokenModel)
+            .where(RefreshTokenModel.id == str(token_id), RefreshTokenModel.revoked == False)
+            .values(revoked=True, replaced_by=str(replaced_by) if replaced_by else None)
+        )
+        await self.db.commit()
+        return result.rowcount == 1
+
+    async def rotate(self, token_id: UUID, replacement: RefreshToken) -> Optional[RefreshToken]:
+        try:
+            result = await self.db.execute(
+                update(RefreshTokenModel)
+                .where(RefreshTokenModel.id == str(token_id), RefreshTokenModel.revoked == False)
+                .values(revoked=True, replaced_by=str(replacement.id))
+            )
+            if result.rowcount != 1:
+                await self.db.rollback()
+                return None
+            db_refresh_token = self._map_to_model(replacement)
+            self.db.add(db_refresh_token)
+            await self.db.commit()
+        except Exception:
+            # Sem o substituto, o token atual continua válido para uma nova tentativa
+            await self.db.rollback()
+            raise
+        return self._map_to_entity(db_refresh_token)
+
+    async def revoke_family(self, family_id: UUID) -> int:
+        result = await self.db.execute(
+            update(RefreshTokenModel)
+            .where(RefreshTokenModel.family_id == str(family_id), RefreshTokenModel.revoked == False)
+            .values(revoked=True)
+        )
+        await self.db.commit()
+        return result.rowcount
+
+    async def revoke_all_for_user(self, user_id: UUID) -> int:
+        result = await self.db.execute(
+            update(RefreshTokenModel)
+            .where(RefreshTokenModel.user_id == str(user_id), RefreshTokenModel.revoked == False)
+            .values(revoked=True)
+        )
+        await self.db.commit()
+        return result.rowcount
+
+    async def purge_expired(self, before: Optional[datetime] = None, chunk_size: int = 1000) -> int:
+        before = before or datetime.utcnow()
+        purged = 0
+        while True:
+            # Apaga em lotes pequenos para não segurar o lock de escrita por muito tempo
+            result = await self.db.execute(
+                select(RefreshTokenModel.id)
+                .where(RefreshTokenModel.expires_at < before)
+                .limit(chunk_size)
+            )
+            expired_ids = result.scalars().all()
+            if not expired_ids:
+                break
+
+            await self.db.execute(
+                delete(RefreshTokenModel).where(RefreshTokenModel.id.in_(expired_ids))
+            )
+            await self.db.commit()
+            purged += len(expired_ids)
+
+            if len(expired_ids) < chunk_size:
+                break
+        return purged
+
+    def _map_to_model(self, refresh_token: RefreshToken) -> RefreshTokenModel:
+        return RefreshTokenModel(
+            id=str(refresh_token.id),
+            token_hash=refresh_token.token_hash,
+            family_id=str(refresh_token.family_id),
+            expires_at=refresh_token.expires_at,
+            user_id=str(refresh_token.user_id),
+            revoked=refresh_token.revoked,
+            replaced_by=str(refresh_token.replaced_by) if refresh_token.replaced_by else None,
+            created_at=refresh_token.created_at,
+        )
+
+    def _map_to_entity(self, db_refresh_token: RefreshTokenModel) -> RefreshToken:
+        return RefreshToken(
+            id=UUID(db_refresh_token.id),
+            token_hash=db_refresh_token.token_hash,
+            user_id=UUID(db_refresh_token.user_id),
+            expires_at=db_refresh_token.expires_at,
+            family_id=UUID(db_refresh_token.family_id),
+            revoked=bool(db_refresh_token.revoked),
+            replaced_by=UUID(db_refresh_token.replaced_by) if db_refresh_token.replaced_by else None,
+            created_at=db_refresh_token.created_at,
+        )
@@ -0,0 +1,55 @@
+from datetime import datetime
+from typing import List, Optional
+
+from sqlalchemy import select, delete
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.domain.entities.token_revocation import RevocationKind, TokenRevocation
+from app.domain.repositories.token_revocation_repository import TokenRevocationRepository
+from app.infrastructure.database.models import TokenRevocationModel
+
+
+class TokenRevocationRepositoryImpl(TokenRevocationRepository):
+    def __init__(self, db: AsyncSession):
+        self.db = db
+
+    async def create(self, revocation: TokenRevocation) -> TokenRevocation:
+        db_revocation = TokenRevocationModel(
+            kind=revocation.kind.value,
+            subject=revocation.subject,
+            issued_before=revocation.issued_before,
+            expires_at=revocation.expires_at,
+            created_at=revocation.created_at,
+        )
+        self.db.add(db_revocation)
+        await self.db.commit()
+        await self.db.refresh(db_revocation)
+        return self._map_to_entity(db_revocation)
+
+    async def get_created_since(self, since: Optional[datetime] = None) -> List[TokenRevocation]:
+        query = select(TokenRevocationModel).where(
+            TokenRevocationModel.expires_at > datetime.utcnow()
+        )
+        if since is not None:
+            query = query.where(TokenRevocationModel.created_at >= since)
+        result = await self.db.execute(query)
+        return [self._map_to_entity(db_revocation) for db_revocation in result.scalars().all()]
+
+    async def purge_expired(self, before: Optional[datetime] = None) -> int:
+        result = await self.db.execute(
+            delete(TokenRevocationModel).where(
+                TokenRevocationModel.expires_at < (before or datetime.utcnow())
+            )
+        )
+        await self.db.commit()
+        return result.rowcount
+
+    def _map_to_entity(self, db_revocation: TokenRevocationModel) -> TokenRevocation:
+        return TokenRevocation(
+            id=db_revocation.id,
+            kind=RevocationKind(db_revocation.kind),
+            subject=db_revocation.subject,
+            issued_before=db_revocation.issued_before,
+            expires_at=db_revocation.expires_at,
+            created_at=db_revocation.created_at,
+        )
@@ -1,7 +1,9 @@
-from typing import List, Optional
+from datetime import datetime
+from typing import List, Optional, Set, Tuple
 from uuid import UUID
 
-from sqlalchemy import select
+from sqlalchemy import select, or_
+from sqlalchemy.exc import IntegrityError
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.domain.entities.user import User, UserRole, ProfileType
@@ -14,17 +16,7 @@ class UserRepositoryImpl(UserRepository):
         self.db = db
 
     async def create(self, user: User) -> User:
-        db_user = UserModel(
-            id=user.id,
-            username=user.username,
-            email=user.email,
-            hashed_password=user.hashed_password,
-            role=user.role,
-            created_at=user.created_at,
-            updated_at=user.updated_at,
-            company_id=user.company_id,
-            profile_type=user.profile_type.value if user.profile_type else None,
-        )
+        db_user = self._map_to_model(user)
         self.db.add(db_user)
         await self.db.commit()
         await self.db.refresh(db_user)
@@ -66,7 +58,7 @@ class UserRepositoryImpl(UserRepository):
         db_user.email = user.email
         db_user.hashed_password = user.hashed_password
         db_user.role = user.role
-        db_user.updated_at = user.updated_at
+        db_user.updated_at = datetime.utcnow()
         db_user.company_id = user.company_id
         db_user.profile_type = user.profile_type.value if user.profile_type else None
 
@@ -94,6 +86,66 @@ class UserRepositoryImpl(UserRepository):
         db_users = result.scalars().all()
         return [self._map_to_entity(db_user) for db_user in db_users]
 
+    async def get_existing_identifiers(
+        self, emails: List[str], usernames: List[str]
+    ) -> Tuple[Set[str], Set[str]]:
+        if not emails and not usernames:
+            return set(), set()
+        result = await self.db.execute(
+            select(UserModel.email, UserModel.username).where(
+                or_(UserModel.email.in_(emails), UserModel.username.in_(usernames))
+            )
+        )
+        rows = result.all()
+        email_set, username_set = set(emails), set(usernames)
+        return (
+            {email for email, _ in rows if email in email_set},
+            {username for _, username in rows if username in username_set},
+        )
+
+    async def create_many(
+        self, users: List[User], chunk_size: int = 200
+    ) -> Tuple[List[User], List[Tuple[int, str]]]:
+        created: List[User] = []
+        failures: List[Tuple[int, str]] = []
+
+        for start in range(0, len(users), chunk_size):
+            chunk = list(enumerate(users[start:start + chunk_size], start=start))
+            db_users = [(index, self._map_to_model(user)) for index, user in chunk]
+            self.db.add_all([db_user for _, db_user in db_users])
+            try:
+                await self.db.commit()
+                created.extend(self._map_to_entity(db_user) for _, db_user in db_users)
+                continue
+            except IntegrityError:
+                await self.db.rollback()
+
+            # Conflito no lote (ex.: criação concorrente): inserir um a um para isolar as falhas
+            for index, user in chunk:
+                db_user = self._map_to_model(user)
+                self.db.add(db_user)
+                try:
+                    await self.db.commit()
+                    created.append(self._map_to_entity(db_user))
+                except IntegrityError:
+                    await self.db.rollback()
+                    failures.append((index, "User with this email or username already exists"))
+
+        return created, failures
+
+    def _map_to_model(self, user: User) -> UserModel:
+        return UserModel(
+            id=str(user.id),
+            username=user.username,
+            email=user.email,
+            hashed_password=user.hashed_password,
+            role=user.role,
+            created_at=user.created_at,
+            updated_at=user.updated_at,
+            company_id=str(user.company_id) if user.company_id else None,
+            profile_type=user.profile_type.value if user.profile_type else None,
+        )
+
     def _map_to_entity(self, db_user: UserModel) -> User:
         profile_type = None
         if db_user.profile_type:
@@ -0,0 +1,122 @@
+import asyncio
+from concurrent.futures import Executor, ThreadPoolExecutor
+from functools import lru_cache, partial
+from typing import Any, Callable, Dict, List, Optional, Sequence, TypeVar
+
+from app.infrastructure.config import get_settings
+
+T = TypeVar("T")
+
+
+class ExecutorQueueFullError(RuntimeError):
+    """Lançada quando a fila do executor está cheia e a tarefa é rejeitada."""
+
+
+class BoundedExecutor:
+    """
+    Executor com limite de profundidade de fila.
+
+    Usado para tirar trabalho pesado de CPU (ex.: bcrypt) do event loop. Quando
+    o número de tarefas pendentes (em execução + na fila) atinge o limite, novas
+    tarefas são rejeitadas imediatamente com ExecutorQueueFullError, em vez de
+    se acumularem e aumentarem a latência de todas as requisições.
+
+    Por padrão usa um pool de threads próprio; `executor` permite aplicar o
+    mesmo limite a outro executor (ex.: o pool de processos da importação).
+    """
+
+    def __init__(
+        self,
+        max_workers: int = 2,
+        max_queue_size: int = 32,
+        name: str = "bounded",
+        executor: Optional[Executor] = None,
+    ):
+        self.max_workers = max_workers
+        self.max_queue_size = max_queue_size
+        self.name = name
+        self._executor = executor or ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix=name)
+
+        # Contadores acessados apenas a partir do event loop
+        self._pending = 0
+        self._rejected = 0
+        self._completed = 0
+
+    @property
+    def capacity(self) -> int:
+        """Número máximo de tarefas pendentes (em execução + na fila)."""
+        return self.max_workers + self.max_queue_size
+
+    async def run(self, func: Callable[..., T], *args: Any, **kwargs: Any) -> T:
+        """
+        Executa a função em uma thread do executor.
+
+        Raises:
+            ExecutorQueueFullError: Se a fila do executor estiver cheia
+        """
+        if self._pending >= self.capacity:
+            self._rejected += 1
+            raise ExecutorQueueFullError(f"Fila do executor '{self.name}' cheia")
+
+        self._pending += 1
+        try:
+            loop = asyncio.get_running_loop()
+            return await loop.run_in_executor(self._executor, partial(func, *args, **kwargs))
+        finally:
+            self._pending -= 1
+            self._completed += 1
+
+    async def map(self, func: Callable[[Any], T], items: Sequence[Any], chunk_size: Optional[int] = None) -> List[T]:
+        """
+        Aplica a função a cada item, em lotes de até `chunk_size` tarefas
+        (padrão: uma por worker).
+
+        Cada lote só é enviado se couber inteiro na fila; assim um lote grande
+        ocupa no máximo `chunk_size` posições por vez e disputa a capacidade
+        com as demais requisições em vez de enfileirar tudo de uma vez.
+
+        Raises:
+            ExecutorQueueFullError: Se um lote não couber na fila do executor
+        """
+        chunk_size = max(1, min(chunk_size or self.max_workers, self.capacity))
+        loop = asyncio.get_running_loop()
+        results: List[T] = []
+        for start in range(0, len(items), chunk_size):
+            chunk = items[start:start + chunk_size]
+            if self._pending + len(chunk) > self.capacity:
+                self._rejected += 1
+                raise ExecutorQueueFullError(f"Fila do executor '{self.name}' cheia")
+
+            self._pending += len(chunk)
+            try:
+                results.extend(await asyncio.gather(
+                    *(loop.run_in_executor(self._executor, func, item) for item in chunk)
+                ))
+            finally:
+                self._pending -= len(chunk)
+                self._completed += len(chunk)
+        return results
+
+    def stats(self) -> Dict[str, int]:
+        """Retorna estatísticas do executor."""
+        return {
+            "max_workers": self.max_workers,
+            "max_queue_size": self.max_queue_size,
+            "pending": self._pending,
+            "completed": self._completed,
+            "rejected": self._rejected,
+        }
+
+    def shutdown(self, wait: bool = True) -> None:
+        self._executor.shutdown(wait=wait)
+
+
+@lru_cache()
+def get_password_hash_executor() -> BoundedExecutor:
+    """Executor compartilhado para hashing e verificação de senhas."""
+    settings = get_settings()
+    return BoundedExecutor(
+        max_workers=settings.password_hash_workers,
+        max_queue_size=settings.password_hash_queue_size,
+        name="password-hash",
+    )
@@ -0,0 +1,45 @@
+import multiprocessing
+import os
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
+from typing import Optional
+
+from passlib.context import CryptContext
+
+from app.infrastructure.config import get_settings
+from app.infrastructure.utils.bounded_executor import BoundedExecutor
+
+# Contexto usado pelos processos do pool (criado sob demanda em cada processo)
+_process_pwd_context: Optional[CryptContext] = None
+
+
+def create_password_context() -> CryptContext:
+    """Configuração única de hashing de senhas, usada pelo AuthService e pelo pool."""
+    return CryptContext(schemes=["bcrypt"], deprecated="auto")
+
+
+def hash_password(password: str) -> str:
+    """Gera o hash de uma senha. Executada dentro dos processos do pool."""
+    global _process_pwd_context
+    if _process_pwd_context is None:
+        _process_pwd_context = create_password_context()
+    return _process_pwd_context.hash(password)
+
+
+@lru_cache()
+def get_password_hash_process_pool() -> BoundedExecutor:
+    """
+    Pool de processos para hashing em lote (ex.: importação de usuários).
+
+    Usa "spawn" para não herdar o event loop nem conexões abertas do worker.
+    A fila é limitada como a do executor de login: importações simultâneas
+    além da capacidade são rejeitadas com ExecutorQueueFullError.
+    """
+    settings = get_settings()
+    processes = settings.password_hash_processes or os.cpu_count() or 1
+    return BoundedExecutor(
+        max_workers=processes,
+        max_queue_size=settings.password_hash_process_queue_size or processes,
+        name="password-hash-process",
+        executor=ProcessPoolExecutor(max_workers=processes, mp_context=multiprocessing.get_context("spawn")),
+    )
@@ -0,0 +1,105 @@
+from collections import OrderedDict
+from functools import lru_cache
+from typing import Any, Dict, Hashable, Optional, Tuple
+
+from app.infrastructure.config import get_settings
+
+# Formato dos payloads guardados quando a rota não informa outro
+DEFAULT_VARIANT = "application/json"
+
+
+class PayloadCache:
+    """
+    LRU de respostas já serializadas, com limite de bytes por entidade.
+
+    Cada entrada é identificada por `(entidade, id)` e guarda a versão do
+    recurso (o `updated_at`, ou quantidade e maior `updated_at` no caso de
+    listagens) e um payload por formato (`variant`, ex.: JSON e MessagePack);
+    uma leitura só é atendida se a versão pedida for igual à guardada. Assim
+    uma leitura em cache precisa apenas da consulta leve de versão, sem o
+    mapeamento do ORM e sem a codificação, e continua correta entre workers,
+    cada um com seu próprio cache.
+
+    Cada entidade tem seu limite em bytes de payload; ao ultrapassá-lo, as
+    entradas menos usadas recentemente são descartadas. Entidades sem limite
+    (ou com limite 0) não são cacheadas, e payloads maiores que o limite da
+    entidade também não. Os repositórios invalidam as entradas nas escritas.
+    """
+
+    def __init__(self, limits: Dict[str, int]):
+        self.limits = dict(limits)
+        self._entries: Dict[str, "OrderedDict[str, Tuple[Hashable, Dict[str, bytes]]]"] = {
+            entity: OrderedDict() for entity in self.limits
+        }
+        self._sizes: Dict[str, int] = {entity: 0 for entity in self.limits}
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def enabled(self, entity: str) -> bool:
+        return self.limits.get(entity, 0) > 0
+
+    def get(self, entity: str, key: Any, version: Hashable, variant: str = DEFAULT_VARIANT) -> Optional[bytes]:
+        entries = self._entries.get(entity)
+        if entries is None:
+            return None
+        entry = entries.get(str(key))
+        payload = entry[1].get(variant) if entry is not None and entry[0] == version else None
+        if payload is None:
+            self.misses += 1
+            return None
+        entries.move_to_end(str(key))
+        self.hits += 1
+        return payload
+
+    def put(self, entity: str, key: Any, version: Hashable, payload: bytes, variant: str = DEFAULT_VARIANT) -> None:
+        limit = self.limits.get(entity, 0)
+        if len(payload) > limit:
+            # Inclui limite 0 (desligado) e payloads que não cabem no limite
+            return
+        entries = self._entries[entity]
+        entry = entries.get(str(key))
+        if entry is None or entry[0] != version:
+            # Uma nova versão descarta os payloads da anterior em todos os formatos
+            self.invalidate(entity, key)
+            entry = (version, {})
+            entries[str(key)] = entry
+        else:
+            self._sizes[entity] -= len(entry[1].pop(variant, b""))
+            entries.move_to_end(str(key))
+        entry[1][variant] = payload
+        self._sizes[entity] += len(payload)
+        while self._sizes[entity] > limit:
+            _, (_, evicted) = entries.popitem(last=False)
+            self._sizes[entity] -= sum(len(item) for item in evicted.values())
+            self.evictions += 1
+
+    def invalidate(self, entity: str, key: Any) -> None:
+        entries = self._entries.get(entity)
+        if entries is None:
+            return
+        entry = entries.pop(str(key), None)
+        if entry is not None:
+            self._sizes[entity] -= sum(len(item) for item in entry[1].values())
+
+    def clear(self, entity: Optional[str] = None) -> None:
+        for name in [entity] if entity is not None else list(self._entries):
+            if name in self._entries:
+                self._entries[name].clear()
+                self._sizes[name] = 0
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "entities": {
+                entity: {"entries": len(entries), "bytes": self._sizes[entity], "limit": self.limits[entity]}
+                for entity, entries in self._entries.items()
+            },
+        }
+
+
+@lru_cache()
+def get_payload_cache() -> PayloadCache:
+    return PayloadCache(get_settings().payload_cache_limits)
@@ -0,0 +1,194 @@
+import math
+import random
+import time
+from functools import lru_cache
+from typing import Any, Dict, List, Optional
+
+from app.infrastructure.config import get_settings
+
+
+class _RouteWindow:
+    """Contadores de uma rota no intervalo de resumo atual."""
+
+    __slots__ = (
+        "requests", "logged", "latencies", "rate_window", "rate_count", "kept", "stride", "skipped",
+    )
+
+    def __init__(self, now: float):
+        self.requests = 0
+        self.logged = 0
+        # Amostra limitada de latências (reservatório) para os percentis do resumo
+        self.latencies: List[float] = []
+        self.rate_window = now
+        self.rate_count = 0
+        self.kept = 0
+        self.stride = 1
+        self.skipped = 0
+
+
+class RequestLogSampler:
+    """
+    Amostragem adaptativa dos eventos `api_request`.
+
+    Sempre registrados: erros, status >= 400, caminhos de autenticação,
+    requisições mais lentas que `slow_ms` e qualquer método diferente de
+    GET/HEAD. As leituras bem-sucedidas restantes são amostradas por rota (o
+    template da rota, ex.: "GET /api/collections/{collection_id}"): a cada
+    `rate_window` segundos a taxa observada define um passo N e apenas uma a
+    cada N requisições é registrada, mantendo cerca de `target_per_minute`
+    eventos por minuto por rota (com um teto por janela para picos). Rotas com
+    pouco tráfego são registradas por inteiro.
+
+    As requisições não registradas entram no resumo da rota, emitido a cada
+    `summary_interval` segundos como evento `api_request_summary` (contagens e
+    percentis de latência).
+    """
+
+    MAX_LATENCY_SAMPLES = 1024
+
+    def __init__(
+        self,
+        target_per_minute: int = 60,
+        slow_ms: float = 1000.0,
+        summary_interval: float = 60.0,
+        auth_paths: Optional[List[str]] = None,
+        rate_window: float = 10.0,
+        max_routes: int = 1000,
+    ):
+        self.target_per_minute = target_per_minute
+        self.slow_ms = slow_ms
+        self.summary_interval = summary_interval
+        self.rate_window = rate_window
+        self.max_routes = max_routes
+        self._auth_suffixes = tuple(auth_paths or ["/token", "/refresh", "/logout"])
+        self._routes: Dict[str, _RouteWindow] = {}
+        self._last_summary = time.monotonic()
+        # Eventos amostrados permitidos por rota em cada janela de taxa
+        self._window_budget = max(1, math.ceil(target_per_minute * rate_window / 60))
+
+    def should_log(
+        self,
+        method: str,
+        path: str,
+        route: Optional[str],
+        status_code: Optional[int],
+        process_time_ms: Optional[float],
+        error: bool = False,
+        now: Optional[float] = None,
+    ) -> bool:
+        """Decide se a requisição gera um evento próprio; as demais entram no resumo da rota."""
+        if now is None:
+            now = time.monotonic()
+        routine = (
+            not error
+            and method in ("GET", "HEAD")
+            and status_code is not None
+            and status_code < 400
+            and (process_time_ms is None or process_time_ms < self.slow_ms)
+            and not path.endswith(self._auth_suffixes)
+        )
+        key = f"{method} {route or path}"
+        window = self._routes.get(key)
+        if window is None:
+            # Caminhos sem rota (ex.: 404) não podem esgotar a memória
+            if not routine or len(self._routes) >= self.max_routes:
+                return True
+            window = self._routes[key] = _RouteWindow(now)
+
+        window.requests += 1
+        if process_time_ms is not None:
+            self._sample_latency(window, process_time_ms)
+        keep = True
+        if routine:
+            keep = self._sample(window, now)
+        if keep:
+            window.logged += 1
+        return keep
+
+    def _sample_latency(self, window: _RouteWindow, process_time_ms: float) -> None:
+        # Amostragem de reservatório: memória limitada e amostra uniforme do intervalo
+        if len(window.latencies) < self.MAX_LATENCY_SAMPLES:
+            window.latencies.append(process_time_ms)
+            return
+        index = random.randrange(window.requests)
+        if index < self.MAX_LATENCY_SAMPLES:
+            window.latencies[index] = process_time_ms
+
+    def _sample(self, window: _RouteWindow, now: float) -> bool:
+        elapsed = now - window.rate_window
+        if elapsed >= self.rate_window:
+            # Novo passo pela taxa observada na janela anterior (eventos por minuto)
+            rate_per_minute = window.rate_count * 60 / elapsed
+            window.stride = max(1, math.ceil(rate_per_minute / self.target_per_minute))
+            window.rate_window = now
+            window.rate_count = 0
+            window.kept = 0
+        window.rate_count += 1
+        window.skipped += 1
+        # O teto por janela cobre picos antes que o passo se ajuste
+        if window.skipped >= window.stride and window.kept < self._window_budget:
+            window.skipped = 0
+            window.kept += 1
+            return True
+        return False
+
+    def due_summaries(self, now: Optional[float] = None) -> List[Dict[str, Any]]:
+        """
+        Retorna os resumos do intervalo se ele terminou (ou lista vazia).
+
+        Só rotas com requisições não registradas geram resumo; as contagens
+        do intervalo são zeradas.
+        """
+        if now is None:
+            now = time.monotonic()
+        if now - self._last_summary < self.summary_interval:
+            return []
+        return self.collect_summaries(now)
+
+    def collect_summaries(self, now: Optional[float] = None) -> List[Dict[str, Any]]:
+        """Retorna os resumos do intervalo atual e zera as contagens."""
+        if now is None:
+            now = time.monotonic()
+        interval = now - self._last_summary
+        self._last_summary = now
+        summaries = []
+        for key, window in self._routes.items():
+            if window.requests > window.logged:
+                summaries.append(self._summarize(key, window, interval))
+            window.requests = 0
+            window.logged = 0
+            window.latencies = []
+        return summaries
+
+    @staticmethod
+    def _summarize(key: str, window: _RouteWindow, interval: float) -> Dict[str, Any]:
+        method, route = key.split(" ", 1)
+        summary: Dict[str, Any] = {
+            "method": method,
+            "route": route,
+            "interval_seconds": round(interval, 1),
+            "requests": window.requests,
+            "logged": window.logged,
+            "sampled_out": window.requests - window.logged,
+            "sample_stride": window.stride,
+        }
+        if window.latencies:
+            latencies = sorted(window.latencies)
+            for name, pct in (("p50_ms", 50), ("p95_ms", 95), ("p99_ms", 99)):
+                summary[name] = latencies[min(len(latencies) - 1, int(pct / 100 * len(latencies)))]
+            summary["max_ms"] = latencies[-1]
+        return summary
+
+
+@lru_cache()
+def get_request_log_sampler() -> Optional[RequestLogSampler]:
+    """Amostrador compartilhado do log de requisições; None se a amostragem estiver desligada."""
+    settings = get_settings()
+    if settings.request_log_sample_target_per_minute <= 0:
+        return None
+    return RequestLogSampler(
+        target_per_minute=settings.request_log_sample_target_per_minute,
+        slow_ms=settings.request_log_slow_ms,
+        summary_interval=settings.request_log_summary_interval_seconds,
+        auth_paths=["/api/token", "/api/refresh", "/api/logout"],
+    )
@@ -0,0 +1,253 @@
+import asyncio
+import json
+import logging
+import os
+import sqlite3
+import time
+from datetime import datetime, timezone
+from functools import lru_cache
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+from app.infrastructure.config import get_settings
+from app.infrastructure.utils.security_log_sinks import SecurityLogSink
+
+logger = logging.getLogger(__name__)
+
+_SCHEMA = (
+    """
+    CREATE TABLE IF NOT EXISTS security_events (
+        id INTEGER PRIMARY KEY,
+        event_id TEXT NOT NULL,
+        event_type TEXT NOT NULL,
+        level TEXT NOT NULL,
+        timestamp REAL NOT NULL,
+        user_id TEXT,
+        ip_address TEXT,
+        details TEXT
+    )
+    """,
+    # Cada filtro tem um índice composto com o timestamp: a igualdade e o
+    # intervalo de tempo são resolvidos no índice, já na ordem da paginação
+    "CREATE INDEX IF NOT EXISTS ix_security_events_timestamp ON security_events (timestamp)",
+    "CREATE INDEX IF NOT EXISTS ix_security_events_event_type ON security_events (event_type, timestamp)",
+    "CREATE INDEX IF NOT EXISTS ix_security_events_user_id ON security_events (user_id, timestamp)",
+    "CREATE INDEX IF NOT EXISTS ix_security_events_ip_address ON security_events (ip_address, timestamp)",
+)
+
+_INSERT = """
+INSERT INTO security_events (event_id, event_type, level, timestamp, user_id, ip_address, details)
+VALUES (?, ?, ?, ?, ?, ?, ?)
+"""
+
+# Filtros aceitos na consulta e a coluna de cada um
+_FILTER_COLUMNS = ("event_type", "user_id", "ip_address", "level")
+
+
+def encode_cursor(timestamp: float, event_row_id: int) -> str:
+    """Cursor opaco da paginação por chave (timestamp, id) do último evento da página."""
+    return f"{timestamp!r}:{event_row_id}"
+
+
+def decode_cursor(cursor: str) -> Tuple[float, int]:
+    """
+    Raises:
+        ValueError: Se o cursor for inválido
+    """
+    timestamp, event_row_id = cursor.rsplit(":", 1)
+    return float(timestamp), int(event_row_id)
+
+
+class SQLiteSecurityAuditStore(SecurityLogSink):
+    """
+    Armazenamento indexado dos eventos de segurança em SQLite (modo WAL).
+
+    Como destino do SecurityLogWriter, recebe os lotes já formatados e grava
+    cada lote em uma única transação (um commit por lote, não por evento). Os
+    workers gravam no mesmo arquivo; com WAL, as consultas não bloqueiam as
+    gravações.
+
+    `query` filtra por tipo de evento, usuário, IP, nível e período, do mais
+    recente ao mais antigo, com paginação por chave: o cursor é o
+    (timestamp, id) do último evento da página, de modo que cada página custa
+    o mesmo independentemente da profundidade. Eventos mais antigos que
+    `retention_days` são removidos periodicamente.
+    """
+
+    def __init__(
+        self,
+        path: str,
+        retention_days: int = 90,
+        busy_timeout_ms: int = 5000,
+        prune_interval: float = 3600,
+        prune_chunk_size: int = 10_000,
+    ):
+        self.path = path
+        self.retention_days = retention_days
+        self.busy_timeout_ms = busy_timeout_ms
+        self.prune_interval = prune_interval
+        self.prune_chunk_size = prune_chunk_size
+        self._connection: Optional[sqlite3.Connection] = None
+        # A primeira limpeza acontece na primeira gravação
+        self._last_prune: Optional[float] = None
+
+    def _connect(self, read_only: bool = False) -> sqlite3.Connection:
+        if read_only:
+            connection = sqlite3.connect(
+                f"file:{self.path}?mode=ro", uri=True, timeout=self.busy_timeout_ms / 1000,
+                check_same_thread=False,
+            )
+        else:
+            os.makedirs(os.path.dirname(os.path.abspath(self.path)), exist_ok=True)
+            # Usada pela thread de escrita; `close` pode vir de outra thread no encerramento
+            connection = sqlite3.connect(
+                self.path, timeout=self.busy_timeout_ms / 1000, isolation_level=None, check_same_thread=False,
+            )
+            connection.execute("PRAGMA journal_mode=WAL")
+            connection.execute("PRAGMA synchronous=NORMAL")
+        connection.execute(f"PRAGMA busy_timeout={int(self.busy_timeout_ms)}")
+        return connection
+
+    def _writer(self) -> sqlite3.Connection:
+        if self._connection is None:
+            self._connection = self._connect()
+            for statement in _SCHEMA:
+                self._connection.execute(statement)
+        return self._connection
+
+    def write(self, records: Sequence[Dict[str, Any]]) -> None:
+        rows = []
+        for record in records:
+            message = record["message"]
+            details = message.get("details")
+            rows.append((
+                message["event_id"],
+                message["event_type"],
+                record["level"],
+                record["created"],
+                message.get("user_id"),
+                message.get("ip_address"),
+                json.dumps(details, default=str) if details else None,
+            ))
+        connection = self._writer()
+        connection.execute("BEGIN IMMEDIATE")
+        try:
+            connection.executemany(_INSERT, rows)
+            connection.execute("COMMIT")
+        except Exception:
+            connection.execute("ROLLBACK")
+            raise
+        if self._last_prune is None or time.monotonic() - self._last_prune > self.prune_interval:
+            self.prune()
+
+    def prune(self, now: Optional[float] = None) -> int:
+        """Remove eventos fora da retenção, em lotes, e retorna quantos foram removidos."""
+        self._last_prune = time.monotonic()
+        cutoff = (now or time.time()) - self.retention_days * 86400
+        connection = self._writer()
+        removed = 0
+        while True:
+            deleted = connection.execute(
+                "DELETE FROM security_events WHERE id IN ("
+                " SELECT id FROM security_events WHERE timestamp < ? LIMIT ?)",
+                (cutoff, self.prune_chunk_size),
+            ).rowcount
+            removed += deleted
+            if deleted < self.prune_chunk_size:
+                return removed
+
+    def query(
+        self,
+        filters: Optional[Dict[str, Optional[str]]] = None,
+        since: Optional[datetime] = None,
+        until: Optional[datetime] = None,
+        limit: int = 100,
+        cursor: Optional[str] = None,
+    ) -> Tuple[List[Dict[str, Any]], Optional[str]]:
+        """
+        Busca eventos do mais recente ao mais antigo.
+
+        Returns:
+            Tuple: (eventos da página, cursor da próxima página ou None)
+
+        Raises:
+            ValueError: Se o cursor for inválido
+        """
+        clauses = []
+        params: List[Any] = []
+        for column in _FILTER_COLUMNS:
+            value = (filters or {}).get(column)
+            if value is not None:
+                clauses.append(f"{column} = ?")
+                params.append(value)
+        if since is not None:
+            clauses.append("timestamp >= ?")
+            params.append(_to_timestamp(since))
+        if until is not None:
+            clauses.append("timestamp <= ?")
+            params.append(_to_timestamp(until))
+        if cursor:
+            cursor_timestamp, cursor_id = decode_cursor(cursor)
+            # O limite simples em timestamp permite começar a leitura do índice no cursor
+            clauses.append("timestamp <= ? AND (timestamp < ? OR id < ?)")
+            params.extend([cursor_timestamp, cursor_timestamp, cursor_id])
+
+        sql = "SELECT id, event_id, event_type, level, timestamp, user_id, ip_address, details FROM security_events"
+        if clauses:
+            sql += " WHERE " + " AND ".join(clauses)
+        sql += " ORDER BY timestamp DESC, id DESC LIMIT ?"
+        # Um evento a mais indica se existe próxima página
+        params.append(limit + 1)
+
+        if not os.path.exists(self.path):
+            return [], None
+        connection = self._connect(read_only=True)
+        try:
+            rows = connection.execute(sql, params).fetchall()
+        finally:
+            connection.close()
+
+        events = [
+            {
+                "event_id": event_id,
+                "event_type": event_type,
+                "level": level,
+                "timestamp": datetime.fromtimestamp(timestamp, timezone.utc),
+                "user_id": user_id,
+                "ip_address": ip_address,
+                "details": json.loads(details) if details else None,
+            }
+            for _, event_id, event_type, level, timestamp, user_id, ip_address, details in rows[:limit]
+        ]
+        next_cursor = None
+        if len(rows) > limit:
+            last = rows[limit - 1]
+            next_cursor = encode_cursor(last[4], last[0])
+        return events, next_cursor
+
+    async def search(self, *args: Any, **kwargs: Any) -> Tuple[List[Dict[str, Any]], Optional[str]]:
+        """`query` em uma thread, fora do event loop."""
+        return await asyncio.to_thread(self.query, *args, **kwargs)
+
+    def close(self) -> None:
+        if self._connection is not None:
+            self._connection.close()
+            self._connection = None
+
+
+def _to_timestamp(value: datetime) -> float:
+    # Datas sem timezone seguem o padrão do projeto: UTC
+    if value.tzinfo is None:
+        value = value.replace(tzinfo=timezone.utc)
+    return value.timestamp()
+
+
+@lru_cache()
+def get_security_audit_store() -> Optional[SQLiteSecurityAuditStore]:
+    """Armazenamento de auditoria compartilhado; None se SECURITY_AUDIT_ENABLED=false."""
+    settings = get_settings()
+    if not settings.security_audit_enabled:
+        return None
+    return SQLiteSecurityAuditStore(
+        settings.security_audit_db_path,
+        retention_days=settings.security_audit_retention_days,
+    )
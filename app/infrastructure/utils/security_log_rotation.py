@@ -0,0 +1,281 @@
+import gzip
+import json
+import logging
+import os
+import shutil
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from datetime import date, datetime, timedelta, timezone
+from typing import Any, Dict, IO, Iterator, List, Optional, Sequence
+
+from app.infrastructure.utils.security_log_sinks import FileSecurityLogSink
+
+try:
+    import fcntl
+except ImportError:  # Windows: sem flock, cada processo deve usar um arquivo próprio
+    fcntl = None
+
+logger = logging.getLogger(__name__)
+
+# Bytes lidos no início/fim de um segmento para obter o primeiro/último timestamp
+_EDGE_READ_BYTES = 64 * 1024
+
+
+def _event_timestamp(line: bytes) -> Optional[str]:
+    """Extrai o timestamp ISO (UTC) do evento de uma linha do log."""
+    try:
+        return json.loads(line)["message"]["timestamp"]
+    except (ValueError, KeyError, TypeError):
+        return None
+
+
+def _parse_timestamp(value: str) -> datetime:
+    parsed = datetime.fromisoformat(value)
+    if parsed.tzinfo is None:
+        parsed = parsed.replace(tzinfo=timezone.utc)
+    return parsed
+
+
+def open_segment(path: str) -> IO[str]:
+    """Abre um segmento do log para leitura, comprimido (.gz) ou não."""
+    if path.endswith(".gz"):
+        return gzip.open(path, "rt", encoding="utf-8")
+    return open(path, "r", encoding="utf-8")
+
+
+class SecurityLogIndex:
+    """
+    Índice dos segmentos rotacionados do log de segurança (JSON ao lado do log).
+
+    Cada entrada guarda o arquivo do segmento, o intervalo de tempo dos eventos
+    (`start`/`end`, ISO UTC), o tamanho e se está comprimido. Com ele, uma busca
+    por período abre apenas os segmentos que o cobrem.
+    """
+
+    def __init__(self, log_path: str):
+        self.log_path = log_path
+        self.path = f"{log_path}.index.json"
+        self.directory = os.path.dirname(os.path.abspath(log_path))
+
+    def load(self) -> List[Dict[str, Any]]:
+        try:
+            with open(self.path, "r", encoding="utf-8") as index_file:
+                return json.load(index_file)
+        except FileNotFoundError:
+            return []
+        except ValueError:
+            logger.warning("Índice de segmentos do log de segurança inválido: %s", self.path)
+            return []
+
+    def save(self, entries: List[Dict[str, Any]]) -> None:
+        # Escrita atômica: leitores nunca veem um índice pela metade
+        temporary_path = f"{self.path}.{os.getpid()}.tmp"
+        with open(temporary_path, "w", encoding="utf-8") as index_file:
+            json.dump(entries, index_file, indent=1)
+        os.replace(temporary_path, self.path)
+
+    def find(self, since: Optional[datetime] = None, until: Optional[datetime] = None) -> List[str]:
+        """
+        Retorna os arquivos que podem conter eventos no período, do mais novo ao mais antigo.
+
+        O arquivo atual (ainda não rotacionado) vem primeiro quando o período
+        alcança o fim do último segmento.
+        """
+        entries = sorted(self.load(), key=lambda entry: _parse_timestamp(entry["end"]), reverse=True)
+        paths = []
+        if until is None or not entries or until >= _parse_timestamp(entries[0]["end"]):
+            if os.path.exists(self.log_path):
+                paths.append(self.log_path)
+        for entry in entries:
+            if since is not None and _parse_timestamp(entry["end"]) < since:
+                continue
+            if until is not None and _parse_timestamp(entry["start"]) > until:
+                continue
+            paths.append(os.path.join(self.directory, entry["file"]))
+        return paths
+
+
+class RotatingFileSecurityLogSink(FileSecurityLogSink):
+    """
+    Arquivo do log de segurança com rotação por tamanho e por dia.
+
+    Vários workers gravam no mesmo arquivo: cada lote é escrito sob um flock
+    exclusivo (arquivo `.lock` ao lado do log), com O_APPEND, de modo que as
+    linhas nunca se misturam. O worker que encontra o arquivo acima de
+    `max_bytes`, ou com a última gravação em outro dia, o renomeia para um
+    segmento com o horário do primeiro evento no nome; os demais percebem a
+    troca pelo inode e reabrem o arquivo novo.
+
+    Segmentos rotacionados são comprimidos com gzip em uma thread de fundo,
+    registrados no SecurityLogIndex e removidos após `retention_days` ou
+    quando passam de `max_segments`.
+    """
+
+    def __init__(
+        self,
+        path: str,
+        max_bytes: int = 100 * 1024 * 1024,
+        rotate_daily: bool = True,
+        retention_days: int = 30,
+        max_segments: int = 100,
+        compress: bool = True,
+    ):
+        super().__init__(path)
+        self.max_bytes = max_bytes
+        self.rotate_daily = rotate_daily
+        self.retention_days = retention_days
+        self.max_segments = max_segments
+        self.compress = compress
+        self.index = SecurityLogIndex(path)
+        self._fd: Optional[int] = None
+        self._inode: Optional[int] = None
+        self._lock_fd: Optional[int] = None
+        # O flock exclui outros processos; threads do mesmo processo (escrita e
+        # compressão) compartilham o descritor e precisam de um lock próprio
+        self._thread_lock = threading.Lock()
+        self._compressor: Optional[ThreadPoolExecutor] = None
+
+    @contextmanager
+    def _locked(self) -> Iterator[None]:
+        with self._thread_lock:
+            if self._lock_fd is None:
+                os.makedirs(self.index.directory, exist_ok=True)
+                self._lock_fd = os.open(f"{self.path}.lock", os.O_RDWR | os.O_CREAT, 0o644)
+            if fcntl is not None:
+                fcntl.flock(self._lock_fd, fcntl.LOCK_EX)
+            try:
+                yield
+            finally:
+                if fcntl is not None:
+                    fcntl.flock(self._lock_fd, fcntl.LOCK_UN)
+
+    def _ensure_open(self) -> int:
+        """Abre o arquivo, ou o reabre se outro worker o rotacionou (inode diferente)."""
+        try:
+            inode = os.stat(self.path).st_ino
+        except FileNotFoundError:
+            inode = None
+        if self._fd is not None and inode == self._inode:
+            return self._fd
+        self._close_file()
+        self._fd = os.open(self.path, os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o644)
+        self._inode = os.fstat(self._fd).st_ino
+        return self._fd
+
+    def _should_rotate(self, fd: int, incoming: int) -> bool:
+        stat = os.fstat(fd)
+        if stat.st_size == 0:
+            return False
+        if stat.st_size + incoming > self.max_bytes:
+            return True
+        return self.rotate_daily and date.fromtimestamp(stat.st_mtime) != date.today()
+
+    def write(self, records: Sequence[Dict[str, Any]]) -> None:
+        data = "".join(self.format_line(record) for record in records).encode("utf-8")
+        with self._locked():
+            fd = self._ensure_open()
+            if self._should_rotate(fd, len(data)):
+                self._rotate()
+                fd = self._ensure_open()
+            os.write(fd, data)
+
+    def _edge_timestamps(self, size: int) -> Dict[str, str]:
+        """Primeiro e último timestamp do arquivo atual, lendo só o início e o fim."""
+        fallback = datetime.fromtimestamp(os.stat(self.path).st_mtime, timezone.utc).isoformat()
+        with open(self.path, "rb") as log_file:
+            first_line = log_file.readline(_EDGE_READ_BYTES)
+            log_file.seek(max(0, size - _EDGE_READ_BYTES))
+            tail = log_file.read().rstrip(b"\n")
+        last_line = tail.rsplit(b"\n", 1)[-1]
+        end = _event_timestamp(last_line) or fallback
+        return {"start": _event_timestamp(first_line) or end, "end": end}
+
+    def _segment_name(self, start: str) -> str:
+        base, extension = os.path.splitext(os.path.basename(self.path))
+        stamp = _parse_timestamp(start).strftime("%Y%m%d-%H%M%S")
+        name = f"{base}-{stamp}{extension}"
+        suffix = 1
+        while os.path.exists(os.path.join(self.index.directory, name)) or os.path.exists(
+            os.path.join(self.index.directory, f"{name}.gz")
+        ):
+            suffix += 1
+            name = f"{base}-{stamp}-{suffix}{extension}"
+        return name
+
+    def _rotate(self) -> None:
+        # Chamado com o flock adquirido
+        size = os.fstat(self._fd).st_size
+        entry = self._edge_timestamps(size)
+        entry["file"] = self._segment_name(entry["start"])
+        entry["bytes"] = size
+        entry["compressed"] = False
+        segment_path = os.path.join(self.index.directory, entry["file"])
+        os.rename(self.path, segment_path)
+        self._close_file()
+
+        entries = self._apply_retention(self.index.load() + [entry])
+        self.index.save(entries)
+        if self.compress:
+            if self._compressor is None:
+                self._compressor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="security-log-gzip")
+            self._compressor.submit(self._compress_segment, entry["file"])
+
+    def _apply_retention(self, entries: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """Remove segmentos antigos demais ou além do máximo; retorna as entradas mantidas."""
+        entries = sorted(entries, key=lambda entry: _parse_timestamp(entry["end"]))
+        cutoff = datetime.now(timezone.utc) - timedelta(days=self.retention_days)
+        kept = [entry for entry in entries if _parse_timestamp(entry["end"]) >= cutoff]
+        kept = kept[-self.max_segments:] if self.max_segments > 0 else kept
+        kept_files = {entry["file"] for entry in kept}
+        for entry in entries:
+            if entry["file"] not in kept_files:
+                path = os.path.join(self.index.directory, entry["file"])
+                # Um segmento pode estar sendo comprimido: remover as duas versões
+                for candidate in (path, f"{path}.gz"):
+                    try:
+                        os.remove(candidate)
+                    except FileNotFoundError:
+                        pass
+        return kept
+
+    def _compress_segment(self, name: str) -> None:
+        source = os.path.join(self.index.directory, name)
+        target = f"{source}.gz"
+        try:
+            with open(source, "rb") as segment, gzip.open(f"{target}.tmp", "wb") as compressed:
+                shutil.copyfileobj(segment, compressed)
+            os.replace(f"{target}.tmp", target)
+            with self._locked():
+                entries = self.index.load()
+                entry = next((entry for entry in entries if entry["file"] == name), None)
+                if entry is None:
+                    # Removido pela retenção durante a compressão
+                    os.remove(target)
+                else:
+                    entry["file"] = os.path.basename(target)
+                    entry["compressed"] = True
+                    entry["compressed_bytes"] = os.path.getsize(target)
+                    self.index.save(entries)
+                os.remove(source)
+        except FileNotFoundError:
+            pass
+        except Exception:
+            logger.exception("Falha ao comprimir o segmento %s do log de segurança", name)
+
+    def _close_file(self) -> None:
+        if self._fd is not None:
+            os.close(self._fd)
+            self._fd = None
+            self._inode = None
+
+    def close(self) -> None:
+        # Aguarda compressões em andamento
+        if self._compressor is not None:
+            self._compressor.shutdown(wait=True)
+            self._compressor = None
+        self._close_file()
+        with self._thread_lock:
+            if self._lock_fd is not None:
+                os.close(self._lock_fd)
+                self._lock_fd = None
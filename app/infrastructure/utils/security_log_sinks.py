@@ -0,0 +1,57 @@
+import json
+import os
+import time
+from abc import ABC, abstractmethod
+from typing import Any, Dict, Sequence
+
+
+class SecurityLogSink(ABC):
+    """Destino dos eventos de segurança já formatados (arquivo, banco de auditoria)."""
+
+    @abstractmethod
+    def write(self, records: Sequence[Dict[str, Any]]) -> None:
+        """
+        Grava um lote de eventos.
+
+        Cada registro tem `level` (nome do nível), `created` (timestamp) e
+        `message` (o evento como dicionário).
+        """
+        pass
+
+    def close(self) -> None:
+        """Libera recursos do destino; ele deve reabrir sob demanda se voltar a ser usado."""
+
+
+class FileSecurityLogSink(SecurityLogSink):
+    """
+    Arquivo JSON lines, no mesmo formato do antigo FileHandler do logger "security".
+
+    O lote inteiro é escrito com um único write e um único flush.
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        self._file = None
+
+    @staticmethod
+    def format_line(record: Dict[str, Any]) -> str:
+        created = record["created"]
+        # Mesmo formato do %(asctime)s do logging: hora local com milissegundos
+        asctime = time.strftime("%Y-%m-%d %H:%M:%S", time.localtime(created))
+        asctime = f"{asctime},{int(created % 1 * 1000):03d}"
+        return (
+            f'{{"timestamp": "{asctime}", "level": "{record["level"]}", '
+            f'"message": {json.dumps(record["message"], default=str)}}}\n'
+        )
+
+    def write(self, records: Sequence[Dict[str, Any]]) -> None:
+        if self._file is None:
+            os.makedirs(os.path.dirname(os.path.abspath(self.path)), exist_ok=True)
+            self._file = open(self.path, "a", encoding="utf-8")
+        self._file.write("".join(self.format_line(record) for record in records))
+        self._file.flush()
+
+    def close(self) -> None:
+        if self._file is not None:
+            self._file.close()
+            self._file = None
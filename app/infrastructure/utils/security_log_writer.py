@@ -0,0 +1,280 @@
+import atexit
+import logging
+import os
+import threading
+import time
+import uuid
+from collections import deque
+from datetime import datetime, timezone
+from functools import lru_cache
+from typing import Any, Callable, Deque, Dict, List, NamedTuple, Optional
+
+from app.infrastructure.config import get_settings
+from app.infrastructure.utils.security_audit_store import get_security_audit_store
+from app.infrastructure.utils.security_log_rotation import RotatingFileSecurityLogSink
+from app.infrastructure.utils.security_log_sinks import SecurityLogSink
+
+logger = logging.getLogger(__name__)
+
+DROP_POLICIES = ("drop_newest", "drop_oldest")
+
+
+class SecurityLogEvent(NamedTuple):
+    """
+    Evento enfileirado pelo SecurityLogger.
+
+    Guarda apenas referências aos dados; id, datas formatadas, mascaramento
+    (`prepare`) e JSON são feitos na thread de escrita.
+    """
+
+    created: float
+    level: int
+    event_type: str
+    user_id: Any
+    ip_address: Optional[str]
+    details: Optional[Dict[str, Any]]
+    local_time: bool
+    prepare: Optional[Callable[[Dict[str, Any]], Dict[str, Any]]]
+
+
+class SecurityLogWriter:
+    """
+    Fila limitada de eventos de segurança com uma thread de escrita em lotes.
+
+    `enqueue` só adiciona uma tupla à fila (sem JSON, uuid ou I/O no event
+    loop). A thread acorda quando a fila atinge `batch_size` ou a cada
+    `flush_interval` segundos, formata os eventos e os grava em cada destino.
+
+    Com a fila cheia, a política define o que acontece com eventos INFO:
+    - drop_newest: o evento novo é descartado
+    - drop_oldest: o evento mais antigo da fila é descartado
+    Eventos WARNING ou mais graves nunca são descartados em favor de eventos
+    antigos: sempre removem o mais antigo da fila. `enqueue` nunca espera por
+    espaço, pois é chamado no event loop.
+
+    Descartes e atraso (tempo entre enfileirar e gravar) são contados em
+    `stats`; se houve descartes, um evento `security_log_stats` é gravado a
+    cada `stats_interval` segundos.
+    """
+
+    def __init__(
+        self,
+        sinks: List[SecurityLogSink],
+        max_queue_size: int = 10_000,
+        batch_size: int = 256,
+        flush_interval: float = 0.5,
+        drop_policy: str = "drop_newest",
+        stats_interval: float = 60.0,
+    ):
+        if drop_policy not in DROP_POLICIES:
+            raise ValueError(f"Política de descarte inválida: {drop_policy}")
+        self.sinks = sinks
+        self.max_queue_size = max_queue_size
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.drop_policy = drop_policy
+        self.stats_interval = stats_interval
+
+        self._queue: Deque[SecurityLogEvent] = deque()
+        self._condition = threading.Condition(threading.Lock())
+        self._thread: Optional[threading.Thread] = None
+        self._pid = os.getpid()
+        self._closing = False
+        self._in_flight = 0
+
+        self._enqueued = 0
+        self._written = 0
+        self._dropped = 0
+        self._batches = 0
+        self._write_errors = 0
+        self._last_lag_ms = 0.0
+        self._max_lag_ms = 0.0
+        self._dropped_reported = 0
+        self._last_stats_report = time.monotonic()
+
+    def enqueue(
+        self,
+        level: int,
+        event_type: str,
+        user_id: Any = None,
+        ip_address: Optional[str] = None,
+        details: Optional[Dict[str, Any]] = None,
+        local_time: bool = False,
+        prepare: Optional[Callable[[Dict[str, Any]], Dict[str, Any]]] = None,
+    ) -> bool:
+        """Enfileira um evento; retorna False se ele foi descartado."""
+        event = SecurityLogEvent(
+            time.time(), level, event_type, user_id, ip_address, details, local_time, prepare
+        )
+        with self._condition:
+            if self._thread is None or self._pid != os.getpid():
+                self._start()
+            if len(self._queue) >= self.max_queue_size:
+                self._dropped += 1
+                if level < logging.WARNING and self.drop_policy == "drop_newest":
+                    return False
+                self._queue.popleft()
+            self._queue.append(event)
+            self._enqueued += 1
+            if len(self._queue) >= self.batch_size:
+                self._condition.notify_all()
+        return True
+
+    def _start(self) -> None:
+        # Chamado com o lock adquirido; também recria a thread após um fork
+        self._pid = os.getpid()
+        self._closing = False
+        self._thread = threading.Thread(target=self._run, name="security-log-writer", daemon=True)
+        self._thread.start()
+
+    def _run(self) -> None:
+        while True:
+            with self._condition:
+                if not self._queue and not self._closing:
+                    self._condition.wait(self.flush_interval)
+                if not self._queue:
+                    if self._closing:
+                        return
+                    self._maybe_report_stats()
+                    continue
+                batch = [self._queue.popleft() for _ in range(min(self.batch_size, len(self._queue)))]
+                self._in_flight = len(batch)
+            self._write_batch(batch)
+            with self._condition:
+                self._in_flight = 0
+                self._condition.notify_all()
+                self._maybe_report_stats()
+
+    def _write_batch(self, batch: List[SecurityLogEvent]) -> None:
+        records = []
+        for event in batch:
+            try:
+                records.append(self._build_record(event))
+            except Exception:
+                self._write_errors += 1
+                logger.exception("Falha ao formatar evento de segurança %s", event.event_type)
+        self._write_records(records)
+        now = time.time()
+        lag_ms = round((now - batch[0].created) * 1000, 2)
+        self._last_lag_ms = lag_ms
+        self._max_lag_ms = max(self._max_lag_ms, lag_ms)
+        self._written += len(records)
+        self._batches += 1
+
+    def _write_records(self, records: List[Dict[str, Any]]) -> None:
+        if not records:
+            return
+        for sink in self.sinks:
+            try:
+                sink.write(records)
+            except Exception:
+                self._write_errors += 1
+                logger.exception("Falha ao gravar eventos de segurança em %s", type(sink).__name__)
+
+    @staticmethod
+    def _build_record(event: SecurityLogEvent) -> Dict[str, Any]:
+        current_time = datetime.fromtimestamp(event.created, timezone.utc)
+        details = event.details
+        if event.local_time:
+            details = dict(details or {})
+            details["timestamp_local"] = datetime.fromtimestamp(event.created).strftime("%Y-%m-%d %H:%M:%S")
+        if details and event.prepare is not None:
+            details = event.prepare(details)
+
+        message = {
+            "event_id": str(uuid.uuid4()),
+            "event_type": event.event_type,
+            "timestamp": current_time.isoformat(),
+            "datetime": current_time.strftime("%Y-%m-%d %H:%M:%S %Z"),
+            "user_id": str(event.user_id) if event.user_id else None,
+            "ip_address": event.ip_address,
+        }
+        if details:
+            message["details"] = details
+        return {"level": logging.getLevelName(event.level), "created": event.created, "message": message}
+
+    def _maybe_report_stats(self) -> None:
+        # Chamado com o lock adquirido, na thread de escrita
+        now = time.monotonic()
+        if now - self._last_stats_report < self.stats_interval or self._dropped == self._dropped_reported:
+            return
+        self._last_stats_report = now
+        self._dropped_reported = self._dropped
+        event = SecurityLogEvent(
+            time.time(), logging.WARNING, "security_log_stats", None, None, self.stats(), False, None
+        )
+        self._write_records([self._build_record(event)])
+
+    def stats(self) -> Dict[str, Any]:
+        """Retorna estatísticas da fila e da escrita."""
+        return {
+            "queued": len(self._queue),
+            "max_queue_size": self.max_queue_size,
+            "enqueued": self._enqueued,
+            "written": self._written,
+            "dropped": self._dropped,
+            "batches": self._batches,
+            "write_errors": self._write_errors,
+            "last_lag_ms": self._last_lag_ms,
+            "max_lag_ms": self._max_lag_ms,
+        }
+
+    def flush(self, timeout: float = 5.0) -> bool:
+        """Espera a gravação dos eventos já enfileirados; retorna False se o tempo acabar."""
+        with self._condition:
+            if self._thread is None:
+                return not self._queue
+            self._condition.notify_all()
+            return self._condition.wait_for(lambda: not self._queue and not self._in_flight, timeout)
+
+    def close(self, timeout: float = 5.0) -> None:
+        """
+        Grava os eventos pendentes, encerra a thread e fecha os destinos.
+
+        Um novo `enqueue` depois disso inicia a thread de novo.
+        """
+        with self._condition:
+            thread = self._thread
+            self._closing = True
+            self._condition.notify_all()
+        if thread is not None and thread.is_alive():
+            thread.join(timeout)
+        with self._condition:
+            self._thread = None
+            # Se a thread não terminou a tempo, gravar o restante aqui mesmo
+            remaining = list(self._queue)
+            self._queue.clear()
+        if remaining:
+            self._write_batch(remaining)
+        for sink in self.sinks:
+            sink.close()
+
+
+@lru_cache()
+def get_security_log_writer() -> SecurityLogWriter:
+    """Writer compartilhado dos logs de segurança (logs/security.log, com rotação, e auditoria)."""
+    settings = get_settings()
+    sinks: List[SecurityLogSink] = [
+        RotatingFileSecurityLogSink(
+            settings.security_log_path,
+            max_bytes=settings.security_log_max_bytes,
+            rotate_daily=settings.security_log_rotate_daily,
+            retention_days=settings.security_log_retention_days,
+            max_segments=settings.security_log_max_segments,
+            compress=settings.security_log_compress,
+        )
+    ]
+    # Cópia indexada para consultas de auditoria
+    audit_store = get_security_audit_store()
+    if audit_store is not None:
+        sinks.append(audit_store)
+    writer = SecurityLogWriter(
+        sinks=sinks,
+        max_queue_size=settings.security_log_queue_size,
+        batch_size=settings.security_log_batch_size,
+        flush_interval=settings.security_log_flush_interval_seconds,
+        drop_policy=settings.security_log_drop_policy,
+    )
+    # Scripts e testes não passam pelo lifespan da aplicação
+    atexit.register(writer.close)
+    return writer
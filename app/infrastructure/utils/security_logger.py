@@ -1,77 +1,76 @@
-import json
 import logging
-import os
-import time
-import uuid
-from datetime import datetime, timezone
-from typing import Dict, Any, Optional, Union
+from typing import Dict, Any, Optional, Tuple, Union
 from uuid import UUID
 
-# Configurar o logger
-logger = logging.getLogger("security")
-logger.setLevel(logging.INFO)
+from app.infrastructure.utils.security_log_writer import get_security_log_writer
 
-# Verificar se o diretório de logs existe, se não, criar
-log_dir = os.path.join(os.getcwd(), "logs")
-if not os.path.exists(log_dir):
-    os.makedirs(log_dir)
 
-# Configurar handler para arquivo
-file_handler = logging.FileHandler(os.path.join(log_dir, "security.log"))
-file_handler.setLevel(logging.INFO)
+class SecurityLogger:
+    """
+    Classe para logging de eventos de segurança.
 
-# Configurar formato do log
-formatter = logging.Formatter(
-    '{"timestamp": "%(asctime)s", "level": "%(levelname)s", "message": %(message)s}'
-)
-file_handler.setFormatter(formatter)
+    Os eventos são enfileirados no SecurityLogWriter e gravados em lotes por
+    uma thread própria (logs/security.log), sem I/O no event loop.
+    """
 
-# Adicionar handler ao logger
-logger.addHandler(file_handler)
+    # Chaves cujo valor nunca deve ser registrado
+    SENSITIVE_REQUEST_KEYS = ("password", "token", "secret")
+    SENSITIVE_RESPONSE_KEYS = ("token", "secret")
 
+    @classmethod
+    def _redact(cls, data: Any, sensitive_keys: Tuple[str, ...]) -> Any:
+        """
+        Substitui recursivamente valores de chaves sensíveis por "********".
 
-class SecurityLogger:
-    """Classe para logging de eventos de segurança."""
+        Aceita qualquer estrutura JSON (ex.: listas de usuários em importações).
+        """
+        if isinstance(data, dict):
+            return {
+                key: "********"
+                if any(sensitive in str(key).lower() for sensitive in sensitive_keys)
+                else cls._redact(value, sensitive_keys)
+                for key, value in data.items()
+            }
+        if isinstance(data, list):
+            return [cls._redact(item, sensitive_keys) for item in data]
+        return data
 
-    @staticmethod
-    def _format_message(
+    @classmethod
+    def _prepare_details(cls, details: Dict[str, Any]) -> Dict[str, Any]:
+        """Mascara dados sensíveis da requisição e da resposta (executado na thread de escrita)."""
+        if "request_data" in details:
+            details["request_data"] = cls._redact(details["request_data"], cls.SENSITIVE_REQUEST_KEYS)
+        if "response_data" in details:
+            details["response_data"] = cls._redact(details["response_data"], cls.SENSITIVE_RESPONSE_KEYS)
+        return details
+
+    @classmethod
+    def _emit(
+        cls,
+        level: int,
         event_type: str,
         user_id: Optional[Union[str, UUID]] = None,
         ip_address: Optional[str] = None,
         details: Optional[Dict[str, Any]] = None,
-    ) -> str:
+        local_time: bool = False,
+    ) -> None:
         """
-        Formata a mensagem de log.
+        Enfileira o evento no writer de logs de segurança.
+
+        Id do evento, datas, mascaramento e JSON são gerados na thread de
+        escrita, fora do event loop.
 
         Args:
+            level: Nível de log (logging.INFO, logging.WARNING, ...)
             event_type: Tipo de evento (login, logout, etc.)
             user_id: ID do usuário
             ip_address: Endereço IP
             details: Detalhes adicionais
-
-        Returns:
-            str: Mensagem formatada em JSON
+            local_time: Se deve incluir `timestamp_local` nos detalhes
         """
-        # Gerar ID único para o evento
-        event_id = str(uuid.uuid4())
-
-        # Obter timestamp atual com timezone
-        current_time = datetime.now(timezone.utc)
-        timestamp = current_time.isoformat()
-
-        message = {
-            "event_id": event_id,
-            "event_type": event_type,
-            "timestamp": timestamp,
-            "datetime": current_time.strftime("%Y-%m-%d %H:%M:%S %Z"),
-            "user_id": str(user_id) if user_id else None,
-            "ip_address": ip_address,
-        }
-
-        if details:
-            message["details"] = details
-
-        return json.dumps(message)
+        get_security_log_writer().enqueue(
+            level, event_type, user_id, ip_address, details, local_time, cls._prepare_details
+        )
 
     @classmethod
     def log_login_attempt(
@@ -97,7 +96,6 @@ class SecurityLogger:
         details = {
             "success": success,
             "username": username,
-            "timestamp_local": datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
         }
 
         if error:
@@ -105,19 +103,12 @@ class SecurityLogger:
             details["error_details"] = str(error)
 
         if request_data:
-            # Adicionar dados da requisição, mas remover informações sensíveis
-            safe_request_data = request_data.copy() if request_data else {}
-            if "password" in safe_request_data:
-                safe_request_data["password"] = "********"
-            details["request_data"] = safe_request_data
+            # Dados da requisição; informações sensíveis são mascaradas antes da gravação
+            details["request_data"] = request_data.copy()
 
         event_type = "login_success" if success else "login_failure"
-        message = cls._format_message(event_type, user_id, ip_address, details)
-
-        if success:
-            logger.info(message)
-        else:
-            logger.warning(message)
+        level = logging.INFO if success else logging.WARNING
+        cls._emit(level, event_type, user_id, ip_address, details, local_time=True)
 
     @classmethod
     def log_logout(
@@ -132,8 +123,7 @@ class SecurityLogger:
             user_id: ID do usuário
             ip_address: Endereço IP
         """
-        message = cls._format_message("logout", user_id, ip_address)
-        logger.info(message)
+        cls._emit(logging.INFO, "logout", user_id, ip_address)
 
     @classmethod
     def log_token_refresh(
@@ -156,13 +146,8 @@ class SecurityLogger:
         if error:
             details["error"] = error
 
-        event_type = "token_refresh"
-        message = cls._format_message(event_type, user_id, ip_address, details)
-
-        if success:
-            logger.info(message)
-        else:
-            logger.warning(message)
+        level = logging.INFO if success else logging.WARNING
+        cls._emit(level, "token_refresh", user_id, ip_address, details)
 
     @classmethod
     def log_permission_denied(
@@ -187,8 +172,7 @@ class SecurityLogger:
         if action:
             details["action"] = action
 
-        message = cls._format_message("permission_denied", user_id, ip_address, details)
-        logger.warning(message)
+        cls._emit(logging.WARNING, "permission_denied", user_id, ip_address, details)
 
     @classmethod
     def log_api_request(
@@ -197,7 +181,7 @@ class SecurityLogger:
         path: str,
         user_id: Optional[Union[str, UUID]] = None,
         ip_address: Optional[str] = None,
-        request_data: Optional[Dict[str, Any]] = None,
+        request_data: Optional[Any] = None,
         response_data: Optional[Dict[str, Any]] = None,
         status_code: Optional[int] = None,
         process_time_ms: Optional[float] = None,
@@ -220,7 +204,6 @@ class SecurityLogger:
         details = {
             "method": method,
             "path": path,
-            "timestamp_local": datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
         }
 
         if status_code is not None:
@@ -234,31 +217,14 @@ class SecurityLogger:
             details["error"] = error
             details["error_details"] = str(error)
 
-        # Adicionar dados da requisição, removendo informações sensíveis
+        # Dados da requisição e da resposta; informações sensíveis são mascaradas antes da gravação
         if request_data:
-            safe_request_data = request_data.copy()
-            # Remover senhas ou outros dados sensíveis
-            for key in list(safe_request_data.keys()):
-                if "password" in key.lower() or "token" in key.lower() or "secret" in key.lower():
-                    safe_request_data[key] = "********"
-            details["request_data"] = safe_request_data
-
-        # Adicionar dados da resposta
+            details["request_data"] = request_data
         if response_data:
-            # Remover tokens ou outros dados sensíveis da resposta
-            safe_response_data = response_data.copy()
-            for key in list(safe_response_data.keys()):
-                if "token" in key.lower() or "secret" in key.lower():
-                    safe_response_data[key] = "********"
-            details["response_data"] = safe_response_data
-
-        event_type = "api_request"
-        message = cls._format_message(event_type, user_id, ip_address, details)
+            details["response_data"] = response_data
 
-        if error or (status_code and status_code >= 400):
-            logger.warning(message)
-        else:
-            logger.info(message)
+        level = logging.WARNING if error or (status_code and status_code >= 400) else logging.INFO
+        cls._emit(level, "api_request", user_id, ip_address, details, local_time=True)
 
     @classmethod
     def log_security_event(
@@ -286,37 +252,16 @@ class SecurityLogger:
         # Criar ou atualizar detalhes
         log_details = details.copy() if details else {}
 
-        # Adicionar timestamp local
-        log_details["timestamp_local"] = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-
-        # Adicionar dados da requisição, removendo informações sensíveis
+        # Dados da requisição e da resposta; informações sensíveis são mascaradas antes da gravação
         if request_data:
-            safe_request_data = request_data.copy()
-            # Remover senhas ou outros dados sensíveis
-            for key in list(safe_request_data.keys()):
-                if "password" in key.lower() or "token" in key.lower() or "secret" in key.lower():
-                    safe_request_data[key] = "********"
-            log_details["request_data"] = safe_request_data
-
-        # Adicionar dados da resposta
+            log_details["request_data"] = request_data
         if response_data:
-            # Remover tokens ou outros dados sensíveis da resposta
-            safe_response_data = response_data.copy()
-            for key in list(safe_response_data.keys()):
-                if "token" in key.lower() or "secret" in key.lower():
-                    safe_response_data[key] = "********"
-            log_details["response_data"] = safe_response_data
+            log_details["response_data"] = response_data
 
             # Adicionar status de sucesso baseado na resposta
             if "status_code" in response_data:
                 status_code = response_data["status_code"]
                 log_details["success"] = 200 <= status_code < 400
 
-        message = cls._format_message(event_type, user_id, ip_address, log_details)
-
-        if level == "warning":
-            logger.warning(message)
-        elif level == "error":
-            logger.error(message)
-        else:
-            logger.info(message)
+        log_level = {"warning": logging.WARNING, "error": logging.ERROR}.get(level, logging.INFO)
+        cls._emit(log_level, event_type, user_id, ip_address, log_details, local_time=True)
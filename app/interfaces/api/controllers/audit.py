@@ -0,0 +1,66 @@
+from datetime import datetime
+from typing import Any, Dict, Optional
+
+from fastapi import APIRouter, Depends, HTTPException, Query, status
+
+from app.domain.entities.user import User
+from app.infrastructure.auth.jwt import get_current_admin_user
+from app.infrastructure.database.concurrency import AdaptiveConcurrencyLimiter
+from app.infrastructure.utils.security_audit_store import SQLiteSecurityAuditStore
+from app.interfaces.api.dependencies import (
+    provide_db_limiters,
+    provide_db_pool_stats,
+    provide_security_audit_store,
+)
+from app.interfaces.api.schemas.audit import DatabaseStatsResponse, SecurityEventPage, SecurityEventResponse
+
+router = APIRouter()
+
+
+@router.get("/events", response_model=SecurityEventPage)
+async def get_security_events(
+    event_type: Optional[str] = Query(None, description="Ex.: login_failure, api_request, permission_denied"),
+    user_id: Optional[str] = None,
+    ip_address: Optional[str] = None,
+    level: Optional[str] = Query(None, description="INFO, WARNING ou ERROR"),
+    since: Optional[datetime] = Query(None, description="Início do período (UTC se sem timezone)"),
+    until: Optional[datetime] = Query(None, description="Fim do período (UTC se sem timezone)"),
+    limit: int = Query(100, ge=1, le=1000),
+    cursor: Optional[str] = Query(None, description="`next_cursor` da página anterior"),
+    audit_store: Optional[SQLiteSecurityAuditStore] = Depends(provide_security_audit_store),
+    current_user: User = Depends(get_current_admin_user),
+) -> SecurityEventPage:
+    if audit_store is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Security audit store is disabled",
+        )
+    try:
+        events, next_cursor = await audit_store.search(
+            filters={"event_type": event_type, "user_id": user_id, "ip_address": ip_address, "level": level},
+            since=since,
+            until=until,
+            limit=limit,
+            cursor=cursor,
+        )
+    except ValueError:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Invalid cursor",
+        )
+    return SecurityEventPage(
+        items=[SecurityEventResponse(**event) for event in events],
+        next_cursor=next_cursor,
+    )
+
+
+@router.get("/database", response_model=DatabaseStatsResponse)
+async def get_database_stats(
+    limiters: Dict[str, AdaptiveConcurrencyLimiter] = Depends(provide_db_limiters),
+    pools: Dict[str, Dict[str, Any]] = Depends(provide_db_pool_stats),
+    current_user: User = Depends(get_current_admin_user),
+) -> DatabaseStatsResponse:
+    return DatabaseStatsResponse(
+        limiters={kind: limiter.stats() for kind, limiter in limiters.items()},
+        pools=pools,
+    )
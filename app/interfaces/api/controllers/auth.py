@@ -1,20 +1,34 @@
-from datetime import timedelta, datetime, timezone
-from typing import Any
-from uuid import UUID
+from datetime import timedelta
+from typing import Any, Optional
 
 from fastapi import APIRouter, Depends, HTTPException, status, Body, Request
 from fastapi.security import OAuth2PasswordRequestForm
-from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.application.services.auth_service import AuthService
+from app.application.use_cases.refresh_token_use_cases import (
+    InvalidRefreshTokenError,
+    RefreshTokenReuseError,
+    RefreshTokenUseCases,
+)
+from app.application.use_cases.token_revocation_use_cases import TokenRevocationUseCases
 from app.application.use_cases.user_use_cases import UserUseCases
 from app.domain.entities.user import User
+from app.infrastructure.auth.jwt import get_current_user
+from app.infrastructure.auth.revocation import get_revocation_registry
+from app.infrastructure.auth.token_verifier import get_request_claims
 from app.infrastructure.config import get_settings
-from app.infrastructure.database.database import get_db
-from app.infrastructure.database.models import RefreshTokenModel
 from app.infrastructure.repositories.user_repository_impl import UserRepositoryImpl
+from app.infrastructure.utils.bounded_executor import ExecutorQueueFullError
 from app.infrastructure.utils.security_logger import SecurityLogger
-from app.interfaces.api.schemas.user import Token, RefreshToken, UserResponse
+from app.interfaces.api.dependencies import (
+    get_refresh_token_use_cases,
+    get_token_revocation_use_cases,
+    get_user_repository,
+    get_user_use_cases,
+    provide_auth_service,
+)
+from app.interfaces.api.errors import server_busy
+from app.interfaces.api.schemas.user import Token, RefreshToken, LogoutRequest, UserResponse
 
 router = APIRouter()
 settings = get_settings()
@@ -24,22 +38,26 @@ settings = get_settings()
 async def login_for_access_token(
     request: Request,
     form_data: OAuth2PasswordRequestForm = Depends(),
-    db: AsyncSession = Depends(get_db),
+    auth_service: AuthService = Depends(provide_auth_service),
+    user_use_cases: UserUseCases = Depends(get_user_use_cases),
+    refresh_token_use_cases: RefreshTokenUseCases = Depends(get_refresh_token_use_cases),
 ) -> Any:
     # Obter o endereço IP do cliente
     client_ip = request.client.host if request.client else "unknown"
 
-    auth_service = AuthService(
-        secret_key=settings.secret_key,
-        algorithm=settings.algorithm,
-        access_token_expire_minutes=settings.access_token_expire_minutes,
-        refresh_token_expire_days=settings.refresh_token_expire_days,
-    )
-    user_repository = UserRepositoryImpl(db)
-    user_use_cases = UserUseCases(user_repository, auth_service)
-
     try:
-        user = await user_use_cases.authenticate_user(form_data.username, form_data.password)
+        try:
+            user = await user_use_cases.authenticate_user(form_data.username, form_data.password)
+        except ExecutorQueueFullError:
+            # Fila de hashing cheia: rejeitar rápido em vez de acumular logins
+            SecurityLogger.log_security_event(
+                event_type="login_rejected_busy",
+                ip_address=client_ip,
+                details={"username": form_data.username},
+                level="warning"
+            )
+            raise server_busy()
+
         if not user:
             # Registrar falha de login
             SecurityLogger.log_login_attempt(
@@ -60,17 +78,8 @@ async def login_for_access_token(
             user_id=user.id, role=user.role, expires_delta=access_token_expires
         )
 
-        # Criar refresh token
-        refresh_token, refresh_expires = auth_service.create_refresh_token(user_id=user.id)
-
-        # Salvar refresh token no banco de dados
-        db_refresh_token = RefreshTokenModel(
-            token=refresh_token,
-            expires_at=refresh_expires,
-            user_id=str(user.id),
-        )
-        db.add(db_refresh_token)
-        await db.commit()
+        # Criar refresh token (apenas o hash é salvo no banco de dados)
+        refresh_token, _ = await refresh_token_use_cases.issue_refresh_token(user_id=user.id)
 
         # Registrar login bem-sucedido
         SecurityLogger.log_login_attempt(
@@ -118,27 +127,34 @@ async def login_for_access_token(
 async def refresh_access_token(
     request: Request,
     refresh_token_data: RefreshToken = Body(...),
-    db: AsyncSession = Depends(get_db),
+    auth_service: AuthService = Depends(provide_auth_service),
+    refresh_token_use_cases: RefreshTokenUseCases = Depends(get_refresh_token_use_cases),
+    user_repository: UserRepositoryImpl = Depends(get_user_repository),
 ) -> Any:
     # Obter o endereço IP do cliente
     client_ip = request.client.host if request.client else "unknown"
 
-    auth_service = AuthService(
-        secret_key=settings.secret_key,
-        algorithm=settings.algorithm,
-        access_token_expire_minutes=settings.access_token_expire_minutes,
-        refresh_token_expire_days=settings.refresh_token_expire_days,
-    )
-
     try:
-        # Verificar se o refresh token existe e é válido
-        db_refresh_token = await db.query(RefreshTokenModel).filter(
-            RefreshTokenModel.token == refresh_token_data.refresh_token,
-            RefreshTokenModel.revoked == False,
-            RefreshTokenModel.expires_at > datetime.now(timezone.utc)
-        ).first()
-
-        if not db_refresh_token:
+        # Verificar o refresh token e rotacioná-lo dentro da mesma família
+        try:
+            new_refresh_token, db_refresh_token = await refresh_token_use_cases.rotate_refresh_token(
+                refresh_token_data.refresh_token
+            )
+        except RefreshTokenReuseError as e:
+            # Token já rotacionado apresentado novamente: família inteira revogada
+            SecurityLogger.log_security_event(
+                event_type="refresh_token_reuse",
+                user_id=e.refresh_token.user_id,
+                ip_address=client_ip,
+                details={"family_id": str(e.refresh_token.family_id)},
+                level="warning"
+            )
+            raise HTTPException(
+                status_code=status.HTTP_401_UNAUTHORIZED,
+                detail="Refresh token inválido ou expirado",
+                headers={"WWW-Authenticate": "Bearer"},
+            )
+        except InvalidRefreshTokenError:
             # Registrar falha de refresh token
             SecurityLogger.log_security_event(
                 event_type="token_refresh_failure",
@@ -153,15 +169,14 @@ async def refresh_access_token(
             )
 
         # Obter o usuário
-        user_repository = UserRepositoryImpl(db)
-        user = await user_repository.get_by_id(UUID(db_refresh_token.user_id))
+        user = await user_repository.get_by_id(str(db_refresh_token.user_id))
 
         if not user:
             # Registrar falha de refresh token
             SecurityLogger.log_security_event(
                 event_type="token_refresh_failure",
                 ip_address=client_ip,
-                details={"error": "Usuário não encontrado", "user_id": db_refresh_token.user_id},
+                details={"error": "Usuário não encontrado", "user_id": str(db_refresh_token.user_id)},
                 level="warning"
             )
             raise HTTPException(
@@ -176,21 +191,6 @@ async def refresh_access_token(
             user_id=user.id, role=user.role, expires_delta=access_token_expires
         )
 
-        # Criar novo refresh token
-        new_refresh_token, refresh_expires = auth_service.create_refresh_token(user_id=user.id)
-
-        # Revogar o refresh token antigo
-        db_refresh_token.revoked = True
-
-        # Salvar novo refresh token
-        new_db_refresh_token = RefreshTokenModel(
-            token=new_refresh_token,
-            expires_at=refresh_expires,
-            user_id=str(user.id),
-        )
-        db.add(new_db_refresh_token)
-        await db.commit()
-
         # Registrar refresh token bem-sucedido
         SecurityLogger.log_token_refresh(
             user_id=user.id,
@@ -230,3 +230,27 @@ async def refresh_access_token(
                 level="error"
             )
         raise
+
+
+@router.post("/logout", status_code=status.HTTP_204_NO_CONTENT)
+async def logout(
+    request: Request,
+    logout_data: Optional[LogoutRequest] = Body(None),
+    token_revocation_use_cases: TokenRevocationUseCases = Depends(get_token_revocation_use_cases),
+    refresh_token_use_cases: RefreshTokenUseCases = Depends(get_refresh_token_use_cases),
+    current_user: User = Depends(get_current_user),
+) -> None:
+    # Obter o endereço IP do cliente
+    client_ip = request.client.host if request.client else "unknown"
+
+    # Revogar o access token atual (as claims já foram verificadas por get_current_user)
+    claims = get_request_claims(request) or {}
+    if claims.get("jti") and claims.get("exp"):
+        revocation = await token_revocation_use_cases.revoke_access_token(claims["jti"], claims["exp"])
+        get_revocation_registry().apply(revocation)
+
+    # Revogar a família do refresh token, se informado
+    if logout_data and logout_data.refresh_token:
+        await refresh_token_use_cases.revoke_refresh_token_family(logout_data.refresh_token)
+
+    SecurityLogger.log_logout(user_id=current_user.id, ip_address=client_ip)
@@ -1,17 +1,15 @@
-from typing import List
+from typing import List, Optional, Tuple, Union
 from uuid import UUID
 
-from fastapi import APIRouter, Depends, HTTPException, status
-from sqlalchemy.ext.asyncio import AsyncSession
+from fastapi import APIRouter, Depends, HTTPException, Request, Response, status
 
 from app.application.use_cases.collection_use_cases import CollectionUseCases
-from app.domain.entities.collection import CollectionStatus
+from app.domain.entities.collection import Collection, CollectionStatus, CollectionVersion
 from app.domain.entities.user import User, UserRole
 from app.infrastructure.auth.jwt import get_current_collector_user, get_current_user
-from app.infrastructure.database.database import get_db
-from app.infrastructure.repositories.collection_repository_impl import CollectionRepositoryImpl
-from app.infrastructure.repositories.company_repository_impl import CompanyRepositoryImpl
-from app.infrastructure.repositories.user_repository_impl import UserRepositoryImpl
+from app.infrastructure.utils.payload_cache import get_payload_cache
+from app.interfaces.api.dependencies import get_collection_use_cases
+from app.interfaces.api.etag import etag_headers, etag_matches, list_etag, make_etag, not_modified
 from app.interfaces.api.schemas.collection import (
     CollectionAssign,
     CollectionCreate,
@@ -19,23 +17,47 @@ from app.interfaces.api.schemas.collection import (
     CollectionStatusUpdate,
     CollectionUpdate,
 )
+from app.interfaces.api.serialization import collection_serializer, payload_response, response_media_type
 
 router = APIRouter()
 
 
+def _list_scope(current_user: User) -> Tuple[str, Optional[UUID], Optional[UUID]]:
+    """Escopo da listagem do usuário: (nome para o ETag, filtro por usuário, filtro por coletor)."""
+    if current_user.role == UserRole.ADMIN:
+        return "collections:all", None, None
+    if current_user.role == UserRole.COLLECTOR:
+        return f"collections:collector:{current_user.id}", None, current_user.id
+    return f"collections:user:{current_user.id}", current_user.id, None
+
+
+def _check_read_permission(current_user: User, collection: Union[Collection, CollectionVersion]) -> None:
+    if (
+        current_user.role == UserRole.REGULAR
+        and collection.user_id != current_user.id
+    ):
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="Not enough permissions",
+        )
+
+    if (
+        current_user.role == UserRole.COLLECTOR
+        and collection.collector_id != current_user.id
+        and collection.company_id != current_user.company_id
+    ):
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="Not enough permissions",
+        )
+
+
 @router.post("/", response_model=CollectionResponse, status_code=status.HTTP_201_CREATED)
 async def create_collection(
     collection_create: CollectionCreate,
-    db: AsyncSession = Depends(get_db),
+    collection_use_cases: CollectionUseCases = Depends(get_collection_use_cases),
     current_user: User = Depends(get_current_user),
-) -> CollectionResponse:
-    collection_repository = CollectionRepositoryImpl(db)
-    company_repository = CompanyRepositoryImpl(db)
-    user_repository = UserRepositoryImpl(db)
-    collection_use_cases = CollectionUseCases(
-        collection_repository, company_repository, user_repository
-    )
-
+) -> Response:
     try:
         collection = await collection_use_cases.request_collection(
             user_id=current_user.id,
@@ -45,20 +67,7 @@ async def create_collection(
             zip_code=collection_create.zip_code,
             images=collection_create.images,
         )
-        return CollectionResponse(
-            id=collection.id,
-            user_id=collection.user_id,
-            description=collection.description,
-            location_latitude=collection.location_latitude,
-            location_longitude=collection.location_longitude,
-            zip_code=collection.zip_code,
-            images=collection.images,
-            status=collection.status,
-            created_at=collection.created_at,
-            updated_at=collection.updated_at,
-            collector_id=collection.collector_id,
-            company_id=collection.company_id,
-        )
+        return collection_serializer.response(collection, status_code=status.HTTP_201_CREATED)
     except ValueError as e:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
@@ -68,54 +77,59 @@ async def create_collection(
 
 @router.get("/", response_model=List[CollectionResponse])
 async def get_collections(
-    db: AsyncSession = Depends(get_db),
+    request: Request,
+    collection_use_cases: CollectionUseCases = Depends(get_collection_use_cases),
     current_user: User = Depends(get_current_user),
-) -> List[CollectionResponse]:
-    collection_repository = CollectionRepositoryImpl(db)
-    company_repository = CompanyRepositoryImpl(db)
-    user_repository = UserRepositoryImpl(db)
-    collection_use_cases = CollectionUseCases(
-        collection_repository, company_repository, user_repository
-    )
+) -> Response:
+    scope, user_id, collector_id = _list_scope(current_user)
+    cache = get_payload_cache()
+    if request.headers.get("If-None-Match") or cache.enabled("collections"):
+        # Uma consulta agregada (quantidade e maior updated_at) decide entre 304,
+        # o payload em cache e a carga completa
+        version = await collection_use_cases.get_collections_version(user_id, collector_id)
+        etag = list_etag(scope, *version)
+        if etag_matches(request, etag):
+            return not_modified(etag)
+        payload = cache.get("collections", scope, version, response_media_type())
+        if payload is not None:
+            return payload_response(payload, headers=etag_headers(etag))
 
     if current_user.role == UserRole.ADMIN:
-        collections = await collection_repository.get_all()
+        collections = await collection_use_cases.get_all_collections()
     elif current_user.role == UserRole.COLLECTOR:
         collections = await collection_use_cases.get_collections_by_collector(current_user.id)
     else:  # Regular user
         collections = await collection_use_cases.get_collections_by_user(current_user.id)
 
-    return [
-        CollectionResponse(
-            id=collection.id,
-            user_id=collection.user_id,
-            description=collection.description,
-            location_latitude=collection.location_latitude,
-            location_longitude=collection.location_longitude,
-            zip_code=collection.zip_code,
-            images=collection.images,
-            status=collection.status,
-            created_at=collection.created_at,
-            updated_at=collection.updated_at,
-            collector_id=collection.collector_id,
-            company_id=collection.company_id,
-        )
-        for collection in collections
-    ]
+    version = (len(collections), max((collection.updated_at for collection in collections), default=None))
+    payload = collection_serializer.dumps_many(collections)
+    cache.put("collections", scope, version, payload, response_media_type())
+    return payload_response(payload, headers=etag_headers(list_etag(scope, *version)))
 
 
 @router.get("/{collection_id}", response_model=CollectionResponse)
 async def get_collection(
     collection_id: UUID,
-    db: AsyncSession = Depends(get_db),
+    request: Request,
+    collection_use_cases: CollectionUseCases = Depends(get_collection_use_cases),
     current_user: User = Depends(get_current_user),
-) -> CollectionResponse:
-    collection_repository = CollectionRepositoryImpl(db)
-    company_repository = CompanyRepositoryImpl(db)
-    user_repository = UserRepositoryImpl(db)
-    collection_use_cases = CollectionUseCases(
-        collection_repository, company_repository, user_repository
-    )
+) -> Response:
+    cache = get_payload_cache()
+    if request.headers.get("If-None-Match") or cache.enabled("collection"):
+        # Permissões, ETag e versão do cache a partir das colunas leves, sem carregar as imagens
+        version = await collection_use_cases.get_collection_version(collection_id)
+        if not version:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail="Collection not found",
+            )
+        _check_read_permission(current_user, version)
+        etag = make_etag("collection", version.id, version.updated_at)
+        if etag_matches(request, etag):
+            return not_modified(etag)
+        payload = cache.get("collection", version.id, version.updated_at, response_media_type())
+        if payload is not None:
+            return payload_response(payload, headers=etag_headers(etag))
 
     collection = await collection_use_cases.get_collection_by_id(collection_id)
     if not collection:
@@ -125,38 +139,12 @@ async def get_collection(
         )
 
     # Check permissions
-    if (
-        current_user.role == UserRole.REGULAR
-        and collection.user_id != current_user.id
-    ):
-        raise HTTPException(
-            status_code=status.HTTP_403_FORBIDDEN,
-            detail="Not enough permissions",
-        )
-
-    if (
-        current_user.role == UserRole.COLLECTOR
-        and collection.collector_id != current_user.id
-        and collection.company_id != current_user.company_id
-    ):
-        raise HTTPException(
-            status_code=status.HTTP_403_FORBIDDEN,
-            detail="Not enough permissions",
-        )
+    _check_read_permission(current_user, collection)
 
-    return CollectionResponse(
-        id=collection.id,
-        user_id=collection.user_id,
-        description=collection.description,
-        location_latitude=collection.location_latitude,
-        location_longitude=collection.location_longitude,
-        zip_code=collection.zip_code,
-        images=collection.images,
-        status=collection.status,
-        created_at=collection.created_at,
-        updated_at=collection.updated_at,
-        collector_id=collection.collector_id,
-        company_id=collection.company_id,
+    payload = collection_serializer.dumps(collection)
+    cache.put("collection", collection.id, collection.updated_at, payload, response_media_type())
+    return payload_response(
+        payload, headers=etag_headers(make_etag("collection", collection.id, collection.updated_at))
     )
 
 
@@ -164,41 +152,21 @@ async def get_collection(
 async def assign_collection(
     collection_id: UUID,
     collection_assign: CollectionAssign,
-    db: AsyncSession = Depends(get_db),
+    collection_use_cases: CollectionUseCases = Depends(get_collection_use_cases),
     current_user: User = Depends(get_current_user),
-) -> CollectionResponse:
+) -> Response:
     if current_user.role != UserRole.ADMIN and current_user.role != UserRole.COLLECTOR:
         raise HTTPException(
             status_code=status.HTTP_403_FORBIDDEN,
             detail="Not enough permissions",
         )
 
-    collection_repository = CollectionRepositoryImpl(db)
-    company_repository = CompanyRepositoryImpl(db)
-    user_repository = UserRepositoryImpl(db)
-    collection_use_cases = CollectionUseCases(
-        collection_repository, company_repository, user_repository
-    )
-
     try:
         collection = await collection_use_cases.assign_collection(
             collection_id=collection_id,
             collector_id=collection_assign.collector_id,
         )
-        return CollectionResponse(
-            id=collection.id,
-            user_id=collection.user_id,
-            description=collection.description,
-            location_latitude=collection.location_latitude,
-            location_longitude=collection.location_longitude,
-            zip_code=collection.zip_code,
-            images=collection.images,
-            status=collection.status,
-            created_at=collection.created_at,
-            updated_at=collection.updated_at,
-            collector_id=collection.collector_id,
-            company_id=collection.company_id,
-        )
+        return collection_serializer.response(collection)
     except ValueError as e:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
@@ -210,36 +178,16 @@ async def assign_collection(
 async def update_collection_status(
     collection_id: UUID,
     status_update: CollectionStatusUpdate,
-    db: AsyncSession = Depends(get_db),
+    collection_use_cases: CollectionUseCases = Depends(get_collection_use_cases),
     current_user: User = Depends(get_current_collector_user),
-) -> CollectionResponse:
-    collection_repository = CollectionRepositoryImpl(db)
-    company_repository = CompanyRepositoryImpl(db)
-    user_repository = UserRepositoryImpl(db)
-    collection_use_cases = CollectionUseCases(
-        collection_repository, company_repository, user_repository
-    )
-
+) -> Response:
     try:
         collection = await collection_use_cases.update_collection_status(
             collection_id=collection_id,
             status=status_update.status,
             collector_id=current_user.id,
         )
-        return CollectionResponse(
-            id=collection.id,
-            user_id=collection.user_id,
-            description=collection.description,
-            location_latitude=collection.location_latitude,
-            location_longitude=collection.location_longitude,
-            zip_code=collection.zip_code,
-            images=collection.images,
-            status=collection.status,
-            created_at=collection.created_at,
-            updated_at=collection.updated_at,
-            collector_id=collection.collector_id,
-            company_id=collection.company_id,
-        )
+        return collection_serializer.response(collection)
     except ValueError as e:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
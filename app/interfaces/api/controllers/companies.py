@@ -1,15 +1,16 @@
 from typing import List
 from uuid import UUID
 
-from fastapi import APIRouter, Depends, HTTPException, status
-from sqlalchemy.ext.asyncio import AsyncSession
+from fastapi import APIRouter, Depends, HTTPException, Request, Response, status
 
 from app.application.use_cases.company_use_cases import CompanyUseCases
 from app.domain.entities.user import User
 from app.infrastructure.auth.jwt import get_current_admin_user
-from app.infrastructure.database.database import get_db
-from app.infrastructure.repositories.company_repository_impl import CompanyRepositoryImpl
+from app.infrastructure.utils.payload_cache import get_payload_cache
+from app.interfaces.api.dependencies import get_company_use_cases
+from app.interfaces.api.etag import etag_headers, etag_matches, list_etag, make_etag, not_modified
 from app.interfaces.api.schemas.company import CompanyCreate, CompanyResponse, CompanyUpdate
+from app.interfaces.api.serialization import company_serializer, payload_response, response_media_type
 
 router = APIRouter()
 
@@ -17,26 +18,16 @@ router = APIRouter()
 @router.post("/", response_model=CompanyResponse, status_code=status.HTTP_201_CREATED)
 async def create_company(
     company_create: CompanyCreate,
-    db: AsyncSession = Depends(get_db),
+    company_use_cases: CompanyUseCases = Depends(get_company_use_cases),
     current_user: User = Depends(get_current_admin_user),
-) -> CompanyResponse:
-    company_repository = CompanyRepositoryImpl(db)
-    company_use_cases = CompanyUseCases(company_repository)
-
+) -> Response:
     try:
         company = await company_use_cases.create_company(
             name=company_create.name,
             description=company_create.description,
             zip_codes=company_create.zip_codes,
         )
-        return CompanyResponse(
-            id=company.id,
-            name=company.name,
-            description=company.description,
-            zip_codes=company.zip_codes,
-            created_at=company.created_at,
-            updated_at=company.updated_at,
-        )
+        return company_serializer.response(company, status_code=status.HTTP_201_CREATED)
     except ValueError as e:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
@@ -46,34 +37,51 @@ async def create_company(
 
 @router.get("/", response_model=List[CompanyResponse])
 async def get_companies(
-    db: AsyncSession = Depends(get_db),
+    request: Request,
+    company_use_cases: CompanyUseCases = Depends(get_company_use_cases),
     current_user: User = Depends(get_current_admin_user),
-) -> List[CompanyResponse]:
-    company_repository = CompanyRepositoryImpl(db)
-    company_use_cases = CompanyUseCases(company_repository)
+) -> Response:
+    cache = get_payload_cache()
+    if request.headers.get("If-None-Match") or cache.enabled("companies"):
+        # Uma consulta agregada (quantidade e maior updated_at) decide entre 304,
+        # o payload em cache e a carga completa
+        version = await company_use_cases.get_companies_version()
+        etag = list_etag("companies", *version)
+        if etag_matches(request, etag):
+            return not_modified(etag)
+        payload = cache.get("companies", "all", version, response_media_type())
+        if payload is not None:
+            return payload_response(payload, headers=etag_headers(etag))
 
     companies = await company_use_cases.get_all_companies()
-    return [
-        CompanyResponse(
-            id=company.id,
-            name=company.name,
-            description=company.description,
-            zip_codes=company.zip_codes,
-            created_at=company.created_at,
-            updated_at=company.updated_at,
-        )
-        for company in companies
-    ]
+    version = (len(companies), max((company.updated_at for company in companies), default=None))
+    payload = company_serializer.dumps_many(companies)
+    cache.put("companies", "all", version, payload, response_media_type())
+    return payload_response(payload, headers=etag_headers(list_etag("companies", *version)))
 
 
 @router.get("/{company_id}", response_model=CompanyResponse)
 async def get_company(
     company_id: UUID,
-    db: AsyncSession = Depends(get_db),
+    request: Request,
+    company_use_cases: CompanyUseCases = Depends(get_company_use_cases),
     current_user: User = Depends(get_current_admin_user),
-) -> CompanyResponse:
-    company_repository = CompanyRepositoryImpl(db)
-    company_use_cases = CompanyUseCases(company_repository)
+) -> Response:
+    cache = get_payload_cache()
+    if request.headers.get("If-None-Match") or cache.enabled("company"):
+        # Só o updated_at da empresa, sem consultar os CEPs
+        updated_at = await company_use_cases.get_company_updated_at(company_id)
+        if updated_at is None:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail="Company not found",
+            )
+        etag = make_etag("company", company_id, updated_at)
+        if etag_matches(request, etag):
+            return not_modified(etag)
+        payload = cache.get("company", company_id, updated_at, response_media_type())
+        if payload is not None:
+            return payload_response(payload, headers=etag_headers(etag))
 
     company = await company_use_cases.get_company_by_id(company_id)
     if not company:
@@ -81,26 +89,18 @@ async def get_company(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Company not found",
         )
-    return CompanyResponse(
-        id=company.id,
-        name=company.name,
-        description=company.description,
-        zip_codes=company.zip_codes,
-        created_at=company.created_at,
-        updated_at=company.updated_at,
-    )
+    payload = company_serializer.dumps(company)
+    cache.put("company", company.id, company.updated_at, payload, response_media_type())
+    return payload_response(payload, headers=etag_headers(make_etag("company", company.id, company.updated_at)))
 
 
 @router.put("/{company_id}", response_model=CompanyResponse)
 async def update_company(
     company_id: UUID,
     company_update: CompanyUpdate,
-    db: AsyncSession = Depends(get_db),
+    company_use_cases: CompanyUseCases = Depends(get_company_use_cases),
     current_user: User = Depends(get_current_admin_user),
-) -> CompanyResponse:
-    company_repository = CompanyRepositoryImpl(db)
-    company_use_cases = CompanyUseCases(company_repository)
-
+) -> Response:
     company = await company_use_cases.get_company_by_id(company_id)
     if not company:
         raise HTTPException(
@@ -117,14 +117,7 @@ async def update_company(
 
     try:
         updated_company = await company_use_cases.update_company(company)
-        return CompanyResponse(
-            id=updated_company.id,
-            name=updated_company.name,
-            description=updated_company.description,
-            zip_codes=updated_company.zip_codes,
-            created_at=updated_company.created_at,
-            updated_at=updated_company.updated_at,
-        )
+        return company_serializer.response(updated_company)
     except ValueError as e:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
@@ -135,12 +128,9 @@ async def update_company(
 @router.delete("/{company_id}", status_code=status.HTTP_204_NO_CONTENT)
 async def delete_company(
     company_id: UUID,
-    db: AsyncSession = Depends(get_db),
+    company_use_cases: CompanyUseCases = Depends(get_company_use_cases),
     current_user: User = Depends(get_current_admin_user),
 ) -> None:
-    company_repository = CompanyRepositoryImpl(db)
-    company_use_cases = CompanyUseCases(company_repository)
-
     deleted = await company_use_cases.delete_company(company_id)
     if not deleted:
         raise HTTPException(
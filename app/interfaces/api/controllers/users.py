@@ -1,17 +1,35 @@
-from typing import List
+import csv
+import io
+import json
+from typing import Any, Dict, List
 from uuid import UUID
 
-from fastapi import APIRouter, Depends, HTTPException, status
-from sqlalchemy.ext.asyncio import AsyncSession
+from fastapi import APIRouter, Depends, HTTPException, Request, Response, status
+from pydantic import ValidationError
 
-from app.application.services.auth_service import AuthService
+from app.application.use_cases.token_revocation_use_cases import TokenRevocationUseCases
 from app.application.use_cases.user_use_cases import UserUseCases
 from app.domain.entities.user import User, UserRole, ProfileType
 from app.infrastructure.auth.jwt import get_current_admin_user, get_current_user
+from app.infrastructure.auth.revocation import get_revocation_registry
 from app.infrastructure.config import get_settings
-from app.infrastructure.database.database import get_db
-from app.infrastructure.repositories.user_repository_impl import UserRepositoryImpl
-from app.interfaces.api.schemas.user import UserCreate, UserResponse, UserUpdate
+from app.infrastructure.repositories.refresh_token_repository_impl import RefreshTokenRepositoryImpl
+from app.infrastructure.utils.bounded_executor import ExecutorQueueFullError
+from app.interfaces.api.dependencies import (
+    get_refresh_token_repository,
+    get_token_revocation_use_cases,
+    get_user_use_cases,
+)
+from app.interfaces.api.errors import server_busy
+from app.interfaces.api.etag import etag_headers, etag_matches, make_etag, not_modified
+from app.interfaces.api.schemas.user import (
+    UserCreate,
+    UserImportError,
+    UserImportResponse,
+    UserResponse,
+    UserUpdate,
+)
+from app.interfaces.api.serialization import user_serializer
 
 router = APIRouter()
 settings = get_settings()
@@ -20,17 +38,9 @@ settings = get_settings()
 @router.post("/", response_model=UserResponse, status_code=status.HTTP_201_CREATED)
 async def create_user(
     user_create: UserCreate,
-    db: AsyncSession = Depends(get_db),
+    user_use_cases: UserUseCases = Depends(get_user_use_cases),
     current_user: User = Depends(get_current_admin_user),
-) -> UserResponse:
-    auth_service = AuthService(
-        secret_key=settings.secret_key,
-        algorithm=settings.algorithm,
-        access_token_expire_minutes=settings.access_token_expire_minutes,
-    )
-    user_repository = UserRepositoryImpl(db)
-    user_use_cases = UserUseCases(user_repository, auth_service)
-
+) -> Response:
     try:
         user = await user_use_cases.create_user(
             username=user_create.username,
@@ -39,115 +49,174 @@ async def create_user(
             role=user_create.role,
             company_id=user_create.company_id,
         )
-        return UserResponse(
-            id=user.id,
-            username=user.username,
-            email=user.email,
-            role=user.role,
-            created_at=user.created_at,
-            updated_at=user.updated_at,
-            company_id=user.company_id,
-            profile_type=user.profile_type,
-        )
+        return user_serializer.response(user, status_code=status.HTTP_201_CREATED)
     except ValueError as e:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail=str(e),
         )
+    except ExecutorQueueFullError:
+        raise server_busy()
 
 
-@router.get("/", response_model=List[UserResponse])
-async def get_users(
-    db: AsyncSession = Depends(get_db),
+async def _read_import_rows(request: Request) -> List[Any]:
+    """Lê as linhas da importação a partir de um CSV ou de uma lista JSON."""
+    body = await request.body()
+    content_type = request.headers.get("Content-Type", "")
+
+    if content_type.startswith("text/csv"):
+        try:
+            reader = csv.DictReader(io.StringIO(body.decode("utf-8-sig")))
+            # Colunas vazias (ex.: company_id) são tratadas como ausentes
+            return [
+                {key.strip(): value.strip() for key, value in row.items() if key and value and value.strip()}
+                for row in reader
+            ]
+        except (UnicodeDecodeError, csv.Error) as e:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail=f"Invalid CSV: {e}",
+            )
+
+    try:
+        data = json.loads(body)
+    except ValueError:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Invalid JSON",
+        )
+    if isinstance(data, dict):
+        data = data.get("users")
+    if not isinstance(data, list):
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Expected a list of users",
+        )
+    return data
+
+
+@router.post(
+    "/import",
+    response_model=UserImportResponse,
+    openapi_extra={
+        "requestBody": {
+            "required": True,
+            "content": {
+                "application/json": {
+                    "schema": {"type": "array", "items": {"$ref": "#/components/schemas/UserCreate"}}
+                },
+                "text/csv": {
+                    "schema": {"type": "string", "description": "username,email,password,role,company_id"}
+                },
+            },
+        }
+    },
+)
+async def import_users(
+    request: Request,
+    user_use_cases: UserUseCases = Depends(get_user_use_cases),
     current_user: User = Depends(get_current_admin_user),
-) -> List[UserResponse]:
-    auth_service = AuthService(
-        secret_key=settings.secret_key,
-        algorithm=settings.algorithm,
-        access_token_expire_minutes=settings.access_token_expire_minutes,
+) -> UserImportResponse:
+    rows = await _read_import_rows(request)
+    if len(rows) > settings.user_import_max_rows:
+        raise HTTPException(
+            status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
+            detail=f"Import limited to {settings.user_import_max_rows} users",
+        )
+
+    errors: List[UserImportError] = []
+    valid_rows: List[Dict[str, Any]] = []
+    row_numbers: List[int] = []
+    for row_number, row in enumerate(rows, start=1):
+        try:
+            user_create = UserCreate.model_validate(row)
+        except ValidationError as e:
+            errors.append(UserImportError(
+                row=row_number,
+                email=row.get("email") if isinstance(row, dict) else None,
+                error="; ".join(
+                    f"{'.'.join(str(loc) for loc in error['loc'])}: {error['msg']}" for error in e.errors()
+                ),
+            ))
+            continue
+        valid_rows.append(user_create.model_dump())
+        row_numbers.append(row_number)
+
+    try:
+        created, failures = await user_use_cases.import_users(
+            valid_rows, chunk_size=settings.user_import_chunk_size
+        )
+    except ExecutorQueueFullError:
+        raise server_busy()
+    errors.extend(
+        UserImportError(row=row_numbers[index], email=valid_rows[index]["email"], error=error)
+        for index, error in failures
+    )
+    errors.sort(key=lambda error: error.row)
+
+    return UserImportResponse(
+        created=[
+            UserResponse(
+                id=user.id,
+                username=user.username,
+                email=user.email,
+                role=user.role,
+                created_at=user.created_at,
+                updated_at=user.updated_at,
+                company_id=user.company_id,
+                profile_type=user.profile_type,
+            )
+            for user in created
+        ],
+        errors=errors,
     )
-    user_repository = UserRepositoryImpl(db)
-    user_use_cases = UserUseCases(user_repository, auth_service)
 
+
+@router.get("/", response_model=List[UserResponse])
+async def get_users(
+    user_use_cases: UserUseCases = Depends(get_user_use_cases),
+    current_user: User = Depends(get_current_admin_user),
+) -> Response:
     users = await user_use_cases.get_all_users()
-    return [
-        UserResponse(
-            id=user.id,
-            username=user.username,
-            email=user.email,
-            role=user.role,
-            created_at=user.created_at,
-            updated_at=user.updated_at,
-            company_id=user.company_id,
-            profile_type=user.profile_type,
-        )
-        for user in users
-    ]
+    return user_serializer.list_response(users)
 
 
 @router.get("/me", response_model=UserResponse)
 async def get_current_user_info(
+    request: Request,
     current_user: User = Depends(get_current_user),
-) -> UserResponse:
-    return UserResponse(
-        id=current_user.id,
-        username=current_user.username,
-        email=current_user.email,
-        role=current_user.role,
-        created_at=current_user.created_at,
-        updated_at=current_user.updated_at,
-        company_id=current_user.company_id,
-        profile_type=current_user.profile_type,
-    )
+) -> Response:
+    # O usuário já foi carregado pela autenticação: a revalidação não consulta o banco
+    etag = make_etag("user", current_user.id, current_user.updated_at)
+    if etag_matches(request, etag):
+        return not_modified(etag)
+    return user_serializer.response(current_user, headers=etag_headers(etag))
 
 
 @router.get("/{user_id}", response_model=UserResponse)
 async def get_user(
     user_id: UUID,
-    db: AsyncSession = Depends(get_db),
+    user_use_cases: UserUseCases = Depends(get_user_use_cases),
     current_user: User = Depends(get_current_admin_user),
-) -> UserResponse:
-    auth_service = AuthService(
-        secret_key=settings.secret_key,
-        algorithm=settings.algorithm,
-        access_token_expire_minutes=settings.access_token_expire_minutes,
-    )
-    user_repository = UserRepositoryImpl(db)
-    user_use_cases = UserUseCases(user_repository, auth_service)
-
+) -> Response:
     user = await user_use_cases.get_user_by_id(user_id)
     if not user:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="User not found",
         )
-    return UserResponse(
-        id=user.id,
-        username=user.username,
-        email=user.email,
-        role=user.role,
-        created_at=user.created_at,
-        updated_at=user.updated_at,
-        company_id=user.company_id,
-        profile_type=user.profile_type,
-    )
+    return user_serializer.response(user)
 
 
 @router.put("/{user_id}", response_model=UserResponse)
 async def update_user(
     user_id: UUID,
     user_update: UserUpdate,
-    db: AsyncSession = Depends(get_db),
+    user_use_cases: UserUseCases = Depends(get_user_use_cases),
+    token_revocation_use_cases: TokenRevocationUseCases = Depends(get_token_revocation_use_cases),
+    refresh_token_repository: RefreshTokenRepositoryImpl = Depends(get_refresh_token_repository),
     current_user: User = Depends(get_current_admin_user),
-) -> UserResponse:
-    auth_service = AuthService(
-        secret_key=settings.secret_key,
-        algorithm=settings.algorithm,
-        access_token_expire_minutes=settings.access_token_expire_minutes,
-    )
-    user_repository = UserRepositoryImpl(db)
-    user_use_cases = UserUseCases(user_repository, auth_service)
-
+) -> Response:
     user = await user_use_cases.get_user_by_id(user_id)
     if not user:
         raise HTTPException(
@@ -160,39 +229,32 @@ async def update_user(
     if user_update.email is not None:
         user.email = user_update.email
     if user_update.password is not None:
-        user.hashed_password = auth_service.get_password_hash(user_update.password)
+        try:
+            user.hashed_password = await user_use_cases.auth_service.get_password_hash_async(user_update.password)
+        except ExecutorQueueFullError:
+            raise server_busy()
     if user_update.role is not None:
         user.role = user_update.role
     if user_update.company_id is not None:
         user.company_id = user_update.company_id
 
     updated_user = await user_use_cases.update_user(user)
-    return UserResponse(
-        id=updated_user.id,
-        username=updated_user.username,
-        email=updated_user.email,
-        role=updated_user.role,
-        created_at=updated_user.created_at,
-        updated_at=updated_user.updated_at,
-        company_id=updated_user.company_id,
-        profile_type=updated_user.profile_type,
-    )
+
+    # Troca de senha encerra todas as sessões existentes do usuário
+    if user_update.password is not None:
+        revocation = await token_revocation_use_cases.revoke_user_tokens(updated_user.id)
+        get_revocation_registry().apply(revocation)
+        await refresh_token_repository.revoke_all_for_user(updated_user.id)
+
+    return user_serializer.response(updated_user)
 
 
 @router.delete("/{user_id}", status_code=status.HTTP_204_NO_CONTENT)
 async def delete_user(
     user_id: UUID,
-    db: AsyncSession = Depends(get_db),
+    user_use_cases: UserUseCases = Depends(get_user_use_cases),
     current_user: User = Depends(get_current_admin_user),
 ) -> None:
-    auth_service = AuthService(
-        secret_key=settings.secret_key,
-        algorithm=settings.algorithm,
-        access_token_expire_minutes=settings.access_token_expire_minutes,
-    )
-    user_repository = UserRepositoryImpl(db)
-    user_use_cases = UserUseCases(user_repository, auth_service)
-
     deleted = await user_use_cases.delete_user(user_id)
     if not deleted:
         raise HTTPException(
@@ -0,0 +1,150 @@
+"""
+Container de dependências da API.
+
+Objetos com escopo de aplicação (configurações, AuthService, caches) são
+criados uma única vez por processo. Repositórios e casos de uso têm escopo de
+requisição: dependem da sessão do banco e são resolvidos pelo FastAPI, que
+reutiliza a mesma instância dentro de uma requisição.
+
+Os provedores usados com `Depends` são `async def`: o FastAPI executa
+dependências síncronas no threadpool, o que custaria um salto de thread por
+provedor em cada requisição. Os getters com `lru_cache` continuam síncronos
+para uso fora das rotas e são expostos às rotas por `provide_*`.
+"""
+from functools import lru_cache
+from typing import Any, Dict, Optional
+
+from fastapi import Depends
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.application.services.auth_service import AuthService
+from app.application.use_cases.collection_use_cases import CollectionUseCases
+from app.application.use_cases.company_use_cases import CompanyUseCases
+from app.application.use_cases.refresh_token_use_cases import RefreshTokenUseCases
+from app.application.use_cases.token_revocation_use_cases import TokenRevocationUseCases
+from app.application.use_cases.user_use_cases import UserUseCases
+from app.infrastructure.auth.revocation import get_revocation_registry
+from app.infrastructure.auth.token_verifier import get_token_verifier
+from app.infrastructure.config import get_settings
+from app.infrastructure.database.concurrency import AdaptiveConcurrencyLimiter, get_db_limiters
+from app.infrastructure.database.database import engines, get_db
+from app.infrastructure.database.pool import pool_stats
+from app.infrastructure.rate_limit.backend import RateLimitBackend
+from app.infrastructure.rate_limit.memory import MemoryRateLimitBackend
+from app.infrastructure.rate_limit.sqlite import SQLiteRateLimitBackend
+from app.infrastructure.repositories.collection_repository_impl import CollectionRepositoryImpl
+from app.infrastructure.repositories.company_repository_impl import CompanyRepositoryImpl
+from app.infrastructure.repositories.refresh_token_repository_impl import RefreshTokenRepositoryImpl
+from app.infrastructure.repositories.token_revocation_repository_impl import TokenRevocationRepositoryImpl
+from app.infrastructure.repositories.user_repository_impl import UserRepositoryImpl
+from app.infrastructure.utils.bounded_executor import get_password_hash_executor
+from app.infrastructure.utils.security_audit_store import SQLiteSecurityAuditStore, get_security_audit_store
+
+
+# Escopo de aplicação
+
+@lru_cache()
+def get_auth_service() -> AuthService:
+    """AuthService compartilhado (o CryptContext do passlib é criado uma vez)."""
+    settings = get_settings()
+    return AuthService(
+        secret_key=settings.secret_key,
+        algorithm=settings.algorithm,
+        access_token_expire_minutes=settings.access_token_expire_minutes,
+        refresh_token_expire_days=settings.refresh_token_expire_days,
+        hash_executor=get_password_hash_executor(),
+    )
+
+
+@lru_cache()
+def get_rate_limit_backend() -> RateLimitBackend:
+    """Backend dos contadores do rate limiter, conforme RATE_LIMIT_BACKEND."""
+    settings = get_settings()
+    if settings.rate_limit_backend == "sqlite":
+        return SQLiteRateLimitBackend(settings.rate_limit_sqlite_path)
+    return MemoryRateLimitBackend(max_clients=settings.rate_limit_max_clients)
+
+
+def init_app_services() -> None:
+    """Cria os objetos de escopo de aplicação antes da primeira requisição."""
+    get_settings()
+    get_auth_service()
+    get_token_verifier()
+    get_revocation_registry()
+
+
+# Escopo de aplicação, como dependências das rotas
+
+async def provide_auth_service() -> AuthService:
+    return get_auth_service()
+
+
+async def provide_security_audit_store() -> Optional[SQLiteSecurityAuditStore]:
+    return get_security_audit_store()
+
+
+async def provide_db_limiters() -> Dict[str, AdaptiveConcurrencyLimiter]:
+    return get_db_limiters()
+
+
+async def provide_db_pool_stats() -> Dict[str, Dict[str, Any]]:
+    return {name: pool_stats(engine.pool) for name, engine in engines.items()}
+
+
+# Escopo de requisição: repositórios
+
+async def get_user_repository(db: AsyncSession = Depends(get_db)) -> UserRepositoryImpl:
+    return UserRepositoryImpl(db)
+
+
+async def get_company_repository(db: AsyncSession = Depends(get_db)) -> CompanyRepositoryImpl:
+    return CompanyRepositoryImpl(db)
+
+
+async def get_collection_repository(db: AsyncSession = Depends(get_db)) -> CollectionRepositoryImpl:
+    return CollectionRepositoryImpl(db)
+
+
+async def get_refresh_token_repository(db: AsyncSession = Depends(get_db)) -> RefreshTokenRepositoryImpl:
+    return RefreshTokenRepositoryImpl(db)
+
+
+async def get_token_revocation_repository(db: AsyncSession = Depends(get_db)) -> TokenRevocationRepositoryImpl:
+    return TokenRevocationRepositoryImpl(db)
+
+
+# Escopo de requisição: casos de uso
+
+async def get_user_use_cases(
+    user_repository: UserRepositoryImpl = Depends(get_user_repository),
+    auth_service: AuthService = Depends(provide_auth_service),
+) -> UserUseCases:
+    return UserUseCases(user_repository, auth_service)
+
+
+async def get_company_use_cases(
+    company_repository: CompanyRepositoryImpl = Depends(get_company_repository),
+) -> CompanyUseCases:
+    return CompanyUseCases(company_repository)
+
+
+async def get_collection_use_cases(
+    collection_repository: CollectionRepositoryImpl = Depends(get_collection_repository),
+    company_repository: CompanyRepositoryImpl = Depends(get_company_repository),
+    user_repository: UserRepositoryImpl = Depends(get_user_repository),
+) -> CollectionUseCases:
+    return CollectionUseCases(collection_repository, company_repository, user_repository)
+
+
+async def get_refresh_token_use_cases(
+    refresh_token_repository: RefreshTokenRepositoryImpl = Depends(get_refresh_token_repository),
+    auth_service: AuthService = Depends(provide_auth_service),
+) -> RefreshTokenUseCases:
+    return RefreshTokenUseCases(refresh_token_repository, auth_service)
+
+
+async def get_token_revocation_use_cases(
+    token_revocation_repository: TokenRevocationRepositoryImpl = Depends(get_token_revocation_repository),
+    auth_service: AuthService = Depends(provide_auth_service),
+) -> TokenRevocationUseCases:
+    return TokenRevocationUseCases(token_revocation_repository, auth_service)
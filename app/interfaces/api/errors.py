@@ -0,0 +1,26 @@
+from fastapi import HTTPException, Request, status
+from fastapi.responses import JSONResponse
+
+from app.infrastructure.database.concurrency import DatabaseBusyError
+
+# Mesma resposta para toda saturação temporária: fila de hashing cheia, controle de admissão
+# ou limiter do banco
+SERVER_BUSY_DETAIL = "Server busy, try again shortly"
+
+
+def server_busy(retry_after: int = 1) -> HTTPException:
+    """503 com `Retry-After` para quando o servidor está temporariamente saturado."""
+    return HTTPException(
+        status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+        detail=SERVER_BUSY_DETAIL,
+        headers={"Retry-After": str(retry_after)},
+    )
+
+
+async def database_busy_handler(request: Request, exc: DatabaseBusyError) -> JSONResponse:
+    """Sem vaga no limiter do banco (em qualquer comando da requisição): 503 com `Retry-After`."""
+    return JSONResponse(
+        {"detail": SERVER_BUSY_DETAIL},
+        status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+        headers={"Retry-After": "1"},
+    )
@@ -0,0 +1,52 @@
+import hashlib
+from datetime import datetime
+from typing import Any, Dict, Optional
+
+from fastapi import Request, Response, status
+
+# Respostas dependem do usuário autenticado: apenas caches privados, sempre revalidando
+CACHE_CONTROL = "private, no-cache"
+
+
+def make_etag(*parts: Any) -> str:
+    """
+    Gera um ETag fraco a partir das partes que identificam a versão do recurso.
+
+    Para um recurso, as partes são o tipo, o `id` e o `updated_at`; para uma
+    listagem, o escopo (tipo e filtro), a quantidade de itens e o maior
+    `updated_at`. Datas entram com microssegundos.
+    """
+    raw = "|".join(part.isoformat() if isinstance(part, datetime) else str(part) for part in parts)
+    return f'W/"{hashlib.sha1(raw.encode("utf-8")).hexdigest()[:20]}"'
+
+
+def list_etag(scope: str, count: int, last_updated_at: Optional[datetime]) -> str:
+    """ETag de uma listagem: muda com inclusões e exclusões (quantidade) e com alterações (maior updated_at)."""
+    return make_etag(scope, count, last_updated_at or "")
+
+
+def etag_matches(request: Request, etag: str) -> bool:
+    """Compara o If-None-Match da requisição com o ETag (comparação fraca, RFC 9110)."""
+    header = request.headers.get("If-None-Match")
+    if not header:
+        return False
+    if header.strip() == "*":
+        return True
+    opaque = etag[2:] if etag.startswith("W/") else etag
+    for candidate in header.split(","):
+        candidate = candidate.strip()
+        if candidate.startswith("W/"):
+            candidate = candidate[2:]
+        if candidate == opaque:
+            return True
+    return False
+
+
+def etag_headers(etag: str) -> Dict[str, str]:
+    """Cabeçalhos de cache comuns à resposta 200 e à 304."""
+    return {"ETag": etag, "Cache-Control": CACHE_CONTROL, "Vary": "Authorization"}
+
+
+def not_modified(etag: str) -> Response:
+    """Resposta 304 sem corpo."""
+    return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=etag_headers(etag))
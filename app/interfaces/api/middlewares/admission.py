@@ -0,0 +1,170 @@
+import asyncio
+import math
+from collections import deque
+from typing import Any, Deque, Dict, List, Optional
+
+from fastapi import Request
+from starlette.responses import JSONResponse
+from starlette.types import ASGIApp, Receive, Scope, Send
+
+from app.infrastructure.auth.token_verifier import get_request_claims
+from app.interfaces.api.errors import SERVER_BUSY_DETAIL
+
+
+class _PriorityClass:
+    """Vagas e fila de espera de uma classe de prioridade."""
+
+    def __init__(self, name: str, limit: int, queue_size: int, timeout: float):
+        self.name = name
+        self.limit = limit
+        self.queue_size = queue_size
+        self.timeout = timeout
+        self.in_flight = 0
+        self.waiters: Deque[asyncio.Future] = deque()
+        self.admitted = 0
+        self.rejected = 0
+        self.timed_out = 0
+
+    async def acquire(self) -> bool:
+        """Ocupa uma vaga; espera na fila até `timeout` segundos. Retorna False se recusada."""
+        if self.in_flight < self.limit and not self.waiters:
+            self.in_flight += 1
+            self.admitted += 1
+            return True
+        if len(self.waiters) >= self.queue_size:
+            self.rejected += 1
+            return False
+
+        waiter = asyncio.get_running_loop().create_future()
+        self.waiters.append(waiter)
+        try:
+            await asyncio.wait({waiter}, timeout=self.timeout)
+        except BaseException:
+            # Cliente desconectou enquanto esperava: devolver a vaga se ela já foi passada
+            if waiter.done() and not waiter.cancelled():
+                self.release()
+            else:
+                waiter.cancel()
+                self._discard(waiter)
+            raise
+        if waiter.done():
+            # A vaga foi transferida por release(); in_flight já a conta
+            self.admitted += 1
+            return True
+        waiter.cancel()
+        self._discard(waiter)
+        self.timed_out += 1
+        return False
+
+    def release(self) -> None:
+        # A vaga passa direto para o primeiro da fila, sem disputa com quem acaba de chegar
+        while self.waiters:
+            waiter = self.waiters.popleft()
+            if not waiter.done():
+                waiter.set_result(None)
+                return
+        self.in_flight -= 1
+
+    def _discard(self, waiter: asyncio.Future) -> None:
+        try:
+            self.waiters.remove(waiter)
+        except ValueError:
+            pass
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "limit": self.limit,
+            "in_flight": self.in_flight,
+            "queued": len(self.waiters),
+            "queue_size": self.queue_size,
+            "admitted": self.admitted,
+            "rejected": self.rejected,
+            "timed_out": self.timed_out,
+        }
+
+
+class AdmissionControlMiddleware:
+    """
+    Middleware ASGI de controle de admissão por classe de prioridade.
+
+    Cada requisição da API é atribuída a uma classe e só chega às rotas com
+    uma vaga livre da sua classe:
+    - auth: login, renovação e logout
+    - collector: requisições de coletores (ações em campo)
+    - resident: usuários regulares e anônimos
+    - admin: administradores (listagens completas e relatórios)
+
+    Cada classe tem seu limite de requisições simultâneas e uma fila de espera
+    limitada, com prazo; com a fila cheia ou o prazo vencido, a requisição é
+    recusada na hora com 503 e `Retry-After`. Assim, relatórios de
+    administradores saturam apenas a própria classe, e a latência das ações
+    de coletores e do login fica limitada pelo prazo da fila da classe.
+    Classes sem limite configurado não são controladas.
+    """
+
+    CLASSES = ("auth", "collector", "resident", "admin")
+
+    def __init__(
+        self,
+        app: ASGIApp,
+        limits: Dict[str, int],
+        queue_sizes: Optional[Dict[str, int]] = None,
+        queue_timeouts_ms: Optional[Dict[str, int]] = None,
+        auth_paths: Optional[List[str]] = None,
+        path_prefix: str = "/api",
+        retry_after: int = 1,
+    ):
+        self.app = app
+        self.path_prefix = path_prefix
+        self.retry_after = retry_after
+        self._auth_suffixes = tuple(auth_paths or ["/token", "/refresh", "/logout"])
+        queue_sizes = queue_sizes or {}
+        queue_timeouts_ms = queue_timeouts_ms or {}
+        self.classes: Dict[str, _PriorityClass] = {
+            name: _PriorityClass(
+                name,
+                limit=limits[name],
+                queue_size=queue_sizes.get(name, 0),
+                timeout=queue_timeouts_ms.get(name, 0) / 1000,
+            )
+            for name in self.CLASSES
+            if limits.get(name, 0) > 0
+        }
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http" or not scope["path"].startswith(self.path_prefix):
+            await self.app(scope, receive, send)
+            return
+
+        priority_class = self.classes.get(self.classify(Request(scope)))
+        if priority_class is None:
+            await self.app(scope, receive, send)
+            return
+
+        if not await priority_class.acquire():
+            retry_after = max(self.retry_after, math.ceil(priority_class.timeout))
+            response = JSONResponse(
+                {"detail": SERVER_BUSY_DETAIL},
+                status_code=503,
+                headers={"Retry-After": str(retry_after)},
+            )
+            await response(scope, receive, send)
+            return
+        try:
+            await self.app(scope, receive, send)
+        finally:
+            priority_class.release()
+
+    def classify(self, request: Request) -> str:
+        if request.url.path.endswith(self._auth_suffixes):
+            return "auth"
+        claims = get_request_claims(request)
+        role = claims.get("role") if claims else None
+        if role == "admin":
+            return "admin"
+        if role == "collector":
+            return "collector"
+        return "resident"
+
+    def stats(self) -> Dict[str, Dict[str, Any]]:
+        return {name: priority_class.stats() for name, priority_class in self.classes.items()}
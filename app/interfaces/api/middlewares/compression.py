@@ -0,0 +1,224 @@
+import gzip
+import zlib
+from typing import Any, Dict, Optional
+
+import anyio
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+# Codificações opcionais: usadas apenas se o pacote estiver instalado
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
+try:
+    import zstandard
+except ImportError:
+    zstandard = None
+
+
+class _StreamCompressor:
+    """Compressor incremental; cada `compress` devolve dados já decodificáveis pelo cliente."""
+
+    def __init__(self, encoding: str, gzip_level: int, brotli_quality: int, zstd_level: int):
+        self.encoding = encoding
+        if encoding == "zstd":
+            self._compressor = zstandard.ZstdCompressor(level=zstd_level).compressobj()
+        elif encoding == "br":
+            self._compressor = brotli.Compressor(quality=brotli_quality)
+        else:
+            # wbits=31: formato gzip (cabeçalho e CRC)
+            self._compressor = zlib.compressobj(gzip_level, zlib.DEFLATED, 31)
+
+    def compress(self, data: bytes) -> bytes:
+        # Flush a cada pedaço para que respostas em streaming cheguem sem atraso
+        if self.encoding == "zstd":
+            return self._compressor.compress(data) + self._compressor.flush(zstandard.COMPRESSOBJ_FLUSH_BLOCK)
+        if self.encoding == "br":
+            return self._compressor.process(data) + self._compressor.flush()
+        return self._compressor.compress(data) + self._compressor.flush(zlib.Z_SYNC_FLUSH)
+
+    def finish(self) -> bytes:
+        if self.encoding == "br":
+            return self._compressor.finish()
+        return self._compressor.flush()
+
+
+class CompressionMiddleware:
+    """
+    Middleware ASGI de compressão das respostas.
+
+    A codificação é escolhida pelo Accept-Encoding do cliente, na ordem de
+    preferência zstd, br e gzip; zstd e br só quando os pacotes `zstandard` e
+    `brotli` estão instalados (gzip está sempre disponível).
+
+    - Respostas menores que `minimum_size`, já codificadas, de tipos já
+      comprimidos (imagens, áudio, vídeo, zip) ou de requisições HEAD seguem
+      sem alteração.
+    - Respostas de corpo único são comprimidas de uma vez; a partir de
+      `thread_threshold` bytes, a compressão roda em uma thread para não
+      bloquear o event loop.
+    - Respostas em streaming são comprimidas pedaço a pedaço, com flush a
+      cada pedaço, sem acumular o corpo.
+    """
+
+    ENCODINGS = ("zstd", "br", "gzip")
+    SKIP_CONTENT_TYPES = (
+        "image/", "audio/", "video/", "application/zip", "application/gzip",
+        "application/x-gzip", "application/zstd", "application/octet-stream",
+    )
+
+    def __init__(
+        self,
+        app: ASGIApp,
+        minimum_size: int = 1024,
+        thread_threshold: int = 256 * 1024,
+        gzip_level: int = 6,
+        brotli_quality: int = 4,
+        zstd_level: int = 3,
+    ):
+        self.app = app
+        self.minimum_size = minimum_size
+        self.thread_threshold = thread_threshold
+        self.gzip_level = gzip_level
+        self.brotli_quality = brotli_quality
+        self.zstd_level = zstd_level
+        self.available_encodings = tuple(
+            encoding for encoding in self.ENCODINGS
+            if encoding == "gzip"
+            or (encoding == "br" and brotli is not None)
+            or (encoding == "zstd" and zstandard is not None)
+        )
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http" or scope["method"] == "HEAD":
+            await self.app(scope, receive, send)
+            return
+
+        encoding = self.select_encoding(Headers(scope=scope).get("Accept-Encoding", ""))
+        if encoding is None:
+            await self.app(scope, receive, send)
+            return
+
+        responder = _CompressionResponder(self, encoding, send)
+        await self.app(scope, receive, responder.send)
+
+    def select_encoding(self, accept_encoding: str) -> Optional[str]:
+        """Escolhe a codificação aceita pelo cliente (q > 0) de maior preferência."""
+        accepted: Dict[str, float] = {}
+        for item in accept_encoding.lower().split(","):
+            name, _, params = item.strip().partition(";")
+            quality = 1.0
+            params = params.strip()
+            if params.startswith("q="):
+                try:
+                    quality = float(params[2:])
+                except ValueError:
+                    quality = 0.0
+            if name:
+                accepted[name.strip()] = quality
+        wildcard = accepted.get("*", 0.0)
+        for encoding in self.available_encodings:
+            if accepted.get(encoding, wildcard) > 0:
+                return encoding
+        return None
+
+    def new_compressor(self, encoding: str) -> _StreamCompressor:
+        return _StreamCompressor(encoding, self.gzip_level, self.brotli_quality, self.zstd_level)
+
+    def compress(self, encoding: str, body: bytes) -> bytes:
+        """Comprime um corpo completo."""
+        if encoding == "zstd":
+            return zstandard.ZstdCompressor(level=self.zstd_level).compress(body)
+        if encoding == "br":
+            return brotli.compress(body, quality=self.brotli_quality)
+        return gzip.compress(body, compresslevel=self.gzip_level, mtime=0)
+
+
+class _CompressionResponder:
+    """Intercepta as mensagens de uma resposta e decide se e como comprimi-la."""
+
+    def __init__(self, middleware: CompressionMiddleware, encoding: str, send: Send):
+        self.middleware = middleware
+        self.encoding = encoding
+        self._send = send
+        self._start_message: Optional[Message] = None
+        # None: ainda não decidido; False: repassar sem compressão
+        self._compressor: Any = None
+
+    async def send(self, message: Message) -> None:
+        message_type = message["type"]
+        if message_type == "http.response.start":
+            self._start_message = message
+            return
+        if message_type != "http.response.body" or self._start_message is None:
+            await self._send(message)
+            return
+
+        if self._compressor is None:
+            await self._first_body(message)
+        elif self._compressor is False:
+            await self._send(message)
+        else:
+            await self._stream_body(message)
+
+    async def _first_body(self, message: Message) -> None:
+        start_message = self._start_message
+        headers = MutableHeaders(raw=start_message["headers"])
+        body = message.get("body", b"")
+        more_body = message.get("more_body", False)
+
+        if not self._compressible(start_message["status"], headers) or (
+            not more_body and len(body) < self.middleware.minimum_size
+        ):
+            self._compressor = False
+            await self._send(start_message)
+            await self._send(message)
+            return
+
+        self._set_encoding_headers(headers)
+        if not more_body:
+            # Corpo único: comprimir de uma vez, em uma thread se for grande
+            self._compressor = False
+            if len(body) >= self.middleware.thread_threshold:
+                compressed = await anyio.to_thread.run_sync(self.middleware.compress, self.encoding, body)
+            else:
+                compressed = self.middleware.compress(self.encoding, body)
+            headers["Content-Length"] = str(len(compressed))
+            await self._send(start_message)
+            await self._send({"type": "http.response.body", "body": compressed})
+            return
+
+        # Streaming: tamanho final desconhecido
+        del headers["Content-Length"]
+        self._compressor = self.middleware.new_compressor(self.encoding)
+        await self._send(start_message)
+        await self._stream_body(message)
+
+    async def _stream_body(self, message: Message) -> None:
+        body = message.get("body", b"")
+        more_body = message.get("more_body", False)
+        if len(body) >= self.middleware.thread_threshold:
+            data = await anyio.to_thread.run_sync(self._compressor.compress, body)
+        else:
+            data = self._compressor.compress(body) if body else b""
+        if not more_body:
+            data += self._compressor.finish()
+        await self._send({"type": "http.response.body", "body": data, "more_body": more_body})
+
+    def _compressible(self, status_code: int, headers: MutableHeaders) -> bool:
+        if status_code < 200 or status_code in (204, 206, 304):
+            return False
+        if "content-encoding" in headers:
+            return False
+        content_type = headers.get("content-type", "").lower()
+        return not content_type.startswith(self.middleware.SKIP_CONTENT_TYPES)
+
+    def _set_encoding_headers(self, headers: MutableHeaders) -> None:
+        headers["Content-Encoding"] = self.encoding
+        headers.add_vary_header("Accept-Encoding")
+        # O corpo muda com a codificação: um ETag forte deixa de valer byte a byte
+        etag = headers.get("etag")
+        if etag and not etag.startswith("W/"):
+            headers["ETag"] = f"W/{etag}"
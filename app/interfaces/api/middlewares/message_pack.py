@@ -0,0 +1,226 @@
+import base64
+from typing import Any, Dict, List, Optional
+
+import msgpack
+import orjson
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from app.interfaces.api.serialization import MSGPACK_MEDIA_TYPE, data_url_to_bytes, negotiated_media_type
+
+MSGPACK_MEDIA_TYPES = ("application/msgpack", "application/x-msgpack", "application/vnd.msgpack")
+
+# Campos com imagens: binário em MessagePack, data URL base64 em JSON
+IMAGE_FIELDS = frozenset({"images"})
+
+# Assinaturas dos formatos aceitos pelo ImageValidator
+_IMAGE_SIGNATURES = (
+    (b"\xff\xd8\xff", "image/jpeg"),
+    (b"\x89PNG\r\n\x1a\n", "image/png"),
+    (b"GIF87a", "image/gif"),
+    (b"GIF89a", "image/gif"),
+)
+
+
+def _image_mime_type(data: bytes) -> str:
+    for signature, mime_type in _IMAGE_SIGNATURES:
+        if data.startswith(signature):
+            return mime_type
+    # Rejeitado pelo ImageValidator com a mensagem de tipo não permitido
+    return "application/octet-stream"
+
+
+def to_json_value(value: Any, field: Optional[str] = None) -> Any:
+    """
+    Valor decodificado de MessagePack -> JSON.
+
+    Binários nos campos de imagem viram data URL base64; em outros campos não
+    têm representação em JSON e o corpo é rejeitado.
+    """
+    if isinstance(value, (bytes, bytearray)) and field in IMAGE_FIELDS:
+        data = bytes(value)
+        return f"data:{_image_mime_type(data)};base64,{base64.b64encode(data).decode('ascii')}"
+    if isinstance(value, dict):
+        return {key: to_json_value(item, key) for key, item in value.items()}
+    if isinstance(value, list):
+        return [to_json_value(item, field) for item in value]
+    return value
+
+
+def to_msgpack_value(value: Any, field: Optional[str] = None) -> Any:
+    """Valor JSON -> MessagePack: só as imagens em data URL dos campos de imagem viram binário."""
+    if isinstance(value, str):
+        return data_url_to_bytes(value) if field in IMAGE_FIELDS else value
+    if isinstance(value, dict):
+        return {key: to_msgpack_value(item, key) for key, item in value.items()}
+    if isinstance(value, list):
+        return [to_msgpack_value(item, field) for item in value]
+    return value
+
+
+def _media_type(content_type: str) -> str:
+    return content_type.split(";", 1)[0].strip().lower()
+
+
+class MessagePackMiddleware:
+    """
+    Middleware ASGI de negociação de MessagePack nas rotas da API.
+
+    - Corpo com `Content-Type: application/msgpack` é convertido para JSON
+      antes de chegar às rotas, de modo que os schemas pydantic e as
+      validações continuam os mesmos; binários viram imagens em data URL
+      (o tipo é identificado pela assinatura do arquivo).
+    - Com `Accept: application/msgpack` (preferido a JSON), o formato fica
+      disponível para as rotas (`serialization.response_media_type`), e o
+      EntitySerializer codifica as entidades direto em MessagePack. As demais
+      respostas JSON (erros, modelos pydantic) são convertidas aqui. Nos dois
+      casos a estrutura é a mesma do JSON dos schemas, com as imagens dos
+      campos `images` enviadas como binário em vez de data URL base64.
+
+    Fica dentro do CompressionMiddleware, que comprime a resposta já convertida.
+    """
+
+    def __init__(self, app: ASGIApp, path_prefix: str = "/api"):
+        self.app = app
+        self.path_prefix = path_prefix
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http" or not scope["path"].startswith(self.path_prefix):
+            await self.app(scope, receive, send)
+            return
+
+        headers = Headers(scope=scope)
+        respond_msgpack = self.accepts_msgpack(headers.get("Accept", ""))
+
+        if _media_type(headers.get("Content-Type", "")) in MSGPACK_MEDIA_TYPES:
+            body = await self._read_body(receive)
+            try:
+                json_body = orjson.dumps(to_json_value(msgpack.unpackb(body, raw=False))) if body else b""
+            except (ValueError, TypeError):
+                await self._send_error(send, respond_msgpack)
+                return
+            scope = dict(scope)
+            request_headers = MutableHeaders(raw=list(scope["headers"]))
+            request_headers["Content-Type"] = "application/json"
+            request_headers["Content-Length"] = str(len(json_body))
+            scope["headers"] = request_headers.raw
+            receive = self._replay(json_body, receive)
+
+        if respond_msgpack:
+            responder = _MessagePackResponder(send)
+            with negotiated_media_type(MSGPACK_MEDIA_TYPE):
+                await self.app(scope, receive, responder.send)
+        else:
+            await self.app(scope, receive, send)
+
+    @staticmethod
+    def accepts_msgpack(accept: str) -> bool:
+        """MessagePack é usado se o cliente o aceitar com qualidade maior ou igual à de JSON."""
+        qualities: Dict[str, float] = {}
+        for item in accept.lower().split(","):
+            media_type, _, params = item.strip().partition(";")
+            quality = 1.0
+            for param in params.split(";"):
+                name, _, value = param.strip().partition("=")
+                if name == "q":
+                    try:
+                        quality = float(value)
+                    except ValueError:
+                        quality = 0.0
+            if media_type:
+                qualities[media_type.strip()] = quality
+        msgpack_quality = max((qualities.get(media_type, 0.0) for media_type in MSGPACK_MEDIA_TYPES), default=0.0)
+        json_quality = qualities.get("application/json", qualities.get("application/*", qualities.get("*/*", 0.0)))
+        return msgpack_quality > 0 and msgpack_quality >= json_quality
+
+    @staticmethod
+    async def _read_body(receive: Receive) -> bytes:
+        chunks: List[bytes] = []
+        while True:
+            message = await receive()
+            if message["type"] != "http.request":
+                break
+            chunks.append(message.get("body", b""))
+            if not message.get("more_body", False):
+                break
+        return b"".join(chunks)
+
+    @staticmethod
+    def _replay(body: bytes, receive: Receive) -> Receive:
+        sent = False
+
+        async def replay() -> Message:
+            nonlocal sent
+            if not sent:
+                sent = True
+                return {"type": "http.request", "body": body, "more_body": False}
+            # Depois do corpo, repassar o desconectar do cliente
+            return await receive()
+
+        return replay
+
+    @staticmethod
+    async def _send_error(send: Send, respond_msgpack: bool) -> None:
+        content = {"detail": "Invalid MessagePack body"}
+        if respond_msgpack:
+            body, media_type = msgpack.packb(content, use_bin_type=True), MSGPACK_MEDIA_TYPE
+        else:
+            body, media_type = orjson.dumps(content), "application/json"
+        await send({
+            "type": "http.response.start",
+            "status": 400,
+            "headers": [
+                (b"content-type", media_type.encode("latin-1")),
+                (b"content-length", str(len(body)).encode("latin-1")),
+            ],
+        })
+        await send({"type": "http.response.body", "body": body})
+
+
+class _MessagePackResponder:
+    """
+    Acumula uma resposta JSON e a reenvia convertida para MessagePack.
+
+    Respostas já codificadas em MessagePack pelas rotas passam direto.
+    """
+
+    def __init__(self, send: Send):
+        self._send = send
+        self._start_message: Optional[Message] = None
+        self._chunks: List[bytes] = []
+        # None: ainda não decidido; False: repassar sem conversão
+        self._convert: Optional[bool] = None
+
+    async def send(self, message: Message) -> None:
+        message_type = message["type"]
+        if message_type == "http.response.start":
+            self._start_message = message
+            headers = MutableHeaders(raw=message["headers"])
+            if _media_type(headers.get("content-type", "")) == MSGPACK_MEDIA_TYPE:
+                headers.add_vary_header("Accept")
+            self._convert = (
+                _media_type(headers.get("content-type", "")) == "application/json"
+                and "content-encoding" not in headers
+                and message["status"] not in (204, 304)
+            )
+            if not self._convert:
+                await self._send(message)
+            return
+        if message_type != "http.response.body" or not self._convert:
+            await self._send(message)
+            return
+
+        self._chunks.append(message.get("body", b""))
+        if message.get("more_body", False):
+            return
+
+        body = b"".join(self._chunks)
+        start_message = self._start_message
+        headers = MutableHeaders(raw=start_message["headers"])
+        if body:
+            body = msgpack.packb(to_msgpack_value(orjson.loads(body)), use_bin_type=True)
+        headers["Content-Type"] = MSGPACK_MEDIA_TYPE
+        headers["Content-Length"] = str(len(body))
+        headers.add_vary_header("Accept")
+        await self._send(start_message)
+        await self._send({"type": "http.response.body", "body": body})
@@ -1,15 +1,34 @@
-import time
-from typing import Dict, Tuple, List, Optional, Callable
+import ipaddress
+import math
+from typing import Dict, List, Optional, Callable, Tuple
 from fastapi import Request, Response
-from starlette.middleware.base import BaseHTTPMiddleware
-from starlette.types import ASGIApp
+from starlette.types import ASGIApp, Receive, Scope, Send
 
+from app.infrastructure.auth.token_verifier import get_request_claims
+from app.infrastructure.rate_limit.backend import RateLimitBackend, RateLimitResult
+from app.infrastructure.rate_limit.memory import MemoryRateLimitBackend
 
-class RateLimiter(BaseHTTPMiddleware):
+
+class RateLimiter:
     """
-    Middleware para limitar a taxa de requisições.
-    Implementa um algoritmo de sliding window para controlar o número de requisições.
+    Middleware ASGI para limitar a taxa de requisições.
+    Implementa um algoritmo de sliding window counter. Os contadores ficam no
+    `backend` (em memória por padrão, ou compartilhados entre workers).
+
+    - Requisições autenticadas são contadas por usuário (id do token), com
+      limites por papel; as demais, por IP.
+    - Cada requisição tem um custo: o declarado para a rota em `route_costs`
+      mais um por `body_cost_bytes` de corpo (pelo Content-Length, antes de
+      ler o corpo). Corpos sem Content-Length (chunked) em POST/PUT/PATCH
+      custam ao menos uma unidade de corpo, já que o tamanho só é conhecido
+      depois da leitura. Requisições com custo maior que 1 usam um bucket
+      próprio ("heavy"), para que uploads pesados não consumam a cota das
+      leituras. O custo é limitado ao limite do cliente: uma requisição maior
+      que a cota consome a janela inteira, em vez de ser sempre rejeitada.
+    - Endpoints de autenticação têm um bucket próprio, sempre por IP.
     """
+    BODY_METHODS = ("POST", "PUT", "PATCH")
+
     def __init__(
         self, 
         app: ASGIApp, 
@@ -18,99 +37,131 @@ class RateLimiter(BaseHTTPMiddleware):
         window_size: int = 60,  # tamanho da janela em segundos
         auth_paths: List[str] = None,
         exclude_paths: List[str] = None,
-        get_client_id: Optional[Callable[[Request], str]] = None
+        get_client_id: Optional[Callable[[Request], str]] = None,
+        max_clients: int = 100_000,
+        trusted_proxies: List[str] = None,
+        backend: Optional[RateLimitBackend] = None,
+        heavy_rate_limit_per_minute: int = 30,
+        role_limits: Optional[Dict[str, int]] = None,
+        role_heavy_limits: Optional[Dict[str, int]] = None,
+        route_costs: Optional[Dict[str, int]] = None,
+        body_cost_bytes: int = 256 * 1024,
     ):
-        super().__init__(app)
+        self.app = app
         self.rate_limit_per_minute = rate_limit_per_minute
         self.auth_rate_limit_per_minute = auth_rate_limit_per_minute
+        self.heavy_rate_limit_per_minute = heavy_rate_limit_per_minute
+        self.role_limits = role_limits or {}
+        self.role_heavy_limits = role_heavy_limits or {}
+        # Custo declarado por rota, no formato "MÉTODO /caminho"
+        self.route_costs = route_costs or {}
+        self.body_cost_bytes = body_cost_bytes
         self.window_size = window_size
         self.auth_paths = auth_paths or ["/token", "/refresh"]
         self.exclude_paths = exclude_paths or []
         self.get_client_id = get_client_id or self._default_client_id
-        
-        # Armazena as requisições: {client_id: [(timestamp, path), ...]}
-        self.requests: Dict[str, List[Tuple[float, str]]] = {}
-        
-        # Última limpeza do cache
-        self.last_cleanup = time.time()
+
+        # Tuplas permitem uma única chamada a startswith/endswith por requisição
+        self._auth_suffixes = tuple(self.auth_paths)
+        self._exclude_prefixes = tuple(self.exclude_paths)
+
+        # X-Forwarded-For só é considerado quando a conexão vem de um proxy confiável
+        self.trusted_proxies = [
+            ipaddress.ip_network(proxy.strip(), strict=False) for proxy in (trusted_proxies or [])
+        ]
+
+        # Contadores por cliente; em memória, o número de clientes é limitado (LRU)
+        self.backend = backend or MemoryRateLimitBackend(max_clients=max_clients)
     
-    async def dispatch(self, request: Request, call_next):
-        # Ignorar caminhos excluídos
-        path = request.url.path
-        if any(path.startswith(exclude) for exclude in self.exclude_paths):
-            return await call_next(request)
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
         
-        # Obter ID do cliente (IP ou outro identificador)
-        client_id = self.get_client_id(request)
-        
-        # Limpar cache periodicamente
-        current_time = time.time()
-        if current_time - self.last_cleanup > 60:  # Limpar a cada minuto
-            self._cleanup_old_requests()
-            self.last_cleanup = current_time
+        # Ignorar caminhos excluídos
+        path = scope["path"]
+        if self._exclude_prefixes and path.startswith(self._exclude_prefixes):
+            await self.app(scope, receive, send)
+            return
         
-        # Verificar se é um endpoint de autenticação
-        is_auth_path = any(path.endswith(auth_path) for auth_path in self.auth_paths)
+        request = Request(scope)
+        bucket, key, limit, cost = self._classify(request, path)
         
-        # Verificar limite de taxa
-        if not self._check_rate_limit(client_id, path, is_auth_path):
-            return Response(
+        # Verificar e registrar a requisição
+        result = await self.backend.hit(bucket, key, limit, self.window_size, cost)
+        if not result.allowed:
+            response = Response(
                 content="Muitas requisições. Tente novamente mais tarde.",
-                status_code=429
+                status_code=429,
+                headers=self._rate_limit_headers(result),
             )
+            await response(scope, receive, send)
+            return
         
-        # Registrar a requisição
-        if client_id not in self.requests:
-            self.requests[client_id] = []
-        self.requests[client_id].append((current_time, path))
-        
-        # Processar a requisição
-        return await call_next(request)
+        # Processar a requisição (a resposta segue direto para o servidor, sem cópias)
+        await self.app(scope, receive, send)
     
-    def _check_rate_limit(self, client_id: str, path: str, is_auth_path: bool) -> bool:
-        """Verifica se o cliente excedeu o limite de taxa."""
-        if client_id not in self.requests:
-            return True
+    def _classify(self, request: Request, path: str) -> Tuple[str, str, int, int]:
+        """Retorna (bucket, chave do cliente, limite, custo) da requisição."""
+        # Endpoints de autenticação têm um limite próprio, mais restritivo, por IP
+        if path.endswith(self._auth_suffixes):
+            return "auth", self.get_client_id(request), self.auth_rate_limit_per_minute, 1
         
-        current_time = time.time()
-        window_start = current_time - self.window_size
-        
-        # Filtrar requisições dentro da janela de tempo
-        recent_requests = [
-            req for req in self.requests[client_id] 
-            if req[0] > window_start
-        ]
-        self.requests[client_id] = recent_requests
+        cost = self.route_costs.get(f"{request.method} {path}", 1)
+        content_length = request.headers.get("Content-Length")
+        if content_length and content_length.isdigit():
+            cost += int(content_length) // self.body_cost_bytes
+        elif request.method in self.BODY_METHODS:
+            # Tamanho desconhecido (chunked): nunca no bucket das leituras
+            cost += 1
         
-        # Contar requisições para endpoints de autenticação
-        if is_auth_path:
-            auth_requests = [
-                req for req in recent_requests 
-                if any(req[1].endswith(auth_path) for auth_path in self.auth_paths)
-            ]
-            return len(auth_requests) < self.auth_rate_limit_per_minute
+        # Usuário autenticado: cota própria, independente do IP (ex.: NAT da operadora)
+        claims = get_request_claims(request)
+        if claims and claims.get("sub"):
+            key = f"user:{claims['sub']}"
+            role = claims.get("role")
+        else:
+            key = self.get_client_id(request)
+            role = None
         
-        # Contar todas as requisições
-        return len(recent_requests) < self.rate_limit_per_minute
+        if cost > 1:
+            limit = self.role_heavy_limits.get(role, self.heavy_rate_limit_per_minute)
+            return "heavy", key, limit, min(cost, limit)
+        return "general", key, self.role_limits.get(role, self.rate_limit_per_minute), cost
     
-    def _cleanup_old_requests(self):
-        """Remove requisições antigas do cache."""
-        current_time = time.time()
-        window_start = current_time - self.window_size
-        
-        for client_id in list(self.requests.keys()):
-            self.requests[client_id] = [
-                req for req in self.requests[client_id] 
-                if req[0] > window_start
-            ]
-            
-            # Remover clientes sem requisições recentes
-            if not self.requests[client_id]:
-                del self.requests[client_id]
+    @staticmethod
+    def _rate_limit_headers(result: RateLimitResult) -> Dict[str, str]:
+        return {
+            "Retry-After": str(math.ceil(result.retry_after)),
+            "RateLimit-Limit": str(result.limit),
+            "RateLimit-Remaining": str(result.remaining),
+            "RateLimit-Reset": str(math.ceil(result.reset_after)),
+        }
+    
+    def _is_trusted_proxy(self, host: str) -> bool:
+        try:
+            address = ipaddress.ip_address(host)
+        except ValueError:
+            return False
+        return any(address in network for network in self.trusted_proxies)
     
     def _default_client_id(self, request: Request) -> str:
-        """Obtém o ID do cliente a partir do IP."""
+        """
+        Obtém o ID do cliente a partir do IP.
+
+        O cabeçalho X-Forwarded-For pode ser forjado pelo cliente, por isso só é
+        usado quando a conexão vem de um proxy confiável. Nesse caso, o cliente é
+        o endereço mais à direita que não pertence a um proxy confiável.
+        """
+        peer = request.client.host if request.client else "unknown"
+        if not self.trusted_proxies or not self._is_trusted_proxy(peer):
+            return peer
+
         forwarded = request.headers.get("X-Forwarded-For")
-        if forwarded:
-            return forwarded.split(",")[0].strip()
-        return request.client.host if request.client else "unknown"
+        if not forwarded:
+            return peer
+        hops = [hop.strip() for hop in forwarded.split(",") if hop.strip()]
+        for hop in reversed(hops):
+            if not self._is_trusted_proxy(hop):
+                return hop
+        return hops[0] if hops else peer
@@ -1,36 +1,70 @@
+import csv
+import hashlib
+import io
 import json
 import time
-from typing import Optional, Callable
+from typing import Any, Callable, List, Optional
+from urllib.parse import parse_qsl
 
 from fastapi import Request
-from starlette.middleware.base import BaseHTTPMiddleware
-from starlette.types import ASGIApp
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
 
+from app.infrastructure.utils.request_log_sampler import RequestLogSampler
 from app.infrastructure.utils.security_logger import SecurityLogger
 
 
-class RequestLoggerMiddleware(BaseHTTPMiddleware):
+class RequestLoggerMiddleware:
     """
-    Middleware para registrar informações detalhadas sobre requisições e respostas.
+    Middleware ASGI para registrar informações detalhadas sobre requisições e respostas.
+
+    O corpo da requisição é copiado à medida que a aplicação o lê (sem ler o
+    corpo antes dela), e a resposta não é envolvida: as mensagens seguem direto
+    para o servidor, inclusive em respostas em streaming. O tempo registrado é
+    o tempo até o início da resposta (`http.response.start`).
+
+    A cópia do corpo é limitada: no máximo `max_body_bytes` são guardados
+    (acima disso registra-se apenas o tamanho), strings maiores que
+    `max_field_chars` viram tamanho + hash e corpos multipart ou binários não
+    são copiados.
+
+    Com um `sampler`, leituras bem-sucedidas e rotineiras são amostradas por
+    rota e resumidas periodicamente (ver RequestLogSampler).
     """
+    # Tipos de conteúdo cujo corpo é copiado para o log
+    TEXT_CONTENT_TYPES = ("application/json", "application/x-www-form-urlencoded", "text/")
+
     def __init__(
         self,
         app: ASGIApp,
-        exclude_paths: list[str] = None,
-        get_user_id: Optional[Callable[[Request], Optional[str]]] = None
+        exclude_paths: List[str] = None,
+        get_user_id: Optional[Callable[[Request], Optional[str]]] = None,
+        max_body_bytes: int = 64 * 1024,
+        max_field_chars: int = 256,
+        sampler: Optional[RequestLogSampler] = None,
     ):
-        super().__init__(app)
+        self.app = app
         self.exclude_paths = exclude_paths or ["/docs", "/redoc", "/openapi.json"]
+        self._exclude_prefixes = tuple(self.exclude_paths)
         self.get_user_id = get_user_id or self._default_get_user_id
+        self.max_body_bytes = max_body_bytes
+        self.max_field_chars = max_field_chars
+        self.sampler = sampler
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
 
-    async def dispatch(self, request: Request, call_next):
         # Verificar se o caminho deve ser excluído do logging
-        path = request.url.path
-        if any(path.startswith(exclude) for exclude in self.exclude_paths):
-            return await call_next(request)
+        path = scope["path"]
+        if path.startswith(self._exclude_prefixes):
+            await self.app(scope, receive, send)
+            return
 
         # Obter informações da requisição
-        start_time = time.time()
+        start_time = time.perf_counter()
+        request = Request(scope)
+        method = scope["method"]
 
         # Obter IP do cliente
         client_ip = self._get_client_ip(request)
@@ -38,56 +72,55 @@ class RequestLoggerMiddleware(BaseHTTPMiddleware):
         # Obter ID do usuário (se autenticado)
         user_id = await self.get_user_id(request)
 
-        # Capturar dados da requisição
-        request_data = {}
-        try:
-            if request.method in ["POST", "PUT", "PATCH"]:
-                body = await request.body()
-                if body:
-                    try:
-                        # Tentar decodificar como JSON
-                        request_data = json.loads(body)
-                    except:
-                        # Se não for JSON, converter para string
-                        request_data = {"raw_body": body.decode("utf-8", errors="replace")}
-        except Exception as e:
-            request_data = {"error": f"Erro ao capturar corpo da requisição: {str(e)}"}
+        # Corpo da requisição, copiado conforme a aplicação o consome e até o limite
+        content_type = request.headers.get("Content-Type", "").lower()
+        body_chunks: List[bytes] = []
+        body_size = 0
+        capture_body = method in ("POST", "PUT", "PATCH")
+        copy_body = capture_body and content_type.startswith(self.TEXT_CONTENT_TYPES)
+
+        async def receive_wrapper() -> Message:
+            nonlocal body_size, copy_body
+            message = await receive()
+            if message["type"] == "http.request":
+                chunk = message.get("body", b"")
+                body_size += len(chunk)
+                if copy_body:
+                    if body_size > self.max_body_bytes:
+                        # Acima do limite: descartar a cópia parcial e registrar só o tamanho
+                        copy_body = False
+                        body_chunks.clear()
+                    else:
+                        body_chunks.append(chunk)
+            return message
+
+        status_code: Optional[int] = None
+        process_time_ms: Optional[float] = None
+
+        async def send_wrapper(message: Message) -> None:
+            nonlocal status_code, process_time_ms
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+                process_time_ms = round((time.perf_counter() - start_time) * 1000, 2)
+            await send(message)
 
         # Processar a requisição e capturar a resposta
         try:
-            # Processar a requisição
-            response = await call_next(request)
-
-            # Calcular tempo de processamento
-            process_time = time.time() - start_time
-            process_time_ms = round(process_time * 1000, 2)
-
-            # Registrar a requisição bem-sucedida
-            SecurityLogger.log_api_request(
-                method=request.method,
-                path=request.url.path,
-                user_id=user_id,
-                ip_address=client_ip,
-                request_data=request_data,
-                response_data={"status_code": response.status_code},
-                status_code=response.status_code,
-                process_time_ms=process_time_ms
-            )
-
-            return response
-
+            await self.app(scope, receive_wrapper if capture_body else receive, send_wrapper)
         except Exception as e:
-            # Calcular tempo de processamento
-            process_time = time.time() - start_time
-            process_time_ms = round(process_time * 1000, 2)
+            if process_time_ms is None:
+                process_time_ms = round((time.perf_counter() - start_time) * 1000, 2)
+            if self.sampler is not None:
+                # Erros são sempre registrados; apenas contabilizar no resumo da rota
+                self.sampler.should_log(method, path, self._route_path(scope), 500, process_time_ms, error=True)
 
             # Registrar a requisição com erro
             SecurityLogger.log_api_request(
-                method=request.method,
-                path=request.url.path,
+                method=method,
+                path=path,
                 user_id=user_id,
                 ip_address=client_ip,
-                request_data=request_data,
+                request_data=self._body_log_data(body_chunks, body_size, content_type, copy_body),
                 status_code=500,
                 process_time_ms=process_time_ms,
                 error=str(e)
@@ -96,6 +129,76 @@ class RequestLoggerMiddleware(BaseHTTPMiddleware):
             # Re-lançar a exceção para ser tratada pelo FastAPI
             raise
 
+        if self.sampler is not None:
+            keep = self.sampler.should_log(method, path, self._route_path(scope), status_code, process_time_ms)
+            self._log_due_summaries()
+            if not keep:
+                # Contabilizada apenas no resumo periódico da rota
+                return
+
+        # Registrar a requisição concluída
+        SecurityLogger.log_api_request(
+            method=method,
+            path=path,
+            user_id=user_id,
+            ip_address=client_ip,
+            request_data=self._body_log_data(body_chunks, body_size, content_type, copy_body),
+            response_data={"status_code": status_code},
+            status_code=status_code,
+            process_time_ms=process_time_ms
+        )
+
+    @staticmethod
+    def _route_path(scope: Scope) -> Optional[str]:
+        """Template da rota atendida (ex.: /api/collections/{collection_id}), preenchido pelo roteador."""
+        route = scope.get("route")
+        return getattr(route, "path", None)
+
+    def _log_due_summaries(self) -> None:
+        for summary in self.sampler.due_summaries():
+            SecurityLogger.log_security_event("api_request_summary", details=summary)
+
+    def _body_log_data(self, body_chunks: List[bytes], body_size: int, content_type: str, copied: bool) -> Any:
+        """Converte o corpo capturado em dados para o log."""
+        if not body_size:
+            return {}
+        if not copied:
+            # Multipart, binário ou acima do limite: apenas metadados
+            return {"content_type": content_type or None, "size_bytes": body_size, "captured": False}
+
+        body = b"".join(body_chunks)
+        if content_type.startswith("application/x-www-form-urlencoded"):
+            # Como dicionário, para que campos sensíveis (ex.: password do login) sejam mascarados
+            data = dict(parse_qsl(body.decode("utf-8", errors="replace"), keep_blank_values=True))
+        elif content_type.startswith("text/csv"):
+            # Linhas como dicionários, para que colunas sensíveis (ex.: password
+            # da importação de usuários) sejam mascaradas como em JSON
+            try:
+                data = list(csv.DictReader(io.StringIO(body.decode("utf-8-sig", errors="replace"))))
+            except csv.Error:
+                return {"content_type": content_type, "size_bytes": body_size, "captured": False}
+        else:
+            try:
+                # Tentar decodificar como JSON
+                data = json.loads(body)
+            except ValueError:
+                # Se não for JSON, converter para string
+                data = {"raw_body": body.decode("utf-8", errors="replace")}
+        return self._truncate_fields(data)
+
+    def _truncate_fields(self, data: Any) -> Any:
+        """Substitui strings longas (ex.: imagens em base64) por tamanho e hash."""
+        if isinstance(data, str):
+            if len(data) <= self.max_field_chars:
+                return data
+            digest = hashlib.sha256(data.encode("utf-8", errors="replace")).hexdigest()[:16]
+            return f"<{len(data)} chars sha256:{digest}>"
+        if isinstance(data, dict):
+            return {key: self._truncate_fields(value) for key, value in data.items()}
+        if isinstance(data, list):
+            return [self._truncate_fields(item) for item in data]
+        return data
+
     def _get_client_ip(self, request: Request) -> str:
         """Obtém o IP do cliente a partir dos cabeçalhos ou da conexão."""
         forwarded = request.headers.get("X-Forwarded-For")
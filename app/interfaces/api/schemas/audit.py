@@ -0,0 +1,28 @@
+from datetime import datetime
+from typing import Any, Dict, List, Optional
+
+from pydantic import BaseModel
+
+
+class SecurityEventResponse(BaseModel):
+    event_id: str
+    event_type: str
+    level: str
+    timestamp: datetime
+    user_id: Optional[str] = None
+    ip_address: Optional[str] = None
+    details: Optional[Dict[str, Any]] = None
+
+
+class SecurityEventPage(BaseModel):
+    items: List[SecurityEventResponse]
+    # Cursor para a próxima página (None na última)
+    next_cursor: Optional[str] = None
+
+
+class DatabaseStatsResponse(BaseModel):
+    # Limiters de acesso ao banco por tipo de operação (read/write): limite atual, fila e recusas
+    limiters: Dict[str, Dict[str, Any]]
+    # Pools de conexões ("primary", ou "write" e "read" no perfil SQLite): ocupação,
+    # overflow, timeouts e espera por conexão
+    pools: Dict[str, Dict[str, Any]]
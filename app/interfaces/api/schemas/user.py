@@ -1,5 +1,5 @@
 from datetime import datetime
-from typing import Optional
+from typing import List, Optional
 from uuid import UUID
 
 from pydantic import BaseModel, EmailStr, Field
@@ -38,6 +38,17 @@ class UserResponse(UserBase):
         from_attributes = True
 
 
+class UserImportError(BaseModel):
+    row: int  # Posição da linha no arquivo/lista enviado, começando em 1
+    email: Optional[str] = None
+    error: str
+
+
+class UserImportResponse(BaseModel):
+    created: List[UserResponse]
+    errors: List[UserImportError]
+
+
 class Token(BaseModel):
     access_token: str
     refresh_token: str
@@ -50,6 +61,10 @@ class RefreshToken(BaseModel):
     refresh_token: str
 
 
+class LogoutRequest(BaseModel):
+    refresh_token: Optional[str] = None  # Se informado, a família do refresh token é revogada
+
+
 class TokenData(BaseModel):
     user_id: UUID
     role: UserRole
@@ -0,0 +1,126 @@
+import binascii
+import re
+from contextlib import contextmanager
+from contextvars import ContextVar
+from datetime import datetime
+from operator import attrgetter
+from typing import Any, Dict, Iterable, Iterator, List, Mapping, Optional, Type
+from uuid import UUID
+
+import msgpack
+import orjson
+from fastapi import Response, status
+from pydantic import BaseModel
+
+from app.interfaces.api.schemas.collection import CollectionResponse
+from app.interfaces.api.schemas.company import CompanyResponse
+from app.interfaces.api.schemas.user import UserResponse
+
+JSON_MEDIA_TYPE = "application/json"
+MSGPACK_MEDIA_TYPE = "application/msgpack"
+
+# Formato negociado pelo MessagePackMiddleware para a requisição em andamento
+_response_media_type: ContextVar[str] = ContextVar("response_media_type", default=JSON_MEDIA_TYPE)
+
+_DATA_URL = re.compile(r"data:image/[a-z]+;base64,")
+
+
+def response_media_type() -> str:
+    """Formato das respostas da requisição em andamento (JSON, salvo negociação de MessagePack)."""
+    return _response_media_type.get()
+
+
+@contextmanager
+def negotiated_media_type(media_type: str) -> Iterator[None]:
+    token = _response_media_type.set(media_type)
+    try:
+        yield
+    finally:
+        _response_media_type.reset(token)
+
+
+def data_url_to_bytes(value: Any) -> Any:
+    """Imagem em data URL base64 -> bytes; outros valores ficam como estão."""
+    if isinstance(value, str):
+        match = _DATA_URL.match(value)
+        if match is not None:
+            try:
+                return binascii.a2b_base64(value[match.end():])
+            except binascii.Error:
+                return value
+    return value
+
+
+def _msgpack_default(value: Any) -> Any:
+    # Mesma representação do JSON dos response models
+    if isinstance(value, datetime):
+        return value.isoformat()
+    if isinstance(value, UUID):
+        return str(value)
+    raise TypeError(f"Tipo não serializável em MessagePack: {type(value).__name__}")
+
+
+def payload_response(
+    body: bytes,
+    status_code: int = status.HTTP_200_OK,
+    headers: Optional[Mapping[str, str]] = None,
+    media_type: Optional[str] = None,
+) -> Response:
+    """Resposta com um corpo já serializado, no formato negociado (ou em `media_type`)."""
+    return Response(body, status_code=status_code, headers=headers, media_type=media_type or response_media_type())
+
+
+class EntitySerializer:
+    """
+    Serializa entidades de domínio direto para os bytes de um response model.
+
+    Os campos do response model são lidos da entidade uma única vez, sem
+    construir o modelo pydantic e sem a segunda validação do `response_model`
+    do FastAPI (que continua declarado nas rotas para o OpenAPI). Em JSON, o
+    dicionário é codificado pelo orjson; em MessagePack (quando negociado), pelo
+    msgpack, com a mesma estrutura e com os `binary_fields` (imagens em data
+    URL) enviados como binário.
+    """
+
+    def __init__(self, response_model: Type[BaseModel], binary_fields: Iterable[str] = ()):
+        self.response_model = response_model
+        self.fields = tuple(response_model.model_fields)
+        self.binary_fields = tuple(binary_fields)
+        self._getter = attrgetter(*self.fields)
+
+    def to_dict(self, entity: Any) -> Dict[str, Any]:
+        return dict(zip(self.fields, self._getter(entity)))
+
+    def _to_msgpack_dict(self, entity: Any) -> Dict[str, Any]:
+        data = self.to_dict(entity)
+        for field in self.binary_fields:
+            if data[field] is not None:
+                data[field] = [data_url_to_bytes(value) for value in data[field]]
+        return data
+
+    def dumps(self, entity: Any, media_type: Optional[str] = None) -> bytes:
+        if (media_type or response_media_type()) == MSGPACK_MEDIA_TYPE:
+            return msgpack.packb(self._to_msgpack_dict(entity), default=_msgpack_default, use_bin_type=True)
+        return orjson.dumps(self.to_dict(entity))
+
+    def dumps_many(self, entities: Iterable[Any], media_type: Optional[str] = None) -> bytes:
+        if (media_type or response_media_type()) == MSGPACK_MEDIA_TYPE:
+            items: List[Dict[str, Any]] = [self._to_msgpack_dict(entity) for entity in entities]
+            return msgpack.packb(items, default=_msgpack_default, use_bin_type=True)
+        return orjson.dumps([self.to_dict(entity) for entity in entities])
+
+    def response(
+        self,
+        entity: Any,
+        status_code: int = status.HTTP_200_OK,
+        headers: Optional[Mapping[str, str]] = None,
+    ) -> Response:
+        return payload_response(self.dumps(entity), status_code=status_code, headers=headers)
+
+    def list_response(self, entities: Iterable[Any], headers: Optional[Mapping[str, str]] = None) -> Response:
+        return payload_response(self.dumps_many(entities), headers=headers)
+
+
+collection_serializer = EntitySerializer(CollectionResponse, binary_fields=("images",))
+company_serializer = EntitySerializer(CompanyResponse)
+user_serializer = EntitySerializer(UserResponse)
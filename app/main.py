@@ -1,16 +1,95 @@
+import asyncio
+import logging
 import os
+from contextlib import asynccontextmanager, suppress
+
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 
 from app.infrastructure.config import get_settings
-from app.interfaces.api.controllers import auth, users, companies, collections
+from app.infrastructure.auth.revocation import get_revocation_registry
+from app.infrastructure.database.concurrency import DatabaseBusyError
+from app.infrastructure.database.database import engines
+from app.infrastructure.database.maintenance import (
+    run_revocation_sync,
+    run_sqlite_optimize,
+    run_token_purge,
+    sync_token_revocations,
+)
+from app.infrastructure.database.pool import warm_up_pool
+from app.infrastructure.utils.request_log_sampler import get_request_log_sampler
+from app.infrastructure.utils.security_log_writer import get_security_log_writer
+from app.infrastructure.utils.security_logger import SecurityLogger
+from app.interfaces.api.controllers import audit, auth, users, companies, collections
+from app.interfaces.api.dependencies import get_rate_limit_backend, init_app_services
+from app.interfaces.api.errors import database_busy_handler
+from app.interfaces.api.middlewares.admission import AdmissionControlMiddleware
+from app.interfaces.api.middlewares.compression import CompressionMiddleware
+from app.interfaces.api.middlewares.message_pack import MessagePackMiddleware
 from app.interfaces.api.middlewares.rate_limiter import RateLimiter
 from app.interfaces.api.middlewares.request_logger import RequestLoggerMiddleware
 from app.interfaces.api.middlewares.jwt_utils import get_user_id_from_token
 
 settings = get_settings()
+logger = logging.getLogger(__name__)
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    # Serviços de escopo de aplicação criados uma única vez, fora do caminho das requisições
+    init_app_services()
+
+    # Conexões dos pools abertas antes da primeira requisição
+    try:
+        for engine in engines.values():
+            await warm_up_pool(engine, settings.db_pool_warmup_connections)
+    except Exception:
+        logger.exception("Falha ao abrir as conexões iniciais do pool")
+
+    # Carregar as revogações de tokens antes de aceitar requisições
+    revocation_registry = get_revocation_registry()
+    try:
+        await sync_token_revocations(revocation_registry)
+    except Exception:
+        # A sincronização periódica tentará novamente
+        logger.exception("Falha ao carregar revogações de tokens na inicialização")
+
+    # Tarefas de manutenção em segundo plano
+    background_tasks = [
+        asyncio.create_task(
+            run_token_purge(
+                settings.refresh_token_purge_interval_seconds,
+                settings.refresh_token_purge_chunk_size,
+            )
+        ),
+        asyncio.create_task(
+            run_revocation_sync(revocation_registry, settings.revocation_sync_interval_seconds)
+        ),
+    ]
+    if "write" in engines and settings.sqlite_optimize_interval_seconds > 0:
+        background_tasks.append(
+            asyncio.create_task(run_sqlite_optimize(engines["write"], settings.sqlite_optimize_interval_seconds))
+        )
+    yield
+    for task in background_tasks:
+        task.cancel()
+    for task in background_tasks:
+        with suppress(asyncio.CancelledError):
+            await task
+    get_rate_limit_backend().close()
+    # Resumos das requisições amostradas desde o último intervalo
+    sampler = get_request_log_sampler()
+    if sampler is not None:
+        for summary in sampler.collect_summaries():
+            SecurityLogger.log_security_event("api_request_summary", details=summary)
+    # Gravar os eventos de segurança ainda na fila
+    get_security_log_writer().close()
+    for engine in engines.values():
+        await engine.dispose()
 
-app = FastAPI(title=settings.app_name)
+
+app = FastAPI(title=settings.app_name, lifespan=lifespan)
+app.add_exception_handler(DatabaseBusyError, database_busy_handler)
 
 # Set up CORS
 origins = []
@@ -33,6 +112,26 @@ else:
     if production_origins:
         origins = production_origins.split(",")
 
+# MessagePack nas rotas da API (se o pacote estiver instalado), dentro da compressão
+app.add_middleware(MessagePackMiddleware, path_prefix="/api")
+
+# Compressão das respostas (gzip; br e zstd se os pacotes estiverem instalados)
+app.add_middleware(
+    CompressionMiddleware,
+    minimum_size=settings.compression_minimum_size,  # Respostas menores seguem sem compressão
+    thread_threshold=settings.compression_thread_threshold_bytes,  # A partir disso, comprimir em uma thread
+    gzip_level=settings.compression_gzip_level,
+)
+
+# Controle de admissão: vagas e filas com prazo por classe de prioridade, 503 quando saturada
+app.add_middleware(
+    AdmissionControlMiddleware,
+    limits=settings.admission_limits,  # Requisições simultâneas por classe
+    queue_sizes=settings.admission_queue_sizes,  # Requisições em espera por classe
+    queue_timeouts_ms=settings.admission_queue_timeouts_ms,  # Prazo máximo na fila
+    auth_paths=["/api/token", "/api/refresh", "/api/logout"],
+)
+
 app.add_middleware(
     CORSMiddleware,
     allow_origins=origins,
@@ -45,7 +144,10 @@ app.add_middleware(
 app.add_middleware(
     RequestLoggerMiddleware,
     exclude_paths=["/docs", "/redoc", "/openapi.json", "/favicon.ico"],
-    get_user_id=get_user_id_from_token
+    get_user_id=get_user_id_from_token,
+    max_body_bytes=settings.request_log_max_body_bytes,  # Corpos maiores são registrados só pelo tamanho
+    max_field_chars=settings.request_log_max_field_chars,  # Strings maiores viram tamanho + hash
+    sampler=get_request_log_sampler(),  # Amostragem de leituras rotineiras por rota, com resumos periódicos
 )
 
 # Adicionar middleware de rate limiting
@@ -54,6 +156,16 @@ app.add_middleware(
     rate_limit_per_minute=100,  # Limite geral de requisições por minuto
     auth_rate_limit_per_minute=5,  # Limite para endpoints de autenticação
     auth_paths=["/api/token", "/api/refresh"],  # Endpoints de autenticação
+    max_clients=settings.rate_limit_max_clients,  # Limite de clientes rastreados em memória
+    backend=get_rate_limit_backend(),  # Contadores em memória ou compartilhados entre workers
+    trusted_proxies=settings.trusted_proxies,  # Proxies cujo X-Forwarded-For é confiável
+    role_limits=settings.rate_limit_role_limits,  # Limites por papel para usuários autenticados
+    heavy_rate_limit_per_minute=settings.rate_limit_heavy_per_minute,  # Custo máximo de uploads por minuto
+    role_heavy_limits=settings.rate_limit_role_heavy_limits,
+    route_costs={  # Custo declarado de rotas pesadas (somado a 1 por 256 KB de corpo)
+        "POST /api/collections/": 5,
+        "POST /api/users/import": 20,
+    },
 )
 
 # Include routers with /api prefix
@@ -61,6 +173,7 @@ app.include_router(auth.router, prefix="/api", tags=["auth"])
 app.include_router(users.router, prefix="/api/users", tags=["users"])
 app.include_router(companies.router, prefix="/api/companies", tags=["companies"])
 app.include_router(collections.router, prefix="/api/collections", tags=["collections"])
+app.include_router(audit.router, prefix="/api/audit", tags=["audit"])
 
 
 @app.get("/")
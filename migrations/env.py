@@ -21,6 +21,10 @@ if config.config_file_name is not None:
 from app.infrastructure.database.models import Base
 target_metadata = Base.metadata
 
+# Mesmo banco da aplicação (DATABASE_URL), e não a URL fixa do alembic.ini
+from app.infrastructure.config import get_settings
+config.set_main_option("sqlalchemy.url", get_settings().database_url)
+
 # other values from the config, defined by the needs of env.py,
 # can be acquired:
 # my_important_option = config.get_main_option("my_important_option")
@@ -79,6 +83,12 @@ async def run_async_migrations() -> None:
 def run_migrations_online() -> None:
     """Run migrations in 'online' mode."""
 
+    # Conexão recebida de `database.migrations.upgrade_schema` (init_db, testes)
+    connection = config.attributes.get("connection")
+    if connection is not None:
+        do_run_migrations(connection)
+        return
+
     asyncio.run(run_async_migrations())
 
 
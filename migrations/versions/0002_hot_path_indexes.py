@@ -0,0 +1,49 @@
+"""hot path indexes
+
+Índices para as consultas que os repositórios executam nas rotas:
+
+- collections: por solicitante e por coletor junto com `updated_at` (a
+  lista e a sua versão, `count` + `max(updated_at)`, saem só do índice), por
+  empresa, por status e por CEP;
+- zip_codes: por empresa (a chave primária começa por `zip_code` e não
+  atende `company_id = ?`);
+- users: coletores por empresa.
+
+`if_not_exists` porque bancos adotados por `upgrade_schema` podem já ter
+alguma tabela criada pelo `create_all` com os índices atuais.
+
+Revision ID: 0002
+Revises: 0001
+Create Date: 2026-10-19 09:30:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = "0002"
+down_revision: Union[str, None] = "0001"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+INDEXES = [
+    ("ix_collections_user_id_updated_at", "collections", ["user_id", "updated_at"]),
+    ("ix_collections_collector_id_updated_at", "collections", ["collector_id", "updated_at"]),
+    ("ix_collections_company_id", "collections", ["company_id"]),
+    ("ix_collections_status", "collections", ["status"]),
+    ("ix_collections_zip_code", "collections", ["zip_code"]),
+    ("ix_zip_codes_company_id", "zip_codes", ["company_id"]),
+    ("ix_users_company_id", "users", ["company_id"]),
+]
+
+
+def upgrade() -> None:
+    for name, table, columns in INDEXES:
+        op.create_index(name, table, columns, if_not_exists=True)
+
+
+def downgrade() -> None:
+    for name, table, _ in reversed(INDEXES):
+        op.drop_index(name, table_name=table, if_exists=True)
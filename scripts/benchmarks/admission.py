@@ -0,0 +1,136 @@
+"""
+Benchmark: latência das ações de coletores sob sobrecarga de relatórios.
+
+Uma rota FastAPI simula o acesso ao banco com um pool de N conexões
+(semáforo): relatórios de administradores ocupam uma conexão por 50 ms e
+atualizações de status de coletores, por 2 ms. Enquanto `--admins`
+requisições de relatório simultâneas chegam sem parar, coletores enviam
+atualizações, e o benchmark mede a latência (p50/p99) das atualizações e
+quantos relatórios foram atendidos ou recusados (503), com e sem o
+AdmissionControlMiddleware.
+
+Uso:
+    python -m scripts.benchmarks.admission --admins 200 --collectors 10 --seconds 5
+"""
+import argparse
+import asyncio
+import os
+import statistics
+import sys
+import time
+from typing import Dict, List
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+from fastapi import FastAPI
+
+from app.interfaces.api.middlewares.admission import AdmissionControlMiddleware
+
+DB_CONNECTIONS = 10
+
+
+def build_app() -> FastAPI:
+    app = FastAPI()
+    pool = asyncio.Semaphore(DB_CONNECTIONS)
+
+    @app.get("/api/collections/")
+    async def report():
+        async with pool:
+            await asyncio.sleep(0.05)
+        return {"ok": True}
+
+    @app.post("/api/collections/{collection_id}/status")
+    async def update_status(collection_id: str):
+        async with pool:
+            await asyncio.sleep(0.002)
+        return {"ok": True}
+
+    return app
+
+
+async def call(app, method: str, path: str, role: str) -> int:
+    scope = {
+        "type": "http",
+        "asgi": {"version": "3.0"},
+        "http_version": "1.1",
+        "method": method,
+        "scheme": "http",
+        "path": path,
+        "raw_path": path.encode(),
+        "query_string": b"",
+        "root_path": "",
+        "headers": [(b"host", b"bench"), (b"x-role", role.encode())],
+        "client": ("10.0.0.1", 1234),
+        "server": ("bench", 80),
+    }
+    status = 0
+
+    async def receive():
+        return {"type": "http.request", "body": b"", "more_body": False}
+
+    async def send(message):
+        nonlocal status
+        if message["type"] == "http.response.start":
+            status = message["status"]
+
+    await app(scope, receive, send)
+    return status
+
+
+async def run(app, admins: int, collectors: int, seconds: float) -> Dict[str, object]:
+    deadline = time.perf_counter() + seconds
+    latencies: List[float] = []
+    reports = {"ok": 0, "rejected": 0}
+
+    async def admin() -> None:
+        while time.perf_counter() < deadline:
+            status = await call(app, "GET", "/api/collections/", "admin")
+            if status == 200:
+                reports["ok"] += 1
+            else:
+                reports["rejected"] += 1
+                await asyncio.sleep(0.01)
+
+    async def collector() -> None:
+        while time.perf_counter() < deadline:
+            start = time.perf_counter()
+            await call(app, "POST", "/api/collections/1/status", "collector")
+            latencies.append(time.perf_counter() - start)
+            await asyncio.sleep(0.01)
+
+    await asyncio.gather(*(admin() for _ in range(admins)), *(collector() for _ in range(collectors)))
+    ordered = sorted(latencies)
+    return {
+        "p50": statistics.median(ordered) * 1000,
+        "p99": ordered[int(0.99 * (len(ordered) - 1))] * 1000,
+        "updates": len(ordered),
+        **reports,
+    }
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--admins", type=int, default=200)
+    parser.add_argument("--collectors", type=int, default=10)
+    parser.add_argument("--seconds", type=float, default=5.0)
+    args = parser.parse_args()
+
+    admission = AdmissionControlMiddleware(
+        build_app(),
+        limits={"collector": 32, "admin": DB_CONNECTIONS // 2},
+        queue_sizes={"collector": 64, "admin": 16},
+        queue_timeouts_ms={"collector": 500, "admin": 5000},
+    )
+    admission.classify = lambda request: request.headers["x-role"]
+
+    for name, app in [("sem admissão", build_app()), ("com admissão", admission)]:
+        result = await run(app, args.admins, args.collectors, args.seconds)
+        print(
+            f"{name:<14} coletores p50 {result['p50']:7.1f} ms  p99 {result['p99']:7.1f} ms"
+            f"  ({result['updates']} atualizações)  relatórios: {result['ok']} atendidos,"
+            f" {result['rejected']} recusados"
+        )
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
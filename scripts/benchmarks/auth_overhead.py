@@ -0,0 +1,95 @@
+"""
+Benchmark: custo de autenticação por requisição.
+
+Compara os seguintes cenários para um mesmo access token:
+- antes: o token é decodificado duas vezes (middleware de log + get_current_user)
+- depois (frio): uma única verificação por requisição, sem cache
+- depois (quente): token já presente no cache de tokens verificados
+- depois (quente + revogação): idem, com a checagem de revogação em memória
+  contra 10 mil jti negados e mil épocas de usuário
+
+Uso:
+    python -m scripts.benchmarks.auth_overhead --iterations 20000
+"""
+import argparse
+import os
+import sys
+import timeit
+from datetime import datetime, timedelta
+from types import SimpleNamespace
+from uuid import uuid4
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+from jose import jwt
+
+from app.application.services.auth_service import AuthService
+from app.domain.entities.token_revocation import RevocationKind, TokenRevocation
+from app.domain.entities.user import UserRole
+from app.infrastructure.auth import token_verifier
+from app.infrastructure.auth.revocation import RevocationRegistry
+from app.infrastructure.auth.token_verifier import TokenVerifier, get_request_claims
+
+SECRET = "benchmark-secret"
+
+
+class FakeRequest:
+    """Apenas o necessário de Request para get_request_claims."""
+
+    def __init__(self, authorization: str):
+        self.headers = {"Authorization": authorization}
+        self.state = SimpleNamespace()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--iterations", type=int, default=20000)
+    args = parser.parse_args()
+
+    auth_service = AuthService(secret_key=SECRET)
+    token, _ = auth_service.create_access_token(uuid4(), UserRole.REGULAR, timedelta(minutes=30))
+    authorization = f"Bearer {token}"
+
+    def before() -> None:
+        # RequestLoggerMiddleware + get_current_user, cada um com seu jwt.decode
+        jwt.decode(token, SECRET, algorithms=["HS256"])
+        jwt.decode(token, SECRET, algorithms=["HS256"])
+
+    cold_verifier = TokenVerifier(secret_key=SECRET, max_entries=0)
+    hot_verifier = TokenVerifier(secret_key=SECRET, max_entries=1024)
+
+    def after(verifier: TokenVerifier) -> None:
+        token_verifier.get_token_verifier = lambda: verifier
+        request = FakeRequest(authorization)
+        get_request_claims(request)  # middleware
+        get_request_claims(request)  # dependência
+
+    registry = RevocationRegistry()
+    expires_at = datetime.utcnow() + timedelta(minutes=30)
+    for _ in range(10000):
+        registry.apply(TokenRevocation(kind=RevocationKind.TOKEN, subject=uuid4().hex, expires_at=expires_at))
+    for _ in range(1000):
+        registry.apply(TokenRevocation(
+            kind=RevocationKind.USER, subject=str(uuid4()), issued_before=datetime.utcnow(), expires_at=expires_at,
+        ))
+
+    def after_with_revocation() -> None:
+        token_verifier.get_token_verifier = lambda: hot_verifier
+        request = FakeRequest(authorization)
+        get_request_claims(request)
+        registry.is_revoked(get_request_claims(request))
+
+    scenarios = [
+        ("antes (2x decode)", before),
+        ("depois, sem cache", lambda: after(cold_verifier)),
+        ("depois, cache quente", lambda: after(hot_verifier)),
+        ("depois, + revogação", after_with_revocation),
+    ]
+    for name, func in scenarios:
+        func()
+        seconds = timeit.timeit(func, number=args.iterations)
+        print(f"{name:<24} {seconds / args.iterations * 1e6:8.2f} µs/requisição")
+
+
+if __name__ == "__main__":
+    main()
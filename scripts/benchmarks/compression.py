@@ -0,0 +1,104 @@
+"""
+Benchmark: banda e CPU da compressão das respostas de listagem.
+
+Monta o JSON de uma listagem de coletas (N coletas, cada uma com imagens em
+base64, como devolvido por GET /api/collections/) e mede, para cada
+codificação disponível no CompressionMiddleware e alguns níveis:
+- tamanho comprimido e razão em relação ao original
+- CPU por resposta (compressão de corpo único, como no middleware)
+- vazão de compressão em MB/s
+
+Os mesmos números são medidos para uma listagem sem imagens, caso em que o
+corpo é quase só JSON repetitivo. brotli e zstd só aparecem se os pacotes
+`brotli` e `zstandard` estiverem instalados.
+
+Uso:
+    python -m scripts.benchmarks.compression --collections 100 --images 2 --image-bytes 30000
+"""
+import argparse
+import base64
+import json
+import os
+import random
+import sys
+import time
+import uuid
+from datetime import datetime, timezone
+from typing import List, Tuple
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+from app.interfaces.api.middlewares.compression import CompressionMiddleware
+
+LEVELS = {"gzip": (1, 6, 9), "br": (1, 4, 6), "zstd": (1, 3, 9)}
+
+
+def fake_image(rng: random.Random, size: int) -> str:
+    # JPEG já é comprimido: bytes aleatórios após o cabeçalho são uma boa aproximação
+    data = b"\xff\xd8\xff\xe0" + rng.randbytes(size - 4)
+    return "data:image/jpeg;base64," + base64.b64encode(data).decode()
+
+
+def build_body(collections: int, images: int, image_bytes: int) -> bytes:
+    rng = random.Random(42)
+    now = datetime.now(timezone.utc).isoformat()
+    items = [
+        {
+            "id": str(uuid.UUID(int=rng.getrandbits(128))),
+            "user_id": str(uuid.UUID(int=rng.getrandbits(128))),
+            "description": f"Coleta de recicláveis {i}: papelão, garrafas PET e latas",
+            "location_latitude": -23.5 + rng.random(),
+            "location_longitude": -46.6 + rng.random(),
+            "zip_code": f"0{rng.randrange(1000, 9999)}-000",
+            "images": [fake_image(rng, image_bytes) for _ in range(images)],
+            "status": rng.choice(["pending", "assigned", "completed"]),
+            "created_at": now,
+            "updated_at": now,
+            "collector_id": None,
+            "company_id": None,
+        }
+        for i in range(collections)
+    ]
+    return json.dumps(items).encode()
+
+
+def measure(middleware: CompressionMiddleware, encoding: str, body: bytes, runs: int) -> Tuple[int, float]:
+    compressed = middleware.compress(encoding, body)
+    start = time.process_time()
+    for _ in range(runs):
+        middleware.compress(encoding, body)
+    return len(compressed), (time.process_time() - start) / runs
+
+
+def report(title: str, body: bytes, runs: int) -> None:
+    print(f"\n{title}: {len(body) / 1024:,.1f} KiB sem compressão")
+    print(f"{'codificação':<14}{'KiB':>10}{'razão':>9}{'CPU/resp. (ms)':>17}{'MB/s':>9}")
+    encodings: List[str] = list(CompressionMiddleware(None).available_encodings)
+    for encoding in reversed(encodings):
+        for level in LEVELS[encoding]:
+            middleware = CompressionMiddleware(None, gzip_level=level, brotli_quality=level, zstd_level=level)
+            size, seconds = measure(middleware, encoding, body, runs)
+            print(
+                f"{f'{encoding}-{level}':<14}{size / 1024:>10,.1f}{len(body) / size:>8.1f}x"
+                f"{seconds * 1000:>17.2f}{len(body) / seconds / 1e6:>9,.0f}"
+            )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--collections", type=int, default=100)
+    parser.add_argument("--images", type=int, default=2)
+    parser.add_argument("--image-bytes", type=int, default=30_000)
+    parser.add_argument("--runs", type=int, default=20)
+    args = parser.parse_args()
+
+    report(
+        f"{args.collections} coletas com {args.images} imagens de {args.image_bytes / 1024:.0f} KiB",
+        build_body(args.collections, args.images, args.image_bytes),
+        args.runs,
+    )
+    report(f"{args.collections} coletas sem imagens", build_body(args.collections, 0, 0), args.runs * 10)
+
+
+if __name__ == "__main__":
+    main()
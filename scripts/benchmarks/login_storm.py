@@ -0,0 +1,145 @@
+"""
+Benchmark: latência de endpoints não relacionados durante uma rajada de logins.
+
+Sobe o router de autenticação em memória (sem middlewares) contra um banco SQLite
+temporário, dispara logins concorrentes e, ao mesmo tempo, mede a latência de um
+endpoint trivial (`/ping`). Compara o caminho atual (bcrypt no executor limitado)
+com o caminho antigo (bcrypt síncrono no event loop).
+
+Uso:
+    python -m scripts.benchmarks.login_storm --logins 40 --mode both
+"""
+import argparse
+import asyncio
+import os
+import statistics
+import sys
+import tempfile
+import time
+from typing import Dict, List
+
+# Banco e logs temporários precisam estar definidos antes de importar a aplicação
+_DB_DIR = tempfile.mkdtemp(prefix="login_storm_")
+os.environ.setdefault("DATABASE_URL", f"sqlite+aiosqlite:///{_DB_DIR}/bench.db")
+# Logs de segurança no mesmo diretório, fora do ./logs do projeto
+os.environ.setdefault("SECURITY_LOG_PATH", os.path.join(_DB_DIR, "security.log"))
+os.environ.setdefault("SECURITY_AUDIT_DB_PATH", os.path.join(_DB_DIR, "security_audit.db"))
+os.environ.setdefault("RATE_LIMIT_SQLITE_PATH", os.path.join(_DB_DIR, "rate_limit.db"))
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+import httpx
+from fastapi import FastAPI
+
+from app.application.services.auth_service import AuthService
+from app.domain.entities.user import UserRole
+from app.infrastructure.database.database import Base, SessionLocal, engine
+from app.infrastructure.database.models import UserModel
+from app.interfaces.api.controllers import auth
+
+EMAIL = "storm@example.com"
+PASSWORD = "storm-password"
+
+
+def build_app() -> FastAPI:
+    app = FastAPI()
+    app.include_router(auth.router, prefix="/api")
+
+    @app.get("/ping")
+    async def ping():
+        return {"ok": True}
+
+    return app
+
+
+async def seed() -> None:
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+    async with SessionLocal() as db:
+        db.add(UserModel(
+            username="storm",
+            email=EMAIL,
+            hashed_password=AuthService(secret_key="bench").get_password_hash(PASSWORD),
+            role=UserRole.REGULAR,
+        ))
+        await db.commit()
+
+
+def percentile(samples: List[float], pct: float) -> float:
+    ordered = sorted(samples)
+    index = min(len(ordered) - 1, int(round(pct / 100 * (len(ordered) - 1))))
+    return ordered[index]
+
+
+async def run_storm(app: FastAPI, logins: int) -> Dict[str, float]:
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://bench") as client:
+        latencies: List[float] = []
+        statuses: Dict[str, int] = {}
+        storm_done = asyncio.Event()
+
+        async def login() -> None:
+            try:
+                response = await client.post("/api/token", data={"username": EMAIL, "password": PASSWORD})
+                outcome = str(response.status_code)
+            except Exception as e:
+                # Ex.: "database is locked" quando o event loop fica bloqueado
+                outcome = type(e).__name__
+            statuses[outcome] = statuses.get(outcome, 0) + 1
+
+        async def pinger() -> None:
+            # Latência medida a partir do instante agendado de envio, para que um
+            # event loop bloqueado apareça no resultado (evita "coordinated omission")
+            interval = 0.005
+            scheduled = time.perf_counter()
+            while not storm_done.is_set():
+                await client.get("/ping")
+                latencies.append((time.perf_counter() - scheduled) * 1000)
+                scheduled += interval
+                await asyncio.sleep(max(0.0, scheduled - time.perf_counter()))
+
+        ping_task = asyncio.create_task(pinger())
+        start = time.perf_counter()
+        await asyncio.gather(*(login() for _ in range(logins)))
+        elapsed = time.perf_counter() - start
+        storm_done.set()
+        await ping_task
+
+    return {
+        "storm_seconds": round(elapsed, 2),
+        "ping_samples": len(latencies),
+        "ping_p50_ms": round(statistics.median(latencies), 2),
+        "ping_p99_ms": round(percentile(latencies, 99), 2),
+        "ping_max_ms": round(max(latencies), 2),
+        "statuses": statuses,
+    }
+
+
+def use_sync_hashing() -> None:
+    """Simula o comportamento anterior: bcrypt executado diretamente no event loop."""
+
+    async def verify_inline(self, plain_password, hashed_password):
+        return self.verify_password(plain_password, hashed_password)
+
+    AuthService.verify_password_async = verify_inline
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--logins", type=int, default=40)
+    parser.add_argument("--mode", choices=["async", "sync", "both"], default="both")
+    args = parser.parse_args()
+
+    await seed()
+    app = build_app()
+
+    modes = ["async", "sync"] if args.mode == "both" else [args.mode]
+    for mode in modes:
+        if mode == "sync":
+            use_sync_hashing()
+        result = await run_storm(app, args.logins)
+        print(f"[{mode}] {result}")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,125 @@
+"""
+Benchmark: MessagePack vs. JSON em listagens de coletas.
+
+Monta listagens de coletas como devolvidas por GET /api/collections/ (com e
+sem imagens) e mede, por resposta:
+- tamanho do payload, sem compressão e com gzip-6
+- codificação no servidor: JSON e MessagePack, ambos pelo EntitySerializer
+  direto das entidades, e a conversão do JSON para MessagePack (caminho do
+  MessagePackMiddleware para as demais respostas)
+- decodificação no cliente: JSON com as imagens base64 decodificadas para
+  bytes, e MessagePack (imagens já em binário)
+
+Uso:
+    python -m scripts.benchmarks.message_pack --collections 50 200 --images 2 --image-bytes 30000
+"""
+import argparse
+import base64
+import gzip
+import json
+import os
+import random
+import sys
+import time
+import uuid
+from datetime import datetime
+from typing import Callable, List
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+import msgpack
+import orjson
+
+from app.domain.entities.collection import Collection, CollectionStatus
+from app.interfaces.api.middlewares import message_pack
+from app.interfaces.api.serialization import MSGPACK_MEDIA_TYPE, collection_serializer
+
+
+def fake_image(rng: random.Random, size: int) -> str:
+    # JPEG já é comprimido: bytes aleatórios após o cabeçalho são uma boa aproximação
+    data = b"\xff\xd8\xff\xe0" + rng.randbytes(size - 4)
+    return "data:image/jpeg;base64," + base64.b64encode(data).decode()
+
+
+def build_collections(count: int, images: int, image_bytes: int) -> List[Collection]:
+    rng = random.Random(42)
+    now = datetime.utcnow()
+    return [
+        Collection(
+            id=str(uuid.UUID(int=rng.getrandbits(128))),
+            user_id=str(uuid.UUID(int=rng.getrandbits(128))),
+            description=f"Coleta de recicláveis {i}: papelão, garrafas PET e latas",
+            location_latitude=-23.5 + rng.random(),
+            location_longitude=-46.6 + rng.random(),
+            zip_code="01001-000",
+            images=[fake_image(rng, image_bytes) for _ in range(images)],
+            status=CollectionStatus.REQUESTED,
+            created_at=now,
+            updated_at=now,
+            company_id=str(uuid.UUID(int=rng.getrandbits(128))),
+        )
+        for i in range(count)
+    ]
+
+
+def decode_json(body: bytes) -> list:
+    items = json.loads(body)
+    for item in items:
+        item["images"] = [base64.b64decode(image.split(",", 1)[1]) for image in item["images"]]
+    return items
+
+
+def elapsed_ms(func: Callable[[], object], runs: int) -> float:
+    func()
+    start = time.perf_counter()
+    for _ in range(runs):
+        func()
+    return (time.perf_counter() - start) / runs * 1000
+
+
+def report(title: str, collections: List[Collection], runs: int) -> None:
+    json_body = collection_serializer.dumps_many(collections)
+    msgpack_body = collection_serializer.dumps_many(collections, MSGPACK_MEDIA_TYPE)
+
+    encode_json = elapsed_ms(lambda: collection_serializer.dumps_many(collections), runs)
+    encode_msgpack = elapsed_ms(lambda: collection_serializer.dumps_many(collections, MSGPACK_MEDIA_TYPE), runs)
+    encode_transcoded = elapsed_ms(
+        lambda: msgpack.packb(
+            message_pack.to_msgpack_value(orjson.loads(collection_serializer.dumps_many(collections))),
+            use_bin_type=True,
+        ),
+        runs,
+    )
+    decode_json_ms = elapsed_ms(lambda: decode_json(json_body), runs)
+    decode_msgpack_ms = elapsed_ms(lambda: msgpack.unpackb(msgpack_body), runs)
+
+    print(f"\n{title}")
+    print(f"{'formato':<12}{'KiB':>10}{'KiB gzip':>10}{'codificar (ms)':>16}{'decodificar (ms)':>18}")
+    for name, body, encode, decode in [
+        ("JSON", json_body, encode_json, decode_json_ms),
+        ("MessagePack", msgpack_body, encode_msgpack, decode_msgpack_ms),
+    ]:
+        compressed = gzip.compress(body, compresslevel=6, mtime=0)
+        print(f"{name:<12}{len(body) / 1024:>10,.1f}{len(compressed) / 1024:>10,.1f}{encode:>16.2f}{decode:>18.2f}")
+    print(f"(conversão JSON -> MessagePack no middleware: {encode_transcoded:.2f} ms)")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--collections", type=int, nargs="+", default=[50, 200])
+    parser.add_argument("--images", type=int, default=2)
+    parser.add_argument("--image-bytes", type=int, default=30_000)
+    parser.add_argument("--runs", type=int, default=20)
+    args = parser.parse_args()
+
+    for count in args.collections:
+        report(
+            f"{count} coletas com {args.images} imagens de {args.image_bytes / 1024:.0f} KiB",
+            build_collections(count, args.images, args.image_bytes),
+            args.runs,
+        )
+        report(f"{count} coletas sem imagens", build_collections(count, 0, 0), args.runs)
+
+
+if __name__ == "__main__":
+    main()
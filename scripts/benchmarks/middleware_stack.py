@@ -0,0 +1,128 @@
+"""
+Benchmark: vazão (req/s) e latência p99 de um endpoint trivial com e sem os middlewares.
+
+As requisições são entregues diretamente à aplicação ASGI (sem servidor nem
+cliente HTTP), de modo que a diferença entre os cenários é o custo dos
+middlewares. Cenários:
+- sem middlewares
+- pilha atual (CORS + RequestLoggerMiddleware + RateLimiter, ASGI puros)
+- dois BaseHTTPMiddleware vazios, para referência do custo que a
+  implementação anterior adicionava a cada requisição
+
+Uso:
+    python -m scripts.benchmarks.middleware_stack --requests 5000 --concurrency 50
+"""
+import argparse
+import asyncio
+import os
+import statistics
+import sys
+import tempfile
+import time
+from typing import Callable, List
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+# Logs do benchmark em um diretório temporário
+os.chdir(tempfile.mkdtemp(prefix="middleware_stack_"))
+
+from fastapi import FastAPI
+from fastapi.middleware.cors import CORSMiddleware
+from starlette.middleware.base import BaseHTTPMiddleware
+
+from app.interfaces.api.middlewares.jwt_utils import get_user_id_from_token
+from app.interfaces.api.middlewares.rate_limiter import RateLimiter
+from app.interfaces.api.middlewares.request_logger import RequestLoggerMiddleware
+
+
+def build_app(stack: str) -> FastAPI:
+    app = FastAPI()
+
+    @app.get("/api/ping")
+    async def ping():
+        return {"ok": True}
+
+    if stack == "atual":
+        app.add_middleware(
+            CORSMiddleware,
+            allow_origins=["http://localhost:3000"],
+            allow_methods=["GET", "POST", "PUT", "DELETE"],
+            allow_headers=["Authorization", "Content-Type"],
+        )
+        app.add_middleware(RequestLoggerMiddleware, get_user_id=get_user_id_from_token)
+        app.add_middleware(RateLimiter, rate_limit_per_minute=10**9)
+    elif stack == "BaseHTTPMiddleware":
+        async def passthrough(request, call_next):
+            return await call_next(request)
+
+        app.add_middleware(BaseHTTPMiddleware, dispatch=passthrough)
+        app.add_middleware(BaseHTTPMiddleware, dispatch=passthrough)
+    return app
+
+
+async def call(app: FastAPI, index: int) -> float:
+    scope = {
+        "type": "http",
+        "asgi": {"version": "3.0"},
+        "http_version": "1.1",
+        "method": "GET",
+        "scheme": "http",
+        "path": "/api/ping",
+        "raw_path": b"/api/ping",
+        "query_string": b"",
+        "root_path": "",
+        "headers": [(b"host", b"bench")],
+        # Clientes distintos, para não medir só o caminho de um único contador
+        "client": (f"10.0.{index >> 8 & 255}.{index & 255}", 1234),
+        "server": ("bench", 80),
+    }
+
+    async def receive():
+        return {"type": "http.request", "body": b"", "more_body": False}
+
+    async def send(message):
+        pass
+
+    start = time.perf_counter()
+    await app(scope, receive, send)
+    return time.perf_counter() - start
+
+
+async def run(app: FastAPI, requests: int, concurrency: int) -> List[float]:
+    latencies: List[float] = []
+    counter = iter(range(requests))
+
+    async def worker() -> None:
+        for index in counter:
+            latencies.append(await call(app, index))
+
+    await asyncio.gather(*(worker() for _ in range(concurrency)))
+    return latencies
+
+
+def percentile(samples: List[float], pct: float) -> float:
+    ordered = sorted(samples)
+    return ordered[min(len(ordered) - 1, int(round(pct / 100 * (len(ordered) - 1))))]
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--requests", type=int, default=5000)
+    parser.add_argument("--concurrency", type=int, default=50)
+    args = parser.parse_args()
+
+    for stack in ("sem middlewares", "atual", "BaseHTTPMiddleware"):
+        app = build_app(stack)
+        await run(app, 200, args.concurrency)  # aquecimento
+        start = time.perf_counter()
+        latencies = await run(app, args.requests, args.concurrency)
+        elapsed = time.perf_counter() - start
+        print(
+            f"{stack:<20} {args.requests / elapsed:9.0f} req/s"
+            f"  p50 {statistics.median(latencies) * 1000:6.2f} ms"
+            f"  p99 {percentile(latencies, 99) * 1000:6.2f} ms"
+        )
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,99 @@
+"""
+Benchmark: backends do rate limiter.
+
+- custo por verificação (µs) de cada backend: memória, SQLite (WAL) e
+  armazenamento externo (com um armazenamento falso em memória)
+- correção entre processos: W processos disputam o mesmo cliente com limite L;
+  com o backend SQLite o total de requisições permitidas deve ser exatamente L,
+  enquanto com o backend em memória cada processo permite L (W x L no total)
+
+Uso:
+    python -m scripts.benchmarks.rate_limit_backends --iterations 20000 --workers 4
+"""
+import argparse
+import asyncio
+import multiprocessing
+import os
+import sys
+import tempfile
+import time
+from typing import Dict
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+from app.infrastructure.rate_limit.backend import CounterStore, RateLimitBackend
+from app.infrastructure.rate_limit.external import ExternalStoreRateLimitBackend
+from app.infrastructure.rate_limit.memory import MemoryRateLimitBackend
+from app.infrastructure.rate_limit.sqlite import SQLiteRateLimitBackend
+
+
+class InProcessCounterStore(CounterStore):
+    def __init__(self):
+        self.values: Dict[str, int] = {}
+
+    async def get(self, key: str) -> int:
+        return self.values.get(key, 0)
+
+    async def incr(self, key: str, amount: int, ttl_seconds: float) -> int:
+        self.values[key] = self.values.get(key, 0) + amount
+        return self.values[key]
+
+
+async def measure(backend: RateLimitBackend, iterations: int) -> float:
+    # 1000 clientes distintos, limite alto para medir o caminho de incremento
+    start = time.perf_counter()
+    for i in range(iterations):
+        await backend.hit("general", f"client-{i % 1000}", 1_000_000, 60)
+    return (time.perf_counter() - start) / iterations * 1e6
+
+
+def contend(kind: str, path: str, limit: int, attempts: int, start_at: float, results) -> None:
+    backend = SQLiteRateLimitBackend(path) if kind == "sqlite" else MemoryRateLimitBackend()
+
+    async def run() -> int:
+        while time.time() < start_at:
+            await asyncio.sleep(0.001)
+        allowed = 0
+        for _ in range(attempts):
+            allowed += (await backend.hit("auth", "attacker", limit, 3600)).allowed
+        return allowed
+
+    results.put(asyncio.run(run()))
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--iterations", type=int, default=20000)
+    parser.add_argument("--workers", type=int, default=4)
+    parser.add_argument("--limit", type=int, default=5)
+    args = parser.parse_args()
+
+    directory = tempfile.mkdtemp(prefix="rate_limit_")
+    backends = [
+        ("memória", MemoryRateLimitBackend()),
+        ("sqlite (WAL)", SQLiteRateLimitBackend(os.path.join(directory, "bench.db"))),
+        ("externo (falso)", ExternalStoreRateLimitBackend(InProcessCounterStore())),
+    ]
+    for name, backend in backends:
+        print(f"{name:<18} {asyncio.run(measure(backend, args.iterations)):8.2f} µs/verificação")
+        backend.close()
+
+    context = multiprocessing.get_context("spawn")
+    for kind in ("memory", "sqlite"):
+        path = os.path.join(directory, f"contend-{kind}.db")
+        results = context.Queue()
+        start_at = time.time() + 2
+        processes = [
+            context.Process(target=contend, args=(kind, path, args.limit, 200, start_at, results))
+            for _ in range(args.workers)
+        ]
+        for process in processes:
+            process.start()
+        allowed = sum(results.get() for _ in processes)
+        for process in processes:
+            process.join()
+        print(f"{kind:<8} {args.workers} workers, limite {args.limit}: {allowed} requisições permitidas")
+
+
+if __name__ == "__main__":
+    main()
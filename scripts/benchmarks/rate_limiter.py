@@ -0,0 +1,115 @@
+"""
+Benchmark: custo por requisição e memória do rate limiter.
+
+Simula requisições de N clientes distintos (padrão: 100 mil) e compara:
+- antes: lista de (timestamp, path) por cliente, refiltrada a cada requisição
+- depois: SlidingWindowCounter (slot fixo por cliente, LRU de clientes)
+
+Também mede um cliente "quente" que já fez muitas requisições na janela, caso
+em que o custo do algoritmo antigo cresce com o histórico.
+
+Uso:
+    python -m scripts.benchmarks.rate_limiter --clients 100000
+"""
+import argparse
+import os
+import sys
+import time
+import tracemalloc
+from typing import Callable, Dict, List, Tuple
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+from app.infrastructure.rate_limit.memory import SlidingWindowCounter
+
+AUTH_PATHS = ["/api/token", "/api/refresh"]
+
+
+class ListRateLimiter:
+    """Reprodução do algoritmo anterior do RateLimiter, para comparação."""
+
+    def __init__(self, limit: int, auth_limit: int, window_size: int = 60):
+        self.limit = limit
+        self.auth_limit = auth_limit
+        self.window_size = window_size
+        self.requests: Dict[str, List[Tuple[float, str]]] = {}
+
+    def hit(self, client_id: str, path: str, now: float) -> bool:
+        is_auth_path = any(path.endswith(auth_path) for auth_path in AUTH_PATHS)
+        if client_id in self.requests:
+            recent = [req for req in self.requests[client_id] if req[0] > now - self.window_size]
+            self.requests[client_id] = recent
+            if is_auth_path:
+                count = len([req for req in recent if any(req[1].endswith(p) for p in AUTH_PATHS)])
+                if count >= self.auth_limit:
+                    return False
+            elif len(recent) >= self.limit:
+                return False
+        self.requests.setdefault(client_id, []).append((now, path))
+        return True
+
+
+class CounterRateLimiter:
+    """Mesma lógica do middleware atual, sem o ASGI."""
+
+    def __init__(self, limit: int, auth_limit: int, window_size: int = 60, max_clients: int = 100_000):
+        self.limit = limit
+        self.auth_limit = auth_limit
+        self.auth_suffixes = tuple(AUTH_PATHS)
+        self.general = SlidingWindowCounter(window_size, max_clients)
+        self.auth = SlidingWindowCounter(window_size, max_clients)
+
+    def hit(self, client_id: str, path: str, now: float) -> bool:
+        if path.endswith(self.auth_suffixes):
+            return self.auth.hit(client_id, self.auth_limit, now)
+        return self.general.hit(client_id, self.limit, now)
+
+
+def run(limiter_factory: Callable[[], object], clients: List[str], rounds: int, hot_requests: int) -> None:
+    now = 1_000_000.0
+
+    def fill(limiter) -> None:
+        for round_index in range(rounds):
+            for client in clients:
+                limiter.hit(client, "/api/collections/", now + round_index)
+
+    start = time.perf_counter()
+    fill(limiter_factory())
+    elapsed = time.perf_counter() - start
+
+    # Memória medida em uma segunda execução (o tracemalloc distorce o tempo)
+    tracemalloc.start()
+    limiter = limiter_factory()
+    fill(limiter)
+    current, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    requests = rounds * len(clients)
+    print(f"  {len(clients)} clientes x {rounds}: {elapsed / requests * 1e6:6.2f} µs/requisição, {current / 1024 / 1024:7.1f} MiB")
+
+    hot = limiter_factory()
+    for i in range(hot_requests):
+        hot.hit("hot", "/api/collections/", now + i * 0.001)
+    start = time.perf_counter()
+    for i in range(1000):
+        hot.hit("hot", "/api/token", now + hot_requests * 0.001 + i * 0.001)
+    elapsed = time.perf_counter() - start
+    print(f"  cliente quente ({hot_requests} req na janela): {elapsed / 1000 * 1e6:8.2f} µs/requisição")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--clients", type=int, default=100_000)
+    parser.add_argument("--rounds", type=int, default=3)
+    parser.add_argument("--hot-requests", type=int, default=5000)
+    args = parser.parse_args()
+
+    clients = [f"10.{i >> 16 & 255}.{i >> 8 & 255}.{i & 255}" for i in range(args.clients)]
+    # Limites altos para que o custo medido seja o da contagem, não o da rejeição
+    print("antes (listas por cliente):")
+    run(lambda: ListRateLimiter(10_000, 10_000), clients, args.rounds, args.hot_requests)
+    print("depois (sliding window counter):")
+    run(lambda: CounterRateLimiter(10_000, 10_000), clients, args.rounds, args.hot_requests)
+
+
+if __name__ == "__main__":
+    main()
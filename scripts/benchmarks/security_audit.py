@@ -0,0 +1,114 @@
+"""
+Benchmark: consultas no armazenamento de auditoria de eventos de segurança.
+
+Popula um SQLiteSecurityAuditStore com N eventos (padrão: 2 milhões,
+distribuídos em 30 dias, 50 mil IPs e 20 mil usuários) pelo mesmo caminho de
+gravação em lotes usado pelo SecurityLogWriter, e mede consultas típicas de
+investigação:
+- falhas de login de um IP na última hora
+- eventos de um usuário nas últimas 24 horas
+- páginas seguintes (cursor) de um tipo de evento frequente
+
+Uso:
+    python -m scripts.benchmarks.security_audit --events 2000000
+    python -m scripts.benchmarks.security_audit --events 20000000 --path /tmp/audit.db
+"""
+import argparse
+import os
+import random
+import statistics
+import sys
+import tempfile
+import time
+from datetime import datetime, timedelta, timezone
+from typing import Callable, List
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+from app.infrastructure.utils.security_audit_store import SQLiteSecurityAuditStore
+
+EVENT_TYPES = ["api_request"] * 90 + ["login_success"] * 5 + ["login_failure"] * 4 + ["permission_denied"]
+IPS = 50_000
+USERS = 20_000
+DAYS = 30
+BATCH_SIZE = 256
+
+
+def seed(store: SQLiteSecurityAuditStore, events: int, now: float) -> float:
+    rng = random.Random(42)
+    start = time.perf_counter()
+    span = DAYS * 86400
+    for offset in range(0, events, BATCH_SIZE):
+        batch = []
+        for i in range(offset, min(events, offset + BATCH_SIZE)):
+            created = now - span + span * i / events
+            event_type = rng.choice(EVENT_TYPES)
+            batch.append({
+                "level": "WARNING" if event_type in ("login_failure", "permission_denied") else "INFO",
+                "created": created,
+                "message": {
+                    "event_id": f"event-{i}",
+                    "event_type": event_type,
+                    "user_id": f"user-{rng.randrange(USERS)}",
+                    "ip_address": f"10.{rng.randrange(IPS) // 256}.{rng.randrange(IPS) % 256}.1",
+                    "details": {"method": "GET", "path": "/api/collections/", "status_code": 200},
+                },
+            })
+        store.write(batch)
+    return time.perf_counter() - start
+
+
+def measure(name: str, runs: int, query: Callable[[], List]) -> None:
+    timings = []
+    results = 0
+    for _ in range(runs):
+        start = time.perf_counter()
+        results = len(query())
+        timings.append(time.perf_counter() - start)
+    print(f"{name:<45} mediana {statistics.median(timings) * 1000:7.2f} ms  máx {max(timings) * 1000:7.2f} ms"
+          f"  ({results} eventos)")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--events", type=int, default=2_000_000)
+    parser.add_argument("--runs", type=int, default=50)
+    parser.add_argument("--path", default=None, help="Reutiliza um banco já populado, se existir")
+    args = parser.parse_args()
+
+    path = args.path or os.path.join(tempfile.mkdtemp(prefix="security_audit_"), "audit.db")
+    store = SQLiteSecurityAuditStore(path, retention_days=DAYS + 1)
+    now = time.time()
+    if not os.path.exists(path):
+        elapsed = seed(store, args.events, now)
+        print(f"{args.events} eventos gravados em {elapsed:.1f} s ({args.events / elapsed:,.0f} eventos/s)")
+    size_mb = os.path.getsize(path) / 1024 / 1024
+    print(f"banco: {path} ({size_mb:,.0f} MB)")
+
+    rng = random.Random(7)
+    last_hour = datetime.fromtimestamp(now, timezone.utc) - timedelta(hours=1)
+    last_day = datetime.fromtimestamp(now, timezone.utc) - timedelta(days=1)
+
+    def failed_logins_by_ip():
+        ip = f"10.{rng.randrange(IPS) // 256}.{rng.randrange(IPS) % 256}.1"
+        return store.query({"event_type": "login_failure", "ip_address": ip}, since=last_hour)[0]
+
+    def events_by_user():
+        return store.query({"user_id": f"user-{rng.randrange(USERS)}"}, since=last_day)[0]
+
+    def deep_pages():
+        cursor = None
+        events: List = []
+        for _ in range(20):
+            page, cursor = store.query({"event_type": "login_failure"}, limit=100, cursor=cursor)
+            events += page
+        return events
+
+    measure("falhas de login de um IP na última hora", args.runs, failed_logins_by_ip)
+    measure("eventos de um usuário nas últimas 24 h", args.runs, events_by_user)
+    measure("20 páginas de 100 login_failure (cursor)", max(1, args.runs // 10), deep_pages)
+    store.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,148 @@
+"""
+Benchmark: custo no event loop de SecurityLogger.log_api_request.
+
+Compara, por chamada, o caminho anterior (uuid, datas, máscara e json.dumps na
+própria chamada, gravando por um logging.FileHandler síncrono) com o atual
+(apenas enfileirar no SecurityLogWriter). Um terceiro cenário simula um disco
+lento (`--disk-delay-ms` por gravação): antes cada evento esperava o disco no
+event loop; agora a espera acontece uma vez por lote, na thread de escrita.
+
+Uso:
+    python -m scripts.benchmarks.security_logger --events 20000 --disk-delay-ms 2
+"""
+import argparse
+import json
+import logging
+import os
+import sys
+import tempfile
+import time
+import uuid
+from datetime import datetime, timezone
+from typing import Any, Dict, Sequence
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+from app.infrastructure.utils.security_log_sinks import FileSecurityLogSink
+from app.infrastructure.utils.security_log_writer import SecurityLogWriter
+from app.infrastructure.utils.security_logger import SecurityLogger
+
+REQUEST_DATA = {"name": "Coleta", "items": [{"type": "plastic", "weight": 1.5}] * 5, "password": "secret"}
+
+
+class SlowFileHandler(logging.FileHandler):
+    def __init__(self, path: str, delay: float):
+        super().__init__(path)
+        self.delay = delay
+
+    def emit(self, record: logging.LogRecord) -> None:
+        time.sleep(self.delay)
+        super().emit(record)
+
+
+class SlowFileSink(FileSecurityLogSink):
+    def __init__(self, path: str, delay: float):
+        super().__init__(path)
+        self.delay = delay
+
+    def write(self, records: Sequence[Dict[str, Any]]) -> None:
+        time.sleep(self.delay)
+        super().write(records)
+
+
+def legacy_log(sync_logger: logging.Logger, i: int) -> None:
+    """Reprodução do caminho anterior de log_api_request."""
+    details = {
+        "method": "POST",
+        "path": "/api/collections/",
+        "timestamp_local": datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
+        "status_code": 201,
+        "success": True,
+        "process_time_ms": 1.5,
+        "request_data": SecurityLogger._redact(REQUEST_DATA, SecurityLogger.SENSITIVE_REQUEST_KEYS),
+    }
+    current_time = datetime.now(timezone.utc)
+    sync_logger.info(json.dumps({
+        "event_id": str(uuid.uuid4()),
+        "event_type": "api_request",
+        "timestamp": current_time.isoformat(),
+        "datetime": current_time.strftime("%Y-%m-%d %H:%M:%S %Z"),
+        "user_id": f"user-{i}",
+        "ip_address": "127.0.0.1",
+        "details": details,
+    }))
+
+
+def build_sync_logger(handler: logging.Handler) -> logging.Logger:
+    sync_logger = logging.getLogger(f"benchmark-{uuid.uuid4()}")
+    sync_logger.propagate = False
+    sync_logger.setLevel(logging.INFO)
+    handler.setFormatter(logging.Formatter(
+        '{"timestamp": "%(asctime)s", "level": "%(levelname)s", "message": %(message)s}'
+    ))
+    sync_logger.addHandler(handler)
+    return sync_logger
+
+
+def bench_legacy(handler: logging.Handler, events: int) -> float:
+    sync_logger = build_sync_logger(handler)
+    start = time.perf_counter()
+    for i in range(events):
+        legacy_log(sync_logger, i)
+    elapsed = time.perf_counter() - start
+    handler.close()
+    return elapsed
+
+
+def bench_writer(writer: SecurityLogWriter, events: int) -> float:
+    start = time.perf_counter()
+    for i in range(events):
+        writer.enqueue(
+            logging.INFO,
+            "api_request",
+            f"user-{i}",
+            "127.0.0.1",
+            {"method": "POST", "path": "/api/collections/", "status_code": 201, "request_data": REQUEST_DATA},
+            True,
+            SecurityLogger._prepare_details,
+        )
+    elapsed = time.perf_counter() - start
+    writer.close(timeout=60)
+    return elapsed
+
+
+def report(name: str, elapsed: float, events: int, extra: str = "") -> None:
+    print(f"{name:<40} {elapsed / events * 1e6:9.2f} µs/evento no event loop{extra}")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--events", type=int, default=20000)
+    parser.add_argument("--disk-delay-ms", type=float, default=2.0)
+    args = parser.parse_args()
+    directory = tempfile.mkdtemp(prefix="security_logger_")
+    delay = args.disk_delay_ms / 1000
+    # Com disco lento, poucos eventos bastam para mostrar a diferença
+    slow_events = min(args.events, 500)
+
+    elapsed = bench_legacy(logging.FileHandler(os.path.join(directory, "legacy.log")), args.events)
+    report("antes: FileHandler síncrono", elapsed, args.events)
+
+    writer = SecurityLogWriter([FileSecurityLogSink(os.path.join(directory, "writer.log"))], max_queue_size=args.events)
+    elapsed = bench_writer(writer, args.events)
+    stats = writer.stats()
+    report("agora: fila + thread de escrita", elapsed, args.events,
+           f"  ({stats['batches']} lotes, descartados {stats['dropped']}, atraso máx. {stats['max_lag_ms']} ms)")
+
+    elapsed = bench_legacy(SlowFileHandler(os.path.join(directory, "legacy-slow.log"), delay), slow_events)
+    report(f"antes, disco lento ({args.disk_delay_ms} ms)", elapsed, slow_events)
+
+    writer = SecurityLogWriter([SlowFileSink(os.path.join(directory, "writer-slow.log"), delay)])
+    elapsed = bench_writer(writer, slow_events)
+    stats = writer.stats()
+    report(f"agora, disco lento ({args.disk_delay_ms} ms)", elapsed, slow_events,
+           f"  ({stats['batches']} lotes, atraso máx. {stats['max_lag_ms']} ms)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,127 @@
+"""
+Benchmark: serialização da listagem de coletas (GET /api/collections/).
+
+Serializa N coletas (padrão: 10 mil) de duas formas e mede, por resposta:
+- tempo e vazão (coletas/s)
+- pico de memória alocada durante a serialização, com tracemalloc
+
+Cenários:
+- antes: cada entidade copiada campo a campo para um CollectionResponse e a
+  lista validada de novo pelo `response_model` do FastAPI
+  (serialize_response) antes do JSONResponse
+- EntitySerializer: caminho usado pelas rotas (campos lidos das entidades e
+  codificados pelo orjson)
+
+Uso:
+    python -m scripts.benchmarks.serialization --collections 10000
+"""
+import argparse
+import asyncio
+import os
+import sys
+import time
+import tracemalloc
+import uuid
+from datetime import datetime
+from typing import Callable, List, Tuple
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+from fastapi.responses import JSONResponse
+from fastapi.routing import serialize_response
+from fastapi.utils import create_model_field
+
+from app.domain.entities.collection import Collection, CollectionStatus
+from app.interfaces.api import serialization
+from app.interfaces.api.schemas.collection import CollectionResponse
+
+
+def build_collections(count: int) -> List[Collection]:
+    now = datetime.utcnow()
+    return [
+        Collection(
+            # Como no banco: identificadores em texto
+            id=str(uuid.uuid4()),
+            user_id=str(uuid.uuid4()),
+            description=f"Coleta de recicláveis {i}: papelão, garrafas PET e latas",
+            location_latitude=-23.5 + i / count,
+            location_longitude=-46.6 - i / count,
+            zip_code="01001-000",
+            images=["data:image/jpeg;base64,/9j/4AAQSkZJRgABAQ"],
+            status=CollectionStatus.REQUESTED,
+            created_at=now,
+            updated_at=now,
+            company_id=str(uuid.uuid4()),
+        )
+        for i in range(count)
+    ]
+
+
+response_field = create_model_field(name="Response_get_collections", type_=List[CollectionResponse], mode="serialization")
+
+
+def before(collections: List[Collection]) -> bytes:
+    content = [
+        CollectionResponse(
+            id=collection.id,
+            user_id=collection.user_id,
+            description=collection.description,
+            location_latitude=collection.location_latitude,
+            location_longitude=collection.location_longitude,
+            zip_code=collection.zip_code,
+            images=collection.images,
+            status=collection.status,
+            created_at=collection.created_at,
+            updated_at=collection.updated_at,
+            collector_id=collection.collector_id,
+            company_id=collection.company_id,
+        )
+        for collection in collections
+    ]
+    jsonable = asyncio.run(serialize_response(field=response_field, response_content=content))
+    return JSONResponse(jsonable).body
+
+
+def entity_serializer(collections: List[Collection]) -> bytes:
+    return serialization.collection_serializer.list_response(collections).body
+
+
+def timing(func: Callable[[List[Collection]], bytes], collections: List[Collection], runs: int) -> Tuple[float, int]:
+    body = func(collections)
+    start = time.perf_counter()
+    for _ in range(runs):
+        func(collections)
+    return (time.perf_counter() - start) / runs, len(body)
+
+
+def peak_allocation(func: Callable[[List[Collection]], bytes], collections: List[Collection]) -> float:
+    """Retorna o pico de memória alocada (MiB) em uma serialização."""
+    tracemalloc.start()
+    func(collections)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return peak / 1024 / 1024
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--collections", type=int, default=10_000)
+    parser.add_argument("--runs", type=int, default=5)
+    args = parser.parse_args()
+
+    collections = build_collections(args.collections)
+    scenarios = [("antes", before), ("EntitySerializer", entity_serializer)]
+
+    print(f"{args.collections} coletas")
+    print(f"{'cenário':<28}{'ms/resp.':>10}{'coletas/s':>12}{'KiB':>10}{'pico MiB':>10}")
+    for name, func in scenarios:
+        seconds, size = timing(func, collections, args.runs)
+        peak = peak_allocation(func, collections)
+        print(
+            f"{name:<28}{seconds * 1000:>10.1f}{args.collections / seconds:>12,.0f}"
+            f"{size / 1024:>10,.0f}{peak:>10.1f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,186 @@
+"""
+Benchmark: construção de serviços por requisição vs. container de dependências.
+
+- inicialização: custo de criar os serviços de escopo de aplicação
+  (init_app_services), pago uma única vez por processo
+- alocação: memória alocada para montar as dependências de um handler de
+  usuários, no formato antigo (AuthService + CryptContext novos a cada
+  requisição) e com o container (AuthService compartilhado)
+- requisições: vazão e latência de uma rota FastAPI que depende de
+  UserUseCases, resolvida pelo próprio FastAPI, com:
+  - antes: provedores síncronos criando o AuthService a cada requisição
+  - provedores síncronos: container, mas cada provedor `def` passa pelo
+    threadpool (um salto de thread por provedor)
+  - container: os provedores `async def` de app.interfaces.api.dependencies
+
+A sessão do banco é substituída por um objeto vazio: o handler não consulta o
+banco, de modo que a diferença entre os cenários é a resolução das dependências.
+
+Uso:
+    python -m scripts.benchmarks.service_container --requests 5000 --concurrency 50
+"""
+import argparse
+import asyncio
+import os
+import statistics
+import sys
+import time
+import tracemalloc
+from typing import Callable, List, Tuple
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+from fastapi import Depends, FastAPI
+
+from app.application.services.auth_service import AuthService
+from app.application.use_cases.user_use_cases import UserUseCases
+from app.infrastructure.config import get_settings
+from app.infrastructure.database.database import get_db
+from app.infrastructure.repositories.user_repository_impl import UserRepositoryImpl
+from app.interfaces.api import dependencies
+
+settings = get_settings()
+
+
+def per_request_before(db: object) -> UserUseCases:
+    auth_service = AuthService(
+        secret_key=settings.secret_key,
+        algorithm=settings.algorithm,
+        access_token_expire_minutes=settings.access_token_expire_minutes,
+    )
+    return UserUseCases(UserRepositoryImpl(db), auth_service)
+
+
+def per_request_after(db: object) -> UserUseCases:
+    return UserUseCases(UserRepositoryImpl(db), dependencies.get_auth_service())
+
+
+# Provedores síncronos, como eram antes de se tornarem `async def`
+
+def sync_user_repository(db=Depends(get_db)) -> UserRepositoryImpl:
+    return UserRepositoryImpl(db)
+
+
+def sync_auth_service() -> AuthService:
+    return dependencies.get_auth_service()
+
+
+def sync_user_use_cases(
+    user_repository: UserRepositoryImpl = Depends(sync_user_repository),
+    auth_service: AuthService = Depends(sync_auth_service),
+) -> UserUseCases:
+    return UserUseCases(user_repository, auth_service)
+
+
+def before_user_use_cases(user_repository: UserRepositoryImpl = Depends(sync_user_repository)) -> UserUseCases:
+    return per_request_before(user_repository.db)
+
+
+async def fake_db():
+    yield object()
+
+
+def build_app(provider: Callable) -> FastAPI:
+    app = FastAPI()
+    app.dependency_overrides[get_db] = fake_db
+
+    @app.get("/api/users/ping")
+    async def ping(user_use_cases: UserUseCases = Depends(provider)):
+        return {"ok": user_use_cases is not None}
+
+    return app
+
+
+async def call(app: FastAPI) -> float:
+    scope = {
+        "type": "http",
+        "asgi": {"version": "3.0"},
+        "http_version": "1.1",
+        "method": "GET",
+        "scheme": "http",
+        "path": "/api/users/ping",
+        "raw_path": b"/api/users/ping",
+        "query_string": b"",
+        "root_path": "",
+        "headers": [(b"host", b"bench")],
+        "client": ("10.0.0.1", 1234),
+        "server": ("bench", 80),
+    }
+
+    async def receive():
+        return {"type": "http.request", "body": b"", "more_body": False}
+
+    async def send(message):
+        pass
+
+    start = time.perf_counter()
+    await app(scope, receive, send)
+    return time.perf_counter() - start
+
+
+async def run(app: FastAPI, requests: int, concurrency: int) -> List[float]:
+    latencies: List[float] = []
+    counter = iter(range(requests))
+
+    async def worker() -> None:
+        for _ in counter:
+            latencies.append(await call(app))
+
+    await asyncio.gather(*(worker() for _ in range(concurrency)))
+    return latencies
+
+
+def percentile(samples: List[float], pct: float) -> float:
+    ordered = sorted(samples)
+    return ordered[min(len(ordered) - 1, int(round(pct / 100 * (len(ordered) - 1))))]
+
+
+def allocations(func: Callable[[object], object], iterations: int) -> Tuple[float, int]:
+    """Retorna (KiB alocados por requisição, blocos alocados por requisição)."""
+    tracemalloc.start()
+    snapshot_before = tracemalloc.take_snapshot()
+    kept = [func(None) for _ in range(iterations)]
+    snapshot_after = tracemalloc.take_snapshot()
+    tracemalloc.stop()
+    stats = snapshot_after.compare_to(snapshot_before, "filename")
+    size = sum(stat.size_diff for stat in stats)
+    count = sum(stat.count_diff for stat in stats)
+    del kept
+    return size / iterations / 1024, count // iterations
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--requests", type=int, default=5000)
+    parser.add_argument("--concurrency", type=int, default=50)
+    args = parser.parse_args()
+
+    start = time.perf_counter()
+    dependencies.init_app_services()
+    print(f"inicialização (init_app_services)  {(time.perf_counter() - start) * 1000:8.2f} ms")
+
+    for name, func in [("antes (por requisição)", per_request_before), ("container", per_request_after)]:
+        func(None)
+        kib, blocks = allocations(func, 500)
+        print(f"{name:<24} {kib:7.2f} KiB  {blocks:5d} blocos por requisição")
+
+    scenarios = [
+        ("antes", before_user_use_cases),
+        ("provedores síncronos", sync_user_use_cases),
+        ("container (async)", dependencies.get_user_use_cases),
+    ]
+    for name, provider in scenarios:
+        app = build_app(provider)
+        await run(app, 200, args.concurrency)  # aquecimento
+        start = time.perf_counter()
+        latencies = await run(app, args.requests, args.concurrency)
+        elapsed = time.perf_counter() - start
+        print(
+            f"{name:<24} {args.requests / elapsed:9.0f} req/s"
+            f"  p50 {statistics.median(latencies) * 1000:6.2f} ms"
+            f"  p99 {percentile(latencies, 99) * 1000:6.2f} ms"
+        )
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
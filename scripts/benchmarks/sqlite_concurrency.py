@@ -0,0 +1,163 @@
+"""
+Benchmark: leituras concorrentes no SQLite com um escritor ativo.
+
+Para cada número de workers (processos, como os do uvicorn), cada worker
+roda `--tasks` tarefas que listam as coletas de um usuário aleatório e
+um processo extra atualiza o status de coletas sem parar. Compara o engine
+padrão (journal em rollback, sem pragmas, um pool comum) com o perfil
+SQLite da aplicação (WAL, `synchronous=NORMAL`, `busy_timeout`, mmap,
+um escritor serializado e um pool de leitura `query_only`) e mostra
+leituras/s, escritas/s e erros ("database is locked").
+
+Uso:
+    python -m scripts.benchmarks.sqlite_concurrency --workers 1 2 4 --seconds 5
+"""
+import argparse
+import asyncio
+import multiprocessing
+import os
+import random
+import sys
+import tempfile
+import time
+import uuid
+from datetime import datetime
+from typing import Tuple
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+from sqlalchemy.orm import sessionmaker
+
+from app.infrastructure.config import Settings
+from app.infrastructure.database.database import Base
+from app.infrastructure.database.models import CollectionModel, UserModel
+from app.infrastructure.database.sqlite import RoutingSession, create_sqlite_engines
+
+USERS = 200
+COLLECTIONS_PER_USER = 20
+
+
+def build_session_factory(url: str, profile: bool):
+    if profile:
+        writer, reader = create_sqlite_engines(Settings(database_url=url))
+        factory = sessionmaker(
+            class_=AsyncSession, sync_session_class=RoutingSession, writer=writer, reader=reader, expire_on_commit=False
+        )
+        return factory, [writer, reader]
+    engine = create_async_engine(url)
+    return sessionmaker(engine, class_=AsyncSession, expire_on_commit=False), [engine]
+
+
+async def seed(url: str) -> None:
+    engine = create_async_engine(url)
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+    now = datetime.utcnow()
+    async with sessionmaker(engine, class_=AsyncSession)() as db:
+        for u in range(USERS):
+            user_id = f"user-{u}"
+            db.add(UserModel(id=user_id, username=user_id, email=f"{user_id}@example.com", hashed_password="x"))
+            for c in range(COLLECTIONS_PER_USER):
+                db.add(
+                    CollectionModel(
+                        id=str(uuid.uuid4()),
+                        user_id=user_id,
+                        description=f"coleta {c}",
+                        zip_code="01001-000",
+                        images=[],
+                        status="REQUESTED",
+                        created_at=now,
+                        updated_at=now,
+                    )
+                )
+        await db.commit()
+    await engine.dispose()
+
+
+async def read_worker(url: str, profile: bool, tasks: int, seconds: float) -> Tuple[int, int]:
+    factory, engines = build_session_factory(url, profile)
+    deadline = time.perf_counter() + seconds
+    reads = errors = 0
+
+    async def task(seed_value: int) -> None:
+        nonlocal reads, errors
+        rng = random.Random(seed_value)
+        while time.perf_counter() < deadline:
+            try:
+                async with factory() as db:
+                    query = select(CollectionModel).where(CollectionModel.user_id == f"user-{rng.randrange(USERS)}")
+                    (await db.execute(query)).scalars().all()
+                reads += 1
+            except Exception:
+                errors += 1
+
+    await asyncio.gather(*(task(os.getpid() * 1000 + i) for i in range(tasks)))
+    for engine in engines:
+        await engine.dispose()
+    return reads, errors
+
+
+async def write_worker(url: str, profile: bool, seconds: float) -> Tuple[int, int]:
+    factory, engines = build_session_factory(url, profile)
+    deadline = time.perf_counter() + seconds
+    rng = random.Random(7)
+    writes = errors = 0
+    while time.perf_counter() < deadline:
+        try:
+            async with factory() as db:
+                user_id = f"user-{rng.randrange(USERS)}"
+                collection = (
+                    await db.execute(select(CollectionModel).where(CollectionModel.user_id == user_id).limit(1))
+                ).scalars().first()
+                collection.status = rng.choice(["ASSIGNED", "IN_PROGRESS", "REQUESTED"])
+                collection.updated_at = datetime.utcnow()
+                await db.commit()
+            writes += 1
+        except Exception:
+            errors += 1
+    for engine in engines:
+        await engine.dispose()
+    return writes, errors
+
+
+def run_reader(args) -> Tuple[int, int]:
+    return asyncio.run(read_worker(*args))
+
+
+def run_writer(args) -> Tuple[int, int]:
+    return asyncio.run(write_worker(*args))
+
+
+def measure(url: str, profile: bool, workers: int, tasks: int, seconds: float):
+    context = multiprocessing.get_context("spawn")
+    with context.Pool(workers + 1) as pool:
+        writer = pool.apply_async(run_writer, ((url, profile, seconds),))
+        readers = pool.map(run_reader, [(url, profile, tasks, seconds)] * workers)
+        writes, write_errors = writer.get()
+    reads = sum(result[0] for result in readers)
+    read_errors = sum(result[1] for result in readers)
+    return reads / seconds, writes / seconds, read_errors + write_errors
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--workers", type=int, nargs="+", default=[1, 2, 4])
+    parser.add_argument("--tasks", type=int, default=16)
+    parser.add_argument("--seconds", type=float, default=5.0)
+    args = parser.parse_args()
+
+    directory = tempfile.mkdtemp(prefix="sqlite_concurrency_")
+    print(f"núcleos: {os.cpu_count()}  coletas: {USERS * COLLECTIONS_PER_USER}")
+    print(f"{'workers':>7}  {'modo':<8}{'leituras/s':>12}{'escritas/s':>12}{'erros':>8}")
+    for name, profile in [("padrão", False), ("perfil", True)]:
+        url = f"sqlite+aiosqlite:///{directory}/{name}.db"
+        asyncio.run(seed(url))
+        for workers in args.workers:
+            reads, writes, errors = measure(url, profile, workers, args.tasks, args.seconds)
+            print(f"{workers:>7}  {name:<8}{reads:>12,.0f}{writes:>12,.0f}{errors:>8}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,84 @@
+"""
+Benchmark: importação de usuários em lote.
+
+Compara, para N usuários:
+- sequencial: um create_user por usuário (bcrypt + INSERT + commit por linha)
+- importação: UserUseCases.import_users (verificação de unicidade em uma
+  consulta, bcrypt paralelo no pool de processos e INSERT em lotes)
+
+Uso:
+    python -m scripts.benchmarks.user_import --users 200
+"""
+import argparse
+import asyncio
+import os
+import sys
+import tempfile
+import time
+
+# Banco e logs temporários precisam estar definidos antes de importar a aplicação
+_DB_DIR = tempfile.mkdtemp(prefix="user_import_")
+os.environ.setdefault("DATABASE_URL", f"sqlite+aiosqlite:///{_DB_DIR}/bench.db")
+# Logs de segurança no mesmo diretório, fora do ./logs do projeto
+os.environ.setdefault("SECURITY_LOG_PATH", os.path.join(_DB_DIR, "security.log"))
+os.environ.setdefault("SECURITY_AUDIT_DB_PATH", os.path.join(_DB_DIR, "security_audit.db"))
+os.environ.setdefault("RATE_LIMIT_SQLITE_PATH", os.path.join(_DB_DIR, "rate_limit.db"))
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+from app.application.services.auth_service import AuthService
+from app.application.use_cases.user_use_cases import UserUseCases
+from app.domain.entities.user import UserRole
+from app.infrastructure.database.database import Base, SessionLocal, engine
+from app.infrastructure.repositories.user_repository_impl import UserRepositoryImpl
+from app.infrastructure.utils.password_hashing import get_password_hash_process_pool
+
+
+def build_rows(prefix: str, count: int):
+    return [
+        {
+            "username": f"{prefix}{i}",
+            "email": f"{prefix}{i}@example.com",
+            "password": f"password-{i}",
+            "role": UserRole.REGULAR,
+        }
+        for i in range(count)
+    ]
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--users", type=int, default=200)
+    args = parser.parse_args()
+
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+
+    auth_service = AuthService(secret_key="bench")
+    # Sobe os processos antes da medição
+    await auth_service.get_password_hashes_parallel(["warmup"] * (os.cpu_count() or 1))
+
+    async with SessionLocal() as db:
+        use_cases = UserUseCases(UserRepositoryImpl(db), auth_service)
+        start = time.perf_counter()
+        for row in build_rows("seq", args.users):
+            await use_cases.create_user(**row)
+        sequential = time.perf_counter() - start
+
+    async with SessionLocal() as db:
+        use_cases = UserUseCases(UserRepositoryImpl(db), auth_service)
+        start = time.perf_counter()
+        created, failures = await use_cases.import_users(build_rows("imp", args.users))
+        imported = time.perf_counter() - start
+
+    print(f"núcleos: {os.cpu_count()}  usuários: {args.users}")
+    print(f"sequencial  {sequential:7.2f} s  {args.users / sequential:8.1f} usuários/s")
+    print(f"importação  {imported:7.2f} s  {len(created) / imported:8.1f} usuários/s  falhas: {len(failures)}")
+
+    get_password_hash_process_pool().shutdown()
+    await engine.dispose()
+
+
+if __name__ == "__main__":
+    # Necessário por causa do pool de processos com "spawn"
+    asyncio.run(main())
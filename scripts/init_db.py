@@ -9,8 +9,9 @@ sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 from app.application.services.auth_service import AuthService
 from app.domain.entities.user import UserRole
 from app.infrastructure.config import get_settings
-from app.infrastructure.database.database import Base, get_db
+from app.infrastructure.database.database import get_db
 from app.infrastructure.database.models import UserModel
+from app.infrastructure.database.schema_upgrades import upgrade_schema
 from sqlalchemy.ext.asyncio import create_async_engine, AsyncSession
 from sqlalchemy import select
 
@@ -21,9 +22,12 @@ async def init_db():
     # Create engine
     engine = create_async_engine(settings.database_url)
 
-    # Create tables
+    # Apply the Alembic migrations (adopting databases created by create_all)
     async with engine.begin() as conn:
-        await conn.run_sync(Base.metadata.create_all)
+        migrated = await conn.run_sync(upgrade_schema)
+        if migrated:
+            print(f"Migrated {migrated} refresh tokens to hashed storage")
+    await engine.dispose()
 
     # Create admin user
     auth_service = AuthService(
@@ -13,5 +13,8 @@ fi
 # Ativar ambiente virtual
 source venv/bin/activate
 
+# Com vários workers, os contadores do rate limiter precisam ser compartilhados
+export RATE_LIMIT_BACKEND=${RATE_LIMIT_BACKEND:-sqlite}
+
 # Iniciar servidor em modo de produção com a porta fixa
 uvicorn app.main:app --host 0.0.0.0 --port $PORT --workers 4
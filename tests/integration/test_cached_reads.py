@@ -0,0 +1,159 @@
+from typing import List
+
+import httpx
+import msgpack
+import pytest
+from fastapi import FastAPI
+from sqlalchemy import event
+
+from app.domain.entities.collection import Collection
+from app.domain.entities.company import Company
+from app.domain.entities.user import User, UserRole
+from app.infrastructure.auth.jwt import get_current_admin_user, get_current_user
+from app.infrastructure.database.database import get_db
+from app.infrastructure.repositories.collection_repository_impl import CollectionRepositoryImpl
+from app.infrastructure.repositories.company_repository_impl import CompanyRepositoryImpl
+from app.infrastructure.repositories.user_repository_impl import UserRepositoryImpl
+from app.infrastructure.utils.payload_cache import get_payload_cache
+from app.interfaces.api.controllers import collections, companies
+from app.interfaces.api.middlewares.message_pack import MessagePackMiddleware
+
+
+def _build_app(db_session, current_user: User) -> FastAPI:
+    app = FastAPI()
+    app.include_router(companies.router, prefix="/api/companies")
+    app.include_router(collections.router, prefix="/api/collections")
+
+    async def override_get_db():
+        yield db_session
+
+    app.dependency_overrides[get_db] = override_get_db
+    app.dependency_overrides[get_current_user] = lambda: current_user
+    app.dependency_overrides[get_current_admin_user] = lambda: current_user
+    return app
+
+
+async def _seed(db_session):
+    get_payload_cache().clear()
+    user = await UserRepositoryImpl(db_session).create(
+        User(username="maria", email="maria@example.com", hashed_password="x", role=UserRole.ADMIN)
+    )
+    company = await CompanyRepositoryImpl(db_session).create(
+        Company(name="Recicla", description="Coleta seletiva", zip_codes=["01001-000", "01002-000"])
+    )
+    collection = await CollectionRepositoryImpl(db_session).create(
+        Collection(
+            user_id=user.id,
+            description="Garrafas PET e papelão",
+            location_latitude=-23.5,
+            location_longitude=-46.6,
+            zip_code="01001-000",
+            images=["data:image/png;base64,AAAA"],
+            company_id=company.id,
+        )
+    )
+    return user, company, collection
+
+
+def _record_statements(db_session) -> List[str]:
+    statements: List[str] = []
+
+    def before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+        statements.append(statement)
+
+    event.listen(db_session.bind.sync_engine, "before_cursor_execute", before_cursor_execute)
+    return statements
+
+
+@pytest.mark.asyncio
+async def test_cached_collection_read_only_checks_the_version(db_session):
+    # Arrange
+    user, _, collection = await _seed(db_session)
+    app = _build_app(db_session, user)
+
+    async with httpx.AsyncClient(transport=httpx.ASGITransport(app=app), base_url="http://test") as client:
+        first = await client.get(f"/api/collections/{collection.id}")
+        statements = _record_statements(db_session)
+
+        # Act
+        second = await client.get(f"/api/collections/{collection.id}")
+
+    # Assert
+    assert second.status_code == 200
+    assert second.content == first.content
+    assert second.headers["ETag"] == first.headers["ETag"]
+    assert len(statements) == 1
+    assert "images" not in statements[0]
+
+
+@pytest.mark.asyncio
+async def test_cached_company_list_skips_zip_code_queries(db_session):
+    # Arrange
+    user, _, _ = await _seed(db_session)
+    app = _build_app(db_session, user)
+
+    async with httpx.AsyncClient(transport=httpx.ASGITransport(app=app), base_url="http://test") as client:
+        first = await client.get("/api/companies/")
+        statements = _record_statements(db_session)
+
+        # Act
+        second = await client.get("/api/companies/")
+
+    # Assert
+    assert second.content == first.content
+    assert len(statements) == 1
+    assert "zip_codes" not in statements[0]
+
+
+@pytest.mark.asyncio
+async def test_repository_writes_invalidate_cached_payloads(db_session):
+    # Arrange
+    user, company, collection = await _seed(db_session)
+    app = _build_app(db_session, user)
+    cache = get_payload_cache()
+
+    async with httpx.AsyncClient(transport=httpx.ASGITransport(app=app), base_url="http://test") as client:
+        await client.get(f"/api/collections/{collection.id}")
+        await client.get(f"/api/companies/{company.id}")
+        await client.get("/api/companies/")
+
+        # Act
+        collection.description = "Garrafas PET, papelão e latas"
+        await CollectionRepositoryImpl(db_session).update(collection)
+        company.zip_codes = ["01001-000"]
+        await CompanyRepositoryImpl(db_session).update(company)
+        entities = cache.stats()["entities"]
+        collection_after = await client.get(f"/api/collections/{collection.id}")
+        company_after = await client.get(f"/api/companies/{company.id}")
+
+    # Assert
+    assert entities["collection"]["entries"] == 0
+    assert entities["company"]["entries"] == 0
+    assert entities["companies"]["entries"] == 0
+    assert collection_after.json()["description"] == "Garrafas PET, papelão e latas"
+    assert company_after.json()["zip_codes"] == ["01001-000"]
+
+
+@pytest.mark.asyncio
+async def test_cached_payloads_are_kept_per_format(db_session):
+    # Arrange
+    user, _, collection = await _seed(db_session)
+    app = _build_app(db_session, user)
+    app.add_middleware(MessagePackMiddleware)
+
+    async with httpx.AsyncClient(transport=httpx.ASGITransport(app=app), base_url="http://test") as client:
+        as_json = await client.get(f"/api/collections/{collection.id}")
+
+        # Act: o JSON em cache não atende a leitura em MessagePack
+        as_msgpack = await client.get(f"/api/collections/{collection.id}", headers={"Accept": "application/msgpack"})
+        hits = get_payload_cache().hits
+        cached_msgpack = await client.get(
+            f"/api/collections/{collection.id}", headers={"Accept": "application/msgpack"}
+        )
+
+    # Assert
+    assert as_json.headers["Content-Type"] == "application/json"
+    assert as_msgpack.headers["Content-Type"] == "application/msgpack"
+    assert cached_msgpack.content == as_msgpack.content
+    assert msgpack.unpackb(as_msgpack.content)["id"] == as_json.json()["id"]
+    assert get_payload_cache().hits == hits + 1
@@ -0,0 +1,176 @@
+from typing import List
+
+import httpx
+import pytest
+from fastapi import FastAPI
+from sqlalchemy import event
+
+from app.domain.entities.collection import Collection
+from app.domain.entities.company import Company
+from app.domain.entities.user import User, UserRole
+from app.infrastructure.auth.jwt import get_current_admin_user, get_current_user
+from app.infrastructure.database.database import get_db
+from app.infrastructure.repositories.collection_repository_impl import CollectionRepositoryImpl
+from app.infrastructure.repositories.company_repository_impl import CompanyRepositoryImpl
+from app.infrastructure.repositories.user_repository_impl import UserRepositoryImpl
+from app.interfaces.api.controllers import collections, companies, users
+
+
+def _build_app(db_session, current_user: User) -> FastAPI:
+    app = FastAPI()
+    app.include_router(users.router, prefix="/api/users")
+    app.include_router(companies.router, prefix="/api/companies")
+    app.include_router(collections.router, prefix="/api/collections")
+
+    async def override_get_db():
+        yield db_session
+
+    app.dependency_overrides[get_db] = override_get_db
+    app.dependency_overrides[get_current_user] = lambda: current_user
+    app.dependency_overrides[get_current_admin_user] = lambda: current_user
+    return app
+
+
+async def _seed(db_session):
+    user = await UserRepositoryImpl(db_session).create(
+        User(username="maria", email="maria@example.com", hashed_password="x", role=UserRole.ADMIN)
+    )
+    company = await CompanyRepositoryImpl(db_session).create(
+        Company(name="Recicla", description="Coleta seletiva", zip_codes=["01001-000"])
+    )
+    collection = await CollectionRepositoryImpl(db_session).create(
+        Collection(
+            user_id=user.id,
+            description="Garrafas PET e papelão",
+            location_latitude=-23.5,
+            location_longitude=-46.6,
+            zip_code="01001-000",
+            images=["data:image/png;base64,AAAA"],
+            company_id=company.id,
+        )
+    )
+    return user, company, collection
+
+
+def _count_statements(db_session) -> List[str]:
+    statements: List[str] = []
+
+    def before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+        statements.append(statement)
+
+    event.listen(db_session.bind.sync_engine, "before_cursor_execute", before_cursor_execute)
+    return statements
+
+
+@pytest.mark.asyncio
+async def test_unchanged_collection_is_revalidated_with_one_light_query(db_session):
+    # Arrange
+    user, _, collection = await _seed(db_session)
+    app = _build_app(db_session, user)
+
+    async with httpx.AsyncClient(transport=httpx.ASGITransport(app=app), base_url="http://test") as client:
+        first = await client.get(f"/api/collections/{collection.id}")
+        statements = _count_statements(db_session)
+
+        # Act
+        second = await client.get(
+            f"/api/collections/{collection.id}", headers={"If-None-Match": first.headers["ETag"]}
+        )
+
+    # Assert
+    assert first.status_code == 200
+    assert first.headers["ETag"].startswith('W/"')
+    assert second.status_code == 304
+    assert second.content == b""
+    assert second.headers["ETag"] == first.headers["ETag"]
+    assert len(statements) == 1
+    assert "images" not in statements[0]
+
+
+@pytest.mark.asyncio
+async def test_collection_update_changes_etag(db_session):
+    # Arrange
+    user, _, collection = await _seed(db_session)
+    app = _build_app(db_session, user)
+
+    async with httpx.AsyncClient(transport=httpx.ASGITransport(app=app), base_url="http://test") as client:
+        first = await client.get(f"/api/collections/{collection.id}")
+        listing = await client.get("/api/collections/")
+        collection.description = "Garrafas PET, papelão e latas"
+        await CollectionRepositoryImpl(db_session).update(collection)
+
+        # Act
+        second = await client.get(
+            f"/api/collections/{collection.id}", headers={"If-None-Match": first.headers["ETag"]}
+        )
+        listing_after = await client.get("/api/collections/", headers={"If-None-Match": listing.headers["ETag"]})
+
+    # Assert
+    assert second.status_code == 200
+    assert second.json()["description"] == "Garrafas PET, papelão e latas"
+    assert second.headers["ETag"] != first.headers["ETag"]
+    assert listing_after.status_code == 200
+    assert listing_after.headers["ETag"] != listing.headers["ETag"]
+
+
+@pytest.mark.asyncio
+async def test_collection_list_is_not_modified_until_an_item_is_deleted(db_session):
+    # Arrange
+    user, _, collection = await _seed(db_session)
+    app = _build_app(db_session, user)
+
+    async with httpx.AsyncClient(transport=httpx.ASGITransport(app=app), base_url="http://test") as client:
+        first = await client.get("/api/collections/")
+        etag = first.headers["ETag"]
+
+        # Act
+        unchanged = await client.get("/api/collections/", headers={"If-None-Match": etag})
+        await CollectionRepositoryImpl(db_session).delete(collection.id)
+        after_delete = await client.get("/api/collections/", headers={"If-None-Match": etag})
+
+    # Assert
+    assert unchanged.status_code == 304
+    assert after_delete.status_code == 200
+    assert after_delete.json() == []
+
+
+@pytest.mark.asyncio
+async def test_zip_code_only_company_change_changes_etag(db_session):
+    # Arrange
+    user, company, _ = await _seed(db_session)
+    app = _build_app(db_session, user)
+
+    async with httpx.AsyncClient(transport=httpx.ASGITransport(app=app), base_url="http://test") as client:
+        first = await client.get(f"/api/companies/{company.id}")
+        unchanged = await client.get(
+            f"/api/companies/{company.id}", headers={"If-None-Match": first.headers["ETag"]}
+        )
+
+        # Act
+        await client.put(f"/api/companies/{company.id}", json={"zip_codes": ["01001-000", "01002-000"]})
+        second = await client.get(
+            f"/api/companies/{company.id}", headers={"If-None-Match": first.headers["ETag"]}
+        )
+
+    # Assert
+    assert unchanged.status_code == 304
+    assert second.status_code == 200
+    assert second.json()["zip_codes"] == ["01001-000", "01002-000"]
+
+
+@pytest.mark.asyncio
+async def test_current_user_info_honours_if_none_match(db_session):
+    # Arrange
+    user, _, _ = await _seed(db_session)
+    app = _build_app(db_session, user)
+
+    async with httpx.AsyncClient(transport=httpx.ASGITransport(app=app), base_url="http://test") as client:
+        first = await client.get("/api/users/me")
+
+        # Act
+        second = await client.get("/api/users/me", headers={"If-None-Match": f'"x", {first.headers["ETag"]}'})
+
+    # Assert
+    assert first.status_code == 200
+    assert first.headers["Cache-Control"] == "private, no-cache"
+    assert second.status_code == 304
@@ -0,0 +1,279 @@
+import asyncio
+import random
+import re
+import shutil
+import uuid
+from contextlib import contextmanager
+from datetime import datetime, timedelta
+from typing import Any, Dict, List, Tuple
+
+import pytest
+import pytest_asyncio
+from sqlalchemy import event, insert, text
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+from sqlalchemy.orm import sessionmaker
+
+from app.domain.entities.collection import CollectionStatus
+from app.domain.entities.refresh_token import RefreshToken
+from app.domain.entities.user import UserRole
+from app.infrastructure.database.database import Base
+from app.infrastructure.database.models import (
+    CollectionModel,
+    CompanyModel,
+    RefreshTokenModel,
+    TokenRevocationModel,
+    UserModel,
+    ZipCodeModel,
+)
+from app.infrastructure.database.schema_upgrades import upgrade_schema
+from app.infrastructure.repositories.collection_repository_impl import CollectionRepositoryImpl
+from app.infrastructure.repositories.company_repository_impl import CompanyRepositoryImpl
+from app.infrastructure.repositories.refresh_token_repository_impl import RefreshTokenRepositoryImpl
+from app.infrastructure.repositories.token_revocation_repository_impl import TokenRevocationRepositoryImpl
+from app.infrastructure.repositories.user_repository_impl import UserRepositoryImpl
+
+COMPANIES = 40
+ZIP_CODES_PER_COMPANY = 5
+COLLECTORS_PER_COMPANY = 2
+USERS = 400
+COLLECTIONS_PER_USER = 10
+
+TABLES = set(Base.metadata.tables)
+# "SCAN <tabela>" percorre a tabela (ou um índice) inteira; "SEARCH" usa o índice para filtrar
+SCAN = re.compile(r"^SCAN (\w+)")
+
+
+def seed_id(kind: str, number: int) -> str:
+    return str(uuid.uuid5(uuid.NAMESPACE_URL, f"{kind}/{number}"))
+
+
+async def build_seeded_database(url: str) -> None:
+    # Banco criado pelas migrações (e não pelo create_all), com volume e estatísticas
+    engine = create_async_engine(url)
+    rng = random.Random(42)
+    now = datetime.utcnow()
+    async with engine.begin() as conn:
+        await conn.run_sync(upgrade_schema)
+        await conn.execute(insert(CompanyModel), [
+            {"id": seed_id("company", c), "name": f"Empresa {c}", "description": "", "created_at": now, "updated_at": now}
+            for c in range(COMPANIES)
+        ])
+        await conn.execute(insert(ZipCodeModel), [
+            {"zip_code": f"{c:05d}-{z:03d}", "company_id": seed_id("company", c)}
+            for c in range(COMPANIES) for z in range(ZIP_CODES_PER_COMPANY)
+        ])
+        await conn.execute(insert(UserModel), [
+            {"id": seed_id("collector", n), "username": f"collector{n}", "email": f"collector{n}@example.com",
+             "hashed_password": "x", "role": UserRole.COLLECTOR, "company_id": seed_id("company", n % COMPANIES),
+             "created_at": now, "updated_at": now}
+            for n in range(COMPANIES * COLLECTORS_PER_COMPANY)
+        ] + [
+            {"id": seed_id("user", n), "username": f"user{n}", "email": f"user{n}@example.com",
+             "hashed_password": "x", "role": UserRole.REGULAR, "company_id": None, "created_at": now, "updated_at": now}
+            for n in range(USERS)
+        ])
+        collections = []
+        for n in range(USERS * COLLECTIONS_PER_USER):
+            company = rng.randrange(COMPANIES)
+            assigned = rng.random() < 0.5
+            collections.append({
+                "id": seed_id("collection", n),
+                "user_id": seed_id("user", n % USERS),
+                "description": f"coleta {n}",
+                "zip_code": f"{company:05d}-{rng.randrange(ZIP_CODES_PER_COMPANY):03d}",
+                "images": [],
+                "status": rng.choice(list(CollectionStatus)).value,
+                "collector_id": seed_id("collector", company) if assigned else None,
+                "company_id": seed_id("company", company) if assigned else None,
+                "created_at": now,
+                "updated_at": now - timedelta(minutes=n),
+            })
+        await conn.execute(insert(CollectionModel), collections)
+        await conn.execute(insert(RefreshTokenModel), [
+            {"id": seed_id("refresh", n), "token_hash": f"{n:064x}", "family_id": seed_id("family", n // 2),
+             "user_id": seed_id("user", n % USERS), "expires_at": now + timedelta(days=n % 14 - 1),
+             "revoked": False, "created_at": now}
+            for n in range(USERS * 2)
+        ])
+        await conn.execute(insert(TokenRevocationModel), [
+            {"kind": "token", "subject": f"jti-{n}", "expires_at": now + timedelta(minutes=n - 100),
+             "created_at": now - timedelta(minutes=n)}
+            for n in range(500)
+        ])
+        # Estatísticas para o planejador, como o PRAGMA optimize periódico faz em produção
+        await conn.execute(text("ANALYZE"))
+    await engine.dispose()
+
+
+@pytest.fixture(scope="module")
+def seeded_database(tmp_path_factory):
+    path = tmp_path_factory.mktemp("query_plans") / "seeded.db"
+    # Loop próprio: asyncio.run desfaria o loop de sessão dos testes assíncronos
+    loop = asyncio.new_event_loop()
+    loop.run_until_complete(build_seeded_database(f"sqlite+aiosqlite:///{path}"))
+    loop.close()
+    return path
+
+
+@pytest_asyncio.fixture
+async def planned_db(seeded_database, tmp_path):
+    # Cópia por teste: os casos de escrita alteram os dados
+    path = tmp_path / "app.db"
+    shutil.copy(seeded_database, path)
+    engine = create_async_engine(f"sqlite+aiosqlite:///{path}")
+    yield engine
+    await engine.dispose()
+
+
+@contextmanager
+def capture_statements(engine) -> List[Tuple[str, Any]]:
+    statements: List[Tuple[str, Any]] = []
+
+    def record(conn, cursor, statement, parameters, context, executemany):
+        if statement.lstrip().upper().startswith(("SELECT", "UPDATE", "DELETE")):
+            # executemany: o plano é o mesmo para todos os grupos de parâmetros
+            statements.append((statement, parameters[0] if executemany else parameters))
+
+    event.listen(engine.sync_engine, "before_cursor_execute", record)
+    try:
+        yield statements
+    finally:
+        event.remove(engine.sync_engine, "before_cursor_execute", record)
+
+
+async def update_collection(db: AsyncSession) -> None:
+    repository = CollectionRepositoryImpl(db)
+    collection = await repository.get_by_id(seed_id("collection", 1))
+    collection.status = CollectionStatus.COMPLETED
+    await repository.update(collection)
+
+
+async def update_company(db: AsyncSession) -> None:
+    repository = CompanyRepositoryImpl(db)
+    company = await repository.get_by_id(seed_id("company", 1))
+    company.zip_codes = ["99999-000"]
+    await repository.update(company)
+
+
+async def update_user(db: AsyncSession) -> None:
+    repository = UserRepositoryImpl(db)
+    user = await repository.get_by_id(seed_id("user", 1))
+    user.username = "renamed"
+    await repository.update(user)
+
+
+async def rotate_refresh_token(db: AsyncSession) -> None:
+    replacement = RefreshToken(
+        token_hash="f" * 64,
+        user_id=uuid.UUID(seed_id("user", 3)),
+        expires_at=datetime.utcnow() + timedelta(days=7),
+        family_id=uuid.UUID(seed_id("family", 1)),
+    )
+    await RefreshTokenRepositoryImpl(db).rotate(uuid.UUID(seed_id("refresh", 3)), replacement)
+
+
+# Cada chamada de repositório usada pelas rotas; as consultas que listam a tabela
+# inteira por definição (listagens administrativas e suas versões) podem varrê-la
+HOT_QUERIES = {
+    "collections.get_by_id": lambda db: CollectionRepositoryImpl(db).get_by_id(seed_id("collection", 1)),
+    "collections.get_version": lambda db: CollectionRepositoryImpl(db).get_version(seed_id("collection", 1)),
+    "collections.get_list_version(user)": lambda db: CollectionRepositoryImpl(db).get_list_version(
+        user_id=seed_id("user", 1)
+    ),
+    "collections.get_list_version(collector)": lambda db: CollectionRepositoryImpl(db).get_list_version(
+        collector_id=seed_id("collector", 1)
+    ),
+    "collections.get_by_user_id": lambda db: CollectionRepositoryImpl(db).get_by_user_id(seed_id("user", 1)),
+    "collections.get_by_collector_id": lambda db: CollectionRepositoryImpl(db).get_by_collector_id(
+        seed_id("collector", 1)
+    ),
+    "collections.get_by_company_id": lambda db: CollectionRepositoryImpl(db).get_by_company_id(
+        seed_id("company", 1)
+    ),
+    "collections.get_by_status": lambda db: CollectionRepositoryImpl(db).get_by_status(CollectionStatus.REQUESTED),
+    "collections.get_by_zip_code": lambda db: CollectionRepositoryImpl(db).get_by_zip_code("00001-001"),
+    "collections.update": update_collection,
+    "collections.delete": lambda db: CollectionRepositoryImpl(db).delete(seed_id("collection", 2)),
+    "companies.get_by_id": lambda db: CompanyRepositoryImpl(db).get_by_id(seed_id("company", 1)),
+    "companies.get_updated_at": lambda db: CompanyRepositoryImpl(db).get_updated_at(seed_id("company", 1)),
+    "companies.get_by_zip_code": lambda db: CompanyRepositoryImpl(db).get_by_zip_code("00001-001"),
+    "companies.update": update_company,
+    "companies.delete": lambda db: CompanyRepositoryImpl(db).delete(seed_id("company", 2)),
+    "users.get_by_id": lambda db: UserRepositoryImpl(db).get_by_id(seed_id("user", 1)),
+    "users.get_by_email": lambda db: UserRepositoryImpl(db).get_by_email("user1@example.com"),
+    "users.get_by_username": lambda db: UserRepositoryImpl(db).get_by_username("user1"),
+    "users.get_collectors_by_company_id": lambda db: UserRepositoryImpl(db).get_collectors_by_company_id(
+        seed_id("company", 1)
+    ),
+    "users.get_existing_identifiers": lambda db: UserRepositoryImpl(db).get_existing_identifiers(
+        ["user1@example.com", "new@example.com"], ["user2", "new"]
+    ),
+    "users.update": update_user,
+    "users.delete": lambda db: UserRepositoryImpl(db).delete(seed_id("user", 2)),
+    "refresh_tokens.get_by_token_hash": lambda db: RefreshTokenRepositoryImpl(db).get_by_token_hash(f"{1:064x}"),
+    "refresh_tokens.revoke": lambda db: RefreshTokenRepositoryImpl(db).revoke(uuid.UUID(seed_id("refresh", 1))),
+    "refresh_tokens.rotate": rotate_refresh_token,
+    "refresh_tokens.revoke_family": lambda db: RefreshTokenRepositoryImpl(db).revoke_family(
+        uuid.UUID(seed_id("family", 1))
+    ),
+    "refresh_tokens.revoke_all_for_user": lambda db: RefreshTokenRepositoryImpl(db).revoke_all_for_user(
+        uuid.UUID(seed_id("user", 1))
+    ),
+    "refresh_tokens.purge_expired": lambda db: RefreshTokenRepositoryImpl(db).purge_expired(),
+    "token_revocations.get_created_since": lambda db: TokenRevocationRepositoryImpl(db).get_created_since(
+        datetime.utcnow() - timedelta(minutes=5)
+    ),
+    "token_revocations.purge_expired": lambda db: TokenRevocationRepositoryImpl(db).purge_expired(),
+}
+
+WHOLE_TABLE_QUERIES = {
+    "collections.get_all": lambda db: CollectionRepositoryImpl(db).get_all(),
+    "collections.get_list_version": lambda db: CollectionRepositoryImpl(db).get_list_version(),
+    "companies.get_all": lambda db: CompanyRepositoryImpl(db).get_all(),
+    "companies.get_list_version": lambda db: CompanyRepositoryImpl(db).get_list_version(),
+    "users.get_all": lambda db: UserRepositoryImpl(db).get_all(),
+    "token_revocations.get_created_since(all)": lambda db: TokenRevocationRepositoryImpl(db).get_created_since(),
+}
+
+
+async def explain_repository_call(engine, call) -> Dict[str, List[str]]:
+    with capture_statements(engine) as statements:
+        async with sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)() as db:
+            await call(db)
+    plans = {}
+    async with engine.connect() as conn:
+        for statement, parameters in statements:
+            rows = (await conn.exec_driver_sql(f"EXPLAIN QUERY PLAN {statement}", parameters)).all()
+            plans[statement] = [row[-1] for row in rows]
+    return plans
+
+
+def full_scans(plans: Dict[str, List[str]]) -> List[str]:
+    return [
+        f"{detail}  <-  {statement}"
+        for statement, details in plans.items()
+        for detail in details
+        if (match := SCAN.match(detail)) and match.group(1) in TABLES
+    ]
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("name", sorted(HOT_QUERIES))
+async def test_hot_repository_queries_use_indexes(planned_db, name):
+    # Act
+    plans = await explain_repository_call(planned_db, HOT_QUERIES[name])
+
+    # Assert
+    assert plans, f"{name} não executou consultas"
+    assert full_scans(plans) == []
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("name", sorted(WHOLE_TABLE_QUERIES))
+async def test_whole_table_queries_still_plan(planned_db, name):
+    # Act
+    plans = await explain_repository_call(planned_db, WHOLE_TABLE_QUERIES[name])
+
+    # Assert: varrem a tabela por definição, mas continuam válidas no schema migrado
+    assert plans
+    assert all(details for details in plans.values())
@@ -0,0 +1,103 @@
+import pytest
+from datetime import datetime, timedelta
+from uuid import uuid4
+
+from sqlalchemy.exc import IntegrityError
+
+from app.domain.entities.refresh_token import RefreshToken
+from app.infrastructure.repositories.refresh_token_repository_impl import RefreshTokenRepositoryImpl
+
+
+def _refresh_token(user_id, family_id=None, expires_in=timedelta(days=1)):
+    return RefreshToken(
+        token_hash=uuid4().hex + uuid4().hex,
+        user_id=user_id,
+        expires_at=datetime.utcnow() + expires_in,
+        family_id=family_id,
+    )
+
+
+@pytest.mark.asyncio
+async def test_get_by_token_hash(db_session):
+    # Arrange
+    repository = RefreshTokenRepositoryImpl(db_session)
+    stored = await repository.create(_refresh_token(uuid4()))
+
+    # Act
+    found = await repository.get_by_token_hash(stored.token_hash)
+
+    # Assert
+    assert found is not None
+    assert found.id == stored.id
+    assert found.family_id == stored.family_id
+    assert await repository.get_by_token_hash("missing") is None
+
+
+@pytest.mark.asyncio
+async def test_revoke_only_succeeds_once(db_session):
+    # Arrange
+    repository = RefreshTokenRepositoryImpl(db_session)
+    stored = await repository.create(_refresh_token(uuid4()))
+
+    # Act & Assert
+    assert await repository.revoke(stored.id, replaced_by=uuid4())
+    assert not await repository.revoke(stored.id)
+
+
+@pytest.mark.asyncio
+async def test_rotate_is_atomic(db_session):
+    # Arrange
+    repository = RefreshTokenRepositoryImpl(db_session)
+    user_id = uuid4()
+    current = await repository.create(_refresh_token(user_id))
+    other = await repository.create(_refresh_token(user_id))
+    # Substituto com hash repetido: o INSERT falha
+    conflicting = _refresh_token(user_id, current.family_id)
+    conflicting.token_hash = other.token_hash
+
+    # Act
+    with pytest.raises(IntegrityError):
+        await repository.rotate(current.id, conflicting)
+    replacement = await repository.rotate(current.id, _refresh_token(user_id, current.family_id))
+
+    # Assert: a falha não revogou o token atual; a nova tentativa rotaciona normalmente
+    assert replacement is not None
+    rotated = await repository.get_by_token_hash(current.token_hash)
+    assert rotated.revoked
+    assert rotated.replaced_by == replacement.id
+    assert await repository.rotate(current.id, _refresh_token(user_id, current.family_id)) is None
+
+
+@pytest.mark.asyncio
+async def test_revoke_family(db_session):
+    # Arrange
+    repository = RefreshTokenRepositoryImpl(db_session)
+    user_id, family_id = uuid4(), uuid4()
+    family = [await repository.create(_refresh_token(user_id, family_id)) for _ in range(3)]
+    other = await repository.create(_refresh_token(user_id))
+
+    # Act
+    revoked = await repository.revoke_family(family_id)
+
+    # Assert
+    assert revoked == 3
+    for refresh_token in family:
+        assert (await repository.get_by_token_hash(refresh_token.token_hash)).revoked
+    assert not (await repository.get_by_token_hash(other.token_hash)).revoked
+
+
+@pytest.mark.asyncio
+async def test_purge_expired_in_chunks(db_session):
+    # Arrange
+    repository = RefreshTokenRepositoryImpl(db_session)
+    user_id = uuid4()
+    for _ in range(5):
+        await repository.create(_refresh_token(user_id, expires_in=timedelta(seconds=-10)))
+    valid = await repository.create(_refresh_token(user_id))
+
+    # Act
+    purged = await repository.purge_expired(chunk_size=2)
+
+    # Assert
+    assert purged == 5
+    assert await repository.get_by_token_hash(valid.token_hash) is not None
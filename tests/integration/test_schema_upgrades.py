@@ -0,0 +1,110 @@
+import hashlib
+from datetime import datetime, timedelta
+
+import pytest
+from alembic import command
+from alembic.autogenerate import compare_metadata
+from alembic.migration import MigrationContext
+from alembic.script import ScriptDirectory
+from sqlalchemy import inspect, text
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+from sqlalchemy.orm import sessionmaker
+
+from app.infrastructure.database.database import Base
+from app.infrastructure.database.schema_upgrades import (
+    BASELINE_REVISION,
+    alembic_config,
+    upgrade_refresh_tokens,
+    upgrade_schema,
+)
+from app.infrastructure.repositories.refresh_token_repository_impl import RefreshTokenRepositoryImpl
+
+
+@pytest.mark.asyncio
+async def test_upgrade_refresh_tokens_hashes_legacy_rows():
+    # Arrange: tabela no formato antigo, com o token em texto puro
+    engine = create_async_engine("sqlite+aiosqlite:///:memory:")
+    expires_at = datetime.utcnow() + timedelta(days=1)
+    async with engine.begin() as conn:
+        await conn.execute(text(
+            "CREATE TABLE refresh_tokens (id VARCHAR PRIMARY KEY, token VARCHAR UNIQUE, "
+            "expires_at DATETIME, user_id VARCHAR, revoked BOOLEAN, created_at DATETIME)"
+        ))
+        await conn.execute(text("CREATE UNIQUE INDEX ix_refresh_tokens_token ON refresh_tokens (token)"))
+        await conn.execute(
+            text("INSERT INTO refresh_tokens VALUES ('00000000-0000-0000-0000-0000000000aa', 'legacy-token', :expires_at, "
+                 "'00000000-0000-0000-0000-000000000001', 0, :expires_at)"),
+            {"expires_at": expires_at},
+        )
+
+    # Act
+    async with engine.begin() as conn:
+        migrated = await conn.run_sync(upgrade_refresh_tokens)
+        await conn.run_sync(Base.metadata.create_all)
+    async with engine.begin() as conn:
+        migrated_again = await conn.run_sync(upgrade_refresh_tokens)
+
+    # Assert: o token antigo continua válido, buscado pelo digest
+    assert migrated == 1
+    assert migrated_again == 0
+    async with sessionmaker(engine, class_=AsyncSession)() as session:
+        stored = await RefreshTokenRepositoryImpl(session).get_by_token_hash(
+            hashlib.sha256(b"legacy-token").hexdigest()
+        )
+    assert stored is not None
+    assert stored.expires_at == expires_at
+    assert not stored.revoked
+    await engine.dispose()
+
+
+HEAD = ScriptDirectory.from_config(alembic_config()).get_current_head()
+
+
+def schema_state(connection):
+    context = MigrationContext.configure(connection)
+    indexes = {index["name"] for index in inspect(connection).get_indexes("collections")}
+    return context.get_current_revision(), compare_metadata(context, Base.metadata), indexes
+
+
+@pytest.mark.asyncio
+async def test_upgrade_schema_creates_database_matching_the_models(tmp_path):
+    # Arrange
+    engine = create_async_engine(f"sqlite+aiosqlite:///{tmp_path / 'fresh.db'}")
+
+    # Act
+    async with engine.begin() as conn:
+        await conn.run_sync(upgrade_schema)
+        revision, differences, indexes = await conn.run_sync(schema_state)
+
+    # Assert: as migrações produzem exatamente o schema declarado nos modelos
+    assert revision == HEAD
+    assert differences == []
+    assert "ix_collections_user_id_updated_at" in indexes
+    await engine.dispose()
+
+
+def create_with_baseline_migration(connection):
+    # Schema de antes das migrações versionadas, sem alembic_version
+    command.upgrade(alembic_config(connection), BASELINE_REVISION)
+    connection.execute(text("DROP TABLE alembic_version"))
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("create", [create_with_baseline_migration, Base.metadata.create_all])
+async def test_upgrade_schema_adopts_databases_created_by_create_all(tmp_path, create):
+    # Arrange
+    engine = create_async_engine(f"sqlite+aiosqlite:///{tmp_path / 'legacy.db'}")
+    async with engine.begin() as conn:
+        await conn.run_sync(create)
+
+    # Act
+    async with engine.begin() as conn:
+        migrated = await conn.run_sync(upgrade_schema)
+        revision, differences, indexes = await conn.run_sync(schema_state)
+
+    # Assert: marcado na revisão inicial e atualizado com os índices
+    assert migrated == 0
+    assert revision == HEAD
+    assert differences == []
+    assert {"ix_collections_status", "ix_collections_collector_id_updated_at"} <= indexes
+    await engine.dispose()
@@ -0,0 +1,59 @@
+import pytest
+
+from app.domain.entities.user import User, UserRole
+from app.infrastructure.repositories.user_repository_impl import UserRepositoryImpl
+
+
+def _user(name: str) -> User:
+    return User(
+        username=name,
+        email=f"{name}@example.com",
+        hashed_password="hashed_password",
+        role=UserRole.COLLECTOR,
+    )
+
+
+@pytest.mark.asyncio
+async def test_create_many_in_chunks(db_session):
+    # Arrange
+    repository = UserRepositoryImpl(db_session)
+    users = [_user(f"user{i}") for i in range(5)]
+
+    # Act
+    created, failures = await repository.create_many(users, chunk_size=2)
+
+    # Assert
+    assert len(created) == 5
+    assert failures == []
+    assert len(await repository.get_all()) == 5
+
+
+@pytest.mark.asyncio
+async def test_create_many_reports_conflicting_rows(db_session):
+    # Arrange
+    repository = UserRepositoryImpl(db_session)
+    await repository.create_many([_user("existing")])
+    users = [_user("first"), _user("existing"), _user("last")]
+
+    # Act
+    created, failures = await repository.create_many(users, chunk_size=10)
+
+    # Assert
+    assert [user.username for user in created] == ["first", "last"]
+    assert failures == [(1, "User with this email or username already exists")]
+
+
+@pytest.mark.asyncio
+async def test_get_existing_identifiers(db_session):
+    # Arrange
+    repository = UserRepositoryImpl(db_session)
+    await repository.create_many([_user("alice"), _user("bob")])
+
+    # Act
+    emails, usernames = await repository.get_existing_identifiers(
+        ["alice@example.com", "carol@example.com"], ["bob", "dave"]
+    )
+
+    # Assert
+    assert emails == {"alice@example.com"}
+    assert usernames == {"bob"}
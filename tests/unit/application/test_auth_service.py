@@ -1,3 +1,7 @@
+import asyncio
+import threading
+import time
+
 import pytest
 from datetime import timedelta
 from uuid import uuid4
@@ -6,6 +10,7 @@ from jose import jwt
 
 from app.application.services.auth_service import AuthService
 from app.domain.entities.user import UserRole
+from app.infrastructure.utils.bounded_executor import BoundedExecutor, ExecutorQueueFullError
 
 
 def test_password_hashing():
@@ -34,7 +39,7 @@ def test_create_access_token():
     expires_delta = timedelta(minutes=15)
 
     # Act
-    token = auth_service.create_access_token(
+    token, expires = auth_service.create_access_token(
         user_id=user_id, role=role, expires_delta=expires_delta
     )
 
@@ -45,3 +50,87 @@ def test_create_access_token():
     assert payload["sub"] == str(user_id)
     assert payload["role"] == role
     assert "exp" in payload
+
+
+@pytest.mark.asyncio
+async def test_password_hashing_async():
+    # Arrange
+    auth_service = AuthService(
+        secret_key="test-secret-key",
+        hash_executor=BoundedExecutor(max_workers=1, max_queue_size=1),
+    )
+    password = "testpassword"
+
+    # Act
+    hashed_password = await auth_service.get_password_hash_async(password)
+
+    # Assert
+    assert hashed_password != password
+    assert await auth_service.verify_password_async(password, hashed_password)
+    assert not await auth_service.verify_password_async("wrongpassword", hashed_password)
+
+
+@pytest.mark.asyncio
+async def test_bounded_executor_rejects_when_queue_is_full():
+    # Arrange
+    executor = BoundedExecutor(max_workers=1, max_queue_size=1)
+    release = threading.Event()
+    running = [asyncio.ensure_future(executor.run(release.wait)) for _ in range(2)]
+    await asyncio.sleep(0)
+
+    # Act & Assert
+    with pytest.raises(ExecutorQueueFullError):
+        await executor.run(release.wait)
+
+    release.set()
+    await asyncio.gather(*running)
+    assert executor.stats()["rejected"] == 1
+    assert executor.stats()["pending"] == 0
+    executor.shutdown()
+
+
+@pytest.mark.asyncio
+async def test_bounded_executor_map_submits_in_chunks():
+    # Arrange
+    executor = BoundedExecutor(max_workers=2, max_queue_size=0)
+    in_flight = []
+    lock = threading.Lock()
+    active = [0]
+
+    def track(item):
+        with lock:
+            active[0] += 1
+            in_flight.append(active[0])
+        time.sleep(0.01)
+        with lock:
+            active[0] -= 1
+        return item * 2
+
+    # Act
+    results = await executor.map(track, list(range(7)))
+
+    # Assert
+    assert results == [item * 2 for item in range(7)]
+    assert max(in_flight) <= 2
+    assert executor.stats()["completed"] == 7
+    assert executor.stats()["pending"] == 0
+    executor.shutdown()
+
+
+@pytest.mark.asyncio
+async def test_bounded_executor_map_rejects_chunk_that_does_not_fit():
+    # Arrange
+    executor = BoundedExecutor(max_workers=2, max_queue_size=1)
+    release = threading.Event()
+    running = [asyncio.ensure_future(executor.run(release.wait)) for _ in range(2)]
+    await asyncio.sleep(0)
+
+    # Act & Assert
+    with pytest.raises(ExecutorQueueFullError):
+        await executor.map(str, ["a", "b", "c"])
+
+    release.set()
+    await asyncio.gather(*running)
+    assert executor.stats()["rejected"] == 1
+    assert executor.stats()["pending"] == 0
+    executor.shutdown()
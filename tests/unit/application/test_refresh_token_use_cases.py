@@ -0,0 +1,115 @@
+import pytest
+from datetime import datetime, timedelta
+from unittest.mock import AsyncMock
+from uuid import uuid4
+
+from app.application.services.auth_service import AuthService
+from app.application.use_cases.refresh_token_use_cases import (
+    InvalidRefreshTokenError,
+    RefreshTokenReuseError,
+    RefreshTokenUseCases,
+)
+from app.domain.entities.refresh_token import RefreshToken
+
+
+@pytest.fixture
+def auth_service():
+    return AuthService(secret_key="test-secret-key")
+
+
+@pytest.fixture
+def refresh_token_repository():
+    repository = AsyncMock()
+    repository.create.side_effect = lambda refresh_token: refresh_token
+    repository.rotate.side_effect = lambda token_id, replacement: replacement
+    return repository
+
+
+@pytest.fixture
+def refresh_token_use_cases(refresh_token_repository, auth_service):
+    return RefreshTokenUseCases(refresh_token_repository, auth_service)
+
+
+def _stored_token(auth_service, token, **kwargs):
+    return RefreshToken(
+        token_hash=auth_service.hash_refresh_token(token),
+        user_id=uuid4(),
+        expires_at=datetime.utcnow() + timedelta(days=1),
+        **kwargs,
+    )
+
+
+@pytest.mark.asyncio
+async def test_issue_refresh_token_stores_only_hash(refresh_token_use_cases, auth_service):
+    # Act
+    token, stored = await refresh_token_use_cases.issue_refresh_token(uuid4())
+
+    # Assert
+    assert stored.token_hash == auth_service.hash_refresh_token(token)
+    assert stored.token_hash != token
+    assert stored.expires_at.tzinfo is None
+
+
+@pytest.mark.asyncio
+async def test_rotate_refresh_token_keeps_family(
+    refresh_token_use_cases, refresh_token_repository, auth_service
+):
+    # Arrange
+    current = _stored_token(auth_service, "old-token")
+    refresh_token_repository.get_by_token_hash.return_value = current
+
+    # Act
+    new_token, replacement = await refresh_token_use_cases.rotate_refresh_token("old-token")
+
+    # Assert
+    assert new_token != "old-token"
+    assert replacement.family_id == current.family_id
+    assert replacement.user_id == current.user_id
+    refresh_token_repository.rotate.assert_awaited_once_with(current.id, replacement)
+    refresh_token_repository.revoke_family.assert_not_awaited()
+
+
+@pytest.mark.asyncio
+async def test_rotate_revoked_refresh_token_revokes_family(
+    refresh_token_use_cases, refresh_token_repository, auth_service
+):
+    # Arrange
+    current = _stored_token(auth_service, "reused-token", revoked=True)
+    refresh_token_repository.get_by_token_hash.return_value = current
+
+    # Act & Assert
+    with pytest.raises(RefreshTokenReuseError):
+        await refresh_token_use_cases.rotate_refresh_token("reused-token")
+    refresh_token_repository.revoke_family.assert_awaited_once_with(current.family_id)
+    refresh_token_repository.rotate.assert_not_awaited()
+
+
+@pytest.mark.asyncio
+async def test_rotate_expired_refresh_token_fails(
+    refresh_token_use_cases, refresh_token_repository, auth_service
+):
+    # Arrange
+    current = _stored_token(auth_service, "expired-token")
+    current.expires_at = datetime.utcnow() - timedelta(seconds=1)
+    refresh_token_repository.get_by_token_hash.return_value = current
+
+    # Act & Assert
+    with pytest.raises(InvalidRefreshTokenError):
+        await refresh_token_use_cases.rotate_refresh_token("expired-token")
+    refresh_token_repository.rotate.assert_not_awaited()
+
+
+@pytest.mark.asyncio
+async def test_rotate_refresh_token_lost_race_revokes_family(
+    refresh_token_use_cases, refresh_token_repository, auth_service
+):
+    # Arrange: outra requisição revogou o token entre a leitura e a rotação
+    current = _stored_token(auth_service, "raced-token")
+    refresh_token_repository.get_by_token_hash.return_value = current
+    refresh_token_repository.rotate.side_effect = None
+    refresh_token_repository.rotate.return_value = None
+
+    # Act & Assert
+    with pytest.raises(RefreshTokenReuseError):
+        await refresh_token_use_cases.rotate_refresh_token("raced-token")
+    refresh_token_repository.revoke_family.assert_awaited_once_with(current.family_id)
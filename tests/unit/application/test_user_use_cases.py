@@ -10,8 +10,8 @@ from app.domain.entities.user import User, UserRole
 @pytest.fixture
 def auth_service():
     service = MagicMock(spec=AuthService)
-    service.get_password_hash.return_value = "hashed_password"
-    service.verify_password.return_value = True
+    service.get_password_hash_async.return_value = "hashed_password"
+    service.verify_password_async.return_value = True
     return service
 
 
@@ -51,7 +51,7 @@ async def test_create_user(user_use_cases, user_repository, auth_service):
     assert user.username == username
     assert user.email == email
     assert user.role == role
-    auth_service.get_password_hash.assert_called_once_with(password)
+    auth_service.get_password_hash_async.assert_awaited_once_with(password)
     user_repository.create.assert_called_once()
 
 
@@ -82,7 +82,7 @@ async def test_authenticate_user_success(user_use_cases, user_repository, auth_s
         role=UserRole.ADMIN,
     )
     user_repository.get_by_email.return_value = user
-    auth_service.verify_password.return_value = True
+    auth_service.verify_password_async.return_value = True
 
     # Act
     authenticated_user = await user_use_cases.authenticate_user("test@example.com", "password")
@@ -90,7 +90,7 @@ async def test_authenticate_user_success(user_use_cases, user_repository, auth_s
     # Assert
     assert authenticated_user is not None
     assert authenticated_user == user
-    auth_service.verify_password.assert_called_once_with("password", "hashed_password")
+    auth_service.verify_password_async.assert_awaited_once_with("password", "hashed_password")
 
 
 @pytest.mark.asyncio
@@ -103,11 +103,38 @@ async def test_authenticate_user_wrong_password(user_use_cases, user_repository,
         role=UserRole.ADMIN,
     )
     user_repository.get_by_email.return_value = user
-    auth_service.verify_password.return_value = False
+    auth_service.verify_password_async.return_value = False
 
     # Act
     authenticated_user = await user_use_cases.authenticate_user("test@example.com", "wrong_password")
 
     # Assert
     assert authenticated_user is None
-    auth_service.verify_password.assert_called_once_with("wrong_password", "hashed_password")
+    auth_service.verify_password_async.assert_awaited_once_with("wrong_password", "hashed_password")
+
+
+@pytest.mark.asyncio
+async def test_import_users(user_use_cases, user_repository, auth_service):
+    # Arrange
+    rows = [
+        {"username": "new1", "email": "new1@example.com", "password": "p1", "role": UserRole.COLLECTOR},
+        {"username": "new2", "email": "new1@example.com", "password": "p2", "role": UserRole.COLLECTOR},
+        {"username": "taken", "email": "new3@example.com", "password": "p3", "role": UserRole.COLLECTOR},
+        {"username": "new4", "email": "new4@example.com", "password": "p4", "role": UserRole.COLLECTOR},
+    ]
+    user_repository.get_existing_identifiers.return_value = (set(), {"taken"})
+    user_repository.create_many.side_effect = lambda users, chunk_size: (users, [])
+    auth_service.get_password_hashes_parallel.side_effect = lambda passwords: [f"hashed-{p}" for p in passwords]
+
+    # Act
+    created, failures = await user_use_cases.import_users(rows)
+
+    # Assert
+    assert [user.username for user in created] == ["new1", "new4"]
+    assert [user.hashed_password for user in created] == ["hashed-p1", "hashed-p4"]
+    assert failures == [
+        (1, "Duplicate email in import"),
+        (2, "User with this username already exists"),
+    ]
+    user_repository.get_existing_identifiers.assert_awaited_once()
+    auth_service.get_password_hashes_parallel.assert_awaited_once_with(["p1", "p4"])
@@ -0,0 +1,241 @@
+import asyncio
+
+import httpx
+import pytest
+import pytest_asyncio
+from fastapi import Depends, FastAPI
+from sqlalchemy import column, insert, table, text
+from sqlalchemy.exc import OperationalError
+from sqlalchemy.ext.asyncio import create_async_engine
+from sqlalchemy.orm import sessionmaker
+
+from app.infrastructure.database import database
+from app.infrastructure.database.concurrency import (
+    AdaptiveConcurrencyLimiter,
+    DatabaseBusyError,
+    LimitedAsyncSession,
+)
+from app.interfaces.api.errors import SERVER_BUSY_DETAIL, database_busy_handler
+
+_items = table("items", column("id"), column("name"))
+
+
+def insert_item(item_id: int):
+    return insert(_items).values(id=item_id, name=f"item-{item_id}")
+
+
+async def _run_rounds(limiter: AdaptiveConcurrencyLimiter, latency: float, rounds: int) -> None:
+    # Mantém o limite inteiro em uso, como sob carga, e devolve as vagas com a latência dada
+    for _ in range(rounds):
+        slots = limiter.limit
+        for _ in range(slots):
+            await limiter.acquire()
+        for _ in range(slots):
+            limiter.release(latency)
+
+
+@pytest.mark.asyncio
+async def test_limit_grows_while_latency_is_stable_and_falls_when_it_rises():
+    # Arrange
+    limiter = AdaptiveConcurrencyLimiter("read", initial_limit=4, max_limit=64, window_size=4)
+
+    # Act
+    await _run_rounds(limiter, latency=0.002, rounds=40)
+    grown = limiter.limit
+    await _run_rounds(limiter, latency=0.010, rounds=3)
+
+    # Assert
+    assert 4 < grown <= 64
+    assert limiter.limit < grown
+    assert limiter.stats()["baseline_latency_ms"] == pytest.approx(2.0, rel=0.01)
+    assert limiter.stats()["in_flight"] == 0
+
+
+@pytest.mark.asyncio
+async def test_limit_does_not_grow_when_underused():
+    # Arrange
+    limiter = AdaptiveConcurrencyLimiter("read", initial_limit=8, max_limit=64)
+
+    # Act
+    for _ in range(100):
+        await limiter.acquire()
+        limiter.release(0.001)
+
+    # Assert
+    assert limiter.limit == 8
+
+
+@pytest.mark.asyncio
+async def test_database_errors_halve_the_limit():
+    # Arrange
+    limiter = AdaptiveConcurrencyLimiter("write", initial_limit=8, max_limit=8)
+
+    # Act
+    await limiter.acquire()
+    limiter.release(0.001, error=True)
+
+    # Assert
+    assert limiter.limit == 4
+    assert limiter.stats()["errors"] == 1
+
+
+@pytest.mark.asyncio
+async def test_queue_admits_in_order_and_rejects_when_full_or_late():
+    # Arrange
+    limiter = AdaptiveConcurrencyLimiter("write", initial_limit=1, max_limit=1, queue_size=1, queue_timeout=0.05)
+    await limiter.acquire()
+    queued = asyncio.create_task(limiter.acquire())
+    await asyncio.sleep(0)
+
+    # Act
+    with pytest.raises(DatabaseBusyError):
+        await limiter.acquire()
+    limiter.release(0.001)
+    await queued
+    with pytest.raises(DatabaseBusyError):
+        await limiter.acquire()
+
+    # Assert
+    stats = limiter.stats()
+    assert stats["admitted"] == 2
+    assert stats["rejected"] == 1
+    assert stats["timed_out"] == 1
+    assert stats["in_flight"] == 1
+    assert stats["queued"] == 0
+
+
+@pytest_asyncio.fixture
+async def limited_app(monkeypatch, tmp_path):
+    # get_db com os limiters dados, sobre um banco temporário
+    engine = create_async_engine(f"sqlite+aiosqlite:///{tmp_path / 'app.db'}")
+    monkeypatch.setattr(
+        database, "SessionLocal", sessionmaker(engine, class_=LimitedAsyncSession, expire_on_commit=False)
+    )
+
+    def build(limiters) -> FastAPI:
+        monkeypatch.setattr(database, "get_db_limiters", lambda: limiters)
+        app = FastAPI()
+        app.add_exception_handler(DatabaseBusyError, database_busy_handler)
+        return app
+
+    yield build
+    await engine.dispose()
+
+
+@pytest_asyncio.fixture
+async def limited_session():
+    engine = create_async_engine("sqlite+aiosqlite:///:memory:")
+    async with engine.begin() as connection:
+        await connection.execute(text("CREATE TABLE items (id INTEGER PRIMARY KEY, name TEXT)"))
+    limiters = {
+        "read": AdaptiveConcurrencyLimiter("read", initial_limit=4, max_limit=4),
+        "write": AdaptiveConcurrencyLimiter("write", initial_limit=1, max_limit=1),
+    }
+    session = LimitedAsyncSession(engine, limiters=limiters)
+    yield session, limiters
+    await session.close()
+    await engine.dispose()
+
+
+@pytest.mark.asyncio
+async def test_get_db_answers_503_when_the_database_is_saturated(limited_app):
+    # Arrange
+    limiter = AdaptiveConcurrencyLimiter("read", initial_limit=1, max_limit=1, queue_size=0)
+    app = limited_app({"read": limiter})
+
+    @app.get("/api/work")
+    async def work(db=Depends(database.get_db)):
+        await db.execute(text("SELECT 1"))
+        return {"ok": True}
+
+    async with httpx.AsyncClient(transport=httpx.ASGITransport(app=app), base_url="http://test") as client:
+        # Outra operação ocupando a única vaga
+        await limiter.acquire()
+
+        # Act
+        busy = await client.get("/api/work")
+        limiter.release(0.001)
+        done = await client.get("/api/work")
+
+    # Assert
+    assert busy.status_code == 503
+    assert busy.headers["Retry-After"] == "1"
+    assert busy.json() == {"detail": SERVER_BUSY_DETAIL}
+    assert done.status_code == 200
+    assert limiter.stats()["rejected"] == 1
+    assert limiter.in_flight == 0
+
+
+@pytest.mark.asyncio
+async def test_request_work_between_queries_does_not_hold_a_slot(limited_app):
+    # Arrange
+    # Uma vaga: os SELECTs esperam na fila uns pelos outros, mas não pelo "bcrypt"
+    limiter = AdaptiveConcurrencyLimiter("read", initial_limit=1, max_limit=1, queue_size=8)
+    app = limited_app({"read": limiter})
+    release = asyncio.Event()
+    hashing = []
+
+    @app.post("/api/token")
+    async def login(db=Depends(database.get_db)):
+        await db.execute(text("SELECT 1"))
+        # Ex.: bcrypt fora do banco
+        hashing.append(1)
+        await release.wait()
+        await db.execute(text("SELECT 1"))
+        return {"ok": True}
+
+    async with httpx.AsyncClient(transport=httpx.ASGITransport(app=app), base_url="http://test") as client:
+        logins = [asyncio.create_task(client.post("/api/token")) for _ in range(3)]
+        while len(hashing) < 3:
+            await asyncio.sleep(0.005)
+
+        # Act
+        in_flight_while_hashing = limiter.in_flight
+        release.set()
+        statuses = [(await login).status_code for login in logins]
+
+    # Assert
+    assert in_flight_while_hashing == 0
+    assert statuses == [200, 200, 200]
+    assert limiter.stats()["rejected"] == 0
+    assert limiter.stats()["timed_out"] == 0
+
+
+@pytest.mark.asyncio
+async def test_write_slot_is_held_from_first_write_until_commit(limited_session):
+    # Arrange
+    session, limiters = limited_session
+
+    # Act
+    await session.execute(text("SELECT 1"))
+    after_read = (limiters["read"].in_flight, limiters["write"].in_flight)
+    await session.execute(insert_item(1))
+    during_write = limiters["write"].in_flight
+    # Leituras da mesma transação usam a vaga de escrita já ocupada
+    await session.execute(text("SELECT count(*) FROM items"))
+    read_admitted = limiters["read"].admitted
+    await session.commit()
+
+    # Assert
+    assert after_read == (0, 0)
+    assert during_write == 1
+    assert read_admitted == 1
+    assert limiters["write"].in_flight == 0
+    assert limiters["write"].admitted == 1
+
+
+@pytest.mark.asyncio
+async def test_rollback_releases_the_write_slot_and_reports_errors(limited_session):
+    # Arrange
+    session, limiters = limited_session
+    await session.execute(insert_item(1))
+
+    # Act
+    with pytest.raises(OperationalError):
+        await session.execute(text("SELECT * FROM missing_table"))
+    await session.rollback()
+
+    # Assert
+    assert limiters["write"].in_flight == 0
+    assert limiters["write"].stats()["errors"] == 1
+    assert limiters["read"].admitted == 0
@@ -0,0 +1,70 @@
+import pytest
+from sqlalchemy import exc, text
+from sqlalchemy.ext.asyncio import create_async_engine
+
+from app.infrastructure.config import Settings
+from app.infrastructure.database.pool import (
+    InstrumentedAsyncQueuePool,
+    engine_options,
+    pool_stats,
+    warm_up_pool,
+)
+
+
+def test_postgres_profile_configures_pool_and_asyncpg():
+    # Arrange
+    settings = Settings(
+        database_url="postgresql+asyncpg://app:secret@db:5432/recicleai",
+        db_pool_size=20,
+        db_max_overflow=4,
+        db_pool_timeout_seconds=2.5,
+        db_statement_cache_size=128,
+        db_statement_timeout_ms=3000,
+    )
+
+    # Act
+    options = engine_options(settings)
+
+    # Assert
+    assert options["poolclass"] is InstrumentedAsyncQueuePool
+    assert (options["pool_size"], options["max_overflow"], options["pool_timeout"]) == (20, 4, 2.5)
+    assert options["pool_pre_ping"] is True
+    assert options["connect_args"]["prepared_statement_cache_size"] == 128
+    assert options["connect_args"]["server_settings"]["statement_timeout"] == "3000"
+
+
+def test_sqlite_keeps_the_dialect_defaults():
+    assert engine_options(Settings(database_url="sqlite+aiosqlite:///:memory:")) == {}
+
+
+@pytest.mark.asyncio
+async def test_pool_stats_report_warmup_checkouts_and_timeouts(tmp_path):
+    # Arrange
+    engine = create_async_engine(
+        f"sqlite+aiosqlite:///{tmp_path / 'pool.db'}",
+        poolclass=InstrumentedAsyncQueuePool,
+        pool_size=2,
+        max_overflow=0,
+        pool_timeout=0.05,
+    )
+
+    # Act
+    warmed = await warm_up_pool(engine, connections=5)
+    async with engine.connect() as first, engine.connect() as second:
+        await first.execute(text("SELECT 1"))
+        await second.execute(text("SELECT 1"))
+        busy = pool_stats(engine.pool)
+        with pytest.raises(exc.TimeoutError):
+            async with engine.connect() as third:
+                await third.execute(text("SELECT 1"))
+    stats = pool_stats(engine.pool)
+    await engine.dispose()
+
+    # Assert
+    assert warmed == 2
+    assert busy["checked_out"] == 2
+    assert busy["checked_in"] == 0
+    assert stats["checked_in"] == 2
+    assert stats["timeouts"] == 1
+    assert stats["checkouts"] == 5
+    assert stats["wait_max_ms"] >= 50
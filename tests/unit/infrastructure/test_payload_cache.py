@@ -0,0 +1,90 @@
+from datetime import datetime, timedelta
+
+from app.infrastructure.utils.payload_cache import PayloadCache
+
+
+def test_get_returns_payload_only_for_the_cached_version():
+    # Arrange
+    cache = PayloadCache({"collection": 1024})
+    updated_at = datetime(2025, 1, 1, 12, 0, 0)
+    cache.put("collection", "c1", updated_at, b'{"id":"c1"}')
+
+    # Act
+    hit = cache.get("collection", "c1", updated_at)
+    stale = cache.get("collection", "c1", updated_at + timedelta(microseconds=1))
+
+    # Assert
+    assert hit == b'{"id":"c1"}'
+    assert stale is None
+    assert (cache.hits, cache.misses) == (1, 1)
+
+
+def test_least_recently_used_entries_are_evicted_by_size():
+    # Arrange
+    cache = PayloadCache({"company": 30})
+    cache.put("company", "a", 1, b"a" * 10)
+    cache.put("company", "b", 1, b"b" * 10)
+    cache.put("company", "c", 1, b"c" * 10)
+    cache.get("company", "a", 1)
+
+    # Act
+    cache.put("company", "d", 1, b"d" * 10)
+
+    # Assert
+    assert cache.get("company", "b", 1) is None
+    assert cache.get("company", "a", 1) == b"a" * 10
+    assert cache.stats()["entities"]["company"] == {"entries": 3, "bytes": 30, "limit": 30}
+    assert cache.evictions == 1
+
+
+def test_limits_are_per_entity_and_oversized_payloads_are_skipped():
+    # Arrange
+    cache = PayloadCache({"company": 8, "collection": 0})
+
+    # Act
+    cache.put("company", "big", 1, b"x" * 9)
+    cache.put("collection", "c1", 1, b"{}")
+    cache.put("user", "u1", 1, b"{}")
+
+    # Assert
+    assert cache.get("company", "big", 1) is None
+    assert cache.get("collection", "c1", 1) is None
+    assert cache.get("user", "u1", 1) is None
+    assert not cache.enabled("collection")
+
+
+def test_invalidate_and_clear_release_bytes():
+    # Arrange
+    cache = PayloadCache({"collection": 100, "collections": 100})
+    cache.put("collection", "c1", 1, b"1234")
+    cache.put("collections", "collections:all", (1, 1), b"[1234]")
+
+    # Act
+    cache.invalidate("collection", "c1")
+    cache.clear("collections")
+
+    # Assert
+    assert cache.get("collection", "c1", 1) is None
+    assert cache.get("collections", "collections:all", (1, 1)) is None
+    assert cache.stats()["entities"]["collection"]["bytes"] == 0
+    assert cache.stats()["entities"]["collections"]["bytes"] == 0
+
+
+def test_variants_share_the_version_and_are_invalidated_together():
+    # Arrange
+    cache = PayloadCache({"collection": 100})
+    cache.put("collection", "c1", 1, b"json", "application/json")
+    cache.put("collection", "c1", 1, b"msgpack", "application/msgpack")
+
+    # Act
+    both = (cache.get("collection", "c1", 1, "application/json"), cache.get("collection", "c1", 1, "application/msgpack"))
+    cache.put("collection", "c1", 2, b"json-2", "application/json")
+    after_update = cache.get("collection", "c1", 2, "application/msgpack")
+    size_after_update = cache.stats()["entities"]["collection"]["bytes"]
+    cache.invalidate("collection", "c1")
+
+    # Assert: uma nova versão descarta os payloads antigos de todos os formatos
+    assert both == (b"json", b"msgpack")
+    assert after_update is None
+    assert size_after_update == len(b"json-2")
+    assert cache.stats()["entities"]["collection"]["bytes"] == 0
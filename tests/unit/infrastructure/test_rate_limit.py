@@ -0,0 +1,200 @@
+import asyncio
+import sqlite3
+from types import SimpleNamespace
+from typing import Dict
+
+import pytest
+
+from app.infrastructure.rate_limit.backend import CounterStore
+from app.infrastructure.rate_limit.external import ExternalStoreRateLimitBackend
+from app.infrastructure.rate_limit.memory import MemoryRateLimitBackend, SlidingWindowCounter
+from app.infrastructure.rate_limit.sqlite import SQLiteRateLimitBackend
+from app.interfaces.api.middlewares.rate_limiter import RateLimiter
+
+
+class FakeCounterStore(CounterStore):
+    """Armazenamento externo em memória, no mesmo processo."""
+
+    def __init__(self):
+        self.values: Dict[str, int] = {}
+
+    async def get(self, key: str) -> int:
+        return self.values.get(key, 0)
+
+    async def incr(self, key: str, amount: int, ttl_seconds: float) -> int:
+        self.values[key] = self.values.get(key, 0) + amount
+        return self.values[key]
+
+
+def _request(host: str, forwarded: str = None) -> SimpleNamespace:
+    headers = {"X-Forwarded-For": forwarded} if forwarded else {}
+    return SimpleNamespace(client=SimpleNamespace(host=host), headers=headers)
+
+
+def test_limit_within_window():
+    # Arrange
+    limiter = SlidingWindowCounter(window_size=60)
+
+    # Act
+    results = [limiter.hit("client", 3, now=0.0 + i).allowed for i in range(4)]
+
+    # Assert
+    assert results == [True, True, True, False]
+    assert limiter.hit("other", 3, now=4.0).allowed
+
+
+def test_previous_window_is_weighted():
+    # Arrange
+    limiter = SlidingWindowCounter(window_size=60)
+    for _ in range(4):
+        assert limiter.hit("client", 4, now=10.0).allowed
+
+    # Act & Assert
+    # Metade da janela anterior ainda conta: 4 * 0.5 = 2 requisições estimadas
+    assert limiter.hit("client", 4, now=90.0).allowed
+    assert limiter.hit("client", 4, now=90.0).allowed
+    assert not limiter.hit("client", 4, now=90.0).allowed
+    # Duas janelas depois, o histórico é descartado
+    assert limiter.hit("client", 4, now=250.0).allowed
+
+
+def test_tracked_clients_are_bounded():
+    # Arrange
+    limiter = SlidingWindowCounter(window_size=60, max_clients=2)
+    limiter.hit("a", 1, now=0.0)
+    limiter.hit("b", 1, now=0.0)
+
+    # Act
+    limiter.hit("a", 1, now=1.0)  # "a" passa a ser o mais recente
+    limiter.hit("c", 1, now=1.0)
+
+    # Assert
+    assert len(limiter) == 2
+    assert limiter.evictions == 1
+    assert not limiter.hit("a", 1, now=2.0).allowed  # "a" continua rastreado
+    assert limiter.hit("b", 1, now=2.0).allowed  # "b" foi descartado
+
+
+def test_forwarded_for_ignored_without_trusted_proxy():
+    # Arrange
+    middleware = RateLimiter(app=None)
+
+    # Act
+    client_id = middleware.get_client_id(_request("203.0.113.7", forwarded="1.2.3.4"))
+
+    # Assert
+    assert client_id == "203.0.113.7"
+
+
+def test_forwarded_for_from_trusted_proxy():
+    # Arrange
+    middleware = RateLimiter(app=None, trusted_proxies=["10.0.0.0/8"])
+
+    # Act
+    client_id = middleware.get_client_id(_request("10.0.0.2", forwarded="6.6.6.6, 198.51.100.9, 10.0.0.1"))
+
+    # Assert
+    # O valor mais à esquerda é controlado pelo cliente; vale o último salto não confiável
+    assert client_id == "198.51.100.9"
+
+
+@pytest.mark.asyncio
+async def test_memory_backend_keeps_buckets_separate():
+    # Arrange
+    backend = MemoryRateLimitBackend()
+
+    # Act & Assert
+    assert (await backend.hit("auth", "client", 1, 60, now=0.0)).allowed
+    assert not (await backend.hit("auth", "client", 1, 60, now=1.0)).allowed
+    assert (await backend.hit("general", "client", 1, 60, now=1.0)).allowed
+
+
+@pytest.mark.asyncio
+async def test_sqlite_backend_is_shared_between_connections(tmp_path):
+    # Arrange
+    # Duas instâncias sobre o mesmo arquivo, como dois workers do uvicorn
+    path = str(tmp_path / "rate_limit.db")
+    worker_a = SQLiteRateLimitBackend(path)
+    worker_b = SQLiteRateLimitBackend(path)
+
+    # Act
+    results = [
+        (await backend.hit("auth", "client", 3, 60, now=10.0)).allowed
+        for backend in (worker_a, worker_b, worker_a, worker_b)
+    ]
+
+    # Assert
+    assert results == [True, True, True, False]
+    # Metade da janela anterior ainda conta (3 * 0.5 = 1.5)
+    assert (await worker_b.hit("auth", "client", 3, 60, now=90.0)).allowed
+    assert (await worker_a.hit("auth", "client", 3, 60, now=90.0)).allowed
+    assert not (await worker_b.hit("auth", "client", 3, 60, now=90.0)).allowed
+    worker_a.close()
+    worker_b.close()
+
+
+@pytest.mark.asyncio
+async def test_sqlite_backend_waits_for_locked_database_off_the_event_loop(tmp_path):
+    # Arrange
+    path = str(tmp_path / "rate_limit.db")
+    backend = SQLiteRateLimitBackend(path, busy_timeout_ms=2000)
+    assert (await backend.hit("auth", "client", 3, 60, now=10.0)).allowed
+    # Outro worker segurando o lock de escrita
+    other_worker = sqlite3.connect(path, isolation_level=None)
+    other_worker.execute("BEGIN IMMEDIATE")
+
+    # Act
+    pending = asyncio.ensure_future(backend.hit("auth", "client", 3, 60, now=11.0))
+    # O event loop segue livre enquanto a verificação espera o lock
+    await asyncio.sleep(0.05)
+    assert not pending.done()
+    other_worker.execute("COMMIT")
+    result = await pending
+
+    # Assert
+    assert result.allowed and result.remaining == 1
+    assert backend.contended == 1
+    assert backend.errors == 0
+    other_worker.close()
+    backend.close()
+
+
+@pytest.mark.asyncio
+async def test_external_backend_does_not_count_rejected_requests():
+    # Arrange
+    store = FakeCounterStore()
+    backend = ExternalStoreRateLimitBackend(store)
+
+    # Act
+    results = [(await backend.hit("general", "client", 2, 60, now=5.0)).allowed for _ in range(4)]
+
+    # Assert
+    assert results == [True, True, False, False]
+    assert store.values == {"rate_limit:general:client:0": 2}
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("backend_factory", [
+    lambda tmp_path: MemoryRateLimitBackend(),
+    lambda tmp_path: SQLiteRateLimitBackend(str(tmp_path / "rate_limit.db")),
+    lambda tmp_path: ExternalStoreRateLimitBackend(FakeCounterStore()),
+], ids=["memory", "sqlite", "external"])
+async def test_backends_apply_cost_and_retry_after(backend_factory, tmp_path):
+    # Arrange
+    backend = backend_factory(tmp_path)
+
+    # Act
+    first = await backend.hit("heavy", "client", 10, 60, cost=6, now=30.0)
+    second = await backend.hit("heavy", "client", 10, 60, cost=6, now=31.0)
+    cheap = await backend.hit("heavy", "client", 10, 60, cost=4, now=31.0)
+
+    # Assert
+    assert first.allowed and first.remaining == 4
+    assert not second.allowed
+    assert second.remaining == 0
+    # A janela atual já tem 6: só cabe quando ela vira a anterior e 6 * peso < 5,
+    # ou seja, 10 s depois do início da próxima janela (29 s + 10 s, arredondado para cima)
+    assert second.retry_after == 40
+    assert second.reset_after == 29
+    assert cheap.allowed and cheap.remaining == 0
+    backend.close()
@@ -0,0 +1,54 @@
+from app.infrastructure.utils.request_log_sampler import RequestLogSampler
+
+ROUTE = "/api/collections/{collection_id}"
+
+
+def _hit(sampler: RequestLogSampler, now: float, status_code: int = 200, method: str = "GET",
+         path: str = "/api/collections/1", process_time_ms: float = 5.0) -> bool:
+    return sampler.should_log(method, path, ROUTE, status_code, process_time_ms, now=now)
+
+
+def test_low_volume_route_is_fully_logged():
+    # Arrange
+    sampler = RequestLogSampler(target_per_minute=60, rate_window=10)
+
+    # Act
+    kept = [_hit(sampler, now=i) for i in range(30)]
+
+    # Assert: 1 req/s está dentro do alvo de 60 por minuto
+    assert all(kept)
+
+
+def test_high_volume_route_adapts_stride_and_summarizes():
+    # Arrange
+    sampler = RequestLogSampler(target_per_minute=60, rate_window=10, summary_interval=60)
+    sampler._last_summary = 0.0
+
+    # Act: 100 req/s por 20 s
+    kept = sum(_hit(sampler, now=i / 100) for i in range(2000))
+    summaries = sampler.due_summaries(now=60.0)
+
+    # Assert: cerca de 10 eventos por janela de 10 s
+    assert kept <= 25
+    assert len(summaries) == 1
+    summary = summaries[0]
+    assert summary["route"] == ROUTE
+    assert summary["requests"] == 2000
+    assert summary["sampled_out"] == 2000 - kept
+    assert summary["p50_ms"] == 5.0
+    assert summary["sample_stride"] >= 100
+
+
+def test_errors_slow_writes_and_auth_are_always_logged():
+    # Arrange: passo alto já ajustado para a rota
+    sampler = RequestLogSampler(target_per_minute=1, rate_window=10)
+    for i in range(1000):
+        _hit(sampler, now=i / 100)
+
+    # Act / Assert
+    assert _hit(sampler, now=10.5, status_code=404)
+    assert _hit(sampler, now=10.5, status_code=500)
+    assert _hit(sampler, now=10.5, process_time_ms=5000)
+    assert _hit(sampler, now=10.5, method="PUT")
+    assert sampler.should_log("POST", "/api/token", "/api/token", 200, 5.0, now=10.5)
+    assert sampler.should_log("GET", "/api/refresh", "/api/refresh", 200, 5.0, now=10.5)
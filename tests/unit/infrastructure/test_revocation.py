@@ -0,0 +1,89 @@
+import time
+from datetime import datetime, timedelta
+from unittest.mock import AsyncMock
+from uuid import uuid4
+
+import pytest
+
+from app.domain.entities.token_revocation import RevocationKind, TokenRevocation
+from app.infrastructure.auth.revocation import RevocationRegistry
+
+
+def _claims(user_id: str, iat: float = None, jti: str = None) -> dict:
+    return {"sub": user_id, "iat": iat or time.time(), "jti": jti or uuid4().hex}
+
+
+def test_denied_jti_is_revoked():
+    # Arrange
+    registry = RevocationRegistry()
+    claims = _claims(str(uuid4()))
+    registry.apply(TokenRevocation(
+        kind=RevocationKind.TOKEN,
+        subject=claims["jti"],
+        expires_at=datetime.utcnow() + timedelta(minutes=5),
+    ))
+
+    # Act & Assert
+    assert registry.is_revoked(claims)
+    assert not registry.is_revoked(_claims(claims["sub"]))
+
+
+def test_user_epoch_revokes_only_older_tokens():
+    # Arrange
+    registry = RevocationRegistry()
+    user_id = str(uuid4())
+    now = datetime.utcnow()
+    registry.apply(TokenRevocation(
+        kind=RevocationKind.USER,
+        subject=user_id,
+        issued_before=now,
+        expires_at=now + timedelta(minutes=30),
+    ))
+    epoch = registry._user_epochs[user_id]
+
+    # Act & Assert
+    assert registry.is_revoked(_claims(user_id, iat=epoch - 1))
+    assert not registry.is_revoked(_claims(user_id, iat=epoch + 1))
+    assert not registry.is_revoked(_claims(str(uuid4()), iat=epoch - 1))
+
+
+def test_prune_removes_expired_entries():
+    # Arrange
+    registry = RevocationRegistry()
+    past = datetime.utcnow() - timedelta(seconds=1)
+    registry.apply(TokenRevocation(kind=RevocationKind.TOKEN, subject="jti", expires_at=past))
+    registry.apply(TokenRevocation(
+        kind=RevocationKind.USER, subject="user", issued_before=past, expires_at=past,
+    ))
+
+    # Act
+    registry.prune()
+
+    # Assert
+    assert registry.stats() == {"denied_tokens": 0, "user_epochs": 0}
+
+
+@pytest.mark.asyncio
+async def test_sync_applies_revocations_from_repository():
+    # Arrange
+    registry = RevocationRegistry()
+    repository = AsyncMock()
+    repository.get_created_since.return_value = [
+        TokenRevocation(
+            kind=RevocationKind.TOKEN,
+            subject="remote-jti",
+            expires_at=datetime.utcnow() + timedelta(minutes=5),
+        )
+    ]
+
+    # Act
+    loaded = await registry.sync(repository)
+    await registry.sync(repository)
+
+    # Assert
+    assert loaded == 1
+    assert registry.is_revoked({"sub": "user", "jti": "remote-jti"})
+    first_since = repository.get_created_since.await_args_list[0].args[0]
+    second_since = repository.get_created_since.await_args_list[1].args[0]
+    assert first_since is None
+    assert second_since is not None
@@ -0,0 +1,86 @@
+import sqlite3
+import time
+from datetime import datetime, timezone
+
+from app.infrastructure.utils.security_audit_store import SQLiteSecurityAuditStore
+
+
+def _record(i: int, created: float, event_type: str = "login_failure", ip: str = "10.0.0.1") -> dict:
+    return {
+        "level": "WARNING",
+        "created": created,
+        "message": {
+            "event_id": f"event-{i}",
+            "event_type": event_type,
+            "user_id": None,
+            "ip_address": ip,
+            "details": {"username": f"user{i}@example.com", "success": False},
+        },
+    }
+
+
+def test_query_filters_and_keyset_pagination(tmp_path):
+    # Arrange
+    store = SQLiteSecurityAuditStore(str(tmp_path / "audit.db"))
+    now = time.time()
+    records = [_record(i, now - 60 * i) for i in range(10)]
+    records += [_record(100, now, ip="10.0.0.2"), _record(101, now, event_type="login_success")]
+    store.write(records)
+
+    # Act
+    pages = []
+    cursor = None
+    while True:
+        events, cursor = store.query({"event_type": "login_failure", "ip_address": "10.0.0.1"}, limit=4, cursor=cursor)
+        pages.append([event["event_id"] for event in events])
+        if cursor is None:
+            break
+
+    # Assert: do mais recente ao mais antigo, sem repetições
+    assert pages == [
+        ["event-0", "event-1", "event-2", "event-3"],
+        ["event-4", "event-5", "event-6", "event-7"],
+        ["event-8", "event-9"],
+    ]
+    store.close()
+
+
+def test_query_by_period_uses_index(tmp_path):
+    # Arrange
+    path = str(tmp_path / "audit.db")
+    store = SQLiteSecurityAuditStore(path)
+    now = time.time()
+    # Um segundo antes de cada marca de 10 minutos: nenhum evento no limite do período
+    store.write([_record(i, now - 600 * i - 1) for i in range(12)])
+
+    # Act
+    events, _ = store.query({"ip_address": "10.0.0.1"}, since=datetime.fromtimestamp(now - 3600, timezone.utc))
+    plan = sqlite3.connect(path).execute(
+        "EXPLAIN QUERY PLAN SELECT id FROM security_events WHERE ip_address = ? AND timestamp >= ? "
+        "ORDER BY timestamp DESC, id DESC LIMIT 100",
+        ("10.0.0.1", now - 3600),
+    ).fetchall()
+
+    # Assert: últimos 60 minutos (eventos 0 a 5)
+    assert [event["event_id"] for event in events] == [f"event-{i}" for i in range(6)]
+    assert events[0]["details"]["success"] is False
+    assert "ix_security_events_ip_address" in str(plan)
+    store.close()
+
+
+def test_prune_removes_events_outside_retention(tmp_path):
+    # Arrange
+    store = SQLiteSecurityAuditStore(str(tmp_path / "audit.db"), retention_days=1, prune_chunk_size=2)
+    now = time.time()
+    # A primeira gravação já faz a limpeza automática; a seguinte, dentro do intervalo, não
+    store.write([_record(9, now)])
+    store.write([_record(i, now - 2 * 86400) for i in range(5)])
+
+    # Act
+    removed = store.prune(now)
+
+    # Assert
+    events, _ = store.query()
+    assert removed == 5
+    assert [event["event_id"] for event in events] == ["event-9"]
+    store.close()
@@ -0,0 +1,97 @@
+import gzip
+import json
+import os
+import time
+from datetime import datetime, timedelta, timezone
+
+from app.infrastructure.utils.security_log_rotation import RotatingFileSecurityLogSink, SecurityLogIndex
+
+
+def _record(i: int, created: float = None) -> dict:
+    created = created or time.time()
+    timestamp = datetime.fromtimestamp(created, timezone.utc).isoformat()
+    return {"level": "INFO", "created": created, "message": {"event_type": "api_request", "i": i, "timestamp": timestamp}}
+
+
+def test_rotates_by_size_compresses_and_indexes(tmp_path):
+    # Arrange
+    path = str(tmp_path / "security.log")
+    sink = RotatingFileSecurityLogSink(path, max_bytes=500)
+
+    # Act
+    for i in range(10):
+        sink.write([_record(i)])
+    sink.close()
+
+    # Assert
+    entries = SecurityLogIndex(path).load()
+    assert entries
+    assert all(entry["compressed"] and entry["file"].endswith(".log.gz") for entry in entries)
+    lines = []
+    for entry in entries:
+        with gzip.open(tmp_path / entry["file"], "rt") as segment:
+            lines += segment.read().splitlines()
+    lines += open(path).read().splitlines()
+    assert [json.loads(line)["message"]["i"] for line in lines] == list(range(10))
+    assert not [name for name in os.listdir(tmp_path) if name.endswith(".log") and name != "security.log"]
+
+
+def test_rotates_on_new_day(tmp_path):
+    # Arrange: última gravação ontem
+    path = str(tmp_path / "security.log")
+    sink = RotatingFileSecurityLogSink(path, compress=False)
+    sink.write([_record(0, time.time() - 86400)])
+    yesterday = time.time() - 86400
+    os.utime(path, (yesterday, yesterday))
+
+    # Act
+    sink.write([_record(1)])
+    sink.close()
+
+    # Assert
+    entries = SecurityLogIndex(path).load()
+    assert len(entries) == 1
+    assert json.loads(open(path).read())["message"]["i"] == 1
+
+
+def test_reopens_file_rotated_by_another_worker(tmp_path):
+    # Arrange
+    path = str(tmp_path / "security.log")
+    worker_a = RotatingFileSecurityLogSink(path, max_bytes=10**6, compress=False)
+    worker_b = RotatingFileSecurityLogSink(path, max_bytes=10**6, compress=False)
+    worker_a.write([_record(0)])
+    worker_b.write([_record(1)])
+
+    # Act: A rotaciona; B deve perceber a troca do inode
+    worker_a.max_bytes = 1
+    worker_a.write([_record(2)])
+    worker_b.write([_record(3)])
+    worker_a.close()
+    worker_b.close()
+
+    # Assert
+    current = [json.loads(line)["message"]["i"] for line in open(path).read().splitlines()]
+    assert current == [2, 3]
+
+
+def test_retention_and_find_by_period(tmp_path):
+    # Arrange
+    path = str(tmp_path / "security.log")
+    sink = RotatingFileSecurityLogSink(path, max_bytes=1, max_segments=3, compress=False)
+    base = time.time() - 3600
+
+    # Act: cada gravação rotaciona a anterior
+    for i in range(6):
+        sink.write([_record(i, base + i * 60)])
+    sink.close()
+
+    # Assert
+    index = SecurityLogIndex(path)
+    entries = index.load()
+    assert len(entries) == 3
+    assert len([name for name in os.listdir(tmp_path) if name.startswith("security-")]) == 3
+    since = datetime.fromtimestamp(base + 4 * 60, timezone.utc)
+    found = index.find(since=since)
+    assert found[0] == path
+    assert len(found) == 2
+    assert index.find(until=datetime.fromtimestamp(base + 150, timezone.utc) - timedelta(seconds=1))[-1].endswith(".log")
@@ -0,0 +1,124 @@
+import json
+import logging
+import time
+from typing import Any, Dict, List, Sequence
+
+import pytest
+
+from app.infrastructure.utils.security_log_sinks import FileSecurityLogSink, SecurityLogSink
+from app.infrastructure.utils.security_log_writer import SecurityLogWriter
+from app.infrastructure.utils.security_logger import SecurityLogger
+
+
+class ListSink(SecurityLogSink):
+    """Destino em memória que guarda os lotes recebidos."""
+
+    def __init__(self):
+        self.batches: List[List[Dict[str, Any]]] = []
+        self.closed = False
+
+    def write(self, records: Sequence[Dict[str, Any]]) -> None:
+        self.batches.append(list(records))
+
+    def close(self) -> None:
+        self.closed = True
+
+    @property
+    def records(self) -> List[Dict[str, Any]]:
+        return [record for batch in self.batches for record in batch]
+
+
+def test_writer_batches_events_and_flushes_on_close():
+    # Arrange
+    sink = ListSink()
+    writer = SecurityLogWriter([sink], batch_size=50, flush_interval=10)
+
+    # Act
+    for i in range(120):
+        writer.enqueue(logging.INFO, "api_request", user_id=f"user-{i}", details={"i": i})
+    writer.close()
+
+    # Assert
+    assert [record["message"]["details"]["i"] for record in sink.records] == list(range(120))
+    assert len(sink.batches) < 120
+    assert sink.closed
+    stats = writer.stats()
+    assert stats["written"] == 120
+    assert stats["dropped"] == 0
+    assert stats["max_lag_ms"] >= 0
+
+
+def test_drop_newest_keeps_warnings():
+    # Arrange: thread parada para a fila encher
+    sink = ListSink()
+    writer = SecurityLogWriter([sink], max_queue_size=2, drop_policy="drop_newest")
+    writer._thread = object()
+
+    # Act
+    assert writer.enqueue(logging.INFO, "first")
+    assert writer.enqueue(logging.INFO, "second")
+    assert not writer.enqueue(logging.INFO, "third")
+    assert writer.enqueue(logging.WARNING, "login_failure")
+
+    # Assert
+    assert [event.event_type for event in writer._queue] == ["second", "login_failure"]
+    assert writer.stats()["dropped"] == 2
+
+
+def test_full_queue_never_blocks_the_caller():
+    # Arrange: thread parada para a fila encher
+    writer = SecurityLogWriter([ListSink()], max_queue_size=1, drop_policy="drop_oldest")
+    writer._thread = object()
+    writer.enqueue(logging.INFO, "first")
+
+    # Act
+    start = time.perf_counter()
+    accepted = writer.enqueue(logging.INFO, "second")
+    elapsed = time.perf_counter() - start
+
+    # Assert
+    assert accepted
+    assert [event.event_type for event in writer._queue] == ["second"]
+    assert elapsed < 0.01
+    with pytest.raises(ValueError):
+        SecurityLogWriter([ListSink()], drop_policy="block")
+
+
+def test_prepare_runs_on_writer_and_redacts():
+    # Arrange
+    sink = ListSink()
+    writer = SecurityLogWriter([sink])
+    request_data = {"users": [{"email": "a@b.com", "password": "secret"}]}
+
+    # Act
+    writer.enqueue(
+        logging.INFO,
+        "api_request",
+        details={"request_data": request_data},
+        local_time=True,
+        prepare=SecurityLogger._prepare_details,
+    )
+    assert writer.flush()
+
+    # Assert
+    details = sink.records[0]["message"]["details"]
+    assert details["request_data"] == {"users": [{"email": "a@b.com", "password": "********"}]}
+    assert "timestamp_local" in details
+    writer.close()
+
+
+def test_file_sink_keeps_log_line_format(tmp_path):
+    # Arrange
+    path = tmp_path / "logs" / "security.log"
+    writer = SecurityLogWriter([FileSecurityLogSink(str(path))])
+
+    # Act
+    writer.enqueue(logging.WARNING, "permission_denied", user_id="u1", ip_address="10.0.0.1")
+    writer.close()
+
+    # Assert
+    line = json.loads(path.read_text().strip())
+    assert line["level"] == "WARNING"
+    assert line["message"]["event_type"] == "permission_denied"
+    assert line["message"]["user_id"] == "u1"
+    assert line["message"]["ip_address"] == "10.0.0.1"
@@ -0,0 +1,105 @@
+import uuid
+
+import pytest
+import pytest_asyncio
+from sqlalchemy import exc, select, text
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import sessionmaker
+
+from app.infrastructure.config import Settings
+from app.infrastructure.database.database import Base
+from app.infrastructure.database.models import CompanyModel
+from app.infrastructure.database.sqlite import RoutingSession, create_sqlite_engines, is_sqlite_file, optimize
+
+
+@pytest_asyncio.fixture
+async def sqlite_engines(tmp_path):
+    settings = Settings(
+        database_url=f"sqlite+aiosqlite:///{tmp_path / 'app.db'}",
+        sqlite_read_pool_size=2,
+        sqlite_busy_timeout_ms=1234,
+        sqlite_cache_size_kib=2048,
+        db_pool_timeout_seconds=0.05,
+    )
+    writer, reader = create_sqlite_engines(settings)
+    async with writer.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+    yield writer, reader
+    await writer.dispose()
+    await reader.dispose()
+
+
+def test_profile_applies_only_to_sqlite_files():
+    assert is_sqlite_file("sqlite+aiosqlite:///./waste_collection.db")
+    assert not is_sqlite_file("sqlite+aiosqlite:///:memory:")
+    assert not is_sqlite_file("postgresql+asyncpg://app:secret@db/recicleai")
+
+
+@pytest.mark.asyncio
+async def test_connections_get_wal_pragmas_and_readers_are_query_only(sqlite_engines):
+    # Arrange
+    writer, reader = sqlite_engines
+
+    # Act
+    async with writer.connect() as conn:
+        write_pragmas = [
+            (await conn.execute(text(f"PRAGMA {name}"))).scalar()
+            for name in ("journal_mode", "synchronous", "busy_timeout", "cache_size", "query_only")
+        ]
+    async with reader.connect() as conn:
+        read_only = (await conn.execute(text("PRAGMA query_only"))).scalar()
+        with pytest.raises(exc.OperationalError):
+            await conn.execute(text("DELETE FROM companies"))
+
+    # Assert
+    assert write_pragmas == ["wal", 1, 1234, -2048, 0]
+    assert read_only == 1
+    assert writer.pool.size() == 1
+    assert reader.pool.size() == 2
+
+
+@pytest.mark.asyncio
+async def test_routing_session_reads_from_pool_and_writes_through_single_writer(sqlite_engines):
+    # Arrange
+    writer, reader = sqlite_engines
+    session_factory = sessionmaker(
+        class_=AsyncSession, sync_session_class=RoutingSession, writer=writer, reader=reader, expire_on_commit=False
+    )
+    company_id = str(uuid.uuid4())
+
+    async with session_factory() as db:
+        # Act
+        before = (await db.execute(select(CompanyModel))).scalars().all()
+        reader_busy = reader.pool.checkedout()
+        db.add(CompanyModel(id=company_id, name="Recicla", description="x"))
+        # O autoflush vai para o escritor, e a leitura seguinte enxerga a linha não confirmada
+        pending = (await db.execute(select(CompanyModel.name))).scalars().all()
+        writer_busy = writer.pool.checkedout()
+        await db.commit()
+        after = (await db.execute(select(CompanyModel.name))).scalars().all()
+        writer_after_commit = writer.pool.checkedout()
+
+    # Assert
+    assert before == []
+    assert reader_busy == 1
+    assert pending == ["Recicla"]
+    assert writer_busy == 1
+    assert after == ["Recicla"]
+    assert writer_after_commit == 0
+
+
+@pytest.mark.asyncio
+async def test_writer_is_serialized_and_optimize_runs(sqlite_engines):
+    # Arrange
+    writer, _ = sqlite_engines
+
+    # Act
+    async with writer.connect() as first:
+        await first.execute(text("SELECT 1"))
+        with pytest.raises(exc.TimeoutError):
+            async with writer.connect() as second:
+                await second.execute(text("SELECT 1"))
+    await optimize(writer)
+
+    # Assert
+    assert writer.pool.timeouts == 1
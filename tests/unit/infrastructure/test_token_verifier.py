@@ -0,0 +1,80 @@
+import time
+from unittest.mock import patch
+from uuid import uuid4
+
+import pytest
+from jose import JWTError, jwt
+
+from app.infrastructure.auth.token_verifier import TokenVerifier, get_bearer_token
+
+SECRET = "test-secret-key"
+
+
+def _token(expires_in: int = 60) -> str:
+    return jwt.encode(
+        {"sub": str(uuid4()), "role": "regular", "exp": int(time.time()) + expires_in},
+        SECRET,
+        algorithm="HS256",
+    )
+
+
+def test_verify_caches_claims():
+    # Arrange
+    verifier = TokenVerifier(secret_key=SECRET)
+    token = _token()
+
+    # Act
+    with patch("app.infrastructure.auth.token_verifier.jwt.decode", wraps=jwt.decode) as decode:
+        first = verifier.verify(token)
+        second = verifier.verify(token)
+
+    # Assert
+    assert first == second
+    assert decode.call_count == 1
+    assert verifier.hits == 1
+
+
+def test_verify_does_not_serve_expired_entries():
+    # Arrange
+    verifier = TokenVerifier(secret_key=SECRET)
+    token = _token()
+    verifier.verify(token)
+
+    # Act
+    with patch("app.infrastructure.auth.token_verifier.time.time", return_value=time.time() + 120):
+        with patch("app.infrastructure.auth.token_verifier.jwt.decode", wraps=jwt.decode) as decode:
+            verifier.verify(token)
+
+    # Assert: a entrada vencida foi descartada e o token verificado de novo
+    assert decode.call_count == 1
+    assert verifier.misses == 2
+
+
+def test_verify_evicts_least_recently_used():
+    # Arrange
+    verifier = TokenVerifier(secret_key=SECRET, max_entries=2)
+    first, second, third = _token(), _token(), _token()
+
+    # Act
+    verifier.verify(first)
+    verifier.verify(second)
+    verifier.verify(first)
+    verifier.verify(third)
+
+    # Assert
+    assert len(verifier._cache) == 2
+    assert first in verifier._cache
+    assert second not in verifier._cache
+
+
+def test_verify_rejects_invalid_signature():
+    verifier = TokenVerifier(secret_key="another-secret")
+    with pytest.raises(JWTError):
+        verifier.verify(_token())
+
+
+def test_get_bearer_token():
+    assert get_bearer_token("Bearer abc") == "abc"
+    assert get_bearer_token("bearer abc") == "abc"
+    assert get_bearer_token("Basic abc") is None
+    assert get_bearer_token(None) is None
@@ -0,0 +1,134 @@
+import asyncio
+from datetime import datetime, timedelta
+
+import httpx
+import pytest
+from fastapi import FastAPI, Request
+from jose import jwt
+
+from app.infrastructure.config import get_settings
+from app.interfaces.api.errors import SERVER_BUSY_DETAIL
+from app.interfaces.api.middlewares.admission import AdmissionControlMiddleware
+
+
+def _build(limits, queue_sizes=None, queue_timeouts_ms=None):
+    app = FastAPI()
+    release = asyncio.Event()
+
+    @app.get("/api/work")
+    async def work():
+        await release.wait()
+        return {"ok": True}
+
+    middleware = AdmissionControlMiddleware(
+        app, limits=limits, queue_sizes=queue_sizes, queue_timeouts_ms=queue_timeouts_ms
+    )
+    # Classe informada pelo teste, sem depender de tokens
+    middleware.classify = lambda request: request.headers.get("X-Class", "resident")
+    client = httpx.AsyncClient(transport=httpx.ASGITransport(app=middleware), base_url="http://test")
+    return middleware, client, release
+
+
+async def _wait_until(condition) -> None:
+    for _ in range(200):
+        if condition():
+            return
+        await asyncio.sleep(0.005)
+    raise AssertionError("condição não atingida")
+
+
+@pytest.mark.asyncio
+async def test_saturated_class_fails_fast_without_affecting_other_classes():
+    # Arrange
+    middleware, client, release = _build(
+        limits={"admin": 1, "collector": 1},
+        queue_sizes={"admin": 0},
+        queue_timeouts_ms={"admin": 2000},
+    )
+    async with client:
+        running = asyncio.create_task(client.get("/api/work", headers={"X-Class": "admin"}))
+        await _wait_until(lambda: middleware.classes["admin"].in_flight == 1)
+
+        # Act
+        rejected = await client.get("/api/work", headers={"X-Class": "admin"})
+        collector = asyncio.create_task(client.get("/api/work", headers={"X-Class": "collector"}))
+        await _wait_until(lambda: middleware.classes["collector"].in_flight == 1)
+        release.set()
+        responses = await asyncio.gather(running, collector)
+
+    # Assert
+    assert rejected.status_code == 503
+    assert rejected.json() == {"detail": SERVER_BUSY_DETAIL}
+    assert rejected.headers["Retry-After"] == "2"
+    assert [response.status_code for response in responses] == [200, 200]
+    assert middleware.stats()["admin"]["rejected"] == 1
+    assert middleware.stats()["admin"]["in_flight"] == 0
+
+
+@pytest.mark.asyncio
+async def test_queued_request_gets_the_released_slot():
+    # Arrange
+    middleware, client, release = _build(
+        limits={"collector": 1}, queue_sizes={"collector": 1}, queue_timeouts_ms={"collector": 2000}
+    )
+    async with client:
+        first = asyncio.create_task(client.get("/api/work", headers={"X-Class": "collector"}))
+        await _wait_until(lambda: middleware.classes["collector"].in_flight == 1)
+        queued = asyncio.create_task(client.get("/api/work", headers={"X-Class": "collector"}))
+        await _wait_until(lambda: len(middleware.classes["collector"].waiters) == 1)
+
+        # Act
+        release.set()
+        responses = await asyncio.gather(first, queued)
+
+    # Assert
+    assert [response.status_code for response in responses] == [200, 200]
+    assert middleware.stats()["collector"]["admitted"] == 2
+    assert middleware.stats()["collector"]["in_flight"] == 0
+
+
+@pytest.mark.asyncio
+async def test_queue_deadline_rejects_with_503():
+    # Arrange
+    middleware, client, release = _build(
+        limits={"resident": 1}, queue_sizes={"resident": 4}, queue_timeouts_ms={"resident": 50}
+    )
+    async with client:
+        running = asyncio.create_task(client.get("/api/work"))
+        await _wait_until(lambda: middleware.classes["resident"].in_flight == 1)
+
+        # Act
+        timed_out = await client.get("/api/work")
+        release.set()
+        await running
+
+    # Assert
+    assert timed_out.status_code == 503
+    assert timed_out.headers["Retry-After"] == "1"
+    assert middleware.stats()["resident"]["timed_out"] == 1
+    assert middleware.stats()["resident"]["queued"] == 0
+
+
+def test_requests_are_classified_by_path_and_role():
+    # Arrange
+    settings = get_settings()
+    middleware = AdmissionControlMiddleware(
+        FastAPI(), limits={"auth": 1}, auth_paths=["/api/token", "/api/refresh"]
+    )
+    expires = datetime.utcnow() + timedelta(minutes=5)
+
+    def request(path: str, role: str = None) -> Request:
+        headers = []
+        if role:
+            token = jwt.encode(
+                {"sub": "user-1", "role": role, "exp": expires}, settings.secret_key, algorithm=settings.algorithm
+            )
+            headers.append((b"authorization", f"Bearer {token}".encode()))
+        return Request({"type": "http", "method": "GET", "path": path, "headers": headers, "query_string": b""})
+
+    # Act / Assert
+    assert middleware.classify(request("/api/token")) == "auth"
+    assert middleware.classify(request("/api/collections/", "admin")) == "admin"
+    assert middleware.classify(request("/api/collections/1/status", "collector")) == "collector"
+    assert middleware.classify(request("/api/collections/", "regular")) == "resident"
+    assert middleware.classify(request("/api/collections/")) == "resident"
@@ -0,0 +1,79 @@
+import time
+from datetime import datetime
+
+import httpx
+import pytest
+from fastapi import FastAPI
+
+from app.domain.entities.user import User, UserRole
+from app.infrastructure.auth.jwt import get_current_admin_user
+from app.infrastructure.utils.security_audit_store import SQLiteSecurityAuditStore
+from app.infrastructure.database.concurrency import AdaptiveConcurrencyLimiter
+from app.interfaces.api.dependencies import provide_db_limiters, provide_security_audit_store
+from app.interfaces.api.controllers import audit
+
+
+def _build_app(store: SQLiteSecurityAuditStore) -> FastAPI:
+    app = FastAPI()
+    app.include_router(audit.router, prefix="/api/audit")
+    admin = User(username="admin", email="admin@example.com", hashed_password="x", role=UserRole.ADMIN)
+    app.dependency_overrides[get_current_admin_user] = lambda: admin
+    app.dependency_overrides[provide_security_audit_store] = lambda: store
+    return app
+
+
+@pytest.mark.asyncio
+async def test_admin_lists_failed_logins_by_ip(tmp_path):
+    # Arrange
+    store = SQLiteSecurityAuditStore(str(tmp_path / "audit.db"))
+    now = time.time()
+    store.write([
+        {
+            "level": "WARNING",
+            "created": now - i,
+            "message": {"event_id": f"e{i}", "event_type": "login_failure", "ip_address": "10.0.0.9"},
+        }
+        for i in range(3)
+    ])
+    app = _build_app(store)
+
+    async with httpx.AsyncClient(transport=httpx.ASGITransport(app=app), base_url="http://test") as client:
+        # Act
+        first = await client.get("/api/audit/events", params={"ip_address": "10.0.0.9", "limit": 2})
+        second = await client.get(
+            "/api/audit/events",
+            params={"ip_address": "10.0.0.9", "limit": 2, "cursor": first.json()["next_cursor"]},
+        )
+        invalid = await client.get("/api/audit/events", params={"cursor": "invalid"})
+
+    # Assert
+    assert first.status_code == 200
+    assert [item["event_id"] for item in first.json()["items"]] == ["e0", "e1"]
+    assert [item["event_id"] for item in second.json()["items"]] == ["e2"]
+    assert second.json()["next_cursor"] is None
+    assert invalid.status_code == 400
+    store.close()
+
+
+@pytest.mark.asyncio
+async def test_admin_reads_database_limiter_stats(tmp_path):
+    # Arrange
+    store = SQLiteSecurityAuditStore(str(tmp_path / "audit.db"))
+    limiter = AdaptiveConcurrencyLimiter("write", initial_limit=2, max_limit=8, queue_size=16)
+    await limiter.acquire()
+    app = _build_app(store)
+    app.dependency_overrides[provide_db_limiters] = lambda: {"write": limiter}
+
+    async with httpx.AsyncClient(transport=httpx.ASGITransport(app=app), base_url="http://test") as client:
+        # Act
+        response = await client.get("/api/audit/database")
+
+    # Assert
+    assert response.status_code == 200
+    stats = response.json()["limiters"]["write"]
+    assert stats["limit"] == 2
+    assert stats["in_flight"] == 1
+    assert stats["queued"] == 0
+    assert stats["rejected"] == 0
+    assert all("checked_out" in pool for pool in response.json()["pools"].values())
+    store.close()
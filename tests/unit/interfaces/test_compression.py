@@ -0,0 +1,134 @@
+import gzip
+import json
+import zlib
+
+import anyio
+import httpx
+import pytest
+from fastapi import FastAPI
+from fastapi.responses import Response, StreamingResponse
+
+from app.interfaces.api.middlewares.compression import CompressionMiddleware
+
+LARGE = [{"id": i, "description": "Coleta de recicláveis", "zip_code": "01001-000"} for i in range(200)]
+
+
+def _build_app(**options) -> FastAPI:
+    app = FastAPI()
+    app.add_middleware(CompressionMiddleware, **options)
+
+    @app.get("/api/large")
+    async def large():
+        return LARGE
+
+    @app.get("/api/small")
+    async def small():
+        return {"ok": True}
+
+    @app.get("/api/image")
+    async def image():
+        return Response(content=b"\x89PNG" + b"\x00" * 4096, media_type="image/png")
+
+    @app.get("/api/stream")
+    async def stream():
+        async def chunks():
+            for i in range(3):
+                yield (f"chunk-{i};" * 200).encode()
+
+        return StreamingResponse(chunks(), media_type="text/plain")
+
+    return app
+
+
+async def _get(app: FastAPI, path: str, accept_encoding: str = "gzip") -> httpx.Response:
+    async with httpx.AsyncClient(transport=httpx.ASGITransport(app=app), base_url="http://test") as client:
+        return await client.get(path, headers={"Accept-Encoding": accept_encoding})
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("thread_threshold", [256 * 1024, 1])
+async def test_large_json_is_gzipped(thread_threshold):
+    # Arrange
+    app = _build_app(thread_threshold=thread_threshold)
+
+    # Act
+    response = await _get(app, "/api/large")
+
+    # Assert: httpx descomprime o corpo de forma transparente
+    assert response.headers["content-encoding"] == "gzip"
+    assert "Accept-Encoding" in response.headers["vary"]
+    assert int(response.headers["content-length"]) < len(json.dumps(LARGE)) / 4
+    assert response.json() == LARGE
+
+
+@pytest.mark.asyncio
+async def test_small_bodies_images_and_identity_are_not_compressed():
+    # Arrange
+    app = _build_app()
+
+    # Act
+    small = await _get(app, "/api/small")
+    image = await _get(app, "/api/image")
+    identity = await _get(app, "/api/large", accept_encoding="identity, gzip;q=0")
+
+    # Assert
+    for response in (small, image, identity):
+        assert "content-encoding" not in response.headers
+    assert identity.json() == LARGE
+
+
+@pytest.mark.asyncio
+async def test_streaming_response_is_compressed_incrementally():
+    # Arrange
+    app = _build_app()
+    received = []
+    response_complete = anyio.Event()
+    requests = iter([{"type": "http.request", "body": b"", "more_body": False}])
+
+    async def send(message):
+        received.append(message)
+        if message["type"] == "http.response.body" and not message.get("more_body", False):
+            response_complete.set()
+
+    async def receive():
+        # Depois do corpo da requisição, o cliente só "desconecta" ao fim da
+        # resposta; antes disso a StreamingResponse interromperia o envio
+        request = next(requests, None)
+        if request is not None:
+            return request
+        await response_complete.wait()
+        return {"type": "http.disconnect"}
+
+    scope = {
+        "type": "http", "method": "GET", "path": "/api/stream", "raw_path": b"/api/stream",
+        "query_string": b"", "headers": [(b"accept-encoding", b"gzip")], "root_path": "",
+        "scheme": "http", "server": ("test", 80), "client": ("127.0.0.1", 1234), "http_version": "1.1",
+    }
+
+    # Act
+    await app(scope, receive, send)
+
+    # Assert: um pedaço comprimido por pedaço produzido, cada um decodificável ao chegar
+    start = received[0]
+    headers = dict(start["headers"])
+    assert headers[b"content-encoding"] == b"gzip"
+    assert b"content-length" not in headers
+    bodies = [message for message in received[1:] if message["type"] == "http.response.body"]
+    assert len(bodies) >= 3
+    decompressor = zlib.decompressobj(31)
+    first = decompressor.decompress(bodies[0]["body"])
+    assert first == ("chunk-0;" * 200).encode()
+    rest = b"".join(decompressor.decompress(message["body"]) for message in bodies[1:])
+    assert first + rest == b"".join((f"chunk-{i};" * 200).encode() for i in range(3))
+    assert gzip.decompress(b"".join(message["body"] for message in bodies)) == first + rest
+
+
+def test_select_encoding_respects_quality_values():
+    # Arrange
+    middleware = CompressionMiddleware(app=None)
+
+    # Act / Assert
+    assert middleware.select_encoding("gzip, deflate, br") in ("br", "gzip")
+    assert middleware.select_encoding("gzip;q=0") is None
+    assert middleware.select_encoding("*") == middleware.available_encodings[0]
+    assert middleware.select_encoding("") is None
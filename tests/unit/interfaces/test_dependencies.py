@@ -0,0 +1,54 @@
+import asyncio
+from unittest.mock import MagicMock
+
+import pytest
+
+from app.interfaces.api import dependencies
+
+
+def test_auth_service_is_app_scoped():
+    # Act
+    first = dependencies.get_auth_service()
+    second = dependencies.get_auth_service()
+
+    # Assert
+    assert first is second
+
+
+@pytest.mark.asyncio
+async def test_use_cases_are_request_scoped():
+    # Arrange
+    db = MagicMock()
+    auth_service = dependencies.get_auth_service()
+
+    # Act
+    first = await dependencies.get_user_use_cases(await dependencies.get_user_repository(db), auth_service)
+    second = await dependencies.get_user_use_cases(await dependencies.get_user_repository(db), auth_service)
+
+    # Assert
+    assert first is not second
+    assert first.user_repository is not second.user_repository
+    assert first.user_repository.db is db
+    assert first.auth_service is second.auth_service
+
+
+def test_route_providers_do_not_run_in_threadpool():
+    # Arrange: o FastAPI executa dependências síncronas no threadpool
+    providers = [
+        dependencies.provide_auth_service,
+        dependencies.provide_security_audit_store,
+        dependencies.get_user_repository,
+        dependencies.get_company_repository,
+        dependencies.get_collection_repository,
+        dependencies.get_refresh_token_repository,
+        dependencies.get_token_revocation_repository,
+        dependencies.get_user_use_cases,
+        dependencies.get_company_use_cases,
+        dependencies.get_collection_use_cases,
+        dependencies.get_refresh_token_use_cases,
+        dependencies.get_token_revocation_use_cases,
+    ]
+
+    # Assert
+    for provider in providers:
+        assert asyncio.iscoroutinefunction(provider), provider.__name__
@@ -0,0 +1,168 @@
+import json
+from datetime import datetime
+from typing import List
+from uuid import uuid4
+
+import httpx
+import msgpack
+import pytest
+from fastapi import FastAPI
+from pydantic import BaseModel
+
+from app.domain.entities.collection import Collection, CollectionStatus
+from app.interfaces.api.middlewares.message_pack import MessagePackMiddleware
+from app.interfaces.api.serialization import collection_serializer
+
+PNG = b"\x89PNG\r\n\x1a\n" + b"\x00" * 16
+PNG_DATA_URL = "data:image/png;base64,iVBORw0KGgoAAAAAAAAAAAAAAAAAAAAA"
+
+_COLLECTION = Collection(
+    id=str(uuid4()),
+    user_id=uuid4(),
+    description=PNG_DATA_URL,
+    location_latitude=-23.0,
+    location_longitude=-46.0,
+    zip_code="01001-000",
+    images=[PNG_DATA_URL],
+    status=CollectionStatus.REQUESTED,
+    created_at=datetime(2025, 1, 2, 3, 4, 5, 678901),
+    updated_at=datetime(2025, 1, 2, 3, 4, 5),
+)
+
+
+class _Item(BaseModel):
+    description: str
+    images: List[str]
+
+
+def _build_app() -> FastAPI:
+    app = FastAPI()
+
+    @app.post("/api/items")
+    async def echo(item: _Item) -> _Item:
+        return item
+
+    @app.get("/api/collections/{collection_id}")
+    async def get_collection(collection_id: str):
+        return collection_serializer.response(_COLLECTION)
+
+    app.add_middleware(MessagePackMiddleware, path_prefix="/api")
+    return app
+
+
+@pytest.mark.asyncio
+async def test_msgpack_request_and_response_carry_images_as_binary():
+    # Arrange
+    app = _build_app()
+    body = msgpack.packb({"description": "Garrafas PET", "images": [PNG]}, use_bin_type=True)
+
+    async with httpx.AsyncClient(transport=httpx.ASGITransport(app=app), base_url="http://test") as client:
+        # Act
+        response = await client.post(
+            "/api/items",
+            content=body,
+            headers={"Content-Type": "application/msgpack", "Accept": "application/msgpack"},
+        )
+        as_json = await client.post(
+            "/api/items",
+            content=body,
+            headers={"Content-Type": "application/msgpack", "Accept": "application/json"},
+        )
+
+    # Assert
+    assert response.status_code == 200
+    assert response.headers["Content-Type"] == "application/msgpack"
+    assert "Accept" in response.headers["Vary"]
+    assert msgpack.unpackb(response.content) == {"description": "Garrafas PET", "images": [PNG]}
+    assert as_json.headers["Content-Type"] == "application/json"
+    assert as_json.json()["images"][0].startswith("data:image/png;base64,")
+
+
+@pytest.mark.asyncio
+async def test_entities_are_encoded_as_msgpack_by_the_serializer():
+    # Arrange
+    app = _build_app()
+
+    async with httpx.AsyncClient(transport=httpx.ASGITransport(app=app), base_url="http://test") as client:
+        # Act
+        response = await client.get("/api/collections/1", headers={"Accept": "application/msgpack"})
+        as_json = await client.get("/api/collections/1")
+
+    # Assert: mesma estrutura do JSON, com binário apenas no campo de imagens
+    body = msgpack.unpackb(response.content)
+    expected = json.loads(as_json.content)
+    assert response.headers["Content-Type"] == "application/msgpack"
+    assert "Accept" in response.headers["Vary"]
+    assert body["images"] == [PNG]
+    assert body["description"] == PNG_DATA_URL
+    assert {**body, "images": expected["images"]} == expected
+
+
+@pytest.mark.asyncio
+async def test_only_image_fields_are_converted():
+    # Arrange
+    app = _build_app()
+
+    async with httpx.AsyncClient(transport=httpx.ASGITransport(app=app), base_url="http://test") as client:
+        # Act: data URL digitada em um campo de texto e binário fora de `images`
+        text_field = await client.post(
+            "/api/items",
+            content=msgpack.packb({"description": PNG_DATA_URL, "images": []}),
+            headers={"Content-Type": "application/msgpack", "Accept": "application/msgpack"},
+        )
+        binary_text = await client.post(
+            "/api/items",
+            content=msgpack.packb({"description": PNG, "images": []}, use_bin_type=True),
+            headers={"Content-Type": "application/msgpack"},
+        )
+
+    # Assert
+    assert msgpack.unpackb(text_field.content) == {"description": PNG_DATA_URL, "images": []}
+    assert binary_text.status_code == 400
+
+
+@pytest.mark.asyncio
+async def test_invalid_msgpack_body_is_rejected():
+    # Arrange
+    app = _build_app()
+
+    async with httpx.AsyncClient(transport=httpx.ASGITransport(app=app), base_url="http://test") as client:
+        # Act
+        response = await client.post("/api/items", content=b"\xc1", headers={"Content-Type": "application/msgpack"})
+
+    # Assert
+    assert response.status_code == 400
+    assert response.json() == {"detail": "Invalid MessagePack body"}
+
+
+@pytest.mark.asyncio
+async def test_validation_errors_are_also_sent_as_msgpack():
+    # Arrange
+    app = _build_app()
+
+    async with httpx.AsyncClient(transport=httpx.ASGITransport(app=app), base_url="http://test") as client:
+        # Act
+        response = await client.post(
+            "/api/items",
+            content=msgpack.packb({"description": "sem imagens"}),
+            headers={"Content-Type": "application/msgpack", "Accept": "application/msgpack"},
+        )
+
+    # Assert
+    assert response.status_code == 422
+    assert msgpack.unpackb(response.content)["detail"][0]["loc"] == ["body", "images"]
+
+
+@pytest.mark.parametrize(
+    "accept,expected",
+    [
+        ("application/msgpack", True),
+        ("application/json, application/msgpack", True),
+        ("application/json, application/msgpack;q=0.5", False),
+        ("application/msgpack;q=0.9, */*;q=0.1", True),
+        ("*/*", False),
+        ("", False),
+    ],
+)
+def test_accept_negotiation(accept, expected):
+    assert MessagePackMiddleware.accepts_msgpack(accept) is expected
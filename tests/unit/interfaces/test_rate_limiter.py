@@ -0,0 +1,140 @@
+from datetime import timedelta
+from uuid import uuid4
+
+import httpx
+import pytest
+from fastapi import FastAPI
+
+from app.application.services.auth_service import AuthService
+from app.domain.entities.user import UserRole
+from app.infrastructure.config import get_settings
+from app.interfaces.api.middlewares.rate_limiter import RateLimiter
+
+
+def _build_app(**options) -> FastAPI:
+    app = FastAPI()
+    app.add_middleware(RateLimiter, **options)
+
+    @app.get("/api/items")
+    async def list_items():
+        return []
+
+    @app.post("/api/uploads")
+    async def upload():
+        return {}
+
+    return app
+
+
+def _auth_header(role: UserRole = UserRole.REGULAR) -> dict:
+    settings = get_settings()
+    token, _ = AuthService(secret_key=settings.secret_key, algorithm=settings.algorithm).create_access_token(
+        uuid4(), role, timedelta(minutes=5)
+    )
+    return {"Authorization": f"Bearer {token}"}
+
+
+@pytest.mark.asyncio
+async def test_users_behind_same_ip_have_separate_quotas():
+    # Arrange
+    app = _build_app(rate_limit_per_minute=1, role_limits={"regular": 2})
+    first_user, second_user = _auth_header(), _auth_header()
+
+    async with httpx.AsyncClient(transport=httpx.ASGITransport(app=app), base_url="http://test") as client:
+        # Act
+        first = [(await client.get("/api/items", headers=first_user)).status_code for _ in range(3)]
+        second = (await client.get("/api/items", headers=second_user)).status_code
+        anonymous = [(await client.get("/api/items")).status_code for _ in range(2)]
+
+    # Assert
+    assert first == [200, 200, 429]
+    assert second == 200
+    assert anonymous == [200, 429]
+
+
+@pytest.mark.asyncio
+async def test_heavy_uploads_do_not_consume_read_quota():
+    # Arrange
+    app = _build_app(
+        rate_limit_per_minute=2,
+        heavy_rate_limit_per_minute=10,
+        route_costs={"POST /api/uploads": 6},
+    )
+
+    async with httpx.AsyncClient(transport=httpx.ASGITransport(app=app), base_url="http://test") as client:
+        # Act
+        uploads = [(await client.post("/api/uploads")) for _ in range(2)]
+        reads = [(await client.get("/api/items")).status_code for _ in range(2)]
+
+    # Assert
+    assert uploads[0].status_code == 200
+    rejected = uploads[1]
+    assert rejected.status_code == 429
+    assert int(rejected.headers["Retry-After"]) >= 1
+    assert rejected.headers["RateLimit-Limit"] == "10"
+    assert rejected.headers["RateLimit-Remaining"] == "0"
+    assert "RateLimit-Reset" in rejected.headers
+    assert reads == [200, 200]
+
+
+@pytest.mark.asyncio
+async def test_body_size_adds_to_cost():
+    # Arrange
+    app = _build_app(heavy_rate_limit_per_minute=5, body_cost_bytes=1024)
+
+    async with httpx.AsyncClient(transport=httpx.ASGITransport(app=app), base_url="http://test") as client:
+        # Act
+        # Custo 1 + 4 (4 KB) cabe no limite de 5; o segundo upload não
+        statuses = [(await client.post("/api/uploads", content=b"x" * 4096)).status_code for _ in range(2)]
+
+    # Assert
+    assert statuses == [200, 429]
+
+
+@pytest.mark.asyncio
+async def test_cost_above_heavy_limit_takes_whole_window_instead_of_always_failing():
+    # Arrange
+    app = _build_app(
+        heavy_rate_limit_per_minute=30,
+        role_heavy_limits={"admin": 200},
+        route_costs={"POST /api/uploads": 20},
+        body_cost_bytes=1024,
+    )
+    # Custo 20 + 40 (40 KB) = 60, acima do limite anônimo de 30
+    body = b"x" * 40 * 1024
+    admin_header = _auth_header(UserRole.ADMIN)
+
+    async with httpx.AsyncClient(transport=httpx.ASGITransport(app=app), base_url="http://test") as client:
+        # Act
+        anonymous = [await client.post("/api/uploads", content=body) for _ in range(2)]
+        admin = [(await client.post("/api/uploads", content=body, headers=admin_header)).status_code for _ in range(4)]
+
+    # Assert
+    assert anonymous[0].status_code == 200
+    assert anonymous[1].status_code == 429
+    assert anonymous[1].headers["RateLimit-Limit"] == "30"
+    # Abaixo do limite do papel, o custo integral continua valendo: 3 x 60 <= 200
+    assert admin == [200, 200, 200, 429]
+
+
+@pytest.mark.asyncio
+async def test_chunked_upload_without_content_length_is_heavy():
+    # Arrange
+    app = _build_app(rate_limit_per_minute=10, heavy_rate_limit_per_minute=2, body_cost_bytes=1024)
+
+    async def chunks():
+        for _ in range(4):
+            yield b"x" * 1024
+
+    async with httpx.AsyncClient(transport=httpx.ASGITransport(app=app), base_url="http://test") as client:
+        # Act: cada upload chunked custa 2 (1 + uma unidade de corpo) no bucket "heavy"
+        first = await client.post("/api/uploads", content=chunks())
+        second = await client.post("/api/uploads", content=chunks())
+        read = await client.get("/api/items")
+
+    # Assert
+    assert "content-length" not in first.request.headers
+    assert first.status_code == 200
+    assert second.status_code == 429
+    assert second.headers["RateLimit-Limit"] == "2"
+    assert read.status_code == 200
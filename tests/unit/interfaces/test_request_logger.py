@@ -0,0 +1,175 @@
+import json
+from unittest.mock import patch
+
+import httpx
+import pytest
+from fastapi import FastAPI, Request
+from fastapi.responses import StreamingResponse
+
+from app.infrastructure.utils.request_log_sampler import RequestLogSampler
+from app.infrastructure.utils.security_logger import SecurityLogger
+from app.interfaces.api.middlewares.request_logger import RequestLoggerMiddleware
+
+
+def _build_app() -> FastAPI:
+    app = FastAPI()
+    app.add_middleware(RequestLoggerMiddleware)
+
+    @app.post("/api/echo")
+    async def echo(request: Request):
+        return await request.json()
+
+    @app.get("/api/stream")
+    async def stream():
+        async def chunks():
+            for i in range(3):
+                yield f"chunk-{i};".encode()
+
+        return StreamingResponse(chunks(), media_type="text/plain")
+
+    return app
+
+
+@pytest.mark.asyncio
+async def test_logs_request_body_read_by_endpoint():
+    # Arrange
+    app = _build_app()
+
+    with patch("app.interfaces.api.middlewares.request_logger.SecurityLogger.log_api_request") as log:
+        async with httpx.AsyncClient(transport=httpx.ASGITransport(app=app), base_url="http://test") as client:
+            # Act
+            response = await client.post("/api/echo", json={"name": "test", "password": "secret"})
+
+    # Assert
+    assert response.json() == {"name": "test", "password": "secret"}
+    kwargs = log.call_args.kwargs
+    assert kwargs["request_data"] == {"name": "test", "password": "secret"}
+    assert kwargs["status_code"] == 200
+    assert kwargs["process_time_ms"] >= 0
+
+
+@pytest.mark.asyncio
+async def test_streaming_response_passes_through():
+    # Arrange
+    app = _build_app()
+
+    with patch("app.interfaces.api.middlewares.request_logger.SecurityLogger.log_api_request") as log:
+        async with httpx.AsyncClient(transport=httpx.ASGITransport(app=app), base_url="http://test") as client:
+            # Act
+            response = await client.get("/api/stream")
+
+    # Assert
+    assert response.text == "chunk-0;chunk-1;chunk-2;"
+    assert log.call_args.kwargs["status_code"] == 200
+
+
+def _build_capture_app(**options) -> FastAPI:
+    app = FastAPI()
+    app.add_middleware(RequestLoggerMiddleware, **options)
+
+    @app.post("/api/raw")
+    async def raw(request: Request):
+        return {"size": len(await request.body())}
+
+    return app
+
+
+async def _post_raw(app: FastAPI, content: bytes, content_type: str):
+    with patch("app.interfaces.api.middlewares.request_logger.SecurityLogger.log_api_request") as log:
+        async with httpx.AsyncClient(transport=httpx.ASGITransport(app=app), base_url="http://test") as client:
+            response = await client.post("/api/raw", content=content, headers={"Content-Type": content_type})
+    return response, log.call_args.kwargs["request_data"]
+
+
+@pytest.mark.asyncio
+async def test_body_over_limit_is_logged_by_size_only():
+    # Arrange
+    app = _build_capture_app(max_body_bytes=100)
+    body = b'{"name": "' + b"x" * 200 + b'"}'
+
+    # Act
+    response, request_data = await _post_raw(app, body, "application/json")
+
+    # Assert
+    assert response.json() == {"size": len(body)}
+    assert request_data == {"content_type": "application/json", "size_bytes": len(body), "captured": False}
+
+
+@pytest.mark.asyncio
+async def test_long_fields_are_replaced_by_length_and_hash():
+    # Arrange
+    app = _build_capture_app(max_field_chars=10)
+    image = "data:image/png;base64," + "A" * 500
+
+    # Act
+    _, request_data = await _post_raw(app, json.dumps({"name": "ok", "items": [image]}).encode(), "application/json")
+
+    # Assert
+    assert request_data["name"] == "ok"
+    assert request_data["items"][0].startswith(f"<{len(image)} chars sha256:")
+
+
+@pytest.mark.asyncio
+async def test_multipart_body_is_not_copied():
+    # Arrange
+    app = _build_capture_app()
+
+    # Act
+    _, request_data = await _post_raw(app, b"--b\r\n\r\ndata\r\n--b--", "multipart/form-data; boundary=b")
+
+    # Assert
+    assert request_data["captured"] is False
+    assert request_data["content_type"].startswith("multipart/form-data")
+
+
+@pytest.mark.asyncio
+async def test_form_body_is_parsed_into_fields():
+    # Arrange
+    app = _build_capture_app()
+
+    # Act
+    _, request_data = await _post_raw(app, b"username=a%40b.com&password=secret", "application/x-www-form-urlencoded")
+
+    # Assert
+    assert request_data == {"username": "a@b.com", "password": "secret"}
+
+
+@pytest.mark.asyncio
+async def test_csv_body_is_parsed_into_rows_and_redacted():
+    # Arrange
+    app = _build_capture_app()
+    body = b"username,email,password\nana,ana@example.com,secret-1\nbia,bia@example.com,secret-2\n"
+
+    # Act
+    _, request_data = await _post_raw(app, body, "text/csv")
+    logged = SecurityLogger._prepare_details({"request_data": request_data})
+
+    # Assert: nenhuma senha chega ao log
+    assert [row["email"] for row in request_data] == ["ana@example.com", "bia@example.com"]
+    assert all(row["password"] == "********" for row in logged["request_data"])
+    assert "secret" not in json.dumps(logged)
+
+
+@pytest.mark.asyncio
+async def test_sampled_reads_are_summarized_by_route_template():
+    # Arrange
+    sampler = RequestLogSampler(target_per_minute=1, summary_interval=3600)
+    app = FastAPI()
+    app.add_middleware(RequestLoggerMiddleware, sampler=sampler)
+
+    @app.get("/api/items/{item_id}")
+    async def get_item(item_id: int):
+        return {"id": item_id}
+
+    with patch("app.interfaces.api.middlewares.request_logger.SecurityLogger.log_api_request") as log:
+        async with httpx.AsyncClient(transport=httpx.ASGITransport(app=app), base_url="http://test") as client:
+            # Act
+            for item_id in range(5):
+                await client.get(f"/api/items/{item_id}")
+
+    # Assert: apenas o primeiro evento é registrado; os demais vão para o resumo
+    assert log.call_count == 1
+    summary = sampler.collect_summaries()[0]
+    assert summary["route"] == "/api/items/{item_id}"
+    assert summary["requests"] == 5
+    assert summary["sampled_out"] == 4
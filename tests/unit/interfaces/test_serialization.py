@@ -0,0 +1,54 @@
+import json
+from datetime import datetime
+from uuid import uuid4
+
+from app.domain.entities.collection import Collection, CollectionStatus
+from app.domain.entities.user import User, UserRole
+from app.interfaces.api.schemas.collection import CollectionResponse
+from app.interfaces.api.schemas.user import UserResponse
+from app.interfaces.api.serialization import collection_serializer, user_serializer
+
+
+def _collection() -> Collection:
+    return Collection(
+        id=str(uuid4()),
+        user_id=uuid4(),
+        description="Garrafas PET e papelão",
+        location_latitude=-23.0,
+        location_longitude=-46.123456789,
+        zip_code="01001-000",
+        images=["data:image/png;base64,AAAA"],
+        status=CollectionStatus.ASSIGNED,
+        created_at=datetime(2025, 1, 2, 3, 4, 5, 678901),
+        updated_at=datetime(2025, 1, 2, 3, 4, 5),
+        collector_id=uuid4(),
+    )
+
+
+def test_serializer_matches_response_model_json():
+    # Arrange
+    collection = _collection()
+    expected = json.loads(CollectionResponse.model_validate(collection).model_dump_json())
+
+    # Act
+    single = collection_serializer.dumps(collection)
+    many = collection_serializer.dumps_many([collection, collection])
+
+    # Assert
+    assert json.loads(single) == expected
+    assert json.loads(many) == [expected, expected]
+
+
+def test_response_carries_status_code_and_headers():
+    # Arrange
+    user = User(username="maria", email="maria@example.com", hashed_password="x", role=UserRole.COLLECTOR)
+
+    # Act
+    response = user_serializer.response(user, status_code=201, headers={"ETag": 'W/"1"'})
+
+    # Assert
+    assert response.status_code == 201
+    assert response.media_type == "application/json"
+    assert response.headers["ETag"] == 'W/"1"'
+    assert json.loads(response.body) == json.loads(UserResponse.model_validate(user).model_dump_json())
+    assert "hashed_password" not in json.loads(response.body)